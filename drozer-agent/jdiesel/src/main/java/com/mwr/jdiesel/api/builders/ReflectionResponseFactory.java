@@ -1,5 +1,9 @@
 package com.mwr.jdiesel.api.builders;
 
+import java.nio.ByteBuffer;
+import java.util.List;
+
+import com.google.protobuf.ByteString;
 import com.google.protobuf.MessageOrBuilder;
 import com.mwr.jdiesel.api.Protobuf.Message;
 import com.mwr.jdiesel.api.Protobuf.Message.ReflectionResponse;
@@ -10,6 +14,10 @@ public class ReflectionResponseFactory {
 	
 	private ReflectionResponse.Builder builder = null;
 	
+	public static ReflectionResponseFactory batch(List<ReflectionResponse> responses) {
+		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setBatch(responses);
+	}
+	
 	public static ReflectionResponseFactory data(byte[] bytes) {
 		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setData(bytes);
 	}
@@ -26,6 +34,10 @@ public class ReflectionResponseFactory {
 		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setObjectReference(ref);		
 	}
 	
+	public static ReflectionResponseFactory object(int ref, Object object) {
+		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setObjectReference(ref, object);
+	}
+	
 	public static ReflectionResponseFactory objectArray(Object[] objects) {
 		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setObjects(objects);
 	}
@@ -39,11 +51,23 @@ public class ReflectionResponseFactory {
 		}
 	}
 	
+	public static ReflectionResponseFactory packedPrimitiveArray(Object primitives) {
+		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setPackedPrimitives(primitives);
+	}
+	
 	public static ReflectionResponseFactory primitiveArray(Object primitives) {
 		return new ReflectionResponseFactory(ReflectionResponse.ResponseStatus.SUCCESS).setPrimitives(primitives);
 	}
 	
 	public static ReflectionResponseFactory send(Object value) {
+		return send(value, false);
+	}
+	
+	/**
+	 * Build a response carrying value. If packed is set, a primitive array is sent as packed
+	 * values rather than an element for each.
+	 */
+	public static ReflectionResponseFactory send(Object value, boolean packed) {
 		if(value == null)
 			return nullPointer();
 		else if(value.getClass().equals(String.class))
@@ -54,11 +78,13 @@ public class ReflectionResponseFactory {
 			return objectArray((Object[])value);
 		else if(value.getClass().isArray() && value.getClass().getComponentType() == Byte.TYPE)
 			return data((byte[])value);
+		else if(value.getClass().isArray() && packed)
+			return packedPrimitiveArray(value);
 		else if(value.getClass().isArray())
 			return primitiveArray(value);
 		//else if(!primitive)
 		else
-			return object(value.hashCode());
+			return object(value.hashCode(), value);
 	}
 	
 	public static ReflectionResponseFactory string(String value) {
@@ -77,6 +103,17 @@ public class ReflectionResponseFactory {
 		return this.builder.build();
 	}
 
+	private Message.ObjectReference.Builder buildObjectReference(int ref, Object object) {
+		Message.ObjectReference.Builder reference = Message.ObjectReference.newBuilder().setReference(ref);
+		
+		if(object instanceof Class)
+			reference.setClassName(((Class<?>)object).getName()).setIsClass(true);
+		else if(object != null)
+			reference.setClassName(object.getClass().getName());
+		
+		return reference;
+	}
+
 	private Message.Argument buildArgument(String string) {
 		return Message.Argument.newBuilder().setType(Message.Argument.ArgumentType.STRING).setString(string).build();
 	}
@@ -156,6 +193,12 @@ public class ReflectionResponseFactory {
 		return this;
 	}
 	
+	public ReflectionResponseFactory setBatch(List<ReflectionResponse> responses) {
+		this.builder.addAllBatch(responses);
+		
+		return this;
+	}
+	
 	public ReflectionResponseFactory setData(byte[] bytes) {
 		this.builder.setResult(ReflectedType.fromNative(bytes).getArgument());
 		
@@ -172,11 +215,64 @@ public class ReflectionResponseFactory {
 		return this.setResult(Message.Argument.ArgumentType.OBJECT, Message.ObjectReference.newBuilder().setReference(ref));
 	}
 	
+	public ReflectionResponseFactory setObjectReference(int ref, Object object) {
+		return this.setResult(Message.Argument.ArgumentType.OBJECT, buildObjectReference(ref, object));
+	}
+	
 	public ReflectionResponseFactory setObjects(Object[] objects) {
 		Message.Array.Builder array_builder = Message.Array.newBuilder().setType(Message.Array.ArrayType.OBJECT);
 		
 		for(Object object : objects)
-			array_builder.addElement(buildArgument(Message.Argument.ArgumentType.OBJECT, Message.ObjectReference.newBuilder().setReference(object.hashCode())));
+			array_builder.addElement(buildArgument(Message.Argument.ArgumentType.OBJECT, buildObjectReference(object.hashCode(), object)));
+		
+		return this.setResult(Message.Argument.ArgumentType.ARRAY, array_builder);
+	}
+	
+	public ReflectionResponseFactory setPackedPrimitives(Object primitiveArray) {
+		Message.Array.Builder array_builder = Message.Array.newBuilder().setType(Message.Array.ArrayType.PRIMITIVE);
+		ByteBuffer packed;
+		
+		if(primitiveArray instanceof boolean[]) {
+			packed = ByteBuffer.allocate(((boolean[])primitiveArray).length);
+			for(boolean b : (boolean[])primitiveArray)
+				packed.put((byte)(b ? 1 : 0));
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.BOOL);
+		}
+		else if(primitiveArray instanceof char[]) {
+			packed = ByteBuffer.allocate(((char[])primitiveArray).length * 2);
+			packed.asCharBuffer().put((char[])primitiveArray);
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.CHAR);
+		}
+		else if(primitiveArray instanceof double[]) {
+			packed = ByteBuffer.allocate(((double[])primitiveArray).length * 8);
+			packed.asDoubleBuffer().put((double[])primitiveArray);
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.DOUBLE);
+		}
+		else if(primitiveArray instanceof float[]) {
+			packed = ByteBuffer.allocate(((float[])primitiveArray).length * 4);
+			packed.asFloatBuffer().put((float[])primitiveArray);
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.FLOAT);
+		}
+		else if(primitiveArray instanceof int[]) {
+			packed = ByteBuffer.allocate(((int[])primitiveArray).length * 4);
+			packed.asIntBuffer().put((int[])primitiveArray);
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.INT);
+		}
+		else if(primitiveArray instanceof long[]) {
+			packed = ByteBuffer.allocate(((long[])primitiveArray).length * 8);
+			packed.asLongBuffer().put((long[])primitiveArray);
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.LONG);
+		}
+		else if(primitiveArray instanceof short[]) {
+			packed = ByteBuffer.allocate(((short[])primitiveArray).length * 2);
+			packed.asShortBuffer().put((short[])primitiveArray);
+			array_builder.setPackedType(Message.Primitive.PrimitiveType.SHORT);
+		}
+		else {
+			return this.setPrimitives(primitiveArray);
+		}
+		
+		array_builder.setPacked(ByteString.copyFrom(packed.array()));
 		
 		return this.setResult(Message.Argument.ArgumentType.ARRAY, array_builder);
 	}
@@ -13,10 +13,13 @@ import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStreamReader;
+import java.io.RandomAccessFile;
 
 import static com.mwr.jdiesel.util.Shell.shellExec;
 
 public class FileTransformMessageHandler implements MessageHandler {
+    private static final int MAX_CHUNK_LENGTH = 4 * 1024 * 1024;
+
     private Session session = null;
 
     public FileTransformMessageHandler(Session session) {
@@ -46,9 +49,13 @@ public class FileTransformMessageHandler implements MessageHandler {
             byte[] data = req.getData().toByteArray();
 
             try {
-                FileOutputStream outputStream = new FileOutputStream(remoteFileName);
-                outputStream.write(data);
-                outputStream.close();
+                if (req.hasOffset()) {
+                    resp.setSize(this.writeChunk(remoteFileName, req.getOffset(), data));
+                } else {
+                    FileOutputStream outputStream = new FileOutputStream(remoteFileName);
+                    outputStream.write(data);
+                    outputStream.close();
+                }
             } catch (Exception e) {
                 resp.setSuccess(false);
             }
@@ -56,13 +63,17 @@ public class FileTransformMessageHandler implements MessageHandler {
             String remoteFileName = message.getFileTransformRequest().getRemoteFilename();
 
             try {
-//                FileInputStream inputStream = new FileInputStream(remoteFileName);
-//                byte[] data = new byte[inputStream.available()];
-//                inputStream.read(data);
-//                inputStream.close();
-                String cmdbuf = shellExec("cat " + remoteFileName).toString();
-                byte[] data = cmdbuf.getBytes();
-                resp.setData(ByteString.copyFrom(data));
+                if (req.hasOffset()) {
+                    this.readChunk(remoteFileName, req.getOffset(), req.getLength(), resp);
+                } else {
+//                    FileInputStream inputStream = new FileInputStream(remoteFileName);
+//                    byte[] data = new byte[inputStream.available()];
+//                    inputStream.read(data);
+//                    inputStream.close();
+                    String cmdbuf = shellExec("cat " + remoteFileName).toString();
+                    byte[] data = cmdbuf.getBytes();
+                    resp.setData(ByteString.copyFrom(data));
+                }
             } catch (Exception e) {
                 resp.setSuccess(false);
             }
@@ -74,6 +85,46 @@ public class FileTransformMessageHandler implements MessageHandler {
                 .build();
     }
 
+    private void readChunk(String remoteFileName, long offset, int length, Protobuf.Message.FileTransformResponse.Builder resp) throws IOException {
+        RandomAccessFile file = new RandomAccessFile(remoteFileName, "r");
+
+        try {
+            byte[] buffer = new byte[Math.max(0, Math.min(length, MAX_CHUNK_LENGTH))];
+            int count = 0;
+
+            file.seek(offset);
+
+            while (count < buffer.length) {
+                int read = file.read(buffer, count, buffer.length - count);
 
+                if (read == -1)
+                    break;
+
+                count += read;
+            }
+
+            resp.setData(ByteString.copyFrom(buffer, 0, count));
+            resp.setSize(file.length());
+        } finally {
+            file.close();
+        }
+    }
+
+    private long writeChunk(String remoteFileName, long offset, byte[] data) throws IOException {
+        RandomAccessFile file = new RandomAccessFile(remoteFileName, "rw");
+
+        try {
+            if (offset > file.length())
+                throw new IOException("cannot write at " + offset + " past the end of " + remoteFileName);
+
+            file.setLength(offset);
+            file.seek(offset);
+            file.write(data);
+
+            return file.length();
+        } finally {
+            file.close();
+        }
+    }
 
 }
@@ -1,5 +1,6 @@
 package com.mwr.jdiesel.api.handlers;
 
+import java.util.ArrayList;
 import java.util.List;
 
 
@@ -32,6 +33,9 @@ public class ReflectionMessageHandler implements MessageHandler {
 		
 		try {
 			switch(message.getReflectionRequest().getType()) {
+			case BATCH:
+				return this.handleBatch(message);
+				
 			case CONSTRUCT:
 				if(!message.getReflectionRequest().hasConstruct())
 					throw new InvalidMessageException(message);
@@ -85,6 +89,30 @@ public class ReflectionMessageHandler implements MessageHandler {
 		}
 	}
 	
+	protected Message handleBatch(Message message) throws InvalidMessageException {
+		List<Message.ReflectionResponse> responses = new ArrayList<Message.ReflectionResponse>();
+		
+		for(Message.ReflectionRequest request : message.getReflectionRequest().getBatchList()) {
+			Message.ReflectionResponse response;
+			
+			if(request.getType() == Message.ReflectionRequest.RequestType.BATCH) {
+				response = ReflectionResponseFactory.error("cannot nest BATCH requests").setSessionId(this.session.getSessionId()).build();
+			}
+			else {
+				try {
+					response = this.handle(message.toBuilder().setReflectionRequest(this.resolveBatchReferences(request, responses)).build()).getReflectionResponse();
+				}
+				catch(IllegalArgumentException e) {
+					response = ReflectionResponseFactory.error(e.getMessage()).setSessionId(this.session.getSessionId()).build();
+				}
+			}
+			
+			responses.add(response);
+		}
+		
+		return this.createResponse(message, ReflectionResponseFactory.batch(responses));
+	}
+	
 	protected Message handleConstruct(Message message) throws InvalidMessageException {
 		Object klass = this.session.object_store.get(message.getReflectionRequest().getConstruct().getObject().getReference());
 		
@@ -95,7 +123,7 @@ public class ReflectionMessageHandler implements MessageHandler {
 				Object object = Reflector.construct((Class<?>)klass, arguments);
 				int ref = this.session.object_store.put(object);
 				
-				return this.createResponse(message, ReflectionResponseFactory.object(ref));
+				return this.createResponse(message, ReflectionResponseFactory.object(ref, object));
 			}
 			catch(Exception e) {
 				return this.handleError(message, e);
@@ -138,7 +166,7 @@ public class ReflectionMessageHandler implements MessageHandler {
 					if(value != null && this.shouldPutInStore(value))
 						this.session.object_store.put(value);
 					
-					return this.createResponse(message, ReflectionResponseFactory.send(value));
+					return this.createResponse(message, ReflectionResponseFactory.send(value, message.getReflectionRequest().getAcceptPacked()));
 				}
 			}
 			catch(Exception e) {
@@ -177,7 +205,7 @@ public class ReflectionMessageHandler implements MessageHandler {
 					if(result != null && this.shouldPutInStore(result))
 						this.session.object_store.put(result);
 					
-					return this.createResponse(message, ReflectionResponseFactory.send(result));
+					return this.createResponse(message, ReflectionResponseFactory.send(result, message.getReflectionRequest().getAcceptPacked()));
 				}
 			}
 			catch(Exception e) {
@@ -195,7 +223,7 @@ public class ReflectionMessageHandler implements MessageHandler {
 		if(klass != null) {
 			int ref = this.session.object_store.put(klass);
 		
-			return this.createResponse(message,	ReflectionResponseFactory.object(ref));
+			return this.createResponse(message,	ReflectionResponseFactory.object(ref, klass));
 		}
 		else {
 			return this.handleError(message, "cannot resolve " + message.getReflectionRequest().getResolve().getClassname());
@@ -229,6 +257,87 @@ public class ReflectionMessageHandler implements MessageHandler {
 		return resolved;
 	}
 
+	/**
+	 * Replace each ObjectReference that carries a batch_index with a reference to the object
+	 * returned by that earlier request in the batch.
+	 */
+	private Message.ObjectReference resolveBatchReference(Message.ObjectReference reference, List<Message.ReflectionResponse> responses) {
+		if(!reference.hasBatchIndex())
+			return reference;
+		
+		int index = reference.getBatchIndex();
+		
+		if(index < 0 || index >= responses.size())
+			throw new IllegalArgumentException("batch result " + index + " is not available");
+		
+		Message.ReflectionResponse response = responses.get(index);
+		
+		if(response.getStatus() != Message.ReflectionResponse.ResponseStatus.SUCCESS || response.getResult().getType() != Message.Argument.ArgumentType.OBJECT)
+			throw new IllegalArgumentException("batch result " + index + " is not an object");
+		
+		return Message.ObjectReference.newBuilder().setReference(response.getResult().getObject().getReference()).build();
+	}
+	
+	private Message.Argument resolveBatchReferences(Message.Argument argument, List<Message.ReflectionResponse> responses) {
+		Message.Argument.Builder builder = argument.toBuilder();
+		
+		if(argument.hasObject() && argument.getObject().hasBatchIndex()) {
+			int index = argument.getObject().getBatchIndex();
+			
+			// a String, primitive or primitive array result is not kept in the
+			// ObjectStore, so pass its value instead of a reference to it
+			if(index >= 0 && index < responses.size() &&
+					responses.get(index).getStatus() == Message.ReflectionResponse.ResponseStatus.SUCCESS &&
+					responses.get(index).getResult().getType() != Message.Argument.ArgumentType.OBJECT)
+				return responses.get(index).getResult();
+		}
+		if(argument.hasObject())
+			builder.setObject(this.resolveBatchReference(argument.getObject(), responses));
+		if(argument.hasArray()) {
+			Message.Array.Builder array = argument.getArray().toBuilder().clearElement();
+			
+			for(Message.Argument element : argument.getArray().getElementList())
+				array.addElement(this.resolveBatchReferences(element, responses));
+			
+			builder.setArray(array);
+		}
+		
+		return builder.build();
+	}
+	
+	private Message.ReflectionRequest resolveBatchReferences(Message.ReflectionRequest request, List<Message.ReflectionResponse> responses) {
+		Message.ReflectionRequest.Builder builder = request.toBuilder();
+		
+		if(request.hasConstruct()) {
+			Message.ReflectionRequest.Construct.Builder construct = request.getConstruct().toBuilder().clearArgument();
+			
+			construct.setObject(this.resolveBatchReference(request.getConstruct().getObject(), responses));
+			for(Message.Argument argument : request.getConstruct().getArgumentList())
+				construct.addArgument(this.resolveBatchReferences(argument, responses));
+			
+			builder.setConstruct(construct);
+		}
+		if(request.hasInvoke()) {
+			Message.ReflectionRequest.Invoke.Builder invoke = request.getInvoke().toBuilder().clearArgument();
+			
+			invoke.setObject(this.resolveBatchReference(request.getInvoke().getObject(), responses));
+			for(Message.Argument argument : request.getInvoke().getArgumentList())
+				invoke.addArgument(this.resolveBatchReferences(argument, responses));
+			
+			builder.setInvoke(invoke);
+		}
+		if(request.hasGetProperty())
+			builder.setGetProperty(request.getGetProperty().toBuilder().setObject(this.resolveBatchReference(request.getGetProperty().getObject(), responses)));
+		if(request.hasSetProperty())
+			builder.setSetProperty(request.getSetProperty().toBuilder()
+					.setObject(this.resolveBatchReference(request.getSetProperty().getObject(), responses))
+					.setValue(this.resolveBatchReferences(request.getSetProperty().getValue(), responses)));
+		if(request.hasDelete())
+			builder.setDelete(request.getDelete().toBuilder().setObject(this.resolveBatchReference(request.getDelete().getObject(), responses)));
+		
+		return builder.build();
+	}
+	
 	private boolean shouldPutInStore(Object obj) {
 		return !(obj.getClass().isPrimitive() ||
 				obj.getClass() == String.class ||
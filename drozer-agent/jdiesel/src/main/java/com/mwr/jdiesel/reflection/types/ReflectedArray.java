@@ -1,10 +1,12 @@
 package com.mwr.jdiesel.reflection.types;
 
+import java.nio.ByteBuffer;
 import java.util.Arrays;
 import java.util.Iterator;
 
 import com.mwr.jdiesel.api.Protobuf.Message.Argument;
 import com.mwr.jdiesel.api.Protobuf.Message.Array;
+import com.mwr.jdiesel.api.Protobuf.Message.Primitive;
 import com.mwr.jdiesel.reflection.ObjectStore;
 
 public class ReflectedArray extends ReflectedType implements Iterable<ReflectedType> {
@@ -19,10 +21,16 @@ public class ReflectedArray extends ReflectedType implements Iterable<ReflectedT
 	
 	public ReflectedArray(Array array, ObjectStore object_store) {
 		this.type = array.getType();
-		this.elements = new ReflectedType[array.getElementCount()];
 		
-		for(int i=0; i<array.getElementCount(); i++)
-			this.elements[i] = ReflectedType.fromArgument(array.getElement(i), object_store);
+		if(array.hasPacked()) {
+			this.elements = ReflectedArray.unpack(array.getPackedType(), array.getPacked().asReadOnlyByteBuffer());
+		}
+		else {
+			this.elements = new ReflectedType[array.getElementCount()];
+			
+			for(int i=0; i<array.getElementCount(); i++)
+				this.elements[i] = ReflectedType.fromArgument(array.getElement(i), object_store);
+		}
 	}
 	
 	public static ReflectedArray fromNative(Object[] elements) {
@@ -43,6 +51,69 @@ public class ReflectedArray extends ReflectedType implements Iterable<ReflectedT
 		return new ReflectedArray(type, reflected_elements);
 	}
 
+	/**
+	 * Read the elements of a packed primitive array, which are big-endian values of the
+	 * given type.
+	 */
+	private static ReflectedType[] unpack(Primitive.PrimitiveType type, ByteBuffer packed) {
+		ReflectedType[] elements;
+		
+		switch(type) {
+		case BOOL:
+			elements = new ReflectedType[packed.remaining()];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.get() != 0);
+			break;
+			
+		case BYTE:
+			elements = new ReflectedType[packed.remaining()];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.get());
+			break;
+			
+		case CHAR:
+			elements = new ReflectedType[packed.remaining() / 2];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.getChar());
+			break;
+			
+		case DOUBLE:
+			elements = new ReflectedType[packed.remaining() / 8];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.getDouble());
+			break;
+			
+		case FLOAT:
+			elements = new ReflectedType[packed.remaining() / 4];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.getFloat());
+			break;
+			
+		case INT:
+			elements = new ReflectedType[packed.remaining() / 4];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.getInt());
+			break;
+			
+		case LONG:
+			elements = new ReflectedType[packed.remaining() / 8];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.getLong());
+			break;
+			
+		case SHORT:
+			elements = new ReflectedType[packed.remaining() / 2];
+			for(int i=0; i<elements.length; i++)
+				elements[i] = new ReflectedPrimitive(packed.getShort());
+			break;
+			
+		default:
+			elements = new ReflectedType[0];
+		}
+		
+		return elements;
+	}
+	
 	@Override
 	public Argument getArgument() {
 		throw new RuntimeException("not implemented yet");
@@ -145,6 +145,6 @@ setuptools.setup(
                     "pydiesel": "src/pydiesel" },
   package_data = get_package_data(),
   scripts = get_executable_scripts(),
-  install_requires = ["protobuf>=2.6.1","pyopenssl>=16.2", "pyyaml>=3.11"],
+  install_requires = ["protobuf>=3.20","pyopenssl>=16.2", "pyyaml>=3.11"],
   data_files = get_install_data(),
   classifiers = [])
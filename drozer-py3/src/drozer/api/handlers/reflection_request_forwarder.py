@@ -31,6 +31,8 @@ class ReflectionRequestForwarder:
         session = Sessions.get(message.reflection_request.session_id)
 
         if session is not None:
+            session.requests += 1
+
             try:
                 session.device.write(message.SerializeToString())
             except DeviceGoneAway as e:
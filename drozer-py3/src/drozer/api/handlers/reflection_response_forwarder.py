@@ -27,6 +27,8 @@ class ReflectionResponseForwarder:
         session = Sessions.get(message.reflection_response.session_id)
 
         if session is not None:
+            session.responses += 1
+
             session.console.write(message.SerializeToString())
         else:
             print("no session:", message.reflection_response.session_id)
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+
+from drozer.configuration import Configuration
+from drozer.dex import ApkStrings
+
+class ApkStore(object):
+    """
+    A local, content-addressed store of APKs pulled from devices, and of the
+    DEX strings extracted from them.
+
+    APKs are keyed by their MD5 checksum, which the Agent can calculate without
+    sending the file, so an APK is only downloaded once, however many sessions
+    or devices it is seen on. The strings from its DEX files are extracted on
+    first use, and kept alongside it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @classmethod
+    def default(cls):
+        """
+        Get an ApkStore in the default location, which can be changed in the
+        [cache] section of the drozer configuration.
+        """
+
+        return ApkStore(Configuration.get("cache", "apks") or os.path.sep.join([os.path.expanduser("~"), ".drozer_apks"]))
+
+    @classmethod
+    def digest(cls, path, block_size=65536):
+        """
+        Calculate the MD5 checksum of a local file.
+        """
+
+        md5 = hashlib.md5()
+
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                md5.update(block)
+
+        return md5.hexdigest()
+
+    def add(self, digest, source):
+        """
+        Move the file at source into the store, as the APK with the given
+        checksum.
+
+        Raises ValueError if the file does not match the checksum, which means
+        it was not downloaded intact.
+        """
+
+        digest = digest.lower()
+
+        if self.digest(source) != digest:
+            os.remove(source)
+
+            raise ValueError("the APK does not match its checksum, %s" % digest)
+
+        os.makedirs(self.path, exist_ok=True)
+        os.replace(source, self.apkPath(digest))
+
+        return self.apkPath(digest)
+
+    def apkPath(self, digest):
+        """
+        Get the path at which the APK with the given checksum is stored.
+        """
+
+        return os.path.join(self.path, digest.lower() + ".apk")
+
+    def has(self, digest):
+        """
+        Test whether the APK with the given checksum is in the store.
+        """
+
+        return os.path.isfile(self.apkPath(digest))
+
+    def strings(self, digest):
+        """
+        Get the strings from every DEX file in a stored APK.
+        """
+
+        path = os.path.join(self.path, digest.lower() + ".strings")
+
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        strings = ApkStrings(self.apkPath(digest)).strings()
+        temp = "%s.%d" % (path, os.getpid())
+
+        # write to a temporary file and rename it into place, so a concurrent
+        # reader never sees a partial list
+        with open(temp, "w") as f:
+            json.dump(strings, f)
+
+        os.replace(temp, path)
+
+        return strings
+
+    def temporaryPath(self, digest):
+        """
+        Get a path to download an APK to, before it is added to the store.
+        """
+
+        os.makedirs(self.path, exist_ok=True)
+
+        return os.path.join(self.path, "%s.%d.part" % (digest.lower(), os.getpid()))
@@ -0,0 +1,496 @@
+import struct
+import xml.etree.ElementTree as ET
+import zipfile
+
+ANDROID_NAMESPACE = "http://schemas.android.com/apk/res/android"
+
+class AxmlFormatException(Exception):
+    """
+    Raised when a buffer does not hold a valid binary XML file or resource
+    table.
+    """
+
+    pass
+
+
+class StringPool(object):
+    """
+    Reads a ResStringPool chunk, as found at the start of binary XML files and
+    resource tables. Strings are decoded as they are first used.
+    """
+
+    UTF8_FLAG = 0x100
+
+    def __init__(self, data, offset):
+        header_size, size = struct.unpack_from("<HI", data, offset + 2)
+        count, _, flags, strings_start = struct.unpack_from("<IIII", data, offset + 8)
+
+        if offset + size > len(data) or offset + header_size + 4 * count > len(data):
+            raise AxmlFormatException("the string pool is truncated")
+
+        self.data = data
+        self.utf8 = flags & StringPool.UTF8_FLAG != 0
+
+        self.__cache = {}
+        self.__offsets = struct.unpack_from("<%dI" % count, data, offset + header_size)
+        self.__strings = offset + strings_start
+
+    def __getitem__(self, index):
+        if index < 0 or index >= len(self.__offsets):
+            return None
+
+        if index not in self.__cache:
+            self.__cache[index] = self.__decode(self.__strings + self.__offsets[index])
+
+        return self.__cache[index]
+
+    def __len__(self):
+        return len(self.__offsets)
+
+    def __decode(self, offset):
+        data = self.data
+
+        if self.utf8:
+            # the length in UTF-16 units, which we do not need, then the length
+            # in bytes, each encoded in one or two bytes
+            offset += 2 if data[offset] & 0x80 else 1
+            length = data[offset]
+
+            if length & 0x80:
+                length = ((length & 0x7f) << 8) | data[offset + 1]
+                offset += 2
+            else:
+                offset += 1
+
+            return bytes(data[offset:offset + length]).decode("utf-8", "replace")
+        else:
+            (length,) = struct.unpack_from("<H", data, offset)
+
+            if length & 0x8000:
+                length = ((length & 0x7fff) << 16) | struct.unpack_from("<H", data, offset + 2)[0]
+                offset += 4
+            else:
+                offset += 2
+
+            return bytes(data[offset:offset + 2 * length]).decode("utf-16-le", "replace")
+
+
+class ResourceTable(object):
+    """
+    Reads the names and default values of resources from resources.arsc, so
+    that resource ids in a binary XML file can be resolved.
+
+    Only simple (non-bag) values are kept, and where a resource has values for
+    several configurations, the default configuration is preferred.
+    """
+
+    FLAG_COMPLEX = 0x0001
+    FLAG_COMPACT = 0x0008
+    FLAG_SPARSE = 0x01
+    FLAG_OFFSET16 = 0x02
+    NO_ENTRY = 0xffffffff
+
+    def __init__(self, data):
+        self.names = {}
+        self.values = {}
+
+        self.__defaults = set()
+
+        chunk_type, header_size, size = struct.unpack_from("<HHI", data, 0)
+
+        if chunk_type != 0x0002:
+            raise AxmlFormatException("not a resource table")
+
+        strings = None
+        offset = header_size
+
+        while offset + 8 <= min(size, len(data)):
+            chunk_type, _, chunk_size = struct.unpack_from("<HHI", data, offset)
+
+            if chunk_size < 8:
+                raise AxmlFormatException("bad chunk size at %d" % offset)
+            elif chunk_type == 0x0001 and strings is None:
+                strings = StringPool(data, offset)
+            elif chunk_type == 0x0200:
+                self.__readPackage(data, offset, strings)
+
+            offset += chunk_size
+
+    def name(self, resource_id):
+        """
+        Get the name of a resource, as type/name (prefixed with package: for
+        resources outside the application), or None if it is not known.
+        """
+
+        return self.names.get(resource_id)
+
+    def value(self, resource_id):
+        """
+        Get the default value of a resource, or None if it is not a simple
+        value.
+        """
+
+        return self.values.get(resource_id)
+
+    def __readPackage(self, data, offset, strings):
+        header_size, size = struct.unpack_from("<HI", data, offset + 2)
+        package_id, = struct.unpack_from("<I", data, offset + 8)
+        package_name = bytes(data[offset + 12:offset + 12 + 256]).decode("utf-16-le", "replace").split("\x00")[0]
+        type_strings, _, key_strings = struct.unpack_from("<III", data, offset + 268)
+
+        types = StringPool(data, offset + type_strings)
+        keys = StringPool(data, offset + key_strings)
+        prefix = package_id != 0x7f and package_name + ":" or ""
+
+        chunk = offset + header_size
+
+        while chunk + 8 <= offset + size:
+            chunk_type, chunk_header_size, chunk_size = struct.unpack_from("<HHI", data, chunk)
+
+            if chunk_size < 8:
+                raise AxmlFormatException("bad chunk size at %d" % chunk)
+            elif chunk_type == 0x0201:
+                self.__readType(data, chunk, chunk_header_size, package_id, prefix, types, keys, strings)
+
+            chunk += chunk_size
+
+    def __readType(self, data, offset, header_size, package_id, prefix, types, keys, strings):
+        type_id, flags, _, count, entries_start = struct.unpack_from("<BBHII", data, offset + 8)
+        config_size, = struct.unpack_from("<I", data, offset + 20)
+
+        default = not any(data[offset + 24:offset + 20 + config_size])
+        type_name = types[type_id - 1]
+        base = (package_id << 24) | (type_id << 16)
+
+        if flags & ResourceTable.FLAG_SPARSE:
+            entries = ((index, entry_offset * 4) for (index, entry_offset) in struct.iter_unpack("<HH", data[offset + header_size:offset + header_size + 4 * count]))
+        elif flags & ResourceTable.FLAG_OFFSET16:
+            entries = ((index, entry_offset * 4) for (index, (entry_offset,)) in enumerate(struct.iter_unpack("<H", data[offset + header_size:offset + header_size + 2 * count])) if entry_offset != 0xffff)
+        else:
+            entries = ((index, entry_offset) for (index, (entry_offset,)) in enumerate(struct.iter_unpack("<I", data[offset + header_size:offset + header_size + 4 * count])) if entry_offset != ResourceTable.NO_ENTRY)
+
+        for (index, entry_offset) in entries:
+            entry = offset + entries_start + entry_offset
+            size, entry_flags, key = struct.unpack_from("<HHI", data, entry)
+
+            if entry_flags & ResourceTable.FLAG_COMPACT:
+                # a compact entry packs the key into size, and the value type
+                # into the high byte of flags
+                key, value_type, value_data = size, entry_flags >> 8, key
+            elif entry_flags & ResourceTable.FLAG_COMPLEX:
+                value_type = None
+            else:
+                value_type, value_data = struct.unpack_from("<xxxBI", data, entry + size)
+
+            resource_id = base | index
+
+            if resource_id not in self.names:
+                self.names[resource_id] = "%s%s/%s" % (prefix, type_name, keys[key])
+
+            if value_type is not None and (default or resource_id not in self.values) and resource_id not in self.__defaults:
+                self.values[resource_id] = TypedValue.format(value_type, value_data, strings)
+
+                if default:
+                    self.__defaults.add(resource_id)
+
+
+class TypedValue(object):
+    """
+    Formats a Res_value as a string, the way that aapt dumps it.
+    """
+
+    TYPE_NULL = 0x00
+    TYPE_REFERENCE = 0x01
+    TYPE_ATTRIBUTE = 0x02
+    TYPE_STRING = 0x03
+    TYPE_FLOAT = 0x04
+    TYPE_DIMENSION = 0x05
+    TYPE_FRACTION = 0x06
+    TYPE_DYNAMIC_REFERENCE = 0x07
+    TYPE_INT_DEC = 0x10
+    TYPE_INT_HEX = 0x11
+    TYPE_INT_BOOLEAN = 0x12
+    TYPE_FIRST_COLOR = 0x1c
+    TYPE_LAST_COLOR = 0x1f
+
+    DIMENSION_UNITS = ["px", "dip", "sp", "pt", "in", "mm"]
+    FRACTION_UNITS = ["%", "%p"]
+    RADIX_MULTIPLIERS = [1.0 / (1 << 8), 1.0 / (1 << 15), 1.0 / (1 << 23), 1.0 / (1 << 31)]
+
+    @classmethod
+    def format(cls, value_type, data, strings=None, resources=None):
+        """
+        Format a value, resolving strings against a StringPool and references
+        against a ResourceTable, if they are given.
+        """
+
+        if value_type == cls.TYPE_STRING:
+            return strings is not None and strings[data] or None
+        elif value_type in (cls.TYPE_REFERENCE, cls.TYPE_DYNAMIC_REFERENCE, cls.TYPE_ATTRIBUTE):
+            symbol = value_type == cls.TYPE_ATTRIBUTE and "?" or "@"
+
+            if data == 0:
+                return "@null"
+            elif resources is not None and resources.name(data) is not None:
+                return symbol + resources.name(data)
+            elif data >> 24 == 0x01 and data in ANDROID_ATTRIBUTES:
+                return symbol + "android:attr/" + ANDROID_ATTRIBUTES[data]
+            else:
+                return "%s0x%08x" % (symbol, data)
+        elif value_type == cls.TYPE_INT_BOOLEAN:
+            return data != 0 and "true" or "false"
+        elif value_type == cls.TYPE_INT_DEC:
+            return str(struct.unpack("<i", struct.pack("<I", data))[0])
+        elif value_type == cls.TYPE_INT_HEX:
+            return "0x%08x" % data
+        elif value_type == cls.TYPE_FLOAT:
+            return repr(struct.unpack("<f", struct.pack("<I", data))[0])
+        elif value_type == cls.TYPE_DIMENSION:
+            return cls.__complex(data) + cls.DIMENSION_UNITS[data & 0xf] if data & 0xf < len(cls.DIMENSION_UNITS) else cls.__complex(data)
+        elif value_type == cls.TYPE_FRACTION:
+            return "%g%s" % (float(cls.__complex(data)) * 100, cls.FRACTION_UNITS[data & 0xf & 1])
+        elif cls.TYPE_FIRST_COLOR <= value_type <= cls.TYPE_LAST_COLOR:
+            return "#%08x" % data
+        elif value_type == cls.TYPE_NULL:
+            return None
+        else:
+            return "0x%08x" % data
+
+    @classmethod
+    def __complex(cls, data):
+        mantissa = struct.unpack("<i", struct.pack("<I", data & 0xffffff00))[0]
+
+        return "%g" % (mantissa * cls.RADIX_MULTIPLIERS[(data >> 4) & 0x3])
+
+
+class AxmlDecoder(object):
+    """
+    Decodes an Android binary XML file, such as a compiled AndroidManifest.xml,
+    straight into an ElementTree:
+
+        root = AxmlDecoder(data, ResourceTable(arsc)).decode()
+
+    Attributes in the android namespace are keyed as {namespace}name, just as
+    ET.fromstring would key them, so the tree can be handed to the classes in
+    manifest_parser without a round trip through XML text. Known android
+    attributes are named from their resource ids, so names that have been
+    stripped from, or obfuscated in, the string pool are recovered.
+    """
+
+    START_NAMESPACE = 0x0100
+    END_NAMESPACE = 0x0101
+    START_ELEMENT = 0x0102
+    END_ELEMENT = 0x0103
+    RESOURCE_MAP = 0x0180
+    STRING_POOL = 0x0001
+    XML = 0x0003
+
+    def __init__(self, data, resources=None):
+        self.data = data
+        self.resources = resources
+
+    def decode(self):
+        """
+        Decode the file, and return its root Element.
+        """
+
+        data = self.data
+
+        if len(data) < 8 or struct.unpack_from("<H", data, 0)[0] != AxmlDecoder.XML:
+            raise AxmlFormatException("not a binary XML file")
+
+        header_size, size = struct.unpack_from("<HI", data, 2)
+
+        resource_ids = ()
+        root = None
+        stack = []
+        strings = None
+
+        offset = header_size
+        end = min(size, len(data))
+
+        while offset + 8 <= end:
+            chunk_type, chunk_header_size, chunk_size = struct.unpack_from("<HHI", data, offset)
+
+            if chunk_size < 8:
+                raise AxmlFormatException("bad chunk size at %d" % offset)
+            elif chunk_type == AxmlDecoder.STRING_POOL:
+                strings = StringPool(data, offset)
+            elif chunk_type == AxmlDecoder.RESOURCE_MAP:
+                resource_ids = struct.unpack_from("<%dI" % ((chunk_size - chunk_header_size) // 4), data, offset + chunk_header_size)
+            elif chunk_type == AxmlDecoder.START_ELEMENT:
+                if strings is None:
+                    raise AxmlFormatException("an element appears before the string pool")
+
+                element = self.__element(offset + chunk_header_size, strings, resource_ids)
+
+                if len(stack) > 0:
+                    stack[-1].append(element)
+                elif root is None:
+                    root = element
+
+                stack.append(element)
+            elif chunk_type == AxmlDecoder.END_ELEMENT:
+                if len(stack) > 0:
+                    stack.pop()
+
+            offset += chunk_size
+
+        if root is None:
+            raise AxmlFormatException("the file has no elements")
+
+        return root
+
+    def __attributeName(self, index, strings, resource_ids):
+        """
+        Get the name of an attribute. The name of a known android attribute
+        comes from its resource id, since the Android runtime only looks at the
+        id, and an obfuscator may have renamed or stripped the pooled name.
+        Other stripped names fall back on the resource id.
+        """
+
+        name = strings[index]
+
+        if index < len(resource_ids) and resource_ids[index] in ANDROID_ATTRIBUTES:
+            name = ANDROID_ATTRIBUTES[resource_ids[index]]
+        elif not name and index < len(resource_ids):
+            resource_id = resource_ids[index]
+
+            if self.resources is not None and self.resources.name(resource_id) is not None:
+                name = self.resources.name(resource_id).split("/")[-1]
+            else:
+                name = "0x%08x" % resource_id
+
+        return name
+
+    def __element(self, offset, strings, resource_ids):
+        data = self.data
+
+        _, name, attribute_start, attribute_size, attribute_count = struct.unpack_from("<IIHHH", data, offset)
+
+        element = ET.Element(strings[name])
+        attribute = offset + attribute_start
+
+        for _ in range(attribute_count):
+            namespace, name, raw_value, value_type, value_data = struct.unpack_from("<III3xBI", data, attribute)
+            attribute += attribute_size
+
+            key = self.__attributeName(name, strings, resource_ids)
+
+            if namespace != 0xffffffff and strings[namespace]:
+                key = "{%s}%s" % (strings[namespace], key)
+
+            if raw_value != 0xffffffff:
+                value = strings[raw_value]
+            else:
+                value = TypedValue.format(value_type, value_data, strings, self.resources)
+
+            if value is not None:
+                element.set(key, value)
+
+        return element
+
+
+class ApkManifest(object):
+    """
+    Reads the AndroidManifest.xml from an APK on the local file system, and
+    resolves its resource ids against the APK's resources.arsc.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def element(self):
+        """
+        Decode the manifest into an ElementTree Element.
+
+        An AxmlFormatException is raised if the file is not an APK, or has no
+        manifest that can be decoded.
+        """
+
+        try:
+            apk = zipfile.ZipFile(self.path)
+        except zipfile.BadZipFile:
+            raise AxmlFormatException("not an APK")
+
+        with apk:
+            try:
+                data = apk.read("AndroidManifest.xml")
+            except KeyError:
+                raise AxmlFormatException("the APK has no AndroidManifest.xml")
+
+            try:
+                resources = ResourceTable(apk.read("resources.arsc"))
+            except (KeyError, AxmlFormatException, struct.error):
+                resources = None
+
+        return AxmlDecoder(data, resources).decode()
+
+    def xml(self):
+        """
+        Decode the manifest into XML text.
+        """
+
+        ET.register_namespace("android", ANDROID_NAMESPACE)
+
+        return ET.tostring(self.element(), encoding="unicode")
+
+
+# the names of the framework attributes that appear in manifests, so that they
+# can be recovered when an obfuscator has stripped them from the string pool
+ANDROID_ATTRIBUTES = {
+    0x01010000: "theme",
+    0x01010001: "label",
+    0x01010002: "icon",
+    0x01010003: "name",
+    0x01010004: "manageSpaceActivity",
+    0x01010005: "allowClearUserData",
+    0x01010006: "permission",
+    0x01010007: "readPermission",
+    0x01010008: "writePermission",
+    0x01010009: "protectionLevel",
+    0x0101000a: "permissionGroup",
+    0x0101000b: "sharedUserId",
+    0x0101000c: "hasCode",
+    0x0101000d: "persistent",
+    0x0101000e: "enabled",
+    0x0101000f: "debuggable",
+    0x01010010: "exported",
+    0x01010011: "process",
+    0x01010012: "taskAffinity",
+    0x01010013: "multiprocess",
+    0x01010014: "finishOnTaskLaunch",
+    0x01010015: "clearTaskOnLaunch",
+    0x01010016: "stateNotNeeded",
+    0x01010017: "excludeFromRecents",
+    0x01010018: "authorities",
+    0x01010019: "syncable",
+    0x0101001a: "initOrder",
+    0x0101001b: "grantUriPermissions",
+    0x0101001c: "priority",
+    0x0101001d: "launchMode",
+    0x0101001e: "screenOrientation",
+    0x0101001f: "configChanges",
+    0x01010020: "description",
+    0x01010021: "targetPackage",
+    0x01010024: "value",
+    0x01010025: "resource",
+    0x01010026: "mimeType",
+    0x01010027: "scheme",
+    0x01010028: "host",
+    0x01010029: "port",
+    0x0101002a: "path",
+    0x0101002b: "pathPrefix",
+    0x0101002c: "pathPattern",
+    0x0101002d: "action",
+    0x0101002e: "data",
+    0x0101002f: "targetClass",
+    0x01010202: "targetActivity",
+    0x0101020c: "minSdkVersion",
+    0x0101021b: "versionCode",
+    0x0101021c: "versionName",
+    0x01010270: "targetSdkVersion",
+    0x01010271: "maxSdkVersion",
+    0x01010280: "allowBackup",
+    0x010104ec: "usesCleartextTraffic",
+}
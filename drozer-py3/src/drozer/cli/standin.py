@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+
+import sys
+
+from ..standin import StandIn
+
+StandIn().run(sys.argv[2::])
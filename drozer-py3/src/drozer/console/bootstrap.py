@@ -0,0 +1,161 @@
+import time
+from contextlib import contextmanager
+
+from pydiesel.reflection import ReflectionBatch, ReflectionException
+
+class StartupTimings(object):
+    """
+    Records where the time to the first prompt goes: how long each phase of
+    starting a session takes, and how many messages it exchanges with the
+    Agent.
+    """
+
+    def __init__(self):
+        self.messages = 0
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a phase of startup, which is run inside the with block.
+        """
+
+        start, messages = time.time(), self.messages
+
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.time() - start, self.messages - messages))
+
+    def report(self):
+        """
+        Get a table of the startup phases, their duration and the number of
+        messages each exchanged.
+        """
+
+        width = max([len(name) for name, elapsed, messages in self.phases] + [5])
+        lines = ["%s  %8.3fs  %3d messages" % (name.ljust(width), elapsed, messages) for name, elapsed, messages in self.phases]
+        lines.append("%s  %8.3fs  %3d messages" % ("total".ljust(width), self.total(), sum(p[2] for p in self.phases)))
+
+        return "\n".join(lines) + "\n\n"
+
+    def total(self):
+        """
+        Get the total time spent in all phases.
+        """
+
+        return sum(p[1] for p in self.phases)
+
+
+class Bootstrap(object):
+    """
+    Collects what a Session needs to know about the Agent before showing its
+    first prompt: the Agent version, whether it has a Context, its data
+    directory and the permissions it has been granted.
+
+    Once the Agent version is known, everything else is fetched in a single
+    ReflectionBatch, rather than a round trip per reflection call. Anything
+    that could not be collected this way (such as on an Agent that does not
+    support BATCH) is left as None, for the Session to fetch as before.
+    """
+
+    # the Agent can pass a String result to a later operation in a batch
+    chained_agent_version = 20408
+
+    GET_PERMISSIONS = 0x1000
+    REQUESTED_PERMISSION_GRANTED = 0x2
+
+    def __init__(self, reflector, timings=None):
+        self.agent_version = 0
+        self.data_dir = None
+        self.has_context = None
+        self.permissions = None
+
+        self.__reflector = reflector
+        self.__timings = timings
+
+    def run(self):
+        """
+        Collect the Agent's details, and return the Bootstrap.
+        """
+
+        with self.__phase("agent version"):
+            try:
+                self.agent_version = int(self.__reflector.resolve("com.mwr.dz.BuildConfig").VERSION_CODE)
+            except:
+                pass
+
+        if self.agent_version >= ReflectionBatch.minimum_agent_version:
+            with self.__phase("bootstrap"):
+                try:
+                    self.__batched()
+                except ReflectionException:
+                    # leave whatever we did not get for the Session to fetch
+                    pass
+
+        return self
+
+    def __batched(self):
+        package = None
+
+        with self.__reflector.batch() as batch:
+            context = batch.invoke(batch.resolve("com.mwr.dz.Agent"), "getContext")
+            data_dir = batch.getProperty(batch.invoke(context, "getApplicationInfo"), "dataDir")
+            cwd = batch.invoke(batch.construct(batch.resolve("java.io.File"), "."), "getCanonicalPath")
+            package_name = batch.invoke(context, "getPackageName")
+            package_manager = batch.invoke(context, "getPackageManager")
+
+            if self.agent_version >= Bootstrap.chained_agent_version:
+                package = self.__package(batch, package_manager, package_name)
+
+        self.has_context = context.result() != None
+
+        if not self.has_context:
+            self.data_dir = str(cwd.result())
+            self.permissions = []
+            return
+
+        self.data_dir = str(data_dir.result())
+
+        if package is None:
+            # an older Agent cannot pass the package name on, so ask again
+            with self.__reflector.batch() as batch:
+                package = self.__package(batch, package_manager.result(), str(package_name.result()))
+
+        self.permissions = self.__granted(*package)
+
+    def __granted(self, requested, flags):
+        """
+        Get the permissions that have been granted, from the requested
+        permissions of a PackageInfo and their flags.
+        """
+
+        permissions = []
+
+        if requested.result() != None:
+            if flags.result() == None:
+                raise ReflectionException("no requestedPermissionsFlags")
+
+            for permission, flag in zip(requested.result(), flags.result()):
+                if flag.native() & Bootstrap.REQUESTED_PERMISSION_GRANTED:
+                    permissions.append(str(permission))
+
+        permissions.append("com.mwr.dz.permissions.GET_CONTEXT")
+
+        return permissions
+
+    def __package(self, batch, package_manager, package_name):
+        """
+        Record the operations that get the requested permissions of the
+        Agent's package, and their flags, in batch.
+        """
+
+        package = batch.invoke(package_manager, "getPackageInfo", package_name, Bootstrap.GET_PERMISSIONS)
+
+        return (batch.getProperty(package, "requestedPermissions"), batch.getProperty(package, "requestedPermissionsFlags"))
+
+    def __phase(self, name):
+        if self.__timings is not None:
+            return self.__timings.phase(name)
+        else:
+            return StartupTimings().phase(name)
@@ -10,6 +10,8 @@ from mwr.common import cli, path_completion
 from .. import meta
 from ..api.formatters import SystemResponseFormatter
 from ..connector import ServerConnector
+from .bootstrap import StartupTimings
+from .parallel import ParallelRunner
 from .session import Session, DebugSession
 
 class Console(cli.Base):
@@ -36,6 +38,11 @@ class Console(cli.Base):
         self._parser.add_argument("--password", action="store_true", default=False, help="the agent requires a password")
         self._parser.add_argument("-c", "--command", default=None, dest="onecmd", help="specify a single command to run in the session")
         self._parser.add_argument("-f", "--file", default=[], help="source file", nargs="*")
+        self._parser.add_argument("--timings", action="store_true", default=False, help="report where the time taken to start the session went")
+        self._parser.add_argument("--record", default=None, metavar="FILE", help="write every message exchanged with the agent to a capture file (compressed if FILE ends in .gz)")
+        self._parser.add_argument("--replay", default=None, metavar="FILE", help="serve the responses from a capture file, in place of connecting to an agent")
+        self._parser.add_argument("--replay-timing", action="store_true", default=False, help="when replaying, delay each response by the time the agent originally took")
+        self._parser.add_argument("--replay-speed", default=1.0, metavar="FACTOR", type=float, help="when replaying with timing, divide each delay by FACTOR")
         
         self.__accept_certificate = False
         self.__server = None
@@ -52,8 +59,11 @@ class Console(cli.Base):
 
         device = self.__get_device(arguments)
         
-        server = self.__getServerConnector(arguments)
-        response = server.startSession(device, password)
+        timings = StartupTimings()
+
+        with timings.phase("connect"):
+            server = self.__getServerConnector(arguments)
+            response = server.startSession(device, password)
         
         if response.type == Message.SYSTEM_RESPONSE and\
             response.system_response.status == Message.SystemResponse.SUCCESS:
@@ -62,9 +72,12 @@ class Console(cli.Base):
             session = None
             try:
                 if arguments.debug:
-                    session = DebugSession(server, session_id, arguments)
+                    session = DebugSession(server, session_id, arguments, timings)
                 else:
-                    session = Session(server, session_id, arguments)
+                    session = Session(server, session_id, arguments, timings)
+
+                if arguments.timings:
+                    session.stdout.write(timings.report())
 
                 if len(arguments.file) > 0:
                     session.do_load(" ".join(arguments.file))
@@ -103,6 +116,48 @@ class Console(cli.Base):
         
         self.__getServerConnector(arguments).close()
         
+    def do_parallel(self, arguments):
+        """runs a command or script on many devices at once"""
+
+        if arguments.onecmd is None and len(arguments.file) == 0:
+            raise cli.UsageError("specify a command to run with -c, or a script with -f")
+
+        if arguments.password:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+
+                arguments.agent_password = getpass.getpass()
+        else:
+            arguments.agent_password = None
+
+        if len(arguments.devices) > 0:
+            devices = arguments.devices
+        elif arguments.server is not None:
+            devices = ParallelRunner.serverDevices(self.__getServerConnector(arguments))
+
+            self.__getServerConnector(arguments).close()
+        else:
+            devices = ParallelRunner.adbDevices()
+
+        if len(devices) == 0:
+            print("No devices available.\n")
+
+            sys.exit(-1)
+
+        runner = ParallelRunner(arguments, devices, arguments.output, concurrency=arguments.concurrency)
+
+        print("Running on %d devices, %d at a time...\n" % (len(devices), arguments.concurrency))
+
+        results = runner.run(progress=print)
+
+        print()
+        print(runner.summary(results))
+
+    def args_for_parallel(self):
+        self._parser.add_argument("--devices", default=[], metavar="SERIAL", nargs="+", help="the devices to run on: adb serials or, with --server, agent identifiers (default: all)")
+        self._parser.add_argument("--concurrency", default=4, metavar="N", type=int, help="the number of devices to run on at a time")
+        self._parser.add_argument("--output", default="drozer-results", metavar="DIR", help="the directory to write per-device results and the summary to")
+
     def do_version(self, arguments):
         """display the installed drozer version"""
         
@@ -180,7 +235,13 @@ class Console(cli.Base):
         """
 
         if self.__server is None:
-            self.__server = ServerConnector(arguments, self.__manage_trust)
+            if arguments.replay is not None:
+                self.__server = ServerConnector.replay(arguments.replay, arguments.replay_timing, arguments.replay_speed)
+            else:
+                self.__server = ServerConnector(arguments, self.__manage_trust)
+
+            if arguments.record is not None:
+                self.__server.record(arguments.record)
 
         return self.__server
     
@@ -0,0 +1,200 @@
+import copy
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.api.transport import SocketTransport
+from pydiesel.api.transport.exceptions import ConnectionError
+
+from ..connector import ServerConnector
+from .session import Session
+
+class DeviceResult(object):
+    """
+    The outcome of running a command against one device.
+    """
+
+    def __init__(self, serial, path, status, elapsed, error=None):
+        self.serial = serial
+        self.path = path
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+
+    def __str__(self):
+        if self.error is not None:
+            return "%s: %s in %.1fs (%s)" % (self.serial, self.status, self.elapsed, self.error)
+        else:
+            return "%s: %s in %.1fs" % (self.serial, self.status, self.elapsed)
+
+
+class ParallelRunner(object):
+    """
+    Runs a command, or a script of commands, against many devices at once,
+    with one Session per device.
+
+    Each device is handled by a separate worker process, since modules keep
+    per-session state at class level, and at most concurrency devices are
+    handled at a time. The output for each device is written to a file named
+    after its serial in the output directory, alongside a summary.txt.
+    """
+
+    def __init__(self, arguments, devices, output, concurrency=4):
+        self.arguments = arguments
+        self.concurrency = concurrency
+        self.devices = devices
+        self.output = output
+
+    @classmethod
+    def adbDevices(cls):
+        """
+        Get the serials of all devices that are online in adb.
+        """
+
+        return [d.split("\t")[0] for d in SocketTransport.adbDevices() if d.endswith("\tdevice")]
+
+    @classmethod
+    def serverDevices(cls, server):
+        """
+        Get the identifiers of all agents bound to a drozer Server.
+        """
+
+        return [d.id for d in server.listDevices().system_response.devices]
+
+    def resultPath(self, serial):
+        """
+        Get the path of the file that the output for a device is written to.
+        """
+
+        return os.path.join(self.output, "%s.txt" % re.sub(r"[^\w.-]", "_", serial))
+
+    def run(self, progress=None):
+        """
+        Run the command against every device, and return a list of their
+        DeviceResults. progress is called with each DeviceResult, as the
+        device finishes.
+        """
+
+        os.makedirs(self.output, exist_ok=True)
+
+        jobs = [(self.arguments, serial, self.resultPath(serial)) for serial in self.devices]
+        results = []
+
+        with multiprocessing.Pool(processes=max(1, min(self.concurrency, len(jobs))), maxtasksperchild=1) as pool:
+            for result in pool.imap_unordered(runOnDevice, jobs):
+                results.append(result)
+
+                if progress is not None:
+                    progress(result)
+
+        results.sort(key=lambda r: self.devices.index(r.serial))
+
+        with open(os.path.join(self.output, "summary.txt"), "w") as summary:
+            summary.write(self.summary(results))
+
+        return results
+
+    def summary(self, results):
+        """
+        Format a table of DeviceResults, with a count of devices that failed.
+        """
+
+        lines = ["%-24s %-8s %8s  %s" % ("device", "status", "time", "output")]
+
+        for result in results:
+            lines.append("%-24s %-8s %7.1fs  %s" % (result.serial, result.status, result.elapsed, result.error or result.path))
+
+        failed = len([r for r in results if r.status != "ok"])
+
+        lines.append("")
+        lines.append("%d devices, %d ok, %d failed" % (len(results), len(results) - failed, failed))
+
+        return "\n".join(lines) + "\n"
+
+
+def runOnDevice(job):
+    """
+    Run the command against one device, writing everything the session
+    outputs to the device's result file. This runs in a worker process.
+    """
+
+    arguments, serial, path = job
+
+    arguments = copy.copy(arguments)
+    arguments.serial = serial
+    arguments.no_color = True
+
+    start = time.time()
+    status, error = "ok", None
+
+    with open(path, "w") as output:
+        sys.stdout = sys.stderr = output
+
+        try:
+            runSession(arguments)
+        except SystemExit as e:
+            status, error = "failed", "the session was lost (exit code %s)" % e.code
+        except ConnectionError as e:
+            status, error = "failed", str(e.cause)
+        except Exception as e:
+            status, error = "failed", str(e) or e.__class__.__name__
+        finally:
+            sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+
+    return DeviceResult(serial, path, status, time.time() - start, error)
+
+def runSession(arguments):
+    """
+    Start a Session with the agent selected by arguments.serial, and run the
+    command or script in it.
+
+    With --server, the serial is the identifier of an agent bound to that
+    server, otherwise it is the adb serial of a device running an agent with
+    its embedded server enabled.
+    """
+
+    server = ServerConnector(arguments, trustCertificate(arguments))
+
+    try:
+        if arguments.server is not None:
+            device = arguments.serial
+        else:
+            devices = server.listDevices().system_response.devices
+
+            if len(devices) != 1:
+                raise RuntimeError("expected one agent, found %d" % len(devices))
+
+            device = devices[0].id
+
+        response = server.startSession(device, arguments.agent_password)
+
+        if response.type != Message.SYSTEM_RESPONSE or response.system_response.status != Message.SystemResponse.SUCCESS:
+            raise RuntimeError(response.system_response.error_message)
+
+        session = Session(server, response.system_response.session_id, arguments)
+
+        try:
+            if len(arguments.file) > 0:
+                session.do_load(" ".join(arguments.file))
+            else:
+                session.onecmd(arguments.onecmd)
+        finally:
+            session.do_exit("")
+    finally:
+        server.close()
+
+def trustCertificate(arguments):
+    """
+    Build a trust callback for SSL connections, which cannot ask whether to
+    trust a new certificate: it must already be trusted, or be accepted with
+    --accept-certificate.
+    """
+
+    def callback(provider, certificate, peer):
+        if provider.trusted(certificate, peer) < 0 and not arguments.accept_certificate:
+            raise ConnectionError("the certificate for %s:%d is not trusted" % peer)
+
+    return callback
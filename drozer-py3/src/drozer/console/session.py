@@ -17,12 +17,15 @@ from mwr.common.stream import ColouredStream, DecolouredStream
 from mwr.common.text import wrap
 
 from . import clean
+from .bootstrap import Bootstrap
 from .sequencer import Sequencer
+from .wire_trace import WireTrace
 
 from .. import meta
 from ..configuration import Configuration
 from ..connector import ServerConnector
 from ..modules import collection, common, loader, Module
+from ..modules.memo import MemoStore
 from ..repoman import ModuleManager
 
 class Session(cmd.Cmd):
@@ -32,7 +35,7 @@ class Session(cmd.Cmd):
     Type `help COMMAND` for more information on a particular command, or `help MODULE` for a particular module.
     """
 
-    def __init__(self, server: ServerConnector, session_id: str, arguments):
+    def __init__(self, server: ServerConnector, session_id: str, arguments, timings=None):
         cmd.Cmd.__init__(self)
         self.__base = ""
         self.__has_context = None
@@ -41,6 +44,8 @@ class Session(cmd.Cmd):
         self.__server = server
         self.__session_id = session_id
         self.__onecmd = arguments.onecmd
+        self.timings = timings
+        self.trace = None
         self.active = True
         self.aliases = { "l": "list", "ls": "list", "ll": "list" }
         self.intro = "drozer Console (v%s)" % meta.version
@@ -48,25 +53,31 @@ class Session(cmd.Cmd):
         self.modules = collection.ModuleCollection(loader.ModuleLoader())
         self.prompt = "dz> "
         self.reflector = Reflector(self)
+        self.reflector.object_tracker.threshold = int(Configuration.get("objects", "release") or 64)
+        self.reflector.object_tracker.warning = int(Configuration.get("objects", "warning") or 10000)
         self.ftp = Ftp(self)
+        self.memo = MemoStore(int(Configuration.get("memo", "ttl") or 600))
         if hasattr(arguments, 'no_color') and not arguments.no_color:
             self.stdout = ColouredStream(self.stdout)
             self.stderr = ColouredStream(self.stderr)
         else:
             self.stdout = DecolouredStream(self.stdout)
             self.stderr = DecolouredStream(self.stderr)
-        self.agent_version: int = 0
-        try:
-            self.agent_version: int = int(self.reflector.resolve("com.mwr.dz.BuildConfig").VERSION_CODE)
-        except:
-            pass
+        bootstrap = Bootstrap(self.reflector, timings).run()
 
-        m = Module(self)
+        self.agent_version: int = bootstrap.agent_version
+        self.__has_context = bootstrap.has_context
+        self.__permissions = bootstrap.permissions
 
-        if m.has_context():
-            dataDir = str(m.getContext().getApplicationInfo().dataDir)
+        if bootstrap.data_dir is not None:
+            dataDir = bootstrap.data_dir
         else:
-            dataDir = str(m.new("java.io.File", ".").getCanonicalPath().native())
+            m = Module(self)
+
+            if m.has_context():
+                dataDir = str(m.getContext().getApplicationInfo().dataDir)
+            else:
+                dataDir = str(m.new("java.io.File", ".").getCanonicalPath().native())
 
         self.variables = {  'PATH': dataDir +'/bin:/sbin:/vendor/bin:/system/sbin:/system/bin:/system/xbin',
                             'WD': dataDir }
@@ -89,14 +100,12 @@ class Session(cmd.Cmd):
         Provides readline auto-completion for drozer module names.
         """
 
-        modules = self.modules.all(permissions=self.permissions(), prefix=self.__base)
-        
         if self.__base == "":
-            modules = [m for m in modules if m.startswith(text)]
+            modules = self.modules.all(permissions=self.permissions(), prefix=text)
         elif text.startswith("."):
-            modules = [m for m in modules if m.startswith(text[1:])]
+            modules = [m for m in self.modules.all(permissions=self.permissions(), prefix=self.__base) if m.startswith(text[1:])]
         else:
-            modules = [[m[len(self.__base):] for m in modules if m.startswith(self.__base + text)]]
+            modules = [[m[len(self.__base):] for m in self.modules.all(permissions=self.permissions(), prefix=self.__base + text)]]
         
         #if len(modules) == 1 and text == modules[0]:
         #    return []
@@ -227,6 +236,35 @@ class Session(cmd.Cmd):
             
             return True
 
+    def do_forget(self, args):
+        """
+        usage: forget [FUNCTION]
+
+        Forget the remembered results of expensive discovery, such as the content URIs found by searching every package.
+
+        drozer remembers these results for the rest of your session, so that running several scanners back to back only pays for discovery once. They are forgotten automatically when a package is installed, updated or removed, or after ten minutes (set `ttl` in the [memo] section of your .drozer_config to change this).
+
+        Use `forget` to discard them sooner, or `forget FUNCTION` to discard the results of one function, such as Provider.iterContentUris.
+        """
+
+        argv = shlex.split(args, comments=True)
+
+        if len(argv) == 1 and (argv[0] == "-h" or argv[0] == "--help"):
+            self.do_help("forget")
+            return
+
+        forgotten = self.memo.invalidate(len(argv) > 0 and argv[0] or None)
+
+        self.stdout.write("Forgot %d remembered results.\n" % forgotten)
+
+    def complete_forget(self, text, line, begidx, endidx):
+        """
+        Provides readline auto-completion for the `forget` command, suggesting
+        the functions with remembered results.
+        """
+
+        return [n for n in self.memo.names() if n.startswith(text)]
+
     def do_help(self, args):
         """
         usage: help [COMMAND OR MODULE]
@@ -312,11 +350,11 @@ class Session(cmd.Cmd):
         else:
             u_modules = []
 
-        self.stdout.write(console.format_dict(dict([[m, self.modules.get(m).name] for m in s_modules])) + "\n")
+        self.stdout.write(console.format_dict(dict([[m, self.modules.info(m).name] for m in s_modules])) + "\n")
         
         if len(u_modules) > 0:
             self.stdout.write("\nUnsupported Modules:\n\n")
-            self.stdout.write(console.format_dict(dict([[m, self.modules.get(m).name] for m in u_modules])) + "\n")
+            self.stdout.write(console.format_dict(dict([[m, self.modules.info(m).name] for m in u_modules])) + "\n")
 
     def do_load(self, args):
         """
@@ -378,9 +416,14 @@ class Session(cmd.Cmd):
         
     def do_run(self, args):
         """
-        usage: run MODULE [OPTIONS]
+        usage: run [--profile] [--trace FILE] MODULE [OPTIONS]
 
         To see the options for a particular module, run `help MODULE`.
+
+        With --profile, a summary of the messages the module exchanged with the
+        Agent is shown after it has run: the methods that took the most round
+        trips and the most time, and the code that sent the most messages. With
+        --trace, every message is written to FILE, as JSON.
         """
         argv = shlex.split(args, comments=True)
 
@@ -388,6 +431,17 @@ class Session(cmd.Cmd):
             self.do_help("run")
             return
 
+        profile, trace_file = False, None
+
+        while len(argv) > 0 and argv[0] in ("--profile", "--trace"):
+            if argv.pop(0) == "--profile":
+                profile = True
+            elif len(argv) > 0:
+                trace_file = argv.pop(0)
+            else:
+                self.do_help("run")
+                return
+
         if len(argv) > 0:
             try:
                 module = self.__module(argv[0])
@@ -399,6 +453,9 @@ class Session(cmd.Cmd):
                 self.stderr.write("unknown module: %s\n" % str(e))
                 return None
 
+            if profile or trace_file is not None:
+                self.trace = WireTrace(module.fqmn())
+
             try:
                 module.run(argv[1:])
             except KeyboardInterrupt:
@@ -408,6 +465,11 @@ class Session(cmd.Cmd):
                 import traceback
                 traceback.print_stack()
                 self.handleException(e)
+            finally:
+                trace, self.trace = self.trace, None
+
+            if trace is not None:
+                self.__report_trace(trace, profile, trace_file)
             
             while self.__module_pushed_completers > 0:
                 self.__pop_module_completer()
@@ -423,7 +485,7 @@ class Session(cmd.Cmd):
         method defined on the specified module.
         """
 
-        _line = re.match("(run\s+)([^\s]*)(\s*)", line)
+        _line = re.match("(run\s+(?:--profile\s+|--trace\s+[^\s]+\s+)*)([^\s]*)(\s*)", line)
 
         # figure out where the module name starts in the string
         cmdidx = len(_line.group(1))
@@ -565,31 +627,83 @@ class Session(cmd.Cmd):
         if self.__onecmd:
             return
 
-    def sendAndReceive(self, message):
+    def gather(self, futures, exit_on_loss=True):
         """
-        Delivers a message to the Agent, and returns the response.
+        Waits for the responses to a collection of messages delivered with
+        #send_async, and returns them in the order they were given.
 
-        If the send operation times out, or the response indicates a fatal error,
-        an error message is displayed and the console terminates with a status
-        code of -1.
+        If the connection is lost, or the Agent reports a fatal error, an error
+        message is displayed and the console exits with status 1 or 2. Without
+        exit_on_loss, a lost connection raises the ConnectionError instead.
         """
 
+        responses = []
+
+        for future in futures:
+            try:
+                message = self.__server.wait(future)
+            except ConnectionError:
+                if not exit_on_loss:
+                    raise
+
+                self.stderr.write("We lost your drozer session.\n\n")
+                self.stderr.write("For some reason the mobile Agent has stopped responding. You will need to restart it, and try again.\n\n")
+
+                sys.exit(1)
+
+            if message and message.type == Message.REFLECTION_RESPONSE and message.reflection_response.status == Message.ReflectionResponse.FATAL:
+                self.stderr.write("We lost your drozer session.\n\n")
+                self.stderr.write("The mobile Agent did not like the last message you sent it. It has terminated your session.\n\n")
+                self.stderr.write("You will need to reconnect, and may need to restart the mobile Agent.\n\n")
+
+                sys.exit(2)
+
+            responses.append(message)
+
+        return responses
+
+    def send_async(self, message, exit_on_loss=True):
+        """
+        Delivers a message to the Agent, without waiting for the response.
+
+        Returns a Future, which should be passed to #gather to collect the
+        response. As with #gather, a lost connection exits the console unless
+        exit_on_loss is cleared.
+        """
+
+        if self.timings is not None:
+            self.timings.messages += 1
+
         try:
-            message = self.__server.sendAndReceive(message.setSessionId(self.__session_id))
+            message = message.setSessionId(self.__session_id)
+
+            if self.trace is not None:
+                return self.__traced(self.trace, self.trace.begin(message.builder), self.__server.send_async(message))
+            else:
+                return self.__server.send_async(message)
         except ConnectionError:
+            if not exit_on_loss:
+                raise
+
             self.stderr.write("We lost your drozer session.\n\n")
             self.stderr.write("For some reason the mobile Agent has stopped responding. You will need to restart it, and try again.\n\n")
 
             sys.exit(1)
 
-        if message and message.type == Message.REFLECTION_RESPONSE and message.reflection_response.status == Message.ReflectionResponse.FATAL:
-            self.stderr.write("We lost your drozer session.\n\n")
-            self.stderr.write("The mobile Agent did not like the last message you sent it. It has terminated your session.\n\n")
-            self.stderr.write("You will need to reconnect, and may need to restart the mobile Agent.\n\n")
+    def sendAndReceive(self, message, exit_on_loss=True):
+        """
+        Delivers a message to the Agent, and returns the response.
 
-            sys.exit(2)
+        The message is sent with #send_async, and its response collected with
+        #gather. If the connection is lost or times out (a ConnectionError),
+        an error message is displayed and the console exits with status 1; if
+        the Agent reports a fatal error, it exits with status 2.
+
+        Without exit_on_loss, the ConnectionError is raised instead, so that
+        the caller (such as Ftp, which can resume a transfer) can handle it.
+        """
 
-        return message
+        return self.gather([self.send_async(message, exit_on_loss)], exit_on_loss)[0]
 
     def __load_variables(self):
         """
@@ -599,6 +713,39 @@ class Session(cmd.Cmd):
         for key in Configuration.get_all_keys("vars"):
             self.variables[key] = Configuration.get("vars", key)
         
+    def __traced(self, trace, entry, future):
+        """
+        Record the response to a message in the trace, once it arrives.
+        """
+
+        def complete(future):
+            if future.exception() is None:
+                trace.complete(entry, future.result())
+            else:
+                trace.complete(entry, None, "LOST")
+
+        future.add_done_callback(complete)
+
+        return future
+
+    def __report_trace(self, trace, profile, trace_file):
+        """
+        Show the summary of a traced module run, and export the trace.
+        """
+
+        trace.finish()
+
+        if profile:
+            self.stdout.write("\n" + trace.summary())
+
+        if trace_file is not None:
+            try:
+                trace.export(trace_file)
+
+                self.stdout.write("Wrote a trace of %d messages to %s.\n\n" % (len(trace.entries), trace_file))
+            except IOError as e:
+                self.stderr.write("Could not write the trace to %s: %s\n\n" % (trace_file, e))
+
     def __module(self, key):
         """
         Gets a module instance, by identifier, and initialises it with the
@@ -644,11 +791,9 @@ class Session(cmd.Cmd):
         """
 
         if global_scope:
-            modules = self.modules.all(permissions=self.permissions(), prefix=None)
+            return self.modules.namespaces(permissions=self.permissions(), prefix=None)
         else:
-            self.modules.all(permissions=self.permissions(), prefix=self.__base)
-        
-        return set([self.__module("." + m).namespace() for m in modules])
+            return self.modules.namespaces(permissions=self.permissions(), prefix=self.__base)
     
     def __push_module_completer(self, completer, history_file=None):
         """
@@ -718,7 +863,7 @@ class Session(cmd.Cmd):
             else:
                 target = self.__base + base + "."
 
-            if True in [m.startswith(target) for m in self.modules.all(permissions=self.permissions())]:
+            if len(self.modules.all(permissions=self.permissions(), prefix=target)) > 0:
                 self.__base = target
             else:
                 self.stderr.write("no such namespace: %s\n"%base)
@@ -737,8 +882,8 @@ class DebugSession(Session):
     handlers to print stacktrace information.
     """
 
-    def __init__(self, server: ServerConnector, session_id: str, arguments):
-        super().__init__(server, session_id, arguments)
+    def __init__(self, server: ServerConnector, session_id: str, arguments, timings=None):
+        super().__init__(server, session_id, arguments, timings)
 
         self.intro = "drozer Console (v%s debug mode)" % meta.version
         self.prompt = "dz> "
@@ -0,0 +1,217 @@
+import json
+import os
+import sys
+import time
+
+import pydiesel
+from pydiesel.api.protobuf_pb2 import Message
+
+class WireTrace(object):
+    """
+    Records every message that a Session exchanges with the Agent while it is
+    attached: what was sent, to which class and method, how large the request
+    and response were, how long the Agent took to answer, and where in the
+    console the message was sent from.
+
+    The trace can be summarised, to find the methods that a module calls most
+    often or spends the most time waiting on, or exported for closer study.
+    """
+
+    # frames in these directories are part of the reflection machinery, rather
+    # than the code that asked for a message to be sent
+    INTERNAL = (os.path.dirname(pydiesel.__file__), os.path.dirname(__file__))
+
+    def __init__(self, module=None):
+        self.entries = []
+        self.module = module
+        self.started = time.time()
+        self.finished = None
+
+        self.__classes = {}
+
+    def begin(self, message):
+        """
+        Record that a message is being sent to the Agent, and get its entry in
+        the trace.
+        """
+
+        entry = { "seq": len(self.entries),
+                  "type": self.__type(message),
+                  "target": self.__target(message),
+                  "module": self.module,
+                  "frame": self.__caller(),
+                  "request_bytes": len(message.SerializePartialToString()),
+                  "response_bytes": None,
+                  "status": None,
+                  "sent": time.time() - self.started,
+                  "latency": None }
+
+        self.entries.append(entry)
+
+        return entry
+
+    def complete(self, entry, response, status=None):
+        """
+        Record the response to a message, which was recorded with #begin.
+        """
+
+        entry["latency"] = time.time() - self.started - entry["sent"]
+
+        if response is not None:
+            entry["response_bytes"] = len(response.SerializePartialToString())
+            entry["status"] = self.__status(response)
+
+            if response.type == Message.REFLECTION_RESPONSE:
+                self.__learn(response.reflection_response, entry["type"] == "RESOLVE" and entry["target"] or None)
+        else:
+            entry["status"] = status
+
+    def export(self, path):
+        """
+        Write the trace to a file, as JSON.
+        """
+
+        with open(path, "w") as trace_file:
+            json.dump({ "module": self.module,
+                        "elapsed": self.elapsed(),
+                        "messages": self.entries }, trace_file, indent=2)
+
+    def elapsed(self):
+        """
+        Get the time between starting and finishing the trace.
+        """
+
+        return (self.finished or time.time()) - self.started
+
+    def finish(self):
+        """
+        Stop the clock on the trace.
+        """
+
+        self.finished = time.time()
+
+    def summary(self, limit=10):
+        """
+        Get a report of the messages sent, with the targets that took the most
+        round trips and the most time, and the code that sent the most
+        messages.
+        """
+
+        sent = sum(e["request_bytes"] for e in self.entries)
+        received = sum(e["response_bytes"] or 0 for e in self.entries)
+        waiting = sum(e["latency"] or 0 for e in self.entries)
+
+        lines = ["%d messages in %.3fs (%.3fs waiting on the Agent), %d bytes sent, %d bytes received" % (len(self.entries), self.elapsed(), waiting, sent, received)]
+
+        targets = self.__group(lambda e: "%s %s" % (e["type"], e["target"]) if e["target"] else e["type"])
+        callers = self.__group(lambda e: e["frame"] or "?")
+
+        lines += self.__table("Top targets by round trips", "target", sorted(targets, key=lambda g: (-g[1], -g[2]))[:limit])
+        lines += self.__table("Top targets by time", "target", sorted(targets, key=lambda g: (-g[2], -g[1]))[:limit])
+        lines += self.__table("Top callers by round trips", "caller", sorted(callers, key=lambda g: (-g[1], -g[2]))[:limit])
+
+        return "\n".join(lines) + "\n\n"
+
+    def __caller(self):
+        """
+        Get the first frame on the stack that is outside the reflection
+        machinery, as 'file:line in function'.
+        """
+
+        frame = sys._getframe(1)
+
+        while frame is not None:
+            filename = frame.f_code.co_filename
+
+            if not any(filename.startswith(d) for d in WireTrace.INTERNAL):
+                return "%s:%d in %s" % (filename, frame.f_lineno, frame.f_code.co_name)
+
+            frame = frame.f_back
+
+        return None
+
+    def __class(self, reference):
+        """
+        Get the name of the class of a referenced object, if the Agent has
+        told us what it is.
+        """
+
+        return self.__classes.get(reference.reference, "?")
+
+    def __group(self, key):
+        """
+        Group the entries, giving the count, time and bytes of each group.
+        """
+
+        groups = {}
+
+        for entry in self.entries:
+            group = groups.setdefault(key(entry), [0, 0.0, 0])
+            group[0] += 1
+            group[1] += entry["latency"] or 0
+            group[2] += entry["request_bytes"] + (entry["response_bytes"] or 0)
+
+        return [(name, count, latency, size) for name, (count, latency, size) in groups.items()]
+
+    def __learn(self, response, resolved=None):
+        """
+        Remember the class names of any objects in a reflection response. An
+        older Agent does not send class names, but we still know the name of a
+        class that was resolved.
+        """
+
+        if response.HasField("result") and response.result.type == Message.Argument.OBJECT:
+            if response.result.object.HasField("class_name"):
+                self.__classes[response.result.object.reference] = response.result.object.class_name
+            elif resolved is not None:
+                self.__classes[response.result.object.reference] = resolved
+
+        for inner in response.batch:
+            self.__learn(inner)
+
+    def __status(self, response):
+        if response.type == Message.REFLECTION_RESPONSE:
+            return Message.ReflectionResponse.ResponseStatus.Name(response.reflection_response.status)
+        elif response.type == Message.FILE_TRANSFORM_RESPONSE:
+            return response.file_transform_response.success and "SUCCESS" or "ERROR"
+        else:
+            return "SUCCESS"
+
+    def __table(self, title, heading, rows):
+        lines = ["", "%s:" % title, "  %6s  %9s  %9s  %s" % ("count", "time (s)", "bytes", heading)]
+
+        for name, count, latency, size in rows:
+            lines.append("  %6d  %9.3f  %9d  %s" % (count, latency, size, name))
+
+        return lines
+
+    def __target(self, message):
+        """
+        Describe the class and member that a message is addressed to.
+        """
+
+        if message.type == Message.REFLECTION_REQUEST:
+            request = message.reflection_request
+
+            if request.type == Message.ReflectionRequest.RESOLVE:
+                return request.resolve.classname
+            elif request.type == Message.ReflectionRequest.CONSTRUCT:
+                return self.__class(request.construct.object)
+            elif request.type == Message.ReflectionRequest.INVOKE:
+                return "%s.%s" % (self.__class(request.invoke.object), request.invoke.method)
+            elif request.type == Message.ReflectionRequest.GET_PROPERTY:
+                return "%s.%s" % (self.__class(request.get_property.object), request.get_property.property)
+            elif request.type == Message.ReflectionRequest.SET_PROPERTY:
+                return "%s.%s" % (self.__class(request.set_property.object), request.set_property.property)
+            elif request.type == Message.ReflectionRequest.BATCH:
+                return "of %d" % len(request.batch)
+        elif message.type == Message.FILE_TRANSFORM_REQUEST:
+            return message.file_transform_request.remote_filename
+
+        return ""
+
+    def __type(self, message):
+        if message.type == Message.REFLECTION_REQUEST:
+            return Message.ReflectionRequest.RequestType.Name(message.reflection_request.type)
+        else:
+            return Message.MessageType.Name(message.type)
@@ -1,3 +1,5 @@
+from collections.abc import MutableSet
+
 from pydiesel.api.builders import SystemRequestFactory
 
 from .session import Sessions
@@ -102,7 +104,8 @@ class Device:
         """
 
         for session in message.system_response.sessions:
-            Sessions.add_session(session.session_id, self, None)
+            if Sessions.get(session.session_id) is None:
+                Sessions.add_session(session.session_id, self, None)
 
     def startSession(self, console, message):
         """
@@ -202,12 +205,23 @@ class Device:
     def __ne__(self, other):
         return self.device_id != other.device_id
 
-class DeviceCollection(set):
+class DeviceCollection(MutableSet):
     """
-    DeviceCollection provides a thin wrapper on top of a set to provide a DSL
-    for interacting with the devices.
+    DeviceCollection provides a set of devices, indexed by identifier, with a
+    DSL for interacting with them.
     """
 
+    def __init__(self):
+        self.__devices = {}
+
+    def add(self, device):
+        """
+        Add a Device to the collection, unless a Device with the same
+        identifier is already present.
+        """
+
+        self.__devices.setdefault(device.device_id, device)
+
     def addFromProtobuf(self, protobuf):
         """
         Build a Device from a Protocol Buffer representation, and add it to the
@@ -221,7 +235,21 @@ class DeviceCollection(set):
         
         self.add(device)
         
-        return self.__getMy(device)
+        return self.get(device.device_id)
+
+    def discard(self, device):
+        """
+        Remove a Device from the collection, if it is present.
+        """
+
+        self.__devices.pop(device.device_id, None)
+
+    def get(self, device_id):
+        """
+        Retrieve a Device from the collection, by identifier.
+        """
+
+        return self.__devices.get(device_id)
 
     def getFromProtobuf(self, protobuf):
         """
@@ -229,7 +257,7 @@ class DeviceCollection(set):
         representation.
         """
 
-        return self.__getMy(Device.fromProtobuf(protobuf))
+        return self.get(protobuf.id)
     
     def removeFromProtobuf(self, protobuf):
         """
@@ -237,23 +265,20 @@ class DeviceCollection(set):
         Buffer representation.
         """
 
-        device = self.__getMy(Device.fromProtobuf(protobuf))
+        device = self.get(protobuf.id)
         
         self.remove(device)
         
         return device
-    
-    def __getMy(self, target):
-        """
-        Gets a Device from the collection, given another representation of a
-        Device.
-        """
 
-        for device in Devices:
-            if device == target:
-                return device
+    def __contains__(self, device):
+        return getattr(device, 'device_id', None) in self.__devices
+
+    def __iter__(self):
+        return iter(list(self.__devices.values()))
 
-        return None
+    def __len__(self):
+        return len(self.__devices)
 
 class DeviceGoneAway(Exception):
     """
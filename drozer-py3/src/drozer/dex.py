@@ -0,0 +1,147 @@
+import mmap
+import re
+import struct
+import zipfile
+
+class DexFormatException(Exception):
+    """
+    Raised when a buffer does not hold a valid DEX file.
+    """
+
+    pass
+
+
+class DexStrings(object):
+    """
+    Reads the string table of a DEX file, straight from its string_ids section,
+    without parsing the rest of the file.
+
+    The buffer can be bytes or an mmap, so that a DEX file inside a larger file
+    can be read in place from offset base, without being copied into memory.
+    """
+
+    HEADER_SIZE = 0x70
+
+    def __init__(self, buffer, base=0):
+        self.base = base
+        self.buffer = buffer
+
+        if len(buffer) < base + DexStrings.HEADER_SIZE or buffer[base:base + 4] != b"dex\n":
+            raise DexFormatException("not a DEX file")
+
+        self.size, self.offset = struct.unpack_from("<II", buffer, base + 0x38)
+
+        if base + self.offset + 4 * self.size > len(buffer):
+            raise DexFormatException("the string_ids section is truncated")
+
+    def __iter__(self):
+        buffer = self.buffer
+        start = self.base + self.offset
+
+        for (data_offset,) in struct.iter_unpack("<I", buffer[start:start + 4 * self.size]):
+            data_offset += self.base
+
+            # skip the uleb128 utf16_size, which is not needed to decode
+            while buffer[data_offset] & 0x80:
+                data_offset += 1
+            data_offset += 1
+
+            end = buffer.find(b"\x00", data_offset)
+
+            if end < 0:
+                raise DexFormatException("unterminated string at %d" % (data_offset - self.base))
+
+            yield self.decode(buffer[data_offset:end])
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def decode(cls, data):
+        """
+        Decode a Modified UTF-8 string, as stored in a DEX file.
+        """
+
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            # Modified UTF-8 encodes NUL as C0 80, and characters beyond the BMP
+            # as a surrogate pair of three-byte sequences
+            data = data.replace(b"\xc0\x80", b"\x00")
+
+            return data.decode("utf-8", "surrogatepass").encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+
+
+class ApkStrings(object):
+    """
+    Reads the string tables of every DEX file in an APK (classes.dex,
+    classes2.dex, ...).
+
+    DEX files that are stored uncompressed are read in place, through an mmap
+    of the APK. Compressed ones must be inflated into memory first.
+    """
+
+    DEX_NAME = re.compile(r"^classes\d*\.dex$")
+
+    def __init__(self, path):
+        self.path = path
+
+    def dexNames(self):
+        """
+        Get the names of the DEX files in the APK, in load order.
+        """
+
+        with zipfile.ZipFile(self.path) as apk:
+            names = [n for n in apk.namelist() if ApkStrings.DEX_NAME.match(n)]
+
+        return sorted(names, key=self.__dexIndex)
+
+    def strings(self):
+        """
+        Get every string from every DEX file in the APK, in order.
+        """
+
+        strings = []
+
+        with open(self.path, "rb") as f, zipfile.ZipFile(f) as apk:
+            mapped = None
+
+            try:
+                for name in self.dexNames():
+                    info = apk.getinfo(name)
+
+                    if info.compress_type == zipfile.ZIP_STORED and info.file_size > 0:
+                        if mapped is None:
+                            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+                        strings.extend(DexStrings(mapped, self.__dataOffset(mapped, info)))
+                    else:
+                        strings.extend(DexStrings(apk.read(name)))
+            finally:
+                if mapped is not None:
+                    mapped.close()
+
+        return strings
+
+    def __dexIndex(self, name):
+        """
+        Get the position of a DEX file in load order: classes.dex is first,
+        then classes2.dex, classes3.dex and so on.
+        """
+
+        if name == "classes.dex":
+            return 1
+        else:
+            return int(name[len("classes"):-len(".dex")])
+
+    def __dataOffset(self, mapped, info):
+        """
+        Find the start of a stored entry's data, after its local file header.
+        """
+
+        signature, name_length, extra_length = struct.unpack_from("<I22xHH", mapped, info.header_offset)
+
+        if signature != 0x04034b50:
+            raise DexFormatException("bad local file header for %s" % info.filename)
+
+        return info.header_offset + 30 + name_length + extra_length
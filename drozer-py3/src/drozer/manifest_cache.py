@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+
+from drozer.configuration import Configuration
+from drozer.manifest_parser import Manifest
+
+class ManifestCache(object):
+    """
+    An on-disk cache of decoded AndroidManifest.xml files, and of the Manifests
+    parsed from them.
+
+    Entries are keyed by the device fingerprint, package name, versionCode and
+    lastUpdateTime, so an entry is only used until the package is updated. When
+    the cache grows beyond max_size bytes, the least recently used entries are
+    evicted.
+
+    Each entry file starts with HEADER, followed by the manifest XML in a JSON
+    object; an entry written in another format is discarded. Only text is
+    stored, since the cache directory may be shared: Manifests are parsed
+    again from the XML when they are read from disk, and then kept in memory.
+    """
+
+    HEADER = b"DZMANIFEST\x00\x02"
+
+    def __init__(self, path, max_size=32 * 1024 * 1024):
+        self.hits = 0
+        self.max_size = max_size
+        self.misses = 0
+        self.path = path
+
+        self.__manifests = {}
+        self.__size = None
+
+    @classmethod
+    def default(cls):
+        """
+        Get a ManifestCache in the default location, which can be changed in
+        the [cache] section of the drozer configuration.
+        """
+
+        path = Configuration.get("cache", "manifests") or os.path.sep.join([os.path.expanduser("~"), ".drozer_manifests"])
+        size = Configuration.get("cache", "manifests_size")
+
+        if size is not None:
+            return ManifestCache(path, int(size))
+        else:
+            return ManifestCache(path)
+
+    @classmethod
+    def key(cls, fingerprint, package, version_code, last_update_time, local=False):
+        """
+        Build the key for a version of a package, installed on a device.
+
+        Manifests decoded on this machine are keyed apart from those decoded by
+        the Agent, since the two decoders do not give identical XML.
+        """
+
+        fields = [fingerprint, package, version_code, last_update_time]
+
+        if local:
+            fields.append("local")
+
+        return hashlib.sha1("\0".join(map(str, fields)).encode("utf-8")).hexdigest()
+
+    def clear(self):
+        """
+        Remove every entry from the cache.
+        """
+
+        for entry in self.__entries():
+            self.__remove(entry.path)
+
+        self.__manifests = {}
+        self.__size = 0
+
+    def get(self, key):
+        """
+        Get the XML of a cached manifest, or None if it is not cached.
+        """
+
+        entry = self.__read(key)
+
+        if entry is not None:
+            return entry["xml"]
+        else:
+            return None
+
+    def getManifest(self, key, options):
+        """
+        Get a Manifest, parsed with the given options, from the cache, or None
+        if it is not cached.
+
+        options is all_node, followed by the sorted (name, value) pairs of the
+        other keyword arguments to Manifest.
+        """
+
+        manifest = self.__manifests.get((key, options))
+
+        if manifest is not None:
+            self.hits += 1
+
+            return manifest
+
+        entry = self.__read(key)
+
+        if entry is None:
+            return None
+
+        manifest = Manifest(entry["xml"], options[0], **dict(options[1:]))
+
+        self.__manifests[(key, options)] = manifest
+
+        return manifest
+
+    def put(self, key, xml):
+        """
+        Add the XML of a manifest to the cache.
+        """
+
+        self.__write(key, { "xml": xml })
+
+    def putManifest(self, key, options, manifest):
+        """
+        Add a Manifest, parsed with the given options, to the cache. Its XML is
+        written to disk, unless the XML is already cached.
+        """
+
+        self.__manifests[(key, options)] = manifest
+
+        if not os.path.exists(self.__path(key)):
+            self.__write(key, { "xml": ET.tostring(manifest.xmlET, encoding="unicode") })
+
+    def size(self):
+        """
+        Get the number of bytes used by the cache on disk.
+
+        The cache directory is scanned once, and the total is then kept up to
+        date as entries are written and removed.
+        """
+
+        if self.__size is None:
+            self.__size = sum(entry.stat().st_size for entry in self.__entries())
+
+        return self.__size
+
+    def __entries(self):
+        """
+        List the files in the cache directory.
+        """
+
+        if not os.path.isdir(self.path):
+            return []
+
+        return [entry for entry in os.scandir(self.path) if entry.is_file() and entry.name.endswith(".manifest")]
+
+    def __evict(self):
+        """
+        Remove the least recently used entries, until the cache fits within
+        max_size.
+        """
+
+        entries = sorted(self.__entries(), key=lambda e: e.stat().st_mtime)
+        self.__size = sum(entry.stat().st_size for entry in entries)
+
+        while self.__size > self.max_size and len(entries) > 0:
+            self.__remove(entries.pop(0).path)
+
+    def __path(self, key):
+        return os.path.join(self.path, key + ".manifest")
+
+    def __read(self, key, count=True):
+        """
+        Load an entry from disk, marking it as recently used.
+
+        An entry that cannot be read is removed, and treated as a miss.
+        """
+
+        path = self.__path(key)
+
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(self.HEADER)) != self.HEADER:
+                    raise ValueError("%s is not a manifest cache entry" % path)
+
+                entry = json.loads(f.read().decode("utf-8"))
+
+            if not isinstance(entry, dict) or not isinstance(entry.get("xml"), str):
+                raise ValueError("%s is not a manifest cache entry" % path)
+
+            os.utime(path)
+        except FileNotFoundError:
+            entry = None
+        except Exception:
+            self.__remove(path)
+
+            entry = None
+
+        if count and entry is not None:
+            self.hits += 1
+        elif count:
+            self.misses += 1
+
+        return entry
+
+    def __remove(self, path):
+        try:
+            size = os.stat(path).st_size
+
+            os.remove(path)
+        except OSError:
+            return
+
+        if self.__size is not None:
+            self.__size -= size
+
+    def __write(self, key, entry):
+        """
+        Write an entry to disk, and evict old entries if the cache has grown
+        too large.
+
+        The entry is written to a temporary file and renamed into place, so a
+        concurrent reader never sees a partial entry.
+        """
+
+        os.makedirs(self.path, exist_ok=True)
+
+        path = self.__path(key)
+        temp = "%s.%d" % (path, os.getpid())
+        size = self.size()
+
+        with open(temp, "wb") as f:
+            f.write(self.HEADER)
+            f.write(json.dumps(entry).encode("utf-8"))
+
+        try:
+            size -= os.stat(path).st_size
+        except OSError:
+            pass
+
+        os.replace(temp, path)
+
+        self.__size = size + os.stat(path).st_size
+
+        if self.__size > self.max_size:
+            self.__evict()
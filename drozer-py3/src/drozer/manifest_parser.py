@@ -11,7 +11,9 @@ class XmlCompact:
         self.xmlET: ET.Element = xml
 
     def __getattr__(self, item: str):
-        if item in ['xmlET'] or item.startswith("__") and item.endswith("__"):
+        if item.startswith("__") and item.endswith("__"):
+            raise AttributeError(item)
+        if item in ['xmlET']:
             return None
         try:
             return self.xmlET.attrib[ANDROID_PREFIX + item]
@@ -1,6 +1,7 @@
 import xml.etree.ElementTree as ET
 
 from drozer import android
+from drozer.axml import AxmlFormatException
 from drozer.modules import common, Module
 from drozer.manifest_parser import Activity, Manifest
 
@@ -66,6 +67,7 @@ class Info(common.IntentFilter, common.PackageManager, common.Assets, common.Cla
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", default=None, help="specify the package to inspect")
+        parser.add_argument("--local", action="store_true", default=False, help="decode manifests on this machine, from APKs pulled into the local APK store")
         parser.add_argument("-f", "--filter", default=None, help="specify a filter term for the activity name")
         parser.add_argument("-i", "--show-intent-filters", action="store_true", default=False, help="specify whether to include intent filters")
         parser.add_argument("-u", "--unexported", action="store_true", default=False, help="include activities that are not exported")
@@ -76,16 +78,16 @@ class Info(common.IntentFilter, common.PackageManager, common.Assets, common.Cla
             for j_package in self.packageManager().getPackages():
                 package = str(j_package.packageName)
                 try:
-                    m = Manifest(self.getAndroidManifest(package), False, has_activity=True)
+                    m = self.getManifest(package, False, package_info=j_package, has_activity=True, local=arguments.local)
                     self.__get_activities(arguments, m)
-                except ET.ParseError as e:
+                except (ET.ParseError, AxmlFormatException) as e:
                     self.stderr.write("%s cannot parse manifest. %s" % (package, e))
         else:
             package = arguments.package
             try:
-                m = Manifest(self.getAndroidManifest(package), False, has_activity=True)
+                m = self.getManifest(package, False, has_activity=True, local=arguments.local)
                 self.__get_activities(arguments, m)
-            except ET.ParseError as e:
+            except (ET.ParseError, AxmlFormatException) as e:
                 self.stderr.write("%s cannot parse manifest. %s" % (package, e))
 
     def __get_activities(self, arguments, manifest: Manifest):
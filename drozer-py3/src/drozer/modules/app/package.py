@@ -1,8 +1,8 @@
 import xml.etree.ElementTree as ET
 
 from drozer import android
+from drozer.axml import AxmlFormatException
 from drozer.modules import common, Module
-from drozer.manifest_parser import Manifest as _ManifestParser
 
 class AttackSurface(common.Assets, common.PackageManager, common.ClassLoader, Module):
     name = "Get attack surface of package"
@@ -30,13 +30,14 @@ class AttackSurface(common.Assets, common.PackageManager, common.ClassLoader, Mo
     def add_arguments(self, parser):
         parser.add_argument("package",  help="the identifier of the package to inspect")
         parser.add_argument("-i", "--info", type=bool, default=False, help="show all attack info")
+        parser.add_argument("--local", action="store_true", default=False, help="decode manifests on this machine, from APKs pulled into the local APK store")
 
     def execute(self, arguments):
         if arguments.package is not None:
             j_packageInfo = self.packageManager().getPackageInfo(arguments.package, common.PackageManager.GET_ACTIVITIES | common.PackageManager.GET_RECEIVERS | common.PackageManager.GET_PROVIDERS | common.PackageManager.GET_SERVICES)
             j_applicationInfo = j_packageInfo.applicationInfo
             try:
-                m = _ManifestParser(self.getAndroidManifest(arguments.package), True)
+                m = self.getManifest(arguments.package, True, package_info=j_packageInfo, local=arguments.local)
                 self.stdout.write("Attack Surface:\n")
                 self.stdout.write("  %d activities exported\n" % sum(e.is_exported() for e in m.application.activities))
                 self.stdout.write("  %d broadcast receivers exported\n" % sum(e.is_exported() for e in m.application.receivers))
@@ -47,7 +48,7 @@ class AttackSurface(common.Assets, common.PackageManager, common.ClassLoader, Mo
                     self.show_info(m.application.receivers, 'receivers')
                     self.show_info(m.application.providers, 'providers')
                     self.show_info(m.application.services, 'services')
-            except ET.ParseError as e:
+            except (ET.ParseError, AxmlFormatException) as e:
                 self.stderr.write("%s cannot parse manifest. %s" % (arguments.package, e))
 
             if (j_applicationInfo.flags & j_applicationInfo.FLAG_DEBUGGABLE) != 0:
@@ -116,11 +117,15 @@ Finding all packages with the "INSTALL_PACKAGES" permission:
         parser.add_argument("-i", "--show-intent-filters", action="store_true", default=False , help="show intent filters")
 
     def execute(self, arguments):
+        fields = ["activities", "dataDir", "gids", "label", "packageName", "permissions", "processName", "publicSourceDir",
+                  "requestedPermissions", "services", "sharedLibraryFiles", "sharedUserId", "uid", "versionName"]
+        flags = common.PackageManager.GET_PERMISSIONS | common.PackageManager.GET_CONFIGURATIONS | common.PackageManager.GET_GIDS | common.PackageManager.GET_SHARED_LIBRARY_FILES | common.PackageManager.GET_ACTIVITIES
+
         if arguments.package is None:
-            for package in self.packageManager().getPackages(common.PackageManager.GET_PERMISSIONS | common.PackageManager.GET_CONFIGURATIONS | common.PackageManager.GET_GIDS | common.PackageManager.GET_SHARED_LIBRARY_FILES | common.PackageManager.GET_ACTIVITIES):
+            for package in self.packageManager().getPackageRecords(fields, flags):
                self.__get_package(arguments, package) 
         else:
-            package = self.packageManager().getPackageInfo(arguments.package, common.PackageManager.GET_PERMISSIONS | common.PackageManager.GET_CONFIGURATIONS | common.PackageManager.GET_GIDS | common.PackageManager.GET_SHARED_LIBRARY_FILES | common.PackageManager.GET_ACTIVITIES)
+            package = self.packageManager().getPackageRecord(arguments.package, fields, flags)
             self.__get_package(arguments, package)
             
     def get_completion_suggestions(self, action, text, **kwargs):
@@ -142,15 +147,26 @@ Finding all packages with the "INSTALL_PACKAGES" permission:
                 for data in intent_filter.datas:
                     self.stdout.write("      - %s\n" % data)
 
+    def __format(self, value):
+        """
+        Format a field of a PackageRecord as the Java value would be shown.
+        """
+
+        if value is None:
+            return "null"
+        elif isinstance(value, list):
+            return "[%s]" % ", ".join(str(v) for v in value)
+        else:
+            return str(value)
+
     def __get_package(self, arguments, package):
-        application = package.applicationInfo
         activities = package.activities
         services = package.services
 
         intent_matches = not (arguments.show_intent_filters and arguments.filter)
 
         if not intent_matches and arguments.filter is not None:
-            if activities.__ne__(None):
+            if activities is not None:
                 for activity in activities:
                     if not intent_matches:
                         for intent_filter in self.find_intent_filters(activity, 'activity'):
@@ -174,7 +190,7 @@ Finding all packages with the "INSTALL_PACKAGES" permission:
                     else:
                         break
 
-            if services.__ne__(None):
+            if services is not None:
                 for service in services:
                     if not intent_matches:
                         for intent_filter in self.find_intent_filters(service, 'service'):
@@ -198,37 +214,37 @@ Finding all packages with the "INSTALL_PACKAGES" permission:
                     else:
                         break
 
-        if (arguments.defines_permission is None or package.permissions.__ne__(None) and any(p.name.upper().find(arguments.defines_permission.upper()) >= 0 for p in package.permissions)) \
+        if (arguments.defines_permission is None or package.permissions is not None and any(p.name.upper().find(arguments.defines_permission.upper()) >= 0 for p in package.permissions)) \
                 and (arguments.filter is None
                      or package.packageName.upper().find(arguments.filter.upper()) >= 0
-                     or self.packageManager().getApplicationLabel(package.packageName).upper().find(arguments.filter.upper()) >= 0) \
-                and (arguments.gid is None or package.gids.__ne__(None) and any(g == int(arguments.gid) for g in package.gids)) \
-                and (arguments.permission is None or package.requestedPermissions.__ne__(None) and any(p.upper().find(arguments.permission.upper()) >= 0 for p in package.requestedPermissions)) \
-                and (arguments.uid is None or arguments.uid == str(package.applicationInfo.uid)) \
+                     or package.label is not None and package.label.upper().find(arguments.filter.upper()) >= 0) \
+                and (arguments.gid is None or package.gids is not None and any(g == int(arguments.gid) for g in package.gids)) \
+                and (arguments.permission is None or package.requestedPermissions is not None and any(p.upper().find(arguments.permission.upper()) >= 0 for p in package.requestedPermissions)) \
+                and (arguments.uid is None or arguments.uid == str(package.uid)) \
                 and intent_matches:
-            self.stdout.write("Package: %s\n" % application.packageName)
-            self.stdout.write("  Application Label: %s\n" % self.packageManager().getApplicationLabel(application.packageName))
-            self.stdout.write("  Process Name: %s\n" % application.processName)
-            self.stdout.write("  Version: %s\n" % package.versionName)
-            self.stdout.write("  Data Directory: %s\n" % application.dataDir)
-            self.stdout.write("  APK Path: %s\n" % application.publicSourceDir)
-            self.stdout.write("  UID: %s\n" % application.uid)
-            if package.gids.__ne__(None):
-                self.stdout.write("  GID: %s\n" % package.gids)
+            self.stdout.write("Package: %s\n" % package.packageName)
+            self.stdout.write("  Application Label: %s\n" % self.__format(package.label))
+            self.stdout.write("  Process Name: %s\n" % self.__format(package.processName))
+            self.stdout.write("  Version: %s\n" % self.__format(package.versionName))
+            self.stdout.write("  Data Directory: %s\n" % self.__format(package.dataDir))
+            self.stdout.write("  APK Path: %s\n" % self.__format(package.publicSourceDir))
+            self.stdout.write("  UID: %s\n" % package.uid)
+            if package.gids is not None:
+                self.stdout.write("  GID: %s\n" % self.__format(package.gids))
             else:
                 self.stdout.write("  GID: None\n")
-            self.stdout.write("  Shared Libraries: %s\n" % application.sharedLibraryFiles)
-            self.stdout.write("  Shared User ID: %s\n" % package.sharedUserId)
+            self.stdout.write("  Shared Libraries: %s\n" % self.__format(package.sharedLibraryFiles))
+            self.stdout.write("  Shared User ID: %s\n" % self.__format(package.sharedUserId))
             self.stdout.write("  Uses Permissions:\n")
-            if package.requestedPermissions.__ne__(None):
+            if package.requestedPermissions is not None:
                 for permission in package.requestedPermissions:
                     self.stdout.write("  - %s\n" % permission)
             else:
                 self.stdout.write("  - None\n")
             self.stdout.write("  Defines Permissions:\n")
-            if package.permissions.__ne__(None):
+            if package.permissions is not None:
                 for permission in package.permissions:
-                    permissionInfo = self.singlePermissionInfo(str(permission.name))
+                    permissionInfo = self.singlePermissionInfo(permission.name)
                     if permissionInfo is None:
                         self.stdout.write("  - %s\n" % (permission.name))
                     else:
@@ -239,7 +255,7 @@ Finding all packages with the "INSTALL_PACKAGES" permission:
                 ifcount = 0
                 self.stdout.write("  Intent Filters:\n")
 
-                if activities.__ne__(None):
+                if activities is not None:
                     for activity in activities:
                        intent_filters = self.find_intent_filters(activity, 'activity')
                        if len(intent_filters) > 0:
@@ -248,7 +264,7 @@ Finding all packages with the "INSTALL_PACKAGES" permission:
                            self.stdout.write("  - %s\n" % activity.name)
                            self.__print_intent_filters(intent_filters)
 
-                if services.__ne__(None):
+                if services is not None:
                     for service in services:
                         intent_filters = self.find_intent_filters(service, 'service')
                         if len(intent_filters) > 0:
@@ -366,23 +382,26 @@ class List(common.PackageManager, common.ClassLoader, Module):
         parser.add_argument("-n", "--no_app_name", action="store_true", default=False, help="do not print the app name")
 
     def execute(self, arguments):
-        for package in self.packageManager().getPackages(common.PackageManager.GET_PERMISSIONS | common.PackageManager.GET_CONFIGURATIONS | common.PackageManager.GET_GIDS | common.PackageManager.GET_SHARED_LIBRARY_FILES):
+        fields = ["packageName", "permissions", "gids", "requestedPermissions", "uid"]
+
+        if arguments.filter is not None or not arguments.no_app_name:
+            fields.append("label")
+
+        for package in self.packageManager().getPackageRecords(fields, common.PackageManager.GET_PERMISSIONS | common.PackageManager.GET_GIDS):
             self.__get_package(arguments, package)
 
     def __get_package(self, arguments, package):
-        application = package.applicationInfo
-
-        if (arguments.defines_permission is None or package.permissions.__ne__(None) and any(p.name.upper().find(arguments.defines_permission.upper()) >= 0 for p in package.permissions)) \
+        if (arguments.defines_permission is None or package.permissions is not None and any(p.name.upper().find(arguments.defines_permission.upper()) >= 0 for p in package.permissions)) \
                 and (arguments.filter is None
                      or package.packageName.upper().find(arguments.filter.upper()) >= 0
-                     or self.packageManager().getApplicationLabel(application.packageName).upper().find(arguments.filter.upper()) >= 0) \
-                and (arguments.gid is None or package.gids.__ne__(None) and any(g == int(arguments.gid) for g in package.gids)) \
-                and (arguments.permission is None or package.requestedPermissions.__ne__(None) and any(p.upper().find(arguments.permission.upper()) >= 0 for p in package.requestedPermissions)) \
-                and (arguments.uid is None or arguments.uid == str(package.applicationInfo.uid)):
+                     or package.label is not None and package.label.upper().find(arguments.filter.upper()) >= 0) \
+                and (arguments.gid is None or package.gids is not None and any(g == int(arguments.gid) for g in package.gids)) \
+                and (arguments.permission is None or package.requestedPermissions is not None and any(p.upper().find(arguments.permission.upper()) >= 0 for p in package.requestedPermissions)) \
+                and (arguments.uid is None or arguments.uid == str(package.uid)):
             if arguments.no_app_name:
-                self.stdout.write("%s\n" % application.packageName)
+                self.stdout.write("%s\n" % package.packageName)
             else:
-                self.stdout.write("%s (%s)\n" % (application.packageName, self.packageManager().getApplicationLabel(application.packageName)))
+                self.stdout.write("%s (%s)\n" % (package.packageName, package.label))
                 
 
 class Manifest(common.Assets, Module):
@@ -409,12 +428,20 @@ class Manifest(common.Assets, Module):
 
     def add_arguments(self, parser):
         parser.add_argument("package", help="the identifier of the package")
+        parser.add_argument("--local", action="store_true", default=False, help="pull the APK into the local APK store, and decode the manifest on this machine")
+        parser.add_argument("--benchmark", action="store_true", default=False, help="time decoding the manifest on the device against decoding it locally")
 
     def execute(self, arguments):
         if arguments.package is None or arguments.package == "":
             self.stderr.write("No package provided.\n")
+        elif arguments.benchmark:
+            timings = self.compareManifestDecoders(arguments.package, repeat=3)
+
+            self.stdout.write("Pull APK:      %8.1f ms\n" % (timings["pull"] * 1000))
+            self.stdout.write("Device decode: %8.1f ms\n" % (timings["device"] * 1000))
+            self.stdout.write("Local decode:  %8.1f ms\n" % (timings["local"] * 1000))
         else:
-            self.stdout.write(self.getAndroidManifest(arguments.package))
+            self.stdout.write(self.getAndroidManifest(arguments.package, local=arguments.local))
 
 
 class Native(common.PackageManager, common.ClassLoader, Module):
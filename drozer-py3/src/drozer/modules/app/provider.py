@@ -2,6 +2,7 @@ import os
 import xml.etree.ElementTree as ET
 
 from drozer import android
+from drozer.axml import AxmlFormatException
 from drozer.modules import common, Module
 from drozer.manifest_parser import Provider, Manifest
 
@@ -119,9 +120,10 @@ This module uses a number of strategies to identify a content URI, including ins
 
     def add_arguments(self, parser):
         parser.add_argument("package", help="the package to search for content provider uris")
+        parser.add_argument("--local", action="store_true", default=False, help="pull each APK into the local APK store, and search all of its DEX files on this machine")
 
     def execute(self, arguments):
-        uris = self.findAllContentUris(arguments.package)
+        uris = self.findAllContentUris(arguments.package, local=arguments.local)
         
         if len(uris) > 0:
             for uri in uris:
@@ -173,6 +175,7 @@ Finding content providers that do not require permissions to read/write:
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", default=None, help="specify the package to inspect")
+        parser.add_argument("--local", action="store_true", default=False, help="decode manifests on this machine, from APKs pulled into the local APK store")
         parser.add_argument("-f", "--filter", default=None, help="specify filter conditions")
         parser.add_argument("-p", "--permission", default=None, help="specify permission conditions")
         parser.add_argument("-u", "--unexported", action="store_true", default=False, help="include providers that are not exported")
@@ -183,16 +186,16 @@ Finding content providers that do not require permissions to read/write:
             for j_package in self.packageManager().getPackages():
                 package = str(j_package.packageName)
                 try:
-                    m = Manifest(self.getAndroidManifest(package), False, has_provider=True)
+                    m = self.getManifest(package, False, package_info=j_package, has_provider=True, local=arguments.local)
                     self.__get_providers(arguments, m)
-                except ET.ParseError as e:
+                except (ET.ParseError, AxmlFormatException) as e:
                     self.stderr.write("%s cannot parse manifest. %s" % (package, e))
         else:
             package = arguments.package
             try:
-                m = Manifest(self.getAndroidManifest(package), False, has_provider=True)
+                m = self.getManifest(package, False, has_provider=True, local=arguments.local)
                 self.__get_providers(arguments, m)
-            except ET.ParseError as e:
+            except (ET.ParseError, AxmlFormatException) as e:
                 self.stderr.write("%s cannot parse manifest. %s" % (package, e))
 
     def get_completion_suggestions(self, action, text, **kwargs):
@@ -381,7 +384,13 @@ Querying, with a WHERE clause in the SELECT statement:
                 --selection-args 10
     
     | _id | name                                    | value   |
-    | 10  | sys_storage_full_threshold_bytes        | 2097152 |"""
+    | 10  | sys_storage_full_threshold_bytes        | 2097152 |
+
+Querying a page of results, from a large table:
+
+    dz> run app.provider.query content://settings/secure
+                --offset 100
+                --limit 50"""
     author = "MWR InfoSecurity (@mwrlabs)"
     date = "2012-11-06"
     license = "BSD (3 clause)"
@@ -394,13 +403,15 @@ Querying, with a WHERE clause in the SELECT statement:
         parser.add_argument("--selection", default=None, metavar="conditions", help="the conditions to apply to the query, as in \"WHERE <conditions>\"")
         parser.add_argument("--selection-args", default=None, metavar="arg", nargs="*", help="any parameters to replace '?' in --selection")
         parser.add_argument("--order", default=None, metavar="by_column", help="the column to order results by")
+        parser.add_argument("--limit", default=None, metavar="rows", type=int, help="the maximum number of rows to show")
+        parser.add_argument("--offset", default=0, metavar="rows", type=int, help="the number of rows to skip, before showing results")
         parser.add_argument("--vertical", action="store_true", default=False)
 
     def execute(self, arguments):
         c = self.contentResolver().query(arguments.uri, arguments.projection, arguments.selection, arguments.selection_args, arguments.order)
 
         if c.__ne__(None):
-            rows = self.getResultSet(c)
+            rows = self.getResultSet(c, offset=arguments.offset, limit=arguments.limit)
 
             self.print_table(rows, show_headers=True, vertical=arguments.vertical)
         else:
@@ -1,6 +1,7 @@
 import xml.etree.ElementTree as ET
 
 from drozer import android
+from drozer.axml import AxmlFormatException
 from drozer.modules import common, Module
 from drozer.manifest_parser import Service, Manifest
 
@@ -36,6 +37,7 @@ List exported services with no permissions required to interact with it:
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", default=None, help="specify the package to inspect")
+        parser.add_argument("--local", action="store_true", default=False, help="decode manifests on this machine, from APKs pulled into the local APK store")
         parser.add_argument("-f", "--filter", metavar='<filter>')
         parser.add_argument("-i", "--show-intent-filters", action="store_true", default=False, help="specify whether to include intent filters")
         parser.add_argument("-p", "--permission", metavar='<filter>')
@@ -47,16 +49,16 @@ List exported services with no permissions required to interact with it:
             for j_package in self.packageManager().getPackages():
                 package = str(j_package.packageName)
                 try:
-                    m = Manifest(self.getAndroidManifest(package), False, has_service=True)
+                    m = self.getManifest(package, False, package_info=j_package, has_service=True, local=arguments.local)
                     self.__get_services(arguments, m)
-                except ET.ParseError as e:
+                except (ET.ParseError, AxmlFormatException) as e:
                     self.stderr.write("%s cannot parse manifest. %s" % (package, e))
         else:
             package = arguments.package
             try:
-                m = Manifest(self.getAndroidManifest(package), False, has_service=True)
+                m = self.getManifest(package, False, has_service=True, local=arguments.local)
                 self.__get_services(arguments, m)
-            except ET.ParseError as e:
+            except (ET.ParseError, AxmlFormatException) as e:
                 self.stderr.write("%s cannot parse manifest. %s" % (package, e))
 
     def get_completion_suggestions(self, action, text, **kwargs):
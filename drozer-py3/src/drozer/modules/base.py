@@ -36,6 +36,7 @@ class Module(object):
             self.modules = session.modules
             self.reflector = session.reflector
             self.ftp = session.ftp
+            self.memo = session.memo
             self.stdout = session.stdout
             self.stderr = session.stderr
             self.variables = session.variables
@@ -3,12 +3,14 @@ import itertools
 from mwr.common.list import flatten
 
 from drozer.modules import base
+from drozer.modules.trie import ModuleTrie
 
 class ModuleCollection(object):
 
     def __init__(self, loader):
         self.__base = base.Module
         self.__loader = loader
+        self.__tries = None
 
     def all(self, contains=None, permissions=None, prefix=None,exploit=None, module_type="drozer"):
         """
@@ -16,17 +18,10 @@ class ModuleCollection(object):
         collection of module identifiers.
         """
 
-        modules = self.__loader.all(self.__base)
-        modules = [m for m in modules if self.get(m).module_type == module_type]
+        modules = self.__trie(module_type).find(prefix or "", contains, permissions)
 
-        if contains is not None:
-            modules = [m for m in modules if m.find(contains.lower()) >= 0]
-        if permissions is not None:
-            modules = [m for m in modules if len(set(self.get(m).permissions).difference(permissions)) == 0]
-        if prefix is not None:
-            modules = [m for m in modules if m.startswith(prefix)]
         if module_type =="payload" and exploit is not None:
-            modules = [m for m in modules if m in self.get(exploit).payloads]
+            modules = [m for m in modules if m in self.info(exploit).payloads]
 
         return modules
 
@@ -36,7 +31,7 @@ class ModuleCollection(object):
         they have authored (in descending order).
         """
 
-        contributors = [self.get(m).author for m in self.all()]
+        contributors = [self.info(m).author for m in self.all()]
         contribution = [(c[0], len(list(c[1]))) for c in itertools.groupby(sorted(flatten(contributors)))]
 
         return [c[0] for c in sorted(contribution, key=lambda c: -c[1])]
@@ -48,6 +43,22 @@ class ModuleCollection(object):
 
         return self.__loader.get(self.__base, key)
 
+    def namespaces(self, permissions=None, prefix=None, module_type="drozer"):
+        """
+        Returns the namespaces that contain modules, optionally limited to
+        those beneath prefix and the modules that need only permissions.
+        """
+
+        return self.__trie(module_type).namespaces(prefix or "", permissions)
+
+    def info(self, key):
+        """
+        Gets the metadata of a module, given its identifier, without importing
+        its implementation.
+        """
+
+        return self.__loader.info(self.__base, key)
+
     def reload(self):
         """
         Reload all modules.
@@ -55,3 +66,31 @@ class ModuleCollection(object):
 
         self.__loader.reload()
 
+        if self.__tries is not None:
+            self.__build()
+
+    def __build(self):
+        """
+        Index the modules by type, in a ModuleTrie for each type. Existing
+        tries are updated in place, so only the modules that have changed are
+        reindexed.
+        """
+
+        modules = {}
+
+        for m in self.__loader.all(self.__base):
+            info = self.info(m)
+            modules.setdefault(info.module_type, {})[m] = info.permissions
+
+        if self.__tries is None:
+            self.__tries = {}
+
+        for module_type in set(self.__tries.keys()).union(modules.keys()):
+            self.__tries.setdefault(module_type, ModuleTrie()).update(modules.get(module_type, {}))
+
+    def __trie(self, module_type):
+        if self.__tries is None:
+            self.__build()
+
+        return self.__tries.get(module_type) or ModuleTrie()
+
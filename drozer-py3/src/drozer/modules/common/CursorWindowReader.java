@@ -0,0 +1,112 @@
+import java.io.ByteArrayOutputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+
+import android.database.Cursor;
+
+public class CursorWindowReader {
+
+	public static final int NULL = 0;
+	public static final int INTEGER = 1;
+	public static final int FLOAT = 2;
+	public static final int STRING = 3;
+	public static final int BLOB = 4;
+
+	/*
+	 * Serialize up to count rows of a cursor, starting at position, into a
+	 * single buffer:
+	 *
+	 *   int rows, then for each field: byte type, followed by a long (INTEGER),
+	 *   a double (FLOAT) or an int length and that many bytes (STRING, as UTF-8,
+	 *   or BLOB).
+	 */
+	public static byte[] read(Cursor cursor, int position, int count) throws IOException {
+		ByteArrayOutputStream fields = new ByteArrayOutputStream();
+		DataOutputStream out = new DataOutputStream(fields);
+
+		int columns = cursor.getColumnCount();
+		int rows = 0;
+
+		if (cursor.moveToPosition(position)) {
+			while (rows < count && !cursor.isAfterLast()) {
+				for (int i = 0; i < columns; i++)
+					write(out, cursor, i);
+
+				rows++;
+				cursor.moveToNext();
+			}
+		}
+
+		out.flush();
+
+		ByteArrayOutputStream output = new ByteArrayOutputStream(fields.size() + 4);
+		DataOutputStream header = new DataOutputStream(output);
+
+		header.writeInt(rows);
+		fields.writeTo(header);
+		header.flush();
+
+		return output.toByteArray();
+	}
+
+	private static int type(Cursor cursor, int i) {
+		try {
+			return cursor.getType(i);
+		}
+		catch (Throwable e) {
+			// getType is not available before API 11, so read the value as a String
+			return Cursor.FIELD_TYPE_STRING;
+		}
+	}
+
+	private static void write(DataOutputStream out, Cursor cursor, int i) throws IOException {
+		switch (type(cursor, i)) {
+		case Cursor.FIELD_TYPE_NULL:
+			out.writeByte(NULL);
+			break;
+
+		case Cursor.FIELD_TYPE_INTEGER:
+			out.writeByte(INTEGER);
+			out.writeLong(cursor.getLong(i));
+			break;
+
+		case Cursor.FIELD_TYPE_FLOAT:
+			out.writeByte(FLOAT);
+			out.writeDouble(cursor.getDouble(i));
+			break;
+
+		case Cursor.FIELD_TYPE_BLOB:
+			writeBytes(out, BLOB, cursor.getBlob(i));
+			break;
+
+		default:
+			String value;
+
+			try {
+				value = cursor.getString(i);
+			}
+			catch (Exception e) {
+				writeBytes(out, BLOB, cursor.getBlob(i));
+				break;
+			}
+
+			if (value == null)
+				out.writeByte(NULL);
+			else
+				writeBytes(out, STRING, value.getBytes("UTF-8"));
+			break;
+		}
+	}
+
+	private static void writeBytes(DataOutputStream out, int type, byte[] bytes) throws IOException {
+		if (bytes == null) {
+			out.writeByte(NULL);
+		}
+		else {
+			out.writeByte(type);
+			out.writeInt(bytes.length);
+			out.write(bytes);
+		}
+	}
+
+}
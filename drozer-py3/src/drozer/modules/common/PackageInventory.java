@@ -0,0 +1,173 @@
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Enumeration;
+import java.util.HashSet;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipFile;
+
+import android.content.pm.ApplicationInfo;
+import android.content.pm.PackageInfo;
+import android.content.pm.PackageItemInfo;
+import android.content.pm.PackageManager;
+import android.content.pm.PackageManager.NameNotFoundException;
+import org.json.JSONArray;
+import org.json.JSONException;
+import org.json.JSONObject;
+
+class PackageInventory {
+
+	/*
+	 * Collect the named fields of every installed package, fetched with flags,
+	 * into a single JSON array of objects. fields is a comma-separated list of
+	 * the names of PackageInfo and ApplicationInfo fields, along with "label"
+	 * (the application label) and "nativeLibraries" (the .so files bundled in
+	 * the APK).
+	 */
+	public static String list(PackageManager pm, int flags, String fields) throws JSONException {
+		HashSet<String> names = new HashSet<String>(Arrays.asList(fields.split(",")));
+		JSONArray packages = new JSONArray();
+
+		for (PackageInfo info : pm.getInstalledPackages(flags))
+			packages.put(project(pm, info, names));
+
+		return packages.toString();
+	}
+
+	/*
+	 * Collect the named fields of a single package, as a JSON object.
+	 */
+	public static String single(PackageManager pm, String packageName, int flags, String fields) throws JSONException, NameNotFoundException {
+		HashSet<String> names = new HashSet<String>(Arrays.asList(fields.split(",")));
+
+		return project(pm, pm.getPackageInfo(packageName, flags), names).toString();
+	}
+
+	private static JSONObject project(PackageManager pm, PackageInfo info, HashSet<String> names) throws JSONException {
+		ApplicationInfo application = info.applicationInfo;
+		JSONObject record = new JSONObject();
+
+		for (String name : names) {
+			if (name.equals("activities"))
+				record.put(name, items(info.activities));
+			else if (name.equals("firstInstallTime"))
+				record.put(name, info.firstInstallTime);
+			else if (name.equals("gids"))
+				record.put(name, ints(info.gids));
+			else if (name.equals("lastUpdateTime"))
+				record.put(name, info.lastUpdateTime);
+			else if (name.equals("packageName"))
+				record.put(name, info.packageName);
+			else if (name.equals("permissions"))
+				record.put(name, items(info.permissions));
+			else if (name.equals("providers"))
+				record.put(name, items(info.providers));
+			else if (name.equals("receivers"))
+				record.put(name, items(info.receivers));
+			else if (name.equals("requestedPermissions"))
+				record.put(name, strings(info.requestedPermissions));
+			else if (name.equals("services"))
+				record.put(name, items(info.services));
+			else if (name.equals("sharedUserId"))
+				record.put(name, value(info.sharedUserId));
+			else if (name.equals("versionCode"))
+				record.put(name, info.versionCode);
+			else if (name.equals("versionName"))
+				record.put(name, value(info.versionName));
+			else if (application == null)
+				record.put(name, JSONObject.NULL);
+			else if (name.equals("dataDir"))
+				record.put(name, value(application.dataDir));
+			else if (name.equals("flags"))
+				record.put(name, application.flags);
+			else if (name.equals("label"))
+				record.put(name, value(pm.getApplicationLabel(application)));
+			else if (name.equals("nativeLibraries"))
+				record.put(name, strings(nativeLibraries(application)));
+			else if (name.equals("nativeLibraryDir"))
+				record.put(name, value(application.nativeLibraryDir));
+			else if (name.equals("processName"))
+				record.put(name, value(application.processName));
+			else if (name.equals("publicSourceDir"))
+				record.put(name, value(application.publicSourceDir));
+			else if (name.equals("sharedLibraryFiles"))
+				record.put(name, strings(application.sharedLibraryFiles));
+			else if (name.equals("sourceDir"))
+				record.put(name, value(application.sourceDir));
+			else if (name.equals("targetSdkVersion"))
+				record.put(name, application.targetSdkVersion);
+			else if (name.equals("uid"))
+				record.put(name, application.uid);
+		}
+
+		return record;
+	}
+
+	private static Object ints(int[] values) {
+		if (values == null)
+			return JSONObject.NULL;
+
+		JSONArray array = new JSONArray();
+
+		for (int value : values)
+			array.put(value);
+
+		return array;
+	}
+
+	private static Object items(PackageItemInfo[] items) throws JSONException {
+		if (items == null)
+			return JSONObject.NULL;
+
+		JSONArray array = new JSONArray();
+
+		for (PackageItemInfo item : items) {
+			JSONObject object = new JSONObject();
+			object.put("name", item.name);
+			object.put("packageName", item.packageName);
+			array.put(object);
+		}
+
+		return array;
+	}
+
+	private static String[] nativeLibraries(ApplicationInfo application) {
+		ArrayList<String> libraries = new ArrayList<String>();
+
+		try {
+			ZipFile zip_file = new ZipFile(application.publicSourceDir);
+			Enumeration<? extends ZipEntry> entries = zip_file.entries();
+
+			while (entries.hasMoreElements()) {
+				String name = entries.nextElement().getName();
+
+				if (name.toUpperCase().endsWith(".SO"))
+					libraries.add(name);
+			}
+
+			zip_file.close();
+		}
+		catch (IOException e) {
+			// the APK cannot be read, so report no bundled libraries
+		}
+
+		return libraries.toArray(new String[libraries.size()]);
+	}
+
+	private static Object strings(String[] values) {
+		if (values == null)
+			return JSONObject.NULL;
+
+		JSONArray array = new JSONArray();
+
+		for (String value : values)
+			array.put(value);
+
+		return array;
+	}
+
+	private static Object value(Object value) {
+		return value == null ? JSONObject.NULL : value.toString();
+	}
+
+}
@@ -1,14 +1,121 @@
-from . import loader
+import time
 
-class Assets(loader.ClassLoader):
+from pydiesel.reflection import ReflectionException
+
+from drozer.axml import ApkManifest, AxmlFormatException
+from drozer.manifest_cache import ManifestCache
+from drozer.manifest_parser import Manifest
+
+from . import file_system, loader
+
+class Assets(file_system.FileSystem, loader.ClassLoader):
     """
     Utility methods for interacting with the Android Asset Manager.
     """
 
-    def getAndroidManifest(self, package) -> str:
+    __fingerprint = None
+    __manifest_cache = None
+
+    def compareManifestDecoders(self, package, repeat=1):
+        """
+        Time decoding a package's AndroidManifest.xml on the device, and
+        locally from the APK store, bypassing the manifest cache.
+
+        Returns the mean seconds taken by each, and the time taken to pull the
+        APK into the store (which is 0 if it was already there).
+        """
+
+        start = time.perf_counter()
+        path = self.__pullPackage(package, None)
+        pull = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            Manifest(self.__decodeAndroidManifest(package))
+        device = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            Manifest(ApkManifest(path).element())
+        local = (time.perf_counter() - start) / repeat
+
+        return { "device": device, "local": local, "pull": pull }
+
+    def getAndroidManifest(self, package, package_info=None, local=False) -> str:
         """
         Extract the AndroidManifest.xml file from a package on the device, and
         recover it as an XML representation.
+
+        Decoded manifests are kept in the manifest cache, until the package is
+        updated. Pass the package's PackageInfo, if it is already to hand, to
+        save looking it up.
+
+        If local is set, the APK is pulled into the local APK store and its
+        manifest is decoded on this machine, rather than by the Agent.
+        """
+
+        if local:
+            return ApkManifest(self.__pullPackage(package, package_info)).xml()
+
+        key = self.__manifestKey(package, package_info)
+
+        if key is not None:
+            xml = self.manifestCache().get(key)
+
+            if xml is not None:
+                return xml
+
+        xml = self.__decodeAndroidManifest(package)
+
+        if key is not None:
+            self.manifestCache().put(key, xml)
+
+        return xml
+
+    def getManifest(self, package, all_node=True, package_info=None, local=False, **components) -> Manifest:
+        """
+        Get the parsed AndroidManifest.xml of a package on the device.
+
+        The arguments are passed to manifest_parser.Manifest, and the parsed
+        Manifest is kept in the manifest cache alongside the XML.
+
+        If local is set, the manifest is decoded from the local APK store
+        straight into the Manifest, without a round trip through XML text.
+        """
+
+        key = self.__manifestKey(package, package_info, local)
+        options = (all_node,) + tuple(sorted(components.items()))
+
+        if key is not None:
+            manifest = self.manifestCache().getManifest(key, options)
+
+            if manifest is not None:
+                return manifest
+
+        if local:
+            manifest = Manifest(ApkManifest(self.__pullPackage(package, package_info)).element(), all_node, **components)
+        else:
+            manifest = Manifest(self.getAndroidManifest(package, package_info), all_node, **components)
+
+        if key is not None:
+            self.manifestCache().putManifest(key, options, manifest)
+
+        return manifest
+
+    @classmethod
+    def manifestCache(cls) -> ManifestCache:
+        """
+        Get the cache of decoded manifests.
+        """
+
+        if Assets.__manifest_cache is None:
+            Assets.__manifest_cache = ManifestCache.default()
+
+        return Assets.__manifest_cache
+
+    def __decodeAndroidManifest(self, package) -> str:
+        """
+        Decode the AndroidManifest.xml file of a package with the APK analyzer.
         """
         # https://github.com/LeadroyaL/ShrinkApkAnalyzer
         ApkAnalyzerCli = self.loadClass("common/shrink.apk", "com.android.tools.apk.analyzer.ApkAnalyzerCli")
@@ -36,6 +143,46 @@ class Assets(loader.ClassLoader):
             raise RuntimeError("Cannot get manifest: " + package)
         return ret
 
+    def __manifestKey(self, package, package_info, local=False):
+        """
+        Build the manifest cache key for the installed version of a package.
+
+        If the package cannot be found, None is returned and the manifest is
+        not cached.
+        """
+
+        try:
+            if package_info is None:
+                package_info = self.getContext().getPackageManager().getPackageInfo(package, 0)
+
+            if self.__fingerprint is None:
+                self.__fingerprint = str(self.klass("android.os.Build").FINGERPRINT)
+
+            return ManifestCache.key(self.__fingerprint, package, package_info.versionCode, package_info.lastUpdateTime, local)
+        except ReflectionException:
+            return None
+
+    def __pullPackage(self, package, package_info):
+        """
+        Pull the APK of a package into the local APK store, and get its path
+        in the store.
+
+        If it cannot be pulled, an AxmlFormatException is raised, as for an APK
+        whose manifest cannot be decoded, so that modules can carry on with the
+        next package.
+        """
+
+        if package_info is None:
+            package_info = self.getContext().getPackageManager().getPackageInfo(package, 0)
+
+        source = str(package_info.applicationInfo.sourceDir)
+        digest = self.pullApk(source)
+
+        if digest is None:
+            raise AxmlFormatException("cannot pull APK: " + source)
+
+        return self.apkStore().apkPath(digest)
+
     def getAssetManager(self, package):
         """
         Get a handle on the AssetManager for the specified package.
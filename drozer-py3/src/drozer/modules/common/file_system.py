@@ -1,7 +1,9 @@
+import io
 import os
 import base64
 from typing import Optional
 
+from drozer.apk_store import ApkStore
 from mwr.common.list import chunk
 from pydiesel.file import FtpException
 
@@ -13,6 +15,19 @@ class FileSystem(Module):
     Utility methods for interacting with the Agent's file system.
     """
 
+    __apk_store = None
+
+    @classmethod
+    def apkStore(cls) -> ApkStore:
+        """
+        Get the local store of APKs pulled from devices.
+        """
+
+        if FileSystem.__apk_store is None:
+            FileSystem.__apk_store = ApkStore.default()
+
+        return FileSystem.__apk_store
+
     def cacheDir(self) -> str:
         """
         Get the full path to the Agent's cache directory.
@@ -32,22 +47,44 @@ class FileSystem(Module):
         else:
             return None
 
-    def downloadFile(self, source: str, destination, block_size=65536) -> Optional[int]:
+    def downloadFile(self, source: str, destination, block_size=65536, resume=False, progress=None) -> Optional[int]:
         """
-        Copy a file from the Agent's file system to the local one.
+        Copy a file from the Agent's file system to the local one, block_size
+        bytes at a time.
+
+        If resume is set, and the local file exists, only the part of the file
+        beyond its end is copied. Otherwise, the file is copied to a .part file
+        alongside the destination, and only moved into place once the copy is
+        complete, so a failed copy leaves the destination untouched.
         """
 
-        data = self.readFile(source, block_size=block_size)
+        if os.path.isdir(destination):
+            destination = os.path.sep.join([destination, source.split("/")[-1]])
 
-        if data:
-            if os.path.isdir(destination):
-                destination = os.path.sep.join([destination, source.split("/")[-1]])
+        if resume and os.path.isfile(destination):
+            # appending never loses what has already been copied
+            try:
+                with open(destination, 'ab') as output:
+                    return self.ftp.downloadFile(source, output, offset=os.path.getsize(destination), block_size=block_size, progress=progress) or None
+            except FtpException:
+                return None
 
-            output = open(destination, 'wb')
-            output.write(data)
-            output.close()
+        partial = destination + ".part"
+        length = None
 
-            return len(data)
+        try:
+            with open(partial, 'wb') as output:
+                length = self.ftp.downloadFile(source, output, block_size=block_size, progress=progress)
+        except FtpException:
+            length = None
+        finally:
+            if not length and os.path.exists(partial):
+                os.remove(partial)
+
+        if length:
+            os.replace(partial, destination)
+
+            return length
         else:
             return None
 
@@ -142,24 +179,66 @@ class FileSystem(Module):
         else:
             return None
 
+    def pullApk(self, source: str) -> Optional[str]:
+        """
+        Copy an APK from the Agent's file system into the local ApkStore,
+        unless an identical APK is already there, and return its checksum.
+
+        Returns None if the APK could not be copied intact.
+        """
+
+        digest = self.md5sum(source)
+
+        if digest is None:
+            return None
+        elif not self.apkStore().has(digest):
+            temp = self.apkStore().temporaryPath(digest)
+
+            if self.downloadFile(source, temp) is None:
+                return None
+
+            try:
+                self.apkStore().add(digest, temp)
+            except ValueError:
+                return None
+
+        return digest
+
     def readFile(self, source, block_size=65536) -> Optional[bytes]:
         """
         Read a file from the Agent's file system, and return the data.
         """
         try:
-            return self.ftp.download(source)
+            data = io.BytesIO()
+
+            self.ftp.downloadFile(source, data, block_size=block_size)
+
+            return data.getvalue()
         except FtpException:
             return None
 
-    def uploadFile(self, source: str, destination, block_size=65536) -> Optional[int]:
+    def uploadFile(self, source: str, destination, block_size=65536, resume=False, progress=None) -> Optional[int]:
         """
-        Copy a file from the local file system to the Agent's.
+        Copy a file from the local file system to the Agent's, block_size bytes
+        at a time.
+
+        If resume is set, and the remote file exists, only the part of the file
+        beyond its end is copied.
         """
 
         if self.isDirectory(destination):
             destination = "/".join([destination, source.split(os.path.sep)[-1]])
 
-        return self.writeFile(destination, open(source, 'rb').read(), block_size=block_size)
+        offset = 0
+
+        if resume and self.ftp.chunked():
+            offset = min(self.fileSize(destination) or 0, os.path.getsize(source))
+
+        try:
+            with open(source, 'rb') as data:
+                return self.ftp.uploadFile(destination, data, offset=offset, block_size=block_size, progress=progress)
+        except FtpException:
+            return None
 
     def workingDir(self) -> str:
         """
@@ -173,7 +252,6 @@ class FileSystem(Module):
         Write data into a file on the Agent's file system.
         """
         try:
-            self.ftp.upload(destination, data)
-            return len(data)
+            return self.ftp.uploadFile(destination, io.BytesIO(data), block_size=block_size)
         except FtpException:
             return None
@@ -1,4 +1,3 @@
-from xml.etree import ElementTree
 
 from . import assets, loader
 
@@ -13,7 +12,7 @@ class IntentFilter(assets.Assets, loader.ClassLoader):
     def find_intent_filters(self, endpoint, endpoint_type):
         filters = set([])
 
-        xml = ElementTree.fromstring(self.getAndroidManifest(endpoint.packageName))
+        xml = self.getManifest(str(endpoint.packageName), False).xmlET
 
         filters.update(list(map(self.__parse_filter, xml.findall(self.__filter_xpath % (endpoint_type, str(endpoint.name)[len(endpoint.packageName):])))))
         filters.update(list(map(self.__parse_filter, xml.findall(self.__filter_xpath % (endpoint_type, str(endpoint.name)[len(endpoint.packageName)+1:])))))
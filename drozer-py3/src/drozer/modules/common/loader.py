@@ -1,4 +1,4 @@
-import os, platform
+import os, platform, threading
 
 from pydiesel.reflection import utils
 
@@ -9,30 +9,37 @@ class ClassLoader(Module):
     """
     Utility methods for loading Java source code from the local system into
     the Dalvik VM on the Agent.
+
+    Classes may be loaded from several threads at once (for example, by the
+    probes of a ScanEngine), so loading is serialised: each library is built
+    and uploaded once, and each class is loaded once.
     """
 
+    __lock = threading.RLock()
+
     def loadClass(self, source: str, klass: str, relative_to=None):
         """
         Load a Class from a local apk file (source) on the running Dalvik VM.
         """
 
-        if relative_to is None:
-            relative_to = os.path.join(os.path.dirname(__file__), "..")
-        elif relative_to.find(".py") >= 0 or relative_to.find(".pyc") >= 0:
-            relative_to = os.path.dirname(relative_to)
-
-        if not Module.cached_classloader(source):
-            loader = utils.ClassLoader(source, self.__get_cache_path(), self.__get_constructor(), self.klass('java.lang.ClassLoader').getSystemClassLoader(), relative_to=relative_to)
-            loader.android_path = lambda: Configuration.library("android.jar")
-            loader.dx_path = lambda: Configuration.executable("dx.bat") if platform.system() == "Windows" else Configuration.executable("dx")
-            loader.javac_path = lambda: Configuration.executable("javac")
-            loader.ftp = self.ftp
-            Module.cache_classloader(source, loader.getClassLoader())
-        classloader = Module.get_cached_classloader(source)
-
-        if not Module.cached_klass(".".join([source, klass])):
-            Module.cache_klass(".".join([source, klass]), classloader.loadClass(klass))
-        return Module.get_cached_klass(".".join([source, klass]))
+        with ClassLoader.__lock:
+            if relative_to is None:
+                relative_to = os.path.join(os.path.dirname(__file__), "..")
+            elif relative_to.find(".py") >= 0 or relative_to.find(".pyc") >= 0:
+                relative_to = os.path.dirname(relative_to)
+
+            if not Module.cached_classloader(source):
+                loader = utils.ClassLoader(source, self.__get_cache_path(), self.__get_constructor(), self.klass('java.lang.ClassLoader').getSystemClassLoader(), relative_to=relative_to)
+                loader.android_path = lambda: Configuration.library("android.jar")
+                loader.dx_path = lambda: Configuration.executable("dx.bat") if platform.system() == "Windows" else Configuration.executable("dx")
+                loader.javac_path = lambda: Configuration.executable("javac")
+                loader.ftp = self.ftp
+                Module.cache_classloader(source, loader.getClassLoader())
+            classloader = Module.get_cached_classloader(source)
+
+            if not Module.cached_klass(".".join([source, klass])):
+                Module.cache_klass(".".join([source, klass]), classloader.loadClass(klass))
+            return Module.get_cached_klass(".".join([source, klass]))
 
     def __get_cache_path(self) -> str:
         """
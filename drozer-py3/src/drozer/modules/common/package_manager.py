@@ -83,6 +83,13 @@ class PackageManager(ClassLoader):
 
             return self.__package_manager.getNameForUid(uid)
 
+        def getNativeLibraries(self, application):
+            """
+            Get the native libraries bundled in the APK of an ApplicationInfo.
+            """
+
+            return self.__module.loadClass("common/Native.apk", "Native").list(application)
+
         def getPackageInfo(self, package, flags=0):
             """
             Get a package's PackageInfo object, optionally passing flags.
@@ -96,6 +103,42 @@ class PackageManager(ClassLoader):
                 else:
                     raise
 
+        def getPackageRecord(self, package, fields, flags=0):
+            """
+            Get a PackageRecord holding the named fields of a single package,
+            fetched with flags, in one round trip. See #getPackageRecords.
+            """
+
+            helper = self.__inventory()
+
+            try:
+                if helper is not None:
+                    return PackageRecord.fromJSON(json.loads(str(helper.single(self.__package_manager, package, flags, ",".join(fields)))))
+                else:
+                    return PackageRecord.fromPackageInfo(self.__package_manager.getPackageInfo(package, flags), fields, self)
+            except ReflectionException as e:
+                if str(e) == package:
+                    raise PackageManager.NoSuchPackageException(package)
+                else:
+                    raise
+
+        def getPackageRecords(self, fields, flags=0):
+            """
+            Get a PackageRecord, holding the named fields, for every installed
+            package, fetched with flags.
+
+            The records are collected by the PackageInventory helper, in a
+            single round trip. If the helper cannot be loaded, they are
+            collected through reflection instead, one package at a time.
+            """
+
+            helper = self.__inventory()
+
+            if helper is not None:
+                return [PackageRecord.fromJSON(r) for r in json.loads(str(helper.list(self.__package_manager, flags, ",".join(fields))))]
+            else:
+                return [PackageRecord.fromPackageInfo(p, fields, self) for p in self.getPackages(flags)]
+
         def getPackages(self, flags=0):
             """
             Iterate through all installed packages.
@@ -167,6 +210,16 @@ class PackageManager(ClassLoader):
             for i in range(activities.size()):
                 yield activities.get(i)
 
+        def __inventory(self):
+            """
+            Load the PackageInventory helper, or get None if it cannot be built.
+            """
+
+            try:
+                return self.__module.loadClass("common/PackageInventory.apk", "PackageInventory")
+            except (RuntimeError, ReflectionException):
+                return None
+
 
     def packageManager(self):
         """
@@ -178,6 +231,25 @@ class PackageManager(ClassLoader):
 
         return self.__package_manager_proxy
 
+    def packageGeneration(self) -> Optional[int]:
+        """
+        Get the sequence number of the device's set of packages, which changes
+        whenever a package is installed, updated or removed.
+
+        None is returned if the device cannot report it (before Android 8.0).
+        """
+
+        try:
+            changed = self.getContext().getPackageManager().getChangedPackages(0)
+        except ReflectionException:
+            return None
+
+        if changed == None:
+            # no package has changed since the device booted
+            return 0
+        else:
+            return int(changed.getSequenceNumber())
+
     def getAllPermissions(self) -> Set['PermissionInfo']:
         if len(self.perm_cache) == 0:
             permissionHelper = self.loadClass("common/PermissionHelper.apk", "PermissionHelper")
@@ -235,3 +307,79 @@ class PermissionInfo(PackageItemInfo):
 
     def __hash__(self) -> int:
         return self.packageName.__hash__()
+
+
+
+class PackageRecord(object):
+    """
+    A local copy of some fields of a PackageInfo, and of its ApplicationInfo,
+    as collected by PackageManagerProxy#getPackageRecords. Only the fields that
+    were asked for are present, and reading them never makes a round trip.
+
+    Java nulls become None, arrays become lists, and components and defined
+    permissions become PackageItemInfo.
+    """
+
+    APPLICATION_FIELDS = {"dataDir": str, "flags": int, "nativeLibraryDir": str, "processName": str,
+                          "publicSourceDir": str, "sharedLibraryFiles": [str], "sourceDir": str,
+                          "targetSdkVersion": int, "uid": int}
+    PACKAGE_FIELDS = {"activities": [PackageItemInfo], "firstInstallTime": int, "gids": [int],
+                      "lastUpdateTime": int, "packageName": str, "permissions": [PackageItemInfo],
+                      "providers": [PackageItemInfo], "receivers": [PackageItemInfo],
+                      "requestedPermissions": [str], "services": [PackageItemInfo],
+                      "sharedUserId": str, "versionCode": int, "versionName": str}
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    @classmethod
+    def fromJSON(cls, record):
+        """
+        Build a PackageRecord from an object written by PackageInventory.
+        """
+
+        for name in cls.PACKAGE_FIELDS:
+            if cls.PACKAGE_FIELDS[name] == [PackageItemInfo] and record.get(name) is not None:
+                record[name] = [PackageItemInfo(i["name"], i["packageName"]) for i in record[name]]
+
+        return cls(**record)
+
+    @classmethod
+    def fromPackageInfo(cls, package, fields, package_manager):
+        """
+        Build a PackageRecord by reading each field of a PackageInfo through
+        reflection.
+        """
+
+        record = {}
+        application = package.applicationInfo
+
+        for name in fields:
+            if name in cls.PACKAGE_FIELDS:
+                record[name] = cls.__native(getattr(package, name), cls.PACKAGE_FIELDS[name])
+            elif application == None:
+                record[name] = None
+            elif name in cls.APPLICATION_FIELDS:
+                record[name] = cls.__native(getattr(application, name), cls.APPLICATION_FIELDS[name])
+            elif name == "label":
+                record[name] = str(package_manager.getApplicationLabel(str(package.packageName)))
+            elif name == "nativeLibraries":
+                record[name] = [str(l) for l in package_manager.getNativeLibraries(application)]
+            else:
+                raise AttributeError("PackageRecord has no field %s" % name)
+
+        return cls(**record)
+
+    @classmethod
+    def __native(cls, value, kind):
+        if value == None:
+            return None
+        elif kind == [PackageItemInfo]:
+            return [PackageItemInfo(str(i.name), str(i.packageName)) for i in value]
+        elif isinstance(kind, list):
+            return [kind[0](v) for v in value]
+        else:
+            return kind(value)
+
+    def __repr__(self):
+        return "<PackageRecord %s>" % ",".join("%s=%s" % (k, v) for k, v in sorted(self.__dict__.items()))
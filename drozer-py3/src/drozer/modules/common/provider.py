@@ -1,7 +1,12 @@
-from pydiesel.reflection import ReflectionException
+import base64
+import struct
+
+from pydiesel.reflection import ReflectionBatch, ReflectionException
 
 from . import loader
 from .package_manager import PackageManager
+from ..memo import memoized
+from .scan_engine import ScanEngine
 
 class Provider(loader.ClassLoader):
     """
@@ -20,15 +25,13 @@ class Provider(loader.ClassLoader):
         def __init__(self, module):
             self.__module = module
             self.__content_resolver = module.getContext().getContentResolver()
-            
-            self.__must_release_client = False
 
         def delete(self, uri, selection, selectionArgs):
             """
             Delete from a content provider, given filter conditions.
             """
             
-            client = self.__get_client(uri)
+            client, must_release = self.__get_client(uri)
 
             return_val = None
             try:
@@ -39,7 +42,7 @@ class Provider(loader.ClassLoader):
                 else:
                     raise
             finally:
-                self.__release(client)
+                self.__release(client, must_release)
 
             return return_val
 
@@ -48,7 +51,7 @@ class Provider(loader.ClassLoader):
             Insert contentValues into a content provider.
             """
             
-            client = self.__get_client(uri)
+            client, must_release = self.__get_client(uri)
 
             return_val = None
             try:
@@ -59,7 +62,7 @@ class Provider(loader.ClassLoader):
                 else:
                     raise
             finally:            
-                self.__release(client)
+                self.__release(client, must_release)
 
             return return_val
 
@@ -76,9 +79,9 @@ class Provider(loader.ClassLoader):
             filter conditions and sort order.
             """
 
-            client = self.__get_client(uri)
+            client, must_release = self.__get_client(uri)
             
-            if client.__ne__(None):
+            if client == None:
                 raise ReflectionException("Could not get a ContentProviderClient for %s." % uri)
             
             cursor = None
@@ -92,7 +95,7 @@ class Provider(loader.ClassLoader):
                 else:
                     raise
             finally:  
-                self.__release(client)
+                self.__release(client, must_release)
 
             return cursor
             
@@ -104,9 +107,9 @@ class Provider(loader.ClassLoader):
             
             ByteStreamReader = self.__module.loadClass("common/ByteStreamReader.apk", "ByteStreamReader")
             
-            client = self.__get_client(uri)
+            client, must_release = self.__get_client(uri)
 
-            if self.__must_release_client:
+            if must_release:
                 fd = None
    
                 if client.__ne__(None):
@@ -118,7 +121,7 @@ class Provider(loader.ClassLoader):
                         else:
                             raise
     
-                self.__release(client)
+                self.__release(client, must_release)
     
                 if fd.__ne__(None):
                     return str(ByteStreamReader.read(self.__module.new("java.io.FileInputStream", fd.getFileDescriptor())))
@@ -137,7 +140,7 @@ class Provider(loader.ClassLoader):
             Update records in a content provider with contentValues.
             """
             
-            client = self.__get_client(uri)
+            client, must_release = self.__get_client(uri)
 
             return_val = None
             try:
@@ -148,22 +151,26 @@ class Provider(loader.ClassLoader):
                 else:
                     raise
             finally:
-                self.__release(client)
+                self.__release(client, must_release)
             
             return return_val
         
         def __get_client(self, uri):
+            """
+            Get a ContentProviderClient for uri, falling back on the
+            ContentResolver, and whether the client must be released.
+
+            This is returned rather than stored, so that a proxy can be shared by
+            threads that scan providers concurrently.
+            """
+
             try:
-                self.__must_release_client = True
-                
-                return self.__content_resolver.acquireUnstableContentProviderClient(self.parseUri(uri))
+                return (self.__content_resolver.acquireUnstableContentProviderClient(self.parseUri(uri)), True)
             except ReflectionException:
-                self.__must_release_client = False
-                
-                return self.__content_resolver
+                return (self.__content_resolver, False)
         
-        def __release(self, client):
-            if self.__must_release_client and client.__ne__(None):
+        def __release(self, client, must_release):
+            if must_release and client.__ne__(None):
                 try:
                     client.release()
                 except ReflectionException:
@@ -179,45 +186,71 @@ class Provider(loader.ClassLoader):
 
         return self.__content_resolver_proxy
 
-    def findAllContentUris(self, package):
+    def contentUrisFor(self, package_or_uri, local=False):
+        """
+        Get the content URIs to scan, given a content URI, a package to search
+        or None to search every package.
+        """
+
+        if package_or_uri is not None and package_or_uri.startswith("content://"):
+            return [package_or_uri]
+        else:
+            return self.iterContentUris(package_or_uri, local=local)
+
+    def findAllContentUris(self, package, local=False):
         """
         Search a package (or packages) for content providers, by searching the
         manifest and looking for content:// paths in the binary.
         """
 
-        uris = set([])
+        return set(self.iterContentUris(package, local=local))
+
+    @memoized()
+    def iterContentUris(self, package, local=False):
+        """
+        Search a package (or packages) for content providers, as
+        #findAllContentUris, yielding the URIs found in each package as soon as
+        it has been searched.
+
+        The URIs from a complete search are kept in the session's memo store,
+        so later scans of the same packages do not repeat it.
+        """
 
         # collect content uris by enumerating all authorities, and uris detected
         # in the source
         
         if package is None:
-            for package in self.packageManager().getPackages(PackageManager.GET_PROVIDERS | PackageManager.GET_URI_PERMISSION_PATTERNS):
-                try:
-                    uris = uris.union(self.__search_package(package))
-                except ReflectionException as e:
-                    if "java.util.zip.ZipException: unknown format" in str(e):
-                        self.stderr.write("Skipping package %s, because we cannot unzip it..." % package.applicationInfo.packageName)
-                    else:
-                        raise
+            packages = self.packageManager().getPackages(PackageManager.GET_PROVIDERS | PackageManager.GET_URI_PERMISSION_PATTERNS)
         else:
-            package = self.packageManager().getPackageInfo(package, PackageManager.GET_PROVIDERS)
+            packages = [self.packageManager().getPackageInfo(package, PackageManager.GET_PROVIDERS)]
 
+        for package in packages:
             try:
-                uris = uris.union(self.__search_package(package))
+                uris = self.__search_package(package, local)
             except ReflectionException as e:
                 if "java.util.zip.ZipException: unknown format" in str(e):
                     self.stderr.write("Skipping package %s, because we cannot unzip it..." % package.applicationInfo.packageName)
+
+                    continue
                 else:
                     raise
 
-        return uris
+            for uri in uris:
+                yield uri
         
-    def findContentUris(self, package):
+    def findContentUris(self, package, local=False):
         """
         Search a package for content providers, by looking for content:// paths
         in the binary.
+
+        If local is set, each APK is pulled into the local ApkStore (unless it
+        is already there) and its DEX files are searched on this machine, which
+        covers every classes*.dex file in a multidex APK.
         """
 
+        if local:
+            return self.__find_content_uris_locally(package)
+
         self.deleteFile("/".join([self.cacheDir(), "classes.dex"]))
 
         content_uris = []
@@ -238,19 +271,76 @@ class Provider(loader.ClassLoader):
             elif ".odex" in path:
                 strings = self.getStrings(path)
             
-            content_uris.append((path, [s for s in strings if ("CONTENT://" in s.upper()) and ("CONTENT://" != s.upper())]))
+            content_uris.append((path, self.__filter_content_uris(strings)))
 
         return content_uris
 
-    def getResultSet(self, cursor):
+    @classmethod
+    def decodeCursorWindow(cls, data, columns):
+        """
+        Decode a page of rows serialized by CursorWindowReader, given the number
+        of columns in the cursor.
+
+        Values are returned as int, float, str, bytes (for blobs) or None.
+        """
+
+        rows = []
+        (count,) = struct.unpack_from(">i", data, 0)
+        offset = 4
+
+        for _ in range(count):
+            row = []
+
+            for _ in range(columns):
+                field_type = data[offset]
+                offset += 1
+
+                if field_type == 0:
+                    row.append(None)
+                elif field_type == 1:
+                    row.append(struct.unpack_from(">q", data, offset)[0])
+                    offset += 8
+                elif field_type == 2:
+                    row.append(struct.unpack_from(">d", data, offset)[0])
+                    offset += 8
+                elif field_type == 3:
+                    (length,) = struct.unpack_from(">i", data, offset)
+                    row.append(bytes(data[offset + 4:offset + 4 + length]).decode("utf-8", "replace"))
+                    offset += 4 + length
+                elif field_type == 4:
+                    (length,) = struct.unpack_from(">i", data, offset)
+                    row.append(bytes(data[offset + 4:offset + 4 + length]))
+                    offset += 4 + length
+                else:
+                    raise ReflectionException("unknown field type in cursor window: %d" % field_type)
+
+            rows.append(row)
+
+        return rows
+
+    def getResultSet(self, cursor, offset=0, limit=None):
         """
         Get a result set from a database cursor, as a 2D array.
+
+        offset and limit select a range of rows, as in a LIMIT clause.
         """
 
         rows = []
         blob_type = self.klass("android.database.Cursor").FIELD_TYPE_BLOB
 
         if cursor.__ne__(None):
+            try:
+                return [self.__format_row(row) for row in self.getRows(cursor, offset=offset, limit=limit)]
+            except RuntimeError:
+                # the CursorWindowReader could not be loaded, so walk the cursor
+                # with reflection instead
+                pass
+
+        if cursor.__ne__(None) and (offset > 0 or limit is not None):
+            raise ReflectionException("cannot select a range of rows without the CursorWindowReader")
+        elif cursor.__ne__(None) and self.agent_version >= ReflectionBatch.minimum_agent_version:
+            return self.__get_result_set_batched(cursor, blob_type)
+        elif cursor.__ne__(None):
             columns = cursor.getColumnNames()
             rows.append(columns)
 
@@ -284,7 +374,147 @@ class Provider(loader.ClassLoader):
         else:
             return None
 
-    def __search_package(self, package):
+    def getRows(self, cursor, page_size=500, offset=0, limit=None):
+        """
+        Iterate over the rows of a database cursor, fetching page_size rows at
+        a time from the Agent, each in a single reply.
+
+        The first row yielded contains the column names. offset and limit select
+        a range of rows, as in a LIMIT clause. Values are decoded as described
+        in #decodeCursorWindow.
+        """
+
+        CursorWindowReader = self.loadClass("common/CursorWindowReader.apk", "CursorWindowReader")
+
+        columns = [str(c) for c in cursor.getColumnNames()]
+        position = offset
+
+        yield columns
+
+        while limit is None or position < offset + limit:
+            if limit is None:
+                count = page_size
+            else:
+                count = min(page_size, offset + limit - position)
+
+            rows = self.decodeCursorWindow(CursorWindowReader.read(cursor, position, count).data(), len(columns))
+
+            for row in rows:
+                yield row
+
+            position += len(rows)
+
+            if len(rows) < count:
+                break
+
+    def scanContentUris(self, uris, probe, workers=8, per_authority=2, interval=0.0):
+        """
+        Run probe against each content URI concurrently, yielding a ScanResult
+        for each as it completes. See ScanEngine for the meaning of the limits.
+        """
+
+        return ScanEngine(probe, workers, per_authority, interval).scan(uris)
+
+    def __filter_content_uris(self, strings):
+        return [s for s in strings if ("CONTENT://" in s.upper()) and ("CONTENT://" != s.upper())]
+
+    def __find_content_uris_locally(self, package):
+        """
+        Search a package's APKs for content:// paths, using the local ApkStore.
+        """
+
+        content_uris = []
+        for path in self.packageManager().getSourcePaths(package):
+            if ".apk" not in path:
+                continue
+
+            digest = self.pullApk(path)
+
+            if digest is None:
+                self.stderr.write("Could not download %s, skipping it...\n" % path)
+            else:
+                content_uris.append((path, self.__filter_content_uris(self.apkStore().strings(digest))))
+
+        return content_uris
+
+    def __format_row(self, row):
+        """
+        Format the values from #getRows, as they are presented by
+        #getResultSet.
+        """
+
+        formatted = []
+
+        for value in row:
+            if isinstance(value, bytes):
+                formatted.append("%s (Base64-encoded)" % base64.b64encode(value).decode("ascii"))
+            elif value is None:
+                formatted.append("null")
+            else:
+                formatted.append(str(value))
+
+        return formatted
+
+    def __get_result_set_batched(self, cursor, blob_type):
+        """
+        Get a result set from a database cursor, as a 2D array, fetching each
+        row from the Agent in a single BATCH request.
+        """
+
+        with self.reflector.batch() as batch:
+            columns = batch.invoke(cursor, "getColumnNames")
+            batch.invoke(cursor, "moveToFirst")
+            after_last = batch.invoke(cursor, "isAfterLast")
+
+        columns = columns.result()
+        rows = [columns]
+
+        while after_last.result() == False:
+            with self.reflector.batch() as batch:
+                types = [batch.invoke(cursor, "getType", i) for i in range(len(columns))]
+                values = [batch.invoke(cursor, "getString", i) for i in range(len(columns))]
+                batch.invoke(cursor, "moveToNext")
+                after_last = batch.invoke(cursor, "isAfterLast")
+
+            row = []
+            blobs = []
+
+            for i in range(len(columns)):
+                try:
+                    is_blob = types[i].result() == blob_type
+                except ReflectionException as e:
+                    if str(e).startswith("getType"):
+                        is_blob = False
+                    else:
+                        raise
+
+                if not is_blob:
+                    try:
+                        row.append(values[i].result())
+                    except ReflectionException as e:
+                        if str(e).startswith("unknown error: Unable to convert BLOB to string"):
+                            is_blob = True
+                        else:
+                            raise
+
+                if is_blob:
+                    blobs.append(i)
+                    row.append(None)
+
+            if len(blobs) > 0:
+                # the cursor has already moved on, so step back to read blobs
+                cursor.moveToPrevious()
+
+                for i in blobs:
+                    row[i] = "%s (Base64-encoded)" % (cursor.getBlob(i).base64_encode())
+
+                cursor.moveToNext()
+
+            rows.append(row)
+
+        return rows
+
+    def __search_package(self, package, local=False):
         """
         Search a package's manifest and binary for content provider URIs, and
         create a union set of them.
@@ -313,7 +543,7 @@ class Provider(loader.ClassLoader):
                         
                         for path in paths:
                             uris.add("content://%s%s" % (authority, path))
-        for (path, content_uris) in self.findContentUris(package.packageName):
+        for (path, content_uris) in self.findContentUris(package.packageName, local=local):
             if len(content_uris) > 0:
                 for uri in content_uris:
                     uris.add(uri[uri.upper().find("CONTENT"):])
@@ -0,0 +1,138 @@
+import collections
+import concurrent.futures
+import time
+
+class ScanResult(object):
+    """
+    The outcome of probing one content URI: the value returned by the probe, or
+    the exception that it raised.
+    """
+
+    def __init__(self, uri, value=None, error=None):
+        self.uri = uri
+        self.value = value
+        self.error = error
+
+
+class ScanEngine(object):
+    """
+    Runs a probe against many content URIs concurrently, and yields a
+    ScanResult for each URI as its probe completes:
+
+        for result in ScanEngine(probe, workers=8).scan(uris):
+            ...
+
+    At most workers probes run at once, and at most per_authority of those
+    target the same authority. Successive probes against an authority are
+    started at least interval seconds apart, so that a single provider is not
+    flooded while others sit idle.
+
+    URIs are pulled from the iterable as capacity allows, so probing can start
+    before every URI has been discovered. Duplicate URIs are probed once.
+    """
+
+    def __init__(self, probe, workers=8, per_authority=2, interval=0.0):
+        self.interval = interval
+        self.per_authority = max(1, per_authority)
+        self.probe = probe
+        self.workers = max(1, workers)
+
+    @classmethod
+    def authority(cls, uri):
+        """
+        Get the authority part of a content URI.
+        """
+
+        if uri.lower().startswith("content://"):
+            uri = uri[len("content://"):]
+
+        return uri.split("/")[0]
+
+    def scan(self, uris):
+        """
+        Probe each URI in uris, yielding ScanResults in the order that the
+        probes complete.
+        """
+
+        uris = iter(uris)
+        exhausted = False
+
+        queued = collections.OrderedDict()
+        running = {}
+        busy = collections.Counter()
+        not_before = {}
+        seen = set()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                # keep enough URIs queued to occupy every worker, even when
+                # several are held back by their authority's limits
+                while not exhausted and sum(len(q) for q in queued.values()) < 4 * self.workers:
+                    try:
+                        uri = next(uris)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    if uri not in seen:
+                        seen.add(uri)
+                        queued.setdefault(self.authority(uri), collections.deque()).append(uri)
+
+                delay = self.__start(pool, queued, running, busy, not_before)
+
+                if len(running) == 0 and len(queued) == 0 and exhausted:
+                    return
+                elif len(running) > 0:
+                    done, _ = concurrent.futures.wait(running, timeout=delay, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                    for future in done:
+                        uri, authority = running.pop(future)
+                        busy[authority] -= 1
+
+                        if future.exception() is not None:
+                            yield ScanResult(uri, error=future.exception())
+                        else:
+                            yield ScanResult(uri, value=future.result())
+                elif delay is not None:
+                    time.sleep(delay)
+
+    def __start(self, pool, queued, running, busy, not_before):
+        """
+        Start probes for queued URIs, taking authorities in turn, while there
+        are free workers.
+
+        Returns the number of seconds until a rate-limited authority may be
+        probed again, or None if no authority is waiting on its rate limit.
+        """
+
+        delay = None
+        now = time.monotonic()
+        started = True
+
+        while started and len(running) < self.workers:
+            started = False
+
+            for authority in list(queued.keys()):
+                if len(running) >= self.workers:
+                    break
+                elif busy[authority] >= self.per_authority:
+                    continue
+                elif not_before.get(authority, 0) > now:
+                    if delay is None or not_before[authority] - now < delay:
+                        delay = not_before[authority] - now
+
+                    continue
+
+                uri = queued[authority].popleft()
+
+                running[pool.submit(self.probe, uri)] = (uri, authority)
+                busy[authority] += 1
+                not_before[authority] = now + self.interval
+                started = True
+
+                if len(queued[authority]) == 0:
+                    del queued[authority]
+                else:
+                    queued.move_to_end(authority)
+
+        return delay
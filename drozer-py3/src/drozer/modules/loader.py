@@ -2,15 +2,25 @@ import os
 import sys
 
 from drozer.modules.import_conflict_resolver import ImportConflictResolver
+from drozer.modules.registry import ModuleInfo, ModuleRegistry
 from drozer.repoman import Repository
 import importlib
 
 class ModuleLoader(object):
+    """
+    Finds the drozer Modules on the module path.
 
-    def __init__(self):
+    Module metadata is read from a ModuleRegistry, so only the source files
+    that have changed since the registry was last written are imported when
+    modules are listed. Other modules are imported when they are first used.
+    """
+
+    def __init__(self, registry=None):
         self.__conflict_resolver = ImportConflictResolver
+        self.__klasses = {}
         self.__modules = {}
         self.__module_paths = os.path.join(os.path.dirname(__file__), "..", "modules")
+        self.__registry = registry
 
     def all(self, base):
         """
@@ -26,54 +36,132 @@ class ModuleLoader(object):
     def get(self, base, key):
         """
         Gets a module implementation, given its identifier.
+
+        The Python module that defines it is imported on first use.
         """
 
         if len(self.__modules) == 0:
             self.__load(base)
-        
-        return self.__modules[key]
+
+        if key not in self.__klasses:
+            self.__klasses[key] = self.__import_klass(key)
+
+        return self.__klasses[key]
+
+    def info(self, base, key):
+        """
+        Gets the metadata of a module, given its identifier, without importing
+        it.
+        """
+
+        if len(self.__modules) == 0:
+            self.__load(base)
+
+        if len(self.__modules[key]) > 1:
+            # more than one source file defines this module, so import them to
+            # decide which to use
+            self.get(base, key)
+
+        return self.__modules[key][0]
 
     def reload(self):
+        self.__klasses = {}
         self.__modules = {}
 
-    def __import_modules(self, modules):
+    def __import_klass(self, key):
+        """
+        Import the Python module that defines a drozer Module, and get the
+        Module's class.
+
+        If more than one Python module defines the Module, the conflict is
+        resolved by the ImportConflictResolver.
+        """
+
+        klass = None
+
+        for info in self.__modules[key]:
+            try:
+                candidate = getattr(importlib.import_module(info.module), info.klass)
+            except (ImportError, IndentationError, AttributeError):
+                sys.stderr.write("Skipping source file at %s. Unable to load Python module.\n" % info.module)
+                continue
+
+            if klass is None:
+                klass = candidate
+            else:
+                klass = self.__conflict_resolver().resolve(klass, candidate)
+
+        if klass is None:
+            raise KeyError(key)
+
+        self.__modules[key] = [info for info in self.__modules[key] if info.module == klass.__module__ and info.klass == klass.__name__]
+
+        return klass
+
+    def __import_module(self, module, base):
         """
-        Import all modules, given a collection of Python modules.
+        Import a Python module, given its name, and record the drozer Modules
+        that it defines.
         """
 
-        for i in modules.keys():
-            if modules[i] is not None and modules[i] != "drozer.modules.base":
-                try:
-                    __import__(modules[i])
-                    # Reload the module in case the source has changed. We don't
-                    # need to be careful over i, because the import must have
-                    # been successful to get here.
-                    if modules[i] in sys.modules:
-                        importlib.reload(sys.modules[modules[i]])
-                except ImportError:
-                    sys.stderr.write("Skipping source file at %s. Unable to load Python module.\n" % modules[i])
-                    pass 
-                except IndentationError:
-                    sys.stderr.write("Skipping source file at %s. Indentation Error.\n" % modules[i])
-                    pass
+        try:
+            __import__(module)
+            # Reload the module in case the source has changed. We don't
+            # need to be careful over module, because the import must have
+            # been successful to get here.
+            if module in sys.modules:
+                importlib.reload(sys.modules[module])
+        except ImportError:
+            sys.stderr.write("Skipping source file at %s. Unable to load Python module.\n" % module)
+            return None
+        except IndentationError:
+            sys.stderr.write("Skipping source file at %s. Indentation Error.\n" % module)
+            return None
+
+        # look in the module's namespace, rather than at base's subclasses,
+        # which still include the classes from before a reload
+        klasses = vars(sys.modules[module]).values()
+
+        return [ModuleInfo.fromKlass(k) for k in klasses if isinstance(k, type) and issubclass(k, base) and k != base and k.__module__ == module]
 
     def __load(self, base):
         """
-        Load all modules from module repositories.
+        Load the metadata of all modules from module repositories, importing
+        only the source files that have changed since they were indexed.
         """
 
+        registry = self.__registry or ModuleRegistry.default()
+        changed = False
+
+        self.__klasses = {}
         self.__modules = {}
 
-        self.__import_modules(self.__locate())
+        located = self.__locate()
 
-        for klass in self.__subclasses_of(base):
-            if klass.__module__.startswith("drozer.modules.common"):
+        for (filepath, module) in located.values():
+            if module is None or module == "drozer.modules.base" or module.startswith("drozer.modules.common"):
                 continue
-            if klass != base:
-                if not klass.fqmn() in self.__modules: 
-                    self.__modules[klass.fqmn()] = klass
-                else:
-                    self.__modules[klass.fqmn()] = self.__conflict_resolver().resolve(self.__modules[klass.fqmn()], klass)
+
+            infos = registry.get(filepath)
+
+            if infos is None:
+                signature = registry.signature(filepath)
+                infos = self.__import_module(module, base)
+
+                if infos is None:
+                    continue
+
+                registry.put(filepath, signature, infos)
+                changed = True
+
+            for info in infos:
+                self.__modules.setdefault(info.fqmn(), []).append(info)
+
+        if registry.prune([filepath for (filepath, _) in located.values()]) > 0:
+            changed = True
+
+        if changed:
+            registry.save()
 
     def __locate(self):
         """
@@ -101,9 +189,9 @@ class ModuleLoader(object):
                         module = filepath[len(path)+1:filepath.rindex(".")].replace(os.path.sep, ".")
 
                         if os.path.abspath(self.__module_paths) in path:
-                            modules[namespace] = "drozer.modules." + module
+                            modules[namespace] = (filepath, "drozer.modules." + module)
                         else:
-                            modules[namespace] = module
+                            modules[namespace] = (filepath, module)
 
         return modules
 
@@ -136,16 +224,3 @@ class ModuleLoader(object):
                 paths.append(path)
 
         return paths
-
-    def __subclasses_of(self, klass):
-        """
-        Method to recursively find subclasses of a given class, used to collate
-        the list of drozer Modules after loading all Python modules from the
-        specified paths.
-        """
-        
-        for i in klass.__subclasses__():
-            for c in self.__subclasses_of(i):
-                yield c
-                
-        yield klass
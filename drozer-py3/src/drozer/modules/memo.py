@@ -0,0 +1,161 @@
+import functools
+import inspect
+import threading
+import time
+
+class MemoStore(object):
+    """
+    A session-level store for the results of expensive discovery functions,
+    such as searching every package for content URIs.
+
+    Entries are keyed by the function name, its arguments and the generation
+    of the device's package set, so installing, updating or removing a package
+    makes earlier results stale. Each entry also expires after a TTL, and can
+    be invalidated by hand.
+    """
+
+    def __init__(self, ttl=600):
+        self.hits = 0
+        self.misses = 0
+        self.ttl = ttl
+
+        self.__entries = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get a (found, value) pair for key. Expired entries are not found.
+        """
+
+        with self.__lock:
+            if key in self.__entries:
+                expires, value = self.__entries[key]
+
+                if expires is None or expires > time.monotonic():
+                    self.hits += 1
+
+                    return (True, value)
+                else:
+                    del self.__entries[key]
+
+            self.misses += 1
+
+            return (False, None)
+
+    def invalidate(self, name=None):
+        """
+        Remove every entry for the function name, or every entry if name is
+        None, and return the number removed.
+        """
+
+        with self.__lock:
+            keys = [k for k in self.__entries if name is None or k[0] == name]
+
+            for key in keys:
+                del self.__entries[key]
+
+            return len(keys)
+
+    @classmethod
+    def key(cls, name, args, kwargs, generation):
+        """
+        Build the key for a call to the function name.
+        """
+
+        return (name, args, tuple(sorted(kwargs.items())), generation)
+
+    def names(self):
+        """
+        Get the names of the functions that have entries in the store.
+        """
+
+        with self.__lock:
+            return sorted(set(k[0] for k in self.__entries))
+
+    def put(self, key, value, ttl=None):
+        """
+        Store a value for key, which expires after ttl seconds (or the store's
+        default TTL). A TTL of 0 means the value never expires.
+        """
+
+        if ttl is None:
+            ttl = self.ttl
+
+        with self.__lock:
+            self.__entries[key] = (ttl > 0 and time.monotonic() + ttl or None, value)
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+def memoized(name=None, ttl=None):
+    """
+    Decorate a Module method, so that its results are kept in the session's
+    MemoStore:
+
+        @memoized(ttl=300)
+        def findAllContentUris(self, package):
+            ...
+
+    The arguments must be hashable, and the results should be native values
+    rather than references to objects in the Agent's ObjectStore, since those
+    do not outlive the session's object store.
+
+    If the module also mixes in PackageManager, the key includes the device's
+    package set generation. A generator's values are stored once it has been
+    consumed completely, and replayed on later calls.
+    """
+
+    def decorator(method):
+        key_name = name or method.__qualname__
+
+        def key(module, args, kwargs):
+            if hasattr(module, "packageGeneration"):
+                return MemoStore.key(key_name, args, kwargs, module.packageGeneration())
+            else:
+                return MemoStore.key(key_name, args, kwargs, None)
+
+        if inspect.isgeneratorfunction(method):
+            @functools.wraps(method)
+            def wrapper(self, *args, **kwargs):
+                store = getattr(self, "memo", None)
+
+                if store is None:
+                    yield from method(self, *args, **kwargs)
+                    return
+
+                k = key(self, args, kwargs)
+                found, values = store.get(k)
+
+                if found:
+                    yield from values
+                else:
+                    values = []
+
+                    for value in method(self, *args, **kwargs):
+                        values.append(value)
+
+                        yield value
+
+                    store.put(k, tuple(values), ttl)
+        else:
+            @functools.wraps(method)
+            def wrapper(self, *args, **kwargs):
+                store = getattr(self, "memo", None)
+
+                if store is None:
+                    return method(self, *args, **kwargs)
+
+                k = key(self, args, kwargs)
+                found, value = store.get(k)
+
+                if not found:
+                    value = method(self, *args, **kwargs)
+
+                    store.put(k, value, ttl)
+
+                return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,163 @@
+import json
+import os
+
+from drozer.configuration import Configuration
+
+class ModuleInfo(object):
+    """
+    The metadata of a drozer Module, as recorded in the ModuleRegistry, which
+    can be listed, filtered and completed without importing the module.
+    """
+
+    FIELDS = ["author", "date", "klass", "module", "module_type", "name", "path", "payloads", "permissions"]
+
+    def __init__(self, **fields):
+        for field in ModuleInfo.FIELDS:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def fromKlass(cls, klass):
+        """
+        Record the metadata of a Module class.
+        """
+
+        return ModuleInfo(author=klass.author,
+            date=klass.date,
+            klass=klass.__name__,
+            module=klass.__module__,
+            module_type=klass.module_type,
+            name=klass.name,
+            path=list(klass.path),
+            payloads=list(getattr(klass, "payloads", [])),
+            permissions=list(klass.permissions))
+
+    def fqmn(self):
+        """
+        Gets the fully-qualified module name, as Module.fqmn().
+        """
+
+        return ".".join(self.path + [self.klass.lower()])
+
+    def namespace(self):
+        """
+        Get the namespace of the module, as Module.namespace().
+        """
+
+        return ".".join(self.path)
+
+    def toDict(self):
+        return dict((field, getattr(self, field)) for field in ModuleInfo.FIELDS)
+
+
+class ModuleRegistry(object):
+    """
+    An on-disk index of the drozer Modules defined in each Python source file
+    on the module path.
+
+    Each file's entry records its size and modification time, so a file is only
+    imported to refresh its entry when it has changed. Otherwise, the console
+    can start, and list modules, without importing anything.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path):
+        self.path = path
+
+        self.__files = None
+
+    @classmethod
+    def default(cls):
+        """
+        Get a ModuleRegistry in the default location, which can be changed in
+        the [cache] section of the drozer configuration.
+        """
+
+        return ModuleRegistry(Configuration.get("cache", "modules") or os.path.sep.join([os.path.expanduser("~"), ".drozer_module_index"]))
+
+    @classmethod
+    def signature(cls, filepath):
+        """
+        Get the size and modification time of a source file, which are used to
+        tell whether its entry is stale.
+        """
+
+        stat = os.stat(filepath)
+
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def get(self, filepath):
+        """
+        Get the ModuleInfos recorded for a source file, or None if the file has
+        no entry or has changed since its entry was recorded.
+        """
+
+        entry = self.__load().get(filepath)
+
+        try:
+            if entry is not None and entry["signature"] == self.signature(filepath):
+                return [ModuleInfo(**m) for m in entry["modules"]]
+        except OSError:
+            pass
+
+        return None
+
+    def prune(self, filepaths):
+        """
+        Remove the entries of source files that are not in filepaths, which
+        have been deleted or are no longer on the module path, and return the
+        number removed.
+        """
+
+        files = self.__load()
+        stale = set(files.keys()).difference(filepaths)
+
+        for filepath in stale:
+            del files[filepath]
+
+        return len(stale)
+
+    def put(self, filepath, signature, modules):
+        """
+        Record the ModuleInfos defined in a source file, with the signature the
+        file had when it was imported.
+        """
+
+        self.__load()[filepath] = { "signature": signature, "modules": [m.toDict() for m in modules] }
+
+    def save(self):
+        """
+        Write the index to disk.
+
+        The index is written to a temporary file and renamed into place, so a
+        concurrent console never reads a partial index.
+        """
+
+        if self.__files is None:
+            return
+
+        temp = "%s.%d" % (self.path, os.getpid())
+
+        try:
+            with open(temp, "w") as f:
+                json.dump({ "format": ModuleRegistry.FORMAT, "files": self.__files }, f)
+
+            os.replace(temp, self.path)
+        except OSError:
+            # the index is only an optimisation, so carry on without it
+            pass
+
+    def __load(self):
+        if self.__files is None:
+            try:
+                with open(self.path) as f:
+                    index = json.load(f)
+
+                if index.get("format") == ModuleRegistry.FORMAT:
+                    self.__files = index["files"]
+                else:
+                    self.__files = {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                self.__files = {}
+
+        return self.__files
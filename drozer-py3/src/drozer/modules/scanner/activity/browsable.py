@@ -55,7 +55,7 @@ Package: com.android.mms
         if arguments.package is not None:
             packages = [self.packageManager().getPackageInfo(arguments.package, 0)]
         else:
-            packages = self.packageManager().getPackages()
+            packages = self.packageManager().getPackageRecords(["packageName"])
 
         for package in packages:
             try:
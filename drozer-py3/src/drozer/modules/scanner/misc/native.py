@@ -17,22 +17,25 @@ class Native(common.PackageManager, common.ClassLoader, common.Filters, Module):
         parser.add_argument("-v", "--verbose", action="store_true", dest="verbose", default=False, help="be verbose")
 
     def execute(self, arguments):
-        Native = self.loadClass("common/Native.apk", "Native")
+        fields = ["packageName", "nativeLibraries", "sharedLibraryFiles"]
 
         if arguments.package is not None:
-            package = self.packageManager().getPackageInfo(arguments.package, common.PackageManager.GET_PROVIDERS | common.PackageManager.GET_SHARED_LIBRARY_FILES)
+            package = self.packageManager().getPackageRecord(arguments.package, fields, common.PackageManager.GET_SHARED_LIBRARY_FILES)
             
-            self.__find_libraries(package, True, Native)
+            self.__find_libraries(package, True)
+        elif arguments.filter is not None:
+            # only search the APKs of packages that match the filter
+            for package in self.packageManager().getPackageRecords(["packageName"]):
+                if package.packageName.upper().find(arguments.filter.upper()) >= 0:
+                    self.__find_libraries(self.packageManager().getPackageRecord(package.packageName, fields, common.PackageManager.GET_SHARED_LIBRARY_FILES), arguments.verbose)
         else:
-            for package in self.packageManager().getPackages(common.PackageManager.GET_PERMISSIONS | common.PackageManager.GET_SHARED_LIBRARY_FILES):
-                if arguments.filter is None or package.packageName.upper().find(arguments.filter.upper()) >= 0:
-                    self.__find_libraries(package, arguments.verbose, Native)
+            for package in self.packageManager().getPackageRecords(fields, common.PackageManager.GET_SHARED_LIBRARY_FILES):
+                self.__find_libraries(package, arguments.verbose)
     
-    def __find_libraries(self, package, verbose, Native):
-        bundled_libraries = Native.list(package.applicationInfo)
-        shared_libraries = package.applicationInfo.sharedLibraryFiles
-
-
+    def __find_libraries(self, package, verbose):
+        # an application without an ApplicationInfo has no bundled libraries
+        bundled_libraries = package.nativeLibraries or []
+        shared_libraries = package.sharedLibraryFiles
 
         self.stdout.write("Package: %s\n" % package.packageName)
 
@@ -15,23 +15,22 @@ class FindUris(common.FileSystem, common.PackageManager, common.Provider, common
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", help="specify a package to search")
-    
+        parser.add_argument("--local", action="store_true", default=False, help="pull each APK into the local APK store, and search all of its DEX files on this machine")
+        parser.add_argument("--workers", default=8, metavar="N", type=int, help="the number of URIs to probe at once")
+        parser.add_argument("--per-authority", default=2, metavar="N", type=int, help="the number of probes to run at once against a single authority")
+        parser.add_argument("--delay", default=0.0, metavar="SECS", type=float, help="the minimum time between probes of a single authority")
+
     def execute(self, arguments):
         accessible_uris = set([])
         
         # attempt to query each content uri
-        for uri in self.findAllContentUris(arguments.package):
-            try:
-                response = self.contentResolver().query(uri)
-            except ReflectionException:
-                response = None
-            
-            if response.__eq__(None):
-                self.stdout.write("Unable to Query  %s\n" % uri)
+        for result in self.scanContentUris(self.iterContentUris(arguments.package, local=arguments.local), self.__test_uri, workers=arguments.workers, per_authority=arguments.per_authority, interval=arguments.delay):
+            if result.error is not None or not result.value:
+                self.stdout.write("Unable to Query  %s\n" % result.uri)
             else:
-                self.stdout.write("Able to Query    %s\n" % uri)
+                self.stdout.write("Able to Query    %s\n" % result.uri)
 
-                accessible_uris.add(uri)
+                accessible_uris.add(result.uri)
 
         # print out a report
         if len(accessible_uris) > 0:
@@ -40,3 +39,11 @@ class FindUris(common.FileSystem, common.PackageManager, common.Provider, common
                 self.stdout.write("  %s\n" % uri)
         else:
             self.stdout.write("\nNo accessible content URIs found.\n")
+
+    def __test_uri(self, uri):
+        try:
+            response = self.contentResolver().query(uri)
+        except ReflectionException:
+            response = None
+
+        return response != None
@@ -15,15 +15,31 @@ class Injection(common.FileSystem, common.PackageManager, common.Provider, commo
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", "--uri", dest="package_or_uri", help="specify a package, or content uri to search", metavar="<package or uri>")
-        
+        parser.add_argument("--local", action="store_true", default=False, help="pull each APK into the local APK store, and search all of its DEX files on this machine")
+        parser.add_argument("--workers", default=8, metavar="N", type=int, help="the number of URIs to probe at once")
+        parser.add_argument("--per-authority", default=2, metavar="N", type=int, help="the number of probes to run at once against a single authority")
+        parser.add_argument("--delay", default=0.0, metavar="SECS", type=float, help="the minimum time between probes of a single authority")
+
     def execute(self, arguments):
         vulnerable = { 'projection': set([]), 'selection': set([]), 'uris': set([]) }
-    
-        if arguments.package_or_uri is not None and arguments.package_or_uri.startswith("content://"):
-            self.__test_uri(arguments.package_or_uri, vulnerable)
-        else:
-            for uri in self.findAllContentUris(arguments.package_or_uri):
-                self.__test_uri(uri, vulnerable)
+
+        for result in self.scanContentUris(self.contentUrisFor(arguments.package_or_uri, local=arguments.local), self.__test_uri, workers=arguments.workers, per_authority=arguments.per_authority, interval=arguments.delay):
+            vulnerable['uris'].add(result.uri)
+
+            if result.error is not None:
+                self.stderr.write("Could not test %s: %s\n" % (result.uri, result.error))
+                continue
+
+            projection, selection = result.value
+
+            if projection:
+                vulnerable['projection'].add(result.uri)
+                self.stdout.write("Injection in Projection: %s\n" % result.uri)
+            if selection:
+                vulnerable['selection'].add(result.uri)
+                self.stdout.write("Injection in Selection: %s\n" % result.uri)
+
+        self.stdout.write("\n")
 
         # remove the collection of vulnerable URIs from the set of all URIs
         vulnerable['uris'] = vulnerable['uris'] - vulnerable['projection'] - vulnerable['selection']
@@ -50,18 +66,21 @@ class Injection(common.FileSystem, common.PackageManager, common.Provider, commo
         else:
             self.stdout.write("  No vulnerabilities found.\n")
 
-    def __test_uri(self, uri, vulnerable):
-        vulnerable['uris'].add(uri)
+    def __test_uri(self, uri):
+        projection = False
+        selection = False
 
         try:
             self.contentResolver().query(uri, projection=["'"])
         except ReflectionException as e:
             if str(e).find("unrecognized token") >= 0:
-                vulnerable['projection'].add(uri)
+                projection = True
 
         try:
             self.contentResolver().query(uri, selection="'")
         except ReflectionException as e:
             if str(e).find("unrecognized token") >= 0:
-                vulnerable['selection'].add(uri)
+                selection = True
+
+        return (projection, selection)
             
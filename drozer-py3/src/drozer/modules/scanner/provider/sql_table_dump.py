@@ -15,18 +15,20 @@ class SqlTables(common.FileSystem, common.PackageManager, common.Provider, commo
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", "--uri", dest="package_or_uri", help="specify a package, or content uri to search", metavar="<package or uri>")
-        
+        parser.add_argument("--local", action="store_true", default=False, help="pull each APK into the local APK store, and search all of its DEX files on this machine")
+        parser.add_argument("--workers", default=8, metavar="N", type=int, help="the number of URIs to probe at once")
+        parser.add_argument("--per-authority", default=2, metavar="N", type=int, help="the number of probes to run at once against a single authority")
+        parser.add_argument("--delay", default=0.0, metavar="SECS", type=float, help="the minimum time between probes of a single authority")
+
     def execute(self, arguments):
-        results = []
-        if arguments.package_or_uri is not None and arguments.package_or_uri.startswith("content://"):
-            results.append(self.__test_uri(arguments.package_or_uri))
-        else:
-            for uri in self.findAllContentUris(arguments.package_or_uri):
-                results.append(self.__test_uri(uri))
-        
-        if results: 
-            self.stdout.write('\n'.join([_f for _f in results if _f]) + '\n')
-        else:
+        found = False
+
+        for result in self.scanContentUris(self.contentUrisFor(arguments.package_or_uri, local=arguments.local), self.__test_uri, workers=arguments.workers, per_authority=arguments.per_authority, interval=arguments.delay):
+            if result.error is None and result.value:
+                found = True
+                self.stdout.write(result.value + "\n")
+
+        if not found:
             self.stdout.write("No results found.\n")
 
     def __test_uri(self, uri):
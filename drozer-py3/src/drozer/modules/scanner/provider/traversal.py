@@ -15,20 +15,25 @@ class Traversal(common.FileSystem, common.PackageManager, common.Provider, commo
 
     def add_arguments(self, parser):
         parser.add_argument("-a", "--package", "--uri", dest="package_or_uri", help="specify a package, or content uri to search", metavar="<package or uri>")
+        parser.add_argument("--local", action="store_true", default=False, help="pull each APK into the local APK store, and search all of its DEX files on this machine")
+        parser.add_argument("--workers", default=8, metavar="N", type=int, help="the number of URIs to probe at once")
+        parser.add_argument("--per-authority", default=2, metavar="N", type=int, help="the number of probes to run at once against a single authority")
+        parser.add_argument("--delay", default=0.0, metavar="SECS", type=float, help="the minimum time between probes of a single authority")
 
     def execute(self, arguments):
         vulnerable = set([])
         uris = set([])
 
-        if arguments.package_or_uri is not None and arguments.package_or_uri.startswith("content://"):
-            uris.add(arguments.package_or_uri)
+        for result in self.scanContentUris(self.contentUrisFor(arguments.package_or_uri, local=arguments.local), self.__test_uri, workers=arguments.workers, per_authority=arguments.per_authority, interval=arguments.delay):
+            uris.add(result.uri)
 
-            self.__test_uri(arguments.package_or_uri, vulnerable)
-        else:
-            for uri in self.findAllContentUris(arguments.package_or_uri):
-                uris.add(uri)
+            if result.error is not None:
+                self.stderr.write("Could not test %s: %s\n" % (result.uri, result.error))
+            elif result.value:
+                vulnerable.add(result.uri)
+                self.stdout.write("Vulnerable: %s\n" % result.uri)
 
-                self.__test_uri(uri, vulnerable)
+        self.stdout.write("\n")
 
         # remove the collection of vulnerable URIs from the set of all URIs
         uris = uris - vulnerable
@@ -48,7 +53,7 @@ class Traversal(common.FileSystem, common.PackageManager, common.Provider, commo
         else:
             self.stdout.write("  No vulnerable providers found.\n")
 
-    def __test_uri(self, uri, vulnerable):
+    def __test_uri(self, uri):
         try:
             data = self.contentResolver().read(uri + "/../../../../../../../../../../../../../../../../etc/hosts")
         except ReflectionException as e:
@@ -61,6 +66,5 @@ class Traversal(common.FileSystem, common.PackageManager, common.Provider, commo
             else:
                 raise
     
-        if data.__ne__(None) and len(data) > 0:
-            vulnerable.add(uri)
+        return data.__ne__(None) and len(data) > 0
             
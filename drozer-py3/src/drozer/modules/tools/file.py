@@ -14,9 +14,10 @@ class Download(common.ClassLoader, common.FileSystem, Module):
     def add_arguments(self, parser):
         parser.add_argument("source")
         parser.add_argument("destination")
+        parser.add_argument("--resume", action="store_true", default=False, help="continue a partial download, from the end of the local file")
 
     def execute(self, arguments):
-        length = self.downloadFile(arguments.source, arguments.destination)
+        length = self.downloadFile(arguments.source, arguments.destination, resume=arguments.resume)
         
         if length is not None:
             self.stdout.write("Read %d bytes\n" % length)
@@ -98,10 +99,10 @@ class Upload(common.ClassLoader, common.FileSystem, Module):
     def add_arguments(self, parser):
         parser.add_argument("source")
         parser.add_argument("destination")
-        
+        parser.add_argument("--resume", action="store_true", default=False, help="continue a partial upload, from the end of the remote file")
 
     def execute(self, arguments):
-        length = self.uploadFile(arguments.source, arguments.destination)
+        length = self.uploadFile(arguments.source, arguments.destination, resume=arguments.resume)
 
         if length is not None:
             self.stdout.write("Written %d bytes\n" % length)
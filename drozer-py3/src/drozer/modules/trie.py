@@ -0,0 +1,234 @@
+class ModuleTrie(object):
+    """
+    A character trie over module identifiers, which answers the prefix,
+    contains and permission-filtered queries that tab completion makes on
+    every keystroke.
+
+    Each node keeps two masks over the permissions that the modules beneath it
+    require: those required by every module (so a subtree can be skipped if any
+    of them is not granted), and those required by any module (so a subtree
+    can be taken whole if all of them are granted). Substring queries are
+    narrowed with an index of the trigrams in each identifier.
+
+    Results are cached until the trie is next changed.
+    """
+
+    class Node(object):
+
+        __slots__ = ["all_mask", "any_mask", "children", "key", "mask"]
+
+        def __init__(self):
+            self.all_mask = 0
+            self.any_mask = 0
+            self.children = {}
+            self.key = None
+            self.mask = None
+
+    def __init__(self):
+        self.__bits = {}
+        self.__cache = {}
+        self.__modules = {}
+        self.__root = ModuleTrie.Node()
+        self.__trigrams = {}
+
+    def __contains__(self, key):
+        return key in self.__modules
+
+    def __len__(self):
+        return len(self.__modules)
+
+    def find(self, prefix="", contains=None, permissions=None):
+        """
+        Get the sorted identifiers of the modules that start with prefix,
+        contain the string contains, and require no permissions beyond those
+        in permissions (if it is not None).
+        """
+
+        query = (prefix, contains, None if permissions is None else frozenset(permissions))
+
+        if query not in self.__cache:
+            self.__cache[query] = self.__find(*query)
+
+        return list(self.__cache[query])
+
+    def insert(self, key, permissions):
+        """
+        Add a module to the trie, or update the permissions it requires.
+        """
+
+        if key in self.__modules:
+            self.remove(key)
+
+        self.__cache = {}
+        self.__modules[key] = frozenset(permissions)
+
+        mask = self.__mask(permissions)
+        path = [self.__root]
+
+        for c in key:
+            path.append(path[-1].children.setdefault(c, ModuleTrie.Node()))
+
+        path[-1].key = key
+        path[-1].mask = mask
+
+        for node in reversed(path):
+            self.__update(node)
+
+        for trigram in self.__trigramsOf(key):
+            self.__trigrams.setdefault(trigram, set()).add(key)
+
+    def keys(self):
+        """
+        Get the identifiers of every module in the trie.
+        """
+
+        return self.__modules.keys()
+
+    def namespaces(self, prefix="", permissions=None):
+        """
+        Get the namespaces of the modules that start with prefix, and require
+        no permissions beyond those in permissions.
+        """
+
+        return set("." in key and key.rsplit(".", 1)[0] or "" for key in self.find(prefix, None, permissions))
+
+    def permissions(self, key):
+        """
+        Get the permissions required by a module in the trie.
+        """
+
+        return self.__modules[key]
+
+    def remove(self, key):
+        """
+        Remove a module from the trie.
+        """
+
+        if key not in self.__modules:
+            return
+
+        self.__cache = {}
+
+        del self.__modules[key]
+
+        path = [self.__root]
+
+        for c in key:
+            path.append(path[-1].children[c])
+
+        path[-1].key = None
+        path[-1].mask = None
+
+        # update the masks from the leaf up, pruning nodes that are now empty
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+
+            if i > 0 and node.key is None and len(node.children) == 0:
+                del path[i - 1].children[key[i - 1]]
+            else:
+                self.__update(node)
+
+        for trigram in self.__trigramsOf(key):
+            self.__trigrams[trigram].discard(key)
+
+            if len(self.__trigrams[trigram]) == 0:
+                del self.__trigrams[trigram]
+
+    def update(self, modules):
+        """
+        Bring the trie into line with a dict of module identifiers to the
+        permissions they require, inserting and removing only the modules that
+        have changed.
+        """
+
+        for key in [k for k in self.__modules if k not in modules]:
+            self.remove(key)
+
+        for key, permissions in modules.items():
+            if self.__modules.get(key) != frozenset(permissions):
+                self.insert(key, permissions)
+
+    def __collect(self, node, denied, keys):
+        """
+        Collect the keys beneath node, in order, that require none of the
+        permissions in the mask denied.
+        """
+
+        if node.all_mask & denied:
+            # every module here requires a permission that we do not have
+            return
+        elif node.any_mask & denied == 0:
+            # no module here requires a permission that we do not have
+            denied = 0
+
+        if node.key is not None and node.mask & denied == 0:
+            keys.append(node.key)
+
+        for c in sorted(node.children):
+            self.__collect(node.children[c], denied, keys)
+
+    def __find(self, prefix, contains, permissions):
+        node = self.__root
+
+        for c in prefix:
+            if c not in node.children:
+                return []
+
+            node = node.children[c]
+
+        if permissions is None:
+            denied = 0
+        else:
+            granted = self.__mask(p for p in permissions if p in self.__bits)
+            denied = ~granted
+
+        keys = []
+        self.__collect(node, denied, keys)
+
+        if contains is not None:
+            contains = contains.lower()
+            candidates = None
+
+            for trigram in self.__trigramsOf(contains):
+                candidates = self.__trigrams.get(trigram, set()) if candidates is None else candidates.intersection(self.__trigrams.get(trigram, set()))
+
+            keys = [k for k in keys if (candidates is None or k in candidates) and contains in k]
+
+        return keys
+
+    def __mask(self, permissions):
+        mask = 0
+
+        for permission in permissions:
+            if permission not in self.__bits:
+                self.__bits[permission] = 1 << len(self.__bits)
+
+            mask |= self.__bits[permission]
+
+        return mask
+
+    def __trigramsOf(self, key):
+        return set(key[i:i + 3] for i in range(len(key) - 2))
+
+    def __update(self, node):
+        """
+        Recalculate a node's masks from its own module, and its children.
+        """
+
+        if node.key is not None:
+            all_mask = node.mask
+            any_mask = node.mask
+        elif len(node.children) > 0:
+            all_mask = -1
+            any_mask = 0
+        else:
+            node.all_mask = 0
+            node.any_mask = 0
+            return
+
+        for child in node.children.values():
+            all_mask &= child.all_mask
+            any_mask |= child.any_mask
+
+        node.all_mask = all_mask
+        node.any_mask = any_mask
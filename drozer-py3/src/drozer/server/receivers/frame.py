@@ -32,12 +32,14 @@ class FrameReceiver(StreamReceiver):
 
     def streamReceived(self):
         """
-        Called whenever the StreamReceiver is updated. Attempts to read a Frame
-        from the stream, and passes it to frameReceived if there is.
+        Called whenever the StreamReceiver is updated. Reads every complete
+        Frame from the stream, and passes each to frameReceived in turn.
         """
 
         frame = self.buildFrame()
 
-        if frame is not None:
+        while frame is not None:
             self.frameReceived(frame)
+
+            frame = self.buildFrame()
             
\ No newline at end of file
@@ -1,3 +1,5 @@
+from collections.abc import MutableSet
+
 class Session:
     """
     Session encapsulates the parameters of a session, established between an
@@ -5,37 +7,67 @@ class Session:
 
     All sessions are persisted in the Sessions collection, which is a singleton
     instance of SessionCollection. Sessions are accessed by identifier.
+
+    The Session counts the reflection requests forwarded to the device, and the
+    responses forwarded back to the console.
     """
     
     def __init__(self, session_id, device, console):
         self.session_id = session_id
         self.device = device
         self.console = console
+
+        self.requests = 0
+        self.responses = 0
     
 
-class SessionCollection(set):
+class SessionCollection(MutableSet):
     """
-    SessionCollection provides a thin wrapper on top of a set to provide a DSL
-    for interacting with the sessions.
+    SessionCollection provides a set of sessions, indexed by identifier, with
+    a DSL for interacting with them.
     """
+
+    def __init__(self):
+        self.__sessions = {}
     
+    def add(self, session):
+        """
+        Add a Session to the collection, replacing any Session with the same
+        identifier.
+        """
+
+        self.__sessions[session.session_id] = session
+
     def add_session(self, session_id, device, console):
         """
         Create a Session, and add it to the collection.
         """
 
         self.add(Session(session_id, device, console))
+
+    def discard(self, session):
+        """
+        Remove a Session from the collection, if it is present.
+        """
+
+        if session in self:
+            del self.__sessions[session.session_id]
         
     def get(self, session_id):
         """
         Retrieve a Session from the collection, by identifier.
         """
 
-        for session in self:
-            if session.session_id == session_id:
-                return session
+        return self.__sessions.get(session_id)
+
+    def __contains__(self, session):
+        return self.__sessions.get(getattr(session, 'session_id', None)) is session
+
+    def __iter__(self):
+        return iter(list(self.__sessions.values()))
 
-        return None
+    def __len__(self):
+        return len(self.__sessions)
 
 
 Sessions = SessionCollection()
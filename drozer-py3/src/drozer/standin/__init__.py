@@ -0,0 +1,4 @@
+from .agent import Link, StandInAgent
+from .graph import Scenario
+from .reflection import ReflectionHandler
+from .standin import StandIn
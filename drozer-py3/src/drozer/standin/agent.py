@@ -0,0 +1,303 @@
+import heapq
+import itertools
+import socket
+import threading
+import time
+import uuid
+
+from pydiesel.api import Frame
+from pydiesel.api.handlers import SystemRequestHandler
+from pydiesel.api.protobuf_pb2 import Message
+
+from .graph import Scenario
+from .reflection import ReflectionHandler
+
+class Link(object):
+    """
+    Delays the responses written to a connection, to model a link with a
+    fixed latency and limited bandwidth.
+
+    Every frame, in either direction, occupies the link for its size divided
+    by the bandwidth. A response is written latency seconds after the link has
+    finished carrying it, so that many requests in flight share the latency
+    as they would on a real connection.
+    """
+
+    def __init__(self, sock, latency=0.0, bandwidth=None):
+        self.bandwidth = bandwidth
+        self.latency = latency
+
+        self.__busy_until = 0.0
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__queue = []
+        self.__sequence = itertools.count()
+        self.__socket = sock
+
+        if latency > 0 or bandwidth is not None:
+            threading.Thread(target=self.__drain, name="drozer-standin-link", daemon=True).start()
+
+    def close(self):
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+
+    def received(self, size):
+        """
+        Account for a frame of size bytes arriving over the link.
+        """
+
+        with self.__condition:
+            self.__occupy(size)
+
+    def write(self, data):
+        """
+        Write a frame to the connection, once the link would have delivered it.
+        """
+
+        if self.latency <= 0 and self.bandwidth is None:
+            self.__socket.sendall(data)
+            return
+
+        with self.__condition:
+            due = self.__occupy(len(data)) + self.latency
+
+            heapq.heappush(self.__queue, (due, next(self.__sequence), data))
+            self.__condition.notify()
+
+    def __drain(self):
+        while True:
+            with self.__condition:
+                while not self.__closed and (len(self.__queue) == 0 or self.__queue[0][0] > time.time()):
+                    self.__condition.wait(self.__queue[0][0] - time.time() if len(self.__queue) > 0 else None)
+
+                if self.__closed:
+                    return
+
+                due, sequence, data = heapq.heappop(self.__queue)
+
+            try:
+                self.__socket.sendall(data)
+            except OSError:
+                return
+
+    def __occupy(self, size):
+        """
+        Occupy the link for size bytes, and get the time at which it is free
+        again.
+        """
+
+        self.__busy_until = max(self.__busy_until, time.time())
+
+        if self.bandwidth is not None:
+            self.__busy_until += float(size) / self.bandwidth
+
+        return self.__busy_until
+
+
+class StandInAgent(SystemRequestHandler):
+    """
+    A pure-Python stand-in for the drozer Agent, which speaks the drozer
+    protocol to a console (or anything else that uses a SocketTransport) and
+    serves the object graph of a Scenario in place of a real device.
+
+    Each connection is served in its own thread. Each session has its own
+    ObjectStore, while the packages and files of the scenario are shared by
+    every session.
+
+    The agent counts the frames it receives, and records the type of each
+    ReflectionRequest, so that the round trips that a piece of code makes can
+    be measured.
+    """
+
+    def __init__(self, scenario=None, latency=0.0, bandwidth=None, device_id="standin"):
+        self.bandwidth = bandwidth
+        self.device_id = device_id
+        self.frames = 0
+        self.latency = latency
+        self.requests = []
+        self.scenario = scenario or Scenario()
+        self.sessions = {}
+
+        self.__classes = self.scenario.classes()
+        self.__lock = threading.Lock()
+        self.__server = None
+
+    def close(self):
+        """
+        Stop listening for connections.
+        """
+
+        if self.__server is not None:
+            self.__server.close()
+            self.__server = None
+
+    def handleFileTransform(self, request):
+        """
+        Upload or download a file in the scenario's file system, either in
+        whole or, with an offset, in chunks.
+        """
+
+        response = Message.FileTransformResponse(session_id=request.session_id, success=True)
+        fs = self.scenario.fs
+
+        if request.upload:
+            fs.write(request.remote_filename, request.data, request.offset if request.HasField("offset") else None)
+
+            response.size = len(fs.read(request.remote_filename))
+        elif request.remote_filename not in fs.files:
+            response.success = False
+        else:
+            data = fs.read(request.remote_filename)
+
+            if request.HasField("offset"):
+                end = request.offset + request.length if request.HasField("length") else len(data)
+
+                response.data = data[request.offset:end]
+            else:
+                response.data = data
+
+            response.size = len(data)
+
+        return response
+
+    def handleMessage(self, message):
+        """
+        Handle a Message received from the console, and get the response.
+        """
+
+        with self.__lock:
+            self.frames += 1
+
+            if message.type == Message.REFLECTION_REQUEST:
+                self.requests.append(message.reflection_request.type)
+
+        if message.type == Message.SYSTEM_REQUEST:
+            return self.handle(message)
+        elif message.type == Message.REFLECTION_REQUEST:
+            response = Message(id=message.id, type=Message.REFLECTION_RESPONSE)
+            response.reflection_response.MergeFrom(self.sessionHandler(message.reflection_request.session_id).handle(message.reflection_request))
+
+            return response
+        elif message.type == Message.FILE_TRANSFORM_REQUEST:
+            response = Message(id=message.id, type=Message.FILE_TRANSFORM_RESPONSE)
+            response.file_transform_response.MergeFrom(self.handleFileTransform(message.file_transform_request))
+
+            return response
+        else:
+            return None
+
+    def listen(self, host="0.0.0.0", port=31415):
+        """
+        Listen for connections on a TCP port, and serve each in a new thread.
+
+        The port is returned, which is useful when listening on port 0.
+        """
+
+        self.__server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__server.bind((host, port))
+        self.__server.listen(5)
+
+        threading.Thread(target=self.__accept, args=(self.__server,), name="drozer-standin", daemon=True).start()
+
+        return self.__server.getsockname()[1]
+
+    def serve(self, sock):
+        """
+        Serve a single connection, until it is closed.
+        """
+
+        link = Link(sock, self.latency, self.bandwidth)
+
+        try:
+            while True:
+                try:
+                    frame = Frame.readFromSocket(sock)
+                except OSError:
+                    return
+
+                if frame is None:
+                    return
+
+                link.received(8 + frame.length)
+
+                response = self.handleMessage(frame.message())
+
+                if response is not None:
+                    link.write(Frame.fromMessage(response.SerializeToString()).bytes())
+        except OSError:
+            return
+        finally:
+            link.close()
+
+    def sessionHandler(self, session_id):
+        """
+        Get the ReflectionHandler for a session, starting it if necessary.
+        """
+
+        with self.__lock:
+            if session_id not in self.sessions:
+                self.sessions[session_id] = ReflectionHandler(self.__classes)
+
+            return self.sessions[session_id]
+
+    def handle(self, message):
+        if message.system_request.type == Message.SystemRequest.PING:
+            return self.__systemResponse(message, Message.SystemResponse.PONG)
+        else:
+            return SystemRequestHandler.handle(self, message)
+
+    def bindDevice(self, message):
+        return self.__systemResponse(message, Message.SystemResponse.BOUND, status=Message.SystemResponse.ERROR)
+
+    def listDevices(self, message):
+        response = self.__systemResponse(message, Message.SystemResponse.DEVICE_LIST)
+        response.system_response.devices.add(id=self.device_id, manufacturer="drozer", model="stand-in", software="Python")
+
+        return response
+
+    def listSessions(self, message):
+        response = self.__systemResponse(message, Message.SystemResponse.SESSION_LIST)
+
+        for session_id in list(self.sessions.keys()):
+            response.system_response.sessions.add(id=session_id, device_id=self.device_id)
+
+        return response
+
+    def startSession(self, message):
+        session_id = uuid.uuid4().hex
+
+        self.sessionHandler(session_id)
+
+        return self.__systemResponse(message, Message.SystemResponse.SESSION_ID, session_id=session_id)
+
+    def stopSession(self, message):
+        with self.__lock:
+            found = self.sessions.pop(message.system_request.session_id, None) is not None
+
+        return self.__systemResponse(message, Message.SystemResponse.SESSION_ID,
+            status=found and Message.SystemResponse.SUCCESS or Message.SystemResponse.ERROR,
+            session_id=message.system_request.session_id)
+
+    def unbindDevice(self, message):
+        return self.__systemResponse(message, Message.SystemResponse.UNBOUND, status=Message.SystemResponse.ERROR)
+
+    def __accept(self, server):
+        while True:
+            try:
+                sock, address = server.accept()
+            except OSError:
+                return
+
+            threading.Thread(target=self.serve, args=(sock,), name="drozer-standin-connection", daemon=True).start()
+
+    def __systemResponse(self, message, response_type, status=Message.SystemResponse.SUCCESS, **fields):
+        response = Message(id=message.id, type=Message.SYSTEM_RESPONSE)
+        response.system_response.type = response_type
+        response.system_response.status = status
+
+        for name, value in fields.items():
+            setattr(response.system_response, name, value)
+
+        return response
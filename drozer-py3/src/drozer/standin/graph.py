@@ -0,0 +1,833 @@
+import hashlib
+import io
+import json
+import posixpath
+import re
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+
+import yaml
+
+ANDROID = "{http://schemas.android.com/apk/res/android}"
+
+class JavaClass(object):
+    """
+    Stands in for a Java Class: it can be called to construct an instance, and
+    exposes its static fields and methods as attributes.
+    """
+
+    def __init__(self, java_name, constructor=None, **statics):
+        self.java_name = java_name
+
+        self.__constructor = constructor
+        self.__dict__.update(statics)
+
+    def __call__(self, *args):
+        if self.__constructor is None:
+            raise RuntimeError("%s has no accessible constructor" % self.java_name)
+
+        return self.__constructor(*args)
+
+
+class JavaObject(object):
+    """
+    Stands in for a java.lang.Object.
+    """
+
+    java_name = "java.lang.Object"
+
+    def equals(self, other):
+        return self is other
+
+    def hashCode(self):
+        return id(self) & 0x7fffffff
+
+    def toString(self):
+        return "%s@%x" % (self.java_name, self.hashCode())
+
+
+class ArrayList(JavaObject):
+
+    java_name = "java.util.ArrayList"
+
+    def __init__(self, items=()):
+        self.__items = list(items)
+
+    def add(self, item):
+        self.__items.append(item)
+
+        return True
+
+    def contains(self, item):
+        return item in self.__items
+
+    def get(self, index):
+        return self.__items[index]
+
+    def isEmpty(self):
+        return len(self.__items) == 0
+
+    def size(self):
+        return len(self.__items)
+
+    def toArray(self):
+        return list(self.__items)
+
+
+class ApplicationInfo(JavaObject):
+
+    java_name = "android.content.pm.ApplicationInfo"
+
+    FLAG_DEBUGGABLE = 0x2
+    FLAG_ALLOW_BACKUP = 0x8000
+
+    def __init__(self, package):
+        self.packageName = package.name
+        self.processName = package.name
+        self.className = None
+        self.uid = package.uid
+        self.dataDir = package.data_dir
+        self.sourceDir = package.source_dir
+        self.publicSourceDir = package.source_dir
+        self.nativeLibraryDir = posixpath.join(package.data_dir, "lib")
+        self.sharedLibraryFiles = None
+        self.permission = None
+        self.flags = package.flags
+        self.targetSdkVersion = package.target_sdk
+
+        self.__label = package.label
+
+    def loadLabel(self, package_manager=None):
+        return self.__label
+
+
+class ComponentInfo(JavaObject):
+
+    def __init__(self, package, spec):
+        self.name = spec["name"].startswith(".") and package.name + spec["name"] or spec["name"]
+        self.packageName = package.name
+        self.processName = package.name
+        self.applicationInfo = package.application_info
+        self.enabled = spec.get("enabled", True)
+        self.exported = spec.get("exported", False)
+        self.permission = spec.get("permission")
+
+
+class ActivityInfo(ComponentInfo):
+
+    java_name = "android.content.pm.ActivityInfo"
+
+    def __init__(self, package, spec):
+        ComponentInfo.__init__(self, package, spec)
+
+        self.targetActivity = spec.get("target")
+        self.launchMode = spec.get("launch_mode", 0)
+
+
+class ServiceInfo(ComponentInfo):
+
+    java_name = "android.content.pm.ServiceInfo"
+
+
+class ProviderInfo(ComponentInfo):
+
+    java_name = "android.content.pm.ProviderInfo"
+
+    def __init__(self, package, spec):
+        ComponentInfo.__init__(self, package, spec)
+
+        self.authority = spec["authority"]
+        self.readPermission = spec.get("read_permission")
+        self.writePermission = spec.get("write_permission")
+        self.grantUriPermissions = spec.get("grant_uri_permissions", False)
+        self.multiprocess = False
+        self.pathPermissions = None
+        self.uriPermissionPatterns = None
+
+        self.rows = spec.get("rows", [])
+
+
+class PermissionInfo(JavaObject):
+
+    java_name = "android.content.pm.PermissionInfo"
+
+    def __init__(self, package, spec):
+        self.name = spec["name"]
+        self.packageName = package.name
+        self.protectionLevel = spec.get("protection_level", 0)
+        self.group = spec.get("group")
+
+
+class PackageInfo(JavaObject):
+    """
+    A PackageInfo, holding the parts of a Package that were asked for with the
+    PackageManager's flags.
+    """
+
+    java_name = "android.content.pm.PackageInfo"
+
+    def __init__(self, package, flags):
+        self.packageName = package.name
+        self.versionName = package.version_name
+        self.versionCode = package.version_code
+        self.applicationInfo = package.application_info
+        self.sharedUserId = package.shared_user_id
+        self.firstInstallTime = package.installed
+        self.lastUpdateTime = package.installed
+        self.gids = [] if flags & PackageManager.GET_GIDS else None
+
+        self.activities = self.__components(flags, PackageManager.GET_ACTIVITIES, package.activities)
+        self.providers = self.__components(flags, PackageManager.GET_PROVIDERS, package.providers)
+        self.receivers = self.__components(flags, PackageManager.GET_RECEIVERS, package.receivers)
+        self.services = self.__components(flags, PackageManager.GET_SERVICES, package.services)
+
+        if flags & PackageManager.GET_PERMISSIONS and len(package.requested_permissions) > 0:
+            self.requestedPermissions = [name for name, granted in package.requested_permissions]
+            self.requestedPermissionsFlags = [granted and 0x3 or 0x1 for name, granted in package.requested_permissions]
+        else:
+            self.requestedPermissions = None
+            self.requestedPermissionsFlags = None
+
+        self.permissions = self.__components(flags, PackageManager.GET_PERMISSIONS, package.permissions)
+
+    def __components(self, flags, flag, components):
+        if flags & flag and len(components) > 0:
+            return list(components)
+        else:
+            return None
+
+
+class Package(object):
+    """
+    A package installed on the stand-in device, built from a dict as found in
+    a scenario file.
+    """
+
+    def __init__(self, spec, uid):
+        self.name = spec["name"]
+        self.label = spec.get("label", self.name.split(".")[-1])
+        self.uid = spec.get("uid", uid)
+        self.version_code = spec.get("version_code", 1)
+        self.version_name = str(spec.get("version_name", "1.0"))
+        self.data_dir = "/data/data/" + self.name
+        self.source_dir = spec.get("source_dir", "/data/app/%s-1/base.apk" % self.name)
+        self.shared_user_id = spec.get("shared_user_id")
+        self.target_sdk = spec.get("target_sdk", 28)
+        self.installed = spec.get("installed", 1500000000000)
+        self.flags = (spec.get("debuggable", False) and ApplicationInfo.FLAG_DEBUGGABLE) | (spec.get("allow_backup", True) and ApplicationInfo.FLAG_ALLOW_BACKUP)
+        self.requested_permissions = [isinstance(p, str) and (p, True) or (p["name"], p.get("granted", True)) for p in spec.get("uses_permissions", [])]
+
+        self.application_info = ApplicationInfo(self)
+
+        self.activities = [ActivityInfo(self, s) for s in spec.get("activities", [])]
+        self.permissions = [PermissionInfo(self, s) for s in spec.get("permissions", [])]
+        self.providers = [ProviderInfo(self, s) for s in spec.get("providers", [])]
+        self.receivers = [ActivityInfo(self, s) for s in spec.get("receivers", [])]
+        self.services = [ServiceInfo(self, s) for s in spec.get("services", [])]
+
+    def manifest(self):
+        """
+        Render the AndroidManifest.xml of the package, as the APK analyzer
+        prints it.
+        """
+
+        root = ET.Element("manifest", { "package": self.name, ANDROID + "versionCode": str(self.version_code), ANDROID + "versionName": self.version_name })
+
+        if self.shared_user_id is not None:
+            root.set(ANDROID + "sharedUserId", self.shared_user_id)
+
+        for name, granted in self.requested_permissions:
+            ET.SubElement(root, "uses-permission", { ANDROID + "name": name })
+        for permission in self.permissions:
+            ET.SubElement(root, "permission", { ANDROID + "name": permission.name, ANDROID + "protectionLevel": "0x%x" % permission.protectionLevel })
+
+        application = ET.SubElement(root, "application", { ANDROID + "label": self.label,
+                                                           ANDROID + "debuggable": self.__bool(self.flags & ApplicationInfo.FLAG_DEBUGGABLE),
+                                                           ANDROID + "allowBackup": self.__bool(self.flags & ApplicationInfo.FLAG_ALLOW_BACKUP) })
+
+        for tag, components in [("activity", self.activities), ("service", self.services), ("receiver", self.receivers), ("provider", self.providers)]:
+            for component in components:
+                element = ET.SubElement(application, tag, { ANDROID + "name": component.name, ANDROID + "exported": self.__bool(component.exported), ANDROID + "enabled": self.__bool(component.enabled) })
+
+                if component.permission is not None:
+                    element.set(ANDROID + "permission", component.permission)
+
+                if tag == "provider":
+                    element.set(ANDROID + "authorities", component.authority)
+                    element.set(ANDROID + "grantUriPermissions", self.__bool(component.grantUriPermissions))
+
+                    if component.readPermission is not None:
+                        element.set(ANDROID + "readPermission", component.readPermission)
+                    if component.writePermission is not None:
+                        element.set(ANDROID + "writePermission", component.writePermission)
+
+        return ET.tostring(root, encoding="unicode")
+
+    def __bool(self, value):
+        return value and "true" or "false"
+
+
+class ChangedPackages(JavaObject):
+
+    java_name = "android.content.pm.ChangedPackages"
+
+    def __init__(self, sequence, names):
+        self.__names = names
+        self.__sequence = sequence
+
+    def getPackageNames(self):
+        return ArrayList(self.__names)
+
+    def getSequenceNumber(self):
+        return self.__sequence
+
+
+class PackageManager(JavaObject):
+
+    java_name = "android.app.ApplicationPackageManager"
+
+    GET_ACTIVITIES = 0x00000001
+    GET_RECEIVERS = 0x00000002
+    GET_SERVICES = 0x00000004
+    GET_PROVIDERS = 0x00000008
+    GET_GIDS = 0x00000100
+    GET_PERMISSIONS = 0x00001000
+
+    def __init__(self, scenario):
+        self.__scenario = scenario
+
+    def getApplicationInfo(self, name, flags):
+        return self.__package(name).application_info
+
+    def getApplicationLabel(self, application_info):
+        return application_info.loadLabel(self)
+
+    def getChangedPackages(self, sequence):
+        if self.__scenario.sequence <= sequence:
+            return None
+
+        return ChangedPackages(self.__scenario.sequence, [p.name for p in self.__scenario.packages])
+
+    def getInstalledApplications(self, flags):
+        return ArrayList(p.application_info for p in self.__scenario.packages)
+
+    def getInstalledPackages(self, flags):
+        return ArrayList(PackageInfo(p, flags) for p in self.__scenario.packages)
+
+    def getLaunchIntentForPackage(self, name):
+        return None
+
+    def getNameForUid(self, uid):
+        for package in self.__scenario.packages:
+            if package.uid == uid:
+                return package.shared_user_id or package.name
+
+        return None
+
+    def getPackageInfo(self, name, flags):
+        return PackageInfo(self.__package(name), flags)
+
+    def getPackagesForUid(self, uid):
+        names = [p.name for p in self.__scenario.packages if p.uid == uid]
+
+        return len(names) > 0 and names or None
+
+    def queryContentProviders(self, process_name, uid, flags):
+        return ArrayList(provider for package in self.__scenario.packages for provider in package.providers
+            if process_name is None or provider.processName == process_name)
+
+    def __package(self, name):
+        for package in self.__scenario.packages:
+            if package.name == name:
+                return package
+
+        # the PackageManager's NameNotFoundException carries the package name
+        raise RuntimeError(name)
+
+
+class Uri(JavaObject):
+
+    java_name = "android.net.Uri$StringUri"
+
+    def __init__(self, uri):
+        self.__uri = uri
+
+    @classmethod
+    def parse(cls, uri):
+        return Uri(uri)
+
+    def getAuthority(self):
+        rest = self.__uri.split("://", 1)[-1]
+
+        return rest.split("/", 1)[0]
+
+    def getPath(self):
+        rest = self.__uri.split("://", 1)[-1]
+
+        return "/" + rest.split("/", 1)[1] if "/" in rest else ""
+
+    def toString(self):
+        return self.__uri
+
+
+class Cursor(JavaObject):
+    """
+    A Cursor over a list of rows, each a dict from column name to value.
+    """
+
+    java_name = "android.database.MatrixCursor"
+
+    FIELD_TYPE_NULL = 0
+    FIELD_TYPE_INTEGER = 1
+    FIELD_TYPE_FLOAT = 2
+    FIELD_TYPE_STRING = 3
+    FIELD_TYPE_BLOB = 4
+
+    def __init__(self, rows, projection=None):
+        self.__columns = projection or (len(rows) > 0 and list(rows[0].keys()) or [])
+        self.__position = -1
+        self.__rows = rows
+
+    def close(self):
+        pass
+
+    def getBlob(self, column):
+        return self.__value(column)
+
+    def getColumnCount(self):
+        return len(self.__columns)
+
+    def getColumnIndex(self, name):
+        return self.__columns.index(name) if name in self.__columns else -1
+
+    def getColumnName(self, column):
+        return self.__columns[column]
+
+    def getColumnNames(self):
+        return list(self.__columns)
+
+    def getCount(self):
+        return len(self.__rows)
+
+    def getDouble(self, column):
+        return float(self.__value(column))
+
+    def getFloat(self, column):
+        return float(self.__value(column))
+
+    def getInt(self, column):
+        return int(self.__value(column))
+
+    def getLong(self, column):
+        return int(self.__value(column))
+
+    def getPosition(self):
+        return self.__position
+
+    def getString(self, column):
+        value = self.__value(column)
+
+        return str(value) if value is not None else None
+
+    def getType(self, column):
+        value = self.__value(column)
+
+        if value is None:
+            return Cursor.FIELD_TYPE_NULL
+        elif isinstance(value, bytes):
+            return Cursor.FIELD_TYPE_BLOB
+        elif isinstance(value, float):
+            return Cursor.FIELD_TYPE_FLOAT
+        elif isinstance(value, int):
+            return Cursor.FIELD_TYPE_INTEGER
+        else:
+            return Cursor.FIELD_TYPE_STRING
+
+    def isAfterLast(self):
+        return self.__position >= len(self.__rows)
+
+    def isNull(self, column):
+        return self.__value(column) is None
+
+    def moveToFirst(self):
+        return self.moveToPosition(0)
+
+    def moveToNext(self):
+        return self.moveToPosition(self.__position + 1)
+
+    def moveToPosition(self, position):
+        self.__position = min(max(position, -1), len(self.__rows))
+
+        return 0 <= self.__position < len(self.__rows)
+
+    def __value(self, column):
+        return self.__rows[self.__position].get(self.__columns[column])
+
+
+class ContentResolver(JavaObject):
+
+    java_name = "android.app.ContextImpl$ApplicationContentResolver"
+
+    def __init__(self, scenario):
+        self.__scenario = scenario
+
+    def query(self, uri, projection, selection, selection_args, sort_order):
+        provider = self.__provider(uri)
+
+        if provider is None:
+            return None
+
+        return Cursor(provider.rows, projection)
+
+    def __provider(self, uri):
+        for package in self.__scenario.packages:
+            for provider in package.providers:
+                if uri.getAuthority() in provider.authority.split(";"):
+                    if not provider.exported:
+                        raise RuntimeError("Permission Denial: opening provider %s that is not exported" % provider.name)
+
+                    return provider
+
+        return None
+
+
+class FileSystem(object):
+    """
+    The files on the stand-in device, as a dict from absolute path to content.
+    """
+
+    def __init__(self, files={}):
+        self.files = dict((p, c if isinstance(c, bytes) else str(c).encode()) for p, c in files.items())
+
+    def exists(self, path):
+        return path in self.files or self.isDirectory(path)
+
+    def isDirectory(self, path):
+        prefix = path.rstrip("/") + "/"
+
+        return any(p.startswith(prefix) for p in self.files)
+
+    def list(self, path):
+        prefix = path.rstrip("/") + "/"
+
+        return sorted(set(prefix + p[len(prefix):].split("/")[0] for p in self.files if p.startswith(prefix)))
+
+    def read(self, path):
+        return self.files[path]
+
+    def write(self, path, data, offset=None):
+        if offset is None:
+            self.files[path] = data
+        else:
+            self.files[path] = self.files.get(path, b"")[:offset].ljust(offset, b"\0") + data
+
+
+class File(JavaObject):
+
+    java_name = "java.io.File"
+
+    def __init__(self, scenario, path):
+        self.__fs = scenario.fs
+        self.__path = path
+        self.__absolute = posixpath.normpath(posixpath.join(scenario.agent.data_dir, path))
+
+    def canRead(self):
+        return self.exists()
+
+    def delete(self):
+        return self.__fs.files.pop(self.__absolute, None) is not None
+
+    def exists(self):
+        return self.__fs.exists(self.__absolute)
+
+    def getAbsolutePath(self):
+        return self.__absolute
+
+    def getCanonicalPath(self):
+        return self.__absolute
+
+    def getName(self):
+        return posixpath.basename(self.__path)
+
+    def getPath(self):
+        return self.__path
+
+    def isDirectory(self):
+        return self.__fs.isDirectory(self.__absolute)
+
+    def isFile(self):
+        return self.__absolute in self.__fs.files
+
+    def length(self):
+        return len(self.__fs.files.get(self.__absolute, b""))
+
+    def list(self):
+        return [posixpath.basename(p) for p in self.__fs.list(self.__absolute)] if self.isDirectory() else None
+
+    def toString(self):
+        return self.__path
+
+
+class ByteArrayOutputStream(JavaObject):
+
+    java_name = "java.io.ByteArrayOutputStream"
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def close(self):
+        pass
+
+    def toByteArray(self):
+        return self.buffer.getvalue()
+
+
+class PrintStream(JavaObject):
+
+    java_name = "java.io.PrintStream"
+
+    def __init__(self, stream):
+        self.__stream = stream
+
+    def close(self):
+        pass
+
+    def print(self, text):
+        self.__stream.buffer.write(text.encode("utf-8"))
+
+
+class ApkAnalyzerCli(JavaObject):
+    """
+    Stands in for the APK analyzer in shrink.apk, which drozer uses to print
+    the manifest of a package.
+    """
+
+    java_name = "com.android.tools.apk.analyzer.ApkAnalyzerCli"
+
+    def __init__(self, scenario, out, err, impl):
+        self.__err = err
+        self.__out = out
+        self.__scenario = scenario
+
+    def run(self, args):
+        packages = [p for p in self.__scenario.packages if args[-1] == p.name]
+
+        if args[:2] != ["manifest", "print"] or len(packages) == 0:
+            self.__err.print("ERROR: cannot print %s\n" % " ".join(args))
+        else:
+            self.__out.print(packages[0].manifest())
+
+
+class DexClassLoader(JavaObject):
+    """
+    Stands in for a DexClassLoader over one of drozer's helper APKs, serving
+    Python implementations of the classes in the scenario's libraries.
+    """
+
+    java_name = "dalvik.system.DexClassLoader"
+
+    def __init__(self, scenario, path, optimized_directory, library_path, parent):
+        self.__path = path
+        self.__scenario = scenario
+
+    def loadClass(self, name):
+        libraries = self.__scenario.libraries()
+
+        if name not in libraries:
+            raise RuntimeError("java.lang.ClassNotFoundException: %s in %s" % (name, self.__path))
+
+        return libraries[name]
+
+
+class Context(JavaObject):
+
+    java_name = "android.app.ContextImpl"
+
+    def __init__(self, scenario):
+        self.__scenario = scenario
+
+    def getApplicationInfo(self):
+        return self.__scenario.agent.application_info
+
+    def getCacheDir(self):
+        return File(self.__scenario, posixpath.join(self.__scenario.agent.data_dir, "cache"))
+
+    def getCacheDir(self):
+        return File(self.__scenario, posixpath.join(self.__scenario.agent.data_dir, "cache"))
+
+    def getContentResolver(self):
+        return ContentResolver(self.__scenario)
+
+    def getDir(self, name, mode):
+        return File(self.__scenario, posixpath.join(self.__scenario.agent.data_dir, "app_" + name))
+
+    def getDir(self, name, mode):
+        return File(self.__scenario, posixpath.join(self.__scenario.agent.data_dir, "app_" + name))
+
+    def getFilesDir(self):
+        return File(self.__scenario, posixpath.join(self.__scenario.agent.data_dir, "files"))
+
+    def getPackageManager(self):
+        return PackageManager(self.__scenario)
+
+    def getPackageName(self):
+        return self.__scenario.agent.name
+
+
+class Scenario(object):
+    """
+    The object graph served by a stand-in Agent: the packages installed on the
+    device, with their components, content providers and files, and the Agent
+    itself.
+
+    A scenario is usually loaded from a YAML file, or generated with a number
+    of synthetic packages.
+    """
+
+    # the version of the Agent in this tree
+    agent_version = 20409
+
+    AGENT_PACKAGE = { "name": "com.mwr.dz",
+                      "label": "drozer Agent",
+                      "uses_permissions": ["android.permission.INTERNET"] }
+
+    def __init__(self, packages=[], files={}, agent_version=None, sdk=28, context=True):
+        self.agent_version = agent_version or Scenario.agent_version
+        self.context = context
+        self.fs = FileSystem(files)
+        self.packages = []
+        self.sdk = sdk
+        # the number of times a package has been installed, updated or removed
+        self.sequence = 0
+
+        for spec in [Scenario.AGENT_PACKAGE] + [p for p in packages if p["name"] != Scenario.AGENT_PACKAGE["name"]]:
+            self.packages.append(Package(spec, 10000 + len(self.packages)))
+
+        self.agent = self.packages[0]
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a scenario from a YAML file.
+        """
+
+        with open(path) as scenario_file:
+            spec = yaml.safe_load(scenario_file) or {}
+
+        return cls(packages=spec.get("packages", []),
+                   files=spec.get("files", {}),
+                   agent_version=spec.get("agent_version"),
+                   sdk=spec.get("sdk", 28),
+                   context=spec.get("context", True))
+
+    @classmethod
+    def synthetic(cls, count, **kwargs):
+        """
+        Build a scenario with count generated packages, each with a handful of
+        components, permissions and an exported content provider.
+        """
+
+        packages = []
+
+        for i in range(count):
+            name = "com.example.app%04d" % i
+
+            packages.append({ "name": name,
+                              "version_code": i + 1,
+                              "debuggable": i % 7 == 0,
+                              "uses_permissions": ["android.permission.INTERNET", { "name": "android.permission.CAMERA", "granted": i % 2 == 0 }],
+                              "permissions": [{ "name": name + ".permission.READ", "protection_level": i % 3 }],
+                              "activities": [{ "name": ".MainActivity", "exported": True }, { "name": ".SettingsActivity" }],
+                              "services": [{ "name": ".SyncService", "exported": i % 5 == 0 }],
+                              "receivers": [{ "name": ".BootReceiver", "exported": True }],
+                              "providers": [{ "name": ".DataProvider", "authority": name + ".provider", "exported": i % 4 == 0,
+                                              "rows": [{ "_id": r, "name": "row%d" % r } for r in range(5)] }] })
+
+        return cls(packages=packages, **kwargs)
+
+    def classes(self):
+        """
+        Get the classes that can be resolved by name, for a ReflectionHandler.
+        """
+
+        return { "android.net.Uri": JavaClass("android.net.Uri", parse=Uri.parse),
+                 "android.os.Build": JavaClass("android.os.Build", MANUFACTURER="drozer", MODEL="stand-in", PRODUCT="standin", DEVICE="standin"),
+                 "android.os.Build$VERSION": JavaClass("android.os.Build$VERSION", SDK_INT=self.sdk, RELEASE=str(self.sdk)),
+                 "com.mwr.dz.Agent": JavaClass("com.mwr.dz.Agent", getContext=lambda: self.context and Context(self) or None),
+                 "com.mwr.dz.BuildConfig": JavaClass("com.mwr.dz.BuildConfig", VERSION_CODE=self.agent_version),
+                 "com.mwr.jdiesel.util.Strings": JavaClass("com.mwr.jdiesel.util.Strings", get=self.__strings),
+                 "dalvik.system.DexClassLoader": JavaClass("dalvik.system.DexClassLoader", lambda *args: DexClassLoader(self, *args)),
+                 "java.io.ByteArrayOutputStream": JavaClass("java.io.ByteArrayOutputStream", ByteArrayOutputStream),
+                 "java.io.File": JavaClass("java.io.File", lambda path: File(self, path)),
+                 "java.io.PrintStream": JavaClass("java.io.PrintStream", PrintStream),
+                 "java.lang.ClassLoader": JavaClass("java.lang.ClassLoader", getSystemClassLoader=JavaObject),
+                 "java.lang.Object": JavaClass("java.lang.Object", JavaObject),
+                 "java.util.ArrayList": JavaClass("java.util.ArrayList", ArrayList) }
+
+    def libraries(self):
+        """
+        Get the classes in drozer's helper APKs, that a DexClassLoader can
+        load by name.
+        """
+
+        return { "FileUtil": JavaClass("FileUtil", md5sum=self.__md5sum),
+                 "PermissionHelper": JavaClass("PermissionHelper", all=self.__all_permissions, single=self.__single_permission),
+                 "ZipUtil": JavaClass("ZipUtil", unzip=self.__unzip),
+                 "com.android.tools.apk.analyzer.ApkAnalyzerCli": JavaClass("com.android.tools.apk.analyzer.ApkAnalyzerCli", lambda *args: ApkAnalyzerCli(self, *args)),
+                 "com.android.tools.apk.analyzer.ApkAnalyzerImpl": JavaClass("com.android.tools.apk.analyzer.ApkAnalyzerImpl", lambda out: JavaObject()) }
+
+    def __all_permissions(self, package_manager):
+        return json.dumps([self.__permission(p) for package in self.packages for p in package.permissions])
+
+    def __md5sum(self, file):
+        """
+        Get the MD5 checksum of a file, as the FileUtil helper does.
+        """
+
+        path = file.getAbsolutePath()
+
+        if path not in self.fs.files:
+            raise RuntimeError("java.io.FileNotFoundException: %s" % path)
+
+        return hashlib.md5(self.fs.read(path)).hexdigest()
+
+    def __permission(self, permission):
+        return { "packageName": permission.packageName, "name": permission.name, "protectionLevel": permission.protectionLevel }
+
+    def __single_permission(self, package_manager, name):
+        for package in self.packages:
+            for permission in package.permissions:
+                if permission.name == name:
+                    return json.dumps(self.__permission(permission))
+
+        return ""
+
+    def __strings(self, path):
+        """
+        Find the printable strings in a file, as the strings utility would.
+        """
+
+        if path not in self.fs.files:
+            return None
+
+        return "\n".join(s.decode("ascii") for s in re.findall(rb"[\x20-\x7e]{4,}", self.fs.read(path)))
+
+    def __unzip(self, target, source, destination):
+        """
+        Extract an entry from a zip file, as the ZipUtil helper does.
+        """
+
+        if source not in self.fs.files:
+            raise RuntimeError("java.io.FileNotFoundException: %s" % source)
+
+        with zipfile.ZipFile(io.BytesIO(self.fs.read(source))) as archive:
+            for name in archive.namelist():
+                if name.upper() == target.upper():
+                    path = posixpath.join(destination, "%d.tmp" % int(time.time() * 1000))
+
+                    self.fs.write(path, archive.read(name))
+
+                    return File(self, path)
+
+        return None
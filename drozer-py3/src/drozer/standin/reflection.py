@@ -0,0 +1,228 @@
+import struct
+
+from pydiesel.api.protobuf_pb2 import Message
+
+class ReflectionHandler(object):
+    """
+    Answers ReflectionRequests as an Agent would, using plain Python objects in
+    place of Java ones.
+
+    Classes are made available to RESOLVE by name, through the classes dict.
+    Every object returned to the console is kept in objects, an ObjectStore
+    keyed by its reference, until it is deleted. Like the Agent's ObjectStore,
+    an object that is returned again while it is stored keeps its reference.
+
+    Python values are sent as their nearest Java equivalents: a str as a
+    String, bytes as DATA, a list as an array and an int that does not fit
+    into 32 bits as a long. The class name sent with an object is taken from
+    its java_name attribute, if it has one.
+    """
+
+    INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+    FIELDS = { Message.Primitive.BOOL: "bool", Message.Primitive.BYTE: "byte",
+               Message.Primitive.CHAR: "char", Message.Primitive.DOUBLE: "double",
+               Message.Primitive.FLOAT: "float", Message.Primitive.INT: "int",
+               Message.Primitive.LONG: "long", Message.Primitive.SHORT: "short" }
+    FORMATS = { Message.Primitive.BOOL: "?", Message.Primitive.BYTE: "b",
+                Message.Primitive.CHAR: "H", Message.Primitive.DOUBLE: "d",
+                Message.Primitive.FLOAT: "f", Message.Primitive.INT: "i",
+                Message.Primitive.LONG: "q", Message.Primitive.SHORT: "h" }
+
+    def __init__(self, classes={}):
+        self.classes = dict(classes)
+        self.objects = {}
+
+        self.__next_ref = 1
+        self.__refs = {}
+
+    def handle(self, request, batch=None):
+        """
+        Handle a ReflectionRequest, and get the ReflectionResponse.
+        """
+
+        response = Message.ReflectionResponse(session_id=request.session_id, status=Message.ReflectionResponse.SUCCESS)
+
+        try:
+            if request.type == Message.ReflectionRequest.BATCH:
+                results = []
+
+                for inner in request.batch:
+                    results.append(self.handle(inner, results))
+
+                response.batch.extend(results)
+            elif request.type == Message.ReflectionRequest.RESOLVE:
+                if request.resolve.classname not in self.classes:
+                    raise RuntimeError("cannot resolve " + request.resolve.classname)
+
+                response.result.MergeFrom(self.argument(self.classes[request.resolve.classname], request.resolve.classname))
+            elif request.type == Message.ReflectionRequest.CONSTRUCT:
+                klass = self.__object(request.construct.object, batch)
+
+                response.result.MergeFrom(self.argument(klass(*[self.native(a, batch) for a in request.construct.argument])))
+            elif request.type == Message.ReflectionRequest.INVOKE:
+                method = getattr(self.__object(request.invoke.object, batch), request.invoke.method)
+
+                response.result.MergeFrom(self.argument(method(*[self.native(a, batch) for a in request.invoke.argument]), packed=request.accept_packed))
+            elif request.type == Message.ReflectionRequest.GET_PROPERTY:
+                obj = self.__object(request.get_property.object, batch)
+
+                if not self.__isField(obj, request.get_property.property):
+                    raise RuntimeError("no such field " + request.get_property.property)
+
+                response.result.MergeFrom(self.argument(getattr(obj, request.get_property.property), packed=request.accept_packed))
+            elif request.type == Message.ReflectionRequest.SET_PROPERTY:
+                obj = self.__object(request.set_property.object, batch)
+
+                if not self.__isField(obj, request.set_property.property):
+                    raise RuntimeError("no such field " + request.set_property.property)
+
+                setattr(obj, request.set_property.property, self.native(request.set_property.value, batch))
+            elif request.type == Message.ReflectionRequest.DELETE:
+                obj = self.objects.pop(request.delete.object.reference, None)
+
+                if obj is not None:
+                    self.__refs.pop(id(obj), None)
+            elif request.type == Message.ReflectionRequest.DELETE_ALL:
+                self.objects = {}
+                self.__refs = {}
+            else:
+                raise RuntimeError("unsupported request type %d" % request.type)
+        except Exception as e:
+            response.status = Message.ReflectionResponse.ERROR
+            response.errormessage = str(e)
+
+        return response
+
+    def argument(self, value, class_name=None, packed=False):
+        """
+        Get an Argument representation of a Python value, storing it in the
+        ObjectStore if it is sent as an object.
+        """
+
+        argument = Message.Argument()
+
+        if value is None:
+            argument.type = Message.Argument.NULL
+        elif isinstance(value, (bool, int, float)):
+            argument.type = Message.Argument.PRIMITIVE
+            argument.primitive.type = self.__primitiveType([value])
+            setattr(argument.primitive, ReflectionHandler.FIELDS[argument.primitive.type], value)
+        elif isinstance(value, str):
+            argument.type = Message.Argument.STRING
+            argument.string = value
+        elif isinstance(value, bytes):
+            argument.type = Message.Argument.DATA
+            argument.data = value
+        elif isinstance(value, (list, tuple)):
+            argument.type = Message.Argument.ARRAY
+            argument.array.MergeFrom(self.__array(value, packed))
+        else:
+            ref = self.__refs.get(id(value))
+
+            if ref is None or self.objects.get(ref) is not value:
+                ref = self.__next_ref
+                self.__next_ref += 1
+                self.objects[ref] = value
+                self.__refs[id(value)] = ref
+
+            argument.type = Message.Argument.OBJECT
+            argument.object.reference = ref
+
+            if class_name is not None:
+                argument.object.class_name = class_name
+                argument.object.is_class = True
+            else:
+                argument.object.class_name = getattr(value, "java_name", type(value).__name__)
+
+        return argument
+
+    def native(self, argument, batch=None):
+        """
+        Get the Python value of an Argument.
+        """
+
+        if argument.type == Message.Argument.NULL:
+            return None
+        elif argument.type == Message.Argument.PRIMITIVE:
+            return getattr(argument.primitive, ReflectionHandler.FIELDS[argument.primitive.type])
+        elif argument.type == Message.Argument.STRING:
+            return argument.string
+        elif argument.type == Message.Argument.DATA:
+            return argument.data
+        elif argument.type == Message.Argument.ARRAY:
+            if argument.array.HasField("packed"):
+                return self.__unpack(argument.array.packed_type, argument.array.packed)
+            else:
+                return [self.native(e, batch) for e in argument.array.element]
+        else:
+            return self.__object(argument.object, batch)
+
+    def __array(self, values, packed):
+        array = Message.Array()
+
+        if len(values) > 0 and all(isinstance(v, str) for v in values):
+            array.type = Message.Array.STRING
+            array.element.extend([self.argument(v) for v in values])
+        elif len(values) > 0 and all(isinstance(v, (bool, int, float)) for v in values):
+            primitive_type = self.__primitiveType(values)
+
+            array.type = Message.Array.PRIMITIVE
+
+            if packed:
+                array.packed_type = primitive_type
+                array.packed = struct.pack(">%d%s" % (len(values), ReflectionHandler.FORMATS[primitive_type]), *values)
+            else:
+                for value in values:
+                    element = array.element.add(type=Message.Argument.PRIMITIVE)
+                    element.primitive.type = primitive_type
+                    setattr(element.primitive, ReflectionHandler.FIELDS[primitive_type], value)
+        else:
+            array.type = Message.Array.OBJECT
+            array.element.extend([self.argument(v) for v in values])
+
+        return array
+
+    def __isField(self, obj, name):
+        return hasattr(obj, name) and not callable(getattr(obj, name))
+
+    def __object(self, reference, batch):
+        """
+        Get the object that a reference refers to, either in the ObjectStore
+        or, with a batch_index, the result of an earlier request in a batch.
+        """
+
+        if reference.HasField("batch_index"):
+            if batch is None or reference.batch_index >= len(batch) or batch[reference.batch_index].status != Message.ReflectionResponse.SUCCESS:
+                raise RuntimeError("batch result %d is not available" % reference.batch_index)
+
+            result = batch[reference.batch_index].result
+
+            if result.type != Message.Argument.OBJECT:
+                return self.native(result)
+
+            reference = result.object
+
+        if reference.reference not in self.objects:
+            raise RuntimeError("cannot find object %d" % reference.reference)
+
+        return self.objects[reference.reference]
+
+    def __primitiveType(self, values):
+        """
+        Get the narrowest Java type that can hold every one of values.
+        """
+
+        if all(isinstance(v, bool) for v in values):
+            return Message.Primitive.BOOL
+        elif any(isinstance(v, float) for v in values):
+            return Message.Primitive.DOUBLE
+        elif all(ReflectionHandler.INT_MIN <= v <= ReflectionHandler.INT_MAX for v in values):
+            return Message.Primitive.INT
+        else:
+            return Message.Primitive.LONG
+
+    def __unpack(self, primitive_type, packed):
+        fmt = ReflectionHandler.FORMATS[primitive_type]
+
+        return list(struct.unpack(">%d%s" % (len(packed) // struct.calcsize(fmt), fmt), packed))
@@ -0,0 +1,53 @@
+import sys
+import time
+
+from mwr.common import cli
+
+from .agent import StandInAgent
+from .graph import Scenario
+
+class StandIn(cli.Base):
+    """
+    drozer standin COMMAND [OPTIONS]
+
+    Runs a stand-in drozer Agent, written in Python, which serves a scripted
+    set of packages, content providers and files in place of a real device.
+
+    Connect a console to it as you would to an Agent's embedded server, with
+    `drozer console connect --server HOST:PORT`. The latency and bandwidth of
+    the link can be set, to measure how a module behaves over a slow
+    connection.
+    """
+
+    def __init__(self):
+        cli.Base.__init__(self)
+
+    def do_start(self, arguments):
+        """start a stand-in Agent"""
+
+        if arguments.scenario is not None:
+            scenario = Scenario.load(arguments.scenario)
+        else:
+            scenario = Scenario.synthetic(arguments.packages)
+
+        if arguments.agent_version is not None:
+            scenario.agent_version = arguments.agent_version
+
+        agent = StandInAgent(scenario, latency=arguments.latency / 1000.0, bandwidth=arguments.bandwidth)
+        port = agent.listen(port=arguments.port)
+
+        sys.stdout.write("Stand-in Agent (version %d, %d packages) listening on port %d...\n" % (scenario.agent_version, len(scenario.packages), port))
+
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            agent.close()
+
+    def args_for_start(self):
+        self._parser.add_argument("--agent-version", default=None, metavar="VERSION", type=int, help="the version code that the Agent reports")
+        self._parser.add_argument("--bandwidth", default=None, metavar="BYTES", type=int, help="the bandwidth of the link, in bytes per second (default: unlimited)")
+        self._parser.add_argument("--latency", default=0, metavar="MS", type=float, help="the latency of the link, in milliseconds")
+        self._parser.add_argument("--packages", default=100, metavar="N", type=int, help="the number of synthetic packages to install, without a scenario")
+        self._parser.add_argument("--port", default=31415, metavar="PORT", type=int, help="specify the port on which to listen")
+        self._parser.add_argument("--scenario", default=None, metavar="FILE", help="a YAML file describing the packages and files on the device")
@@ -1 +1,2 @@
+from .stream_buffer import StreamBuffer
 from .stream_receiver import StreamReceiver
@@ -0,0 +1,75 @@
+class StreamBuffer(object):
+    """
+    A byte stream backed by a bytearray, which is written to at the end and
+    read from the front. It supports enough of the file interface (read, seek
+    and tell) for readers to back off if a message is incomplete.
+
+    Data that has been read stays in the buffer until compact() is called,
+    which discards it. Anything left unread is then at the start of the buffer,
+    so it is only moved once however long it waits for the rest of its message.
+    """
+
+    def __init__(self):
+        self.__buffer = bytearray()
+        self.__position = 0
+
+    def append(self, data):
+        """
+        Add data to the end of the stream.
+        """
+
+        self.__buffer += data
+
+    def available(self):
+        """
+        Get the number of bytes that have not been read.
+        """
+
+        return len(self.__buffer) - self.__position
+
+    def compact(self):
+        """
+        Discard the data that has been read.
+        """
+
+        if self.__position > 0:
+            del self.__buffer[:self.__position]
+
+            self.__position = 0
+
+    def read(self, length=-1):
+        """
+        Read up to length bytes from the stream, or all available bytes if
+        length is negative.
+        """
+
+        start = self.__position
+
+        if length < 0:
+            end = len(self.__buffer)
+        else:
+            end = min(len(self.__buffer), start + length)
+
+        with memoryview(self.__buffer) as view:
+            data = view[start:end].tobytes()
+
+        self.__position = end
+
+        return data
+
+    def seek(self, position):
+        """
+        Move to a position in the stream, as returned by tell().
+        """
+
+        self.__position = position
+
+    def tell(self):
+        """
+        Get the current position in the stream.
+        """
+
+        return self.__position
+
+    def __len__(self):
+        return self.available()
@@ -1,6 +1,7 @@
-from io import StringIO
 from twisted.internet.protocol import Protocol
 
+from .stream_buffer import StreamBuffer
+
 class StreamReceiver(Protocol):
     """
     A Twisted Protocol that receives data from the runtime, and recombines it
@@ -21,32 +22,19 @@ class StreamReceiver(Protocol):
         initialises the buffer we will use.
         """
 
-        self.stream = StringIO()
+        self.stream = StreamBuffer()
     
     def dataReceived(self, data):
         """
         Called whenever more data is received from the client. The data is
         added to the stream, and streamReceived() called on the implementation.
 
-        If the implementation has consumed the entire stream, we truncate
-        it to preserve memory.
+        Afterwards, whatever the implementation has consumed is discarded to
+        preserve memory.
         """
 
-        self.__enqueue(data)
+        self.stream.append(data)
         
         self.streamReceived()
 
-        if self.stream.tell() == self.stream.len:
-            self.stream.truncate(0)
-
-    def __enqueue(self, data):
-        """
-        Append some more data to the end of the stream.
-        """
-
-        position = self.stream.tell()
-
-        self.stream.seek(self.stream.len)
-        self.stream.write(data)
-        self.stream.seek(position)
-        
\ No newline at end of file
+        self.stream.compact()
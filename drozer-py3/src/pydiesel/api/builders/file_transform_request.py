@@ -19,6 +19,19 @@ class FileTransformRequestFactory:
 
         return self.builder.SerializeToString()
 
+    def setChunk(self, offset: int, length: Optional[int] = None):
+        """
+        Address the transfer to part of the file: a download reads up to length
+        bytes from offset, and an upload writes its data at offset.
+        """
+
+        self.builder.file_transform_request.offset = offset
+
+        if length is not None:
+            self.builder.file_transform_request.length = length
+
+        return self
+
     def setSessionId(self, session_id):
         """
         Set session identifier, to route a message correctly on the Agent.
@@ -10,6 +10,21 @@ class ReflectionRequestFactory:
         self.builder = Message(type=Message.REFLECTION_REQUEST)
         self.builder.reflection_request.type = request_type
     
+    @classmethod
+    def batch(cls, requests):
+        """
+        Helper method to build a BATCH request, which carries a sequence of
+        other ReflectionRequests to be executed by the Agent in a single round
+        trip.
+        """
+
+        builder = ReflectionRequestFactory(Message.ReflectionRequest.BATCH)
+
+        for request in requests:
+            builder.builder.reflection_request.batch.add().MergeFrom(request.builder.reflection_request)
+
+        return builder
+
     def build(self):
         """
         Serialize the built Message to a String, using the Protocol Buffer
@@ -66,10 +81,13 @@ class ReflectionRequestFactory:
         """
         Helper method to build a GET_PROPERTY request, to get the value of an
         object's field.
+
+        An Agent that supports it may pack a primitive array value.
         """
 
         builder = ReflectionRequestFactory(Message.ReflectionRequest.GET_PROPERTY)
 
+        builder.builder.reflection_request.accept_packed = True
         builder.builder.reflection_request.get_property.object.reference = ref
         builder.builder.reflection_request.get_property.property = property_name
         
@@ -79,10 +97,13 @@ class ReflectionRequestFactory:
     def invoke(cls, ref, method_name):
         """
         Helper method to build an INVOKE request, to call a method on an object.
+
+        An Agent that supports it may pack a primitive array return value.
         """
 
         builder = ReflectionRequestFactory(Message.ReflectionRequest.INVOKE)
 
+        builder.builder.reflection_request.accept_packed = True
         builder.builder.reflection_request.invoke.object.reference = ref
         builder.builder.reflection_request.invoke.method = method_name
         
@@ -149,6 +170,9 @@ class ReflectionRequestFactory:
         """
 
         self.builder.reflection_request.session_id = session_id
+
+        for request in self.builder.reflection_request.batch:
+            request.session_id = session_id
         
         return self
         
\ No newline at end of file
@@ -48,13 +48,15 @@ class Frame:
         Determine the type of the Message encapsulated in this Frame.
         """
 
-        if self.message().type == Message.REFLECTION_REQUEST:
+        message_type = self.message().type
+
+        if message_type == Message.REFLECTION_REQUEST:
             return "REFLECTION_REQUEST"
-        elif self.message().type == Message.REFLECTION_RESPONSE:
+        elif message_type == Message.REFLECTION_RESPONSE:
             return "REFLECTION_RESPONSE"
-        elif self.message().type == Message.SYSTEM_REQUEST:
+        elif message_type == Message.SYSTEM_REQUEST:
             return "SYSTEM_REQUEST"
-        elif self.message().type == Message.SYSTEM_RESPONSE:
+        elif message_type == Message.SYSTEM_RESPONSE:
             return "SYSTEM_RESPONSE"
         else:
             return "UNKNOWN"
@@ -90,24 +92,43 @@ class Frame:
         Read a Frame from a network Socket.
 
         This blocks until a header is available, then continues to block until
-        the entire payload has been read.
+        the entire payload has been read. The payload is read straight into a
+        buffer of the advertised length, and None is returned if the socket is
+        closed part way through a frame.
         """
 
-        header = socket.recv(8)
+        header = bytearray(8)
 
-        if len(header) == 8:
-            version, length = unpack(">II", header)
-            payload = b""
+        if not cls.__readInto(socket, memoryview(header)):
+            return None
 
-            while len(payload) != length:
-                # TODO: add a timeout in here!
-                payload += socket.recv(length - len(payload))
+        version, length = unpack(">II", header)
+        payload = bytearray(length)
+
+        if not cls.__readInto(socket, memoryview(payload)):
+            return None
+
+        return Frame(version, length, payload)
+
+    @classmethod
+    def __readInto(cls, socket, view):
+        """
+        Fill a memoryview with data from a Socket, returning False if the
+        socket is closed before it is full.
+        """
+
+        offset = 0
+
+        while offset < len(view):
+            count = socket.recv_into(view[offset:], len(view) - offset)
+
+            if count == 0:
+                return False
+
+            offset += count
+
+        return True
 
-                if len(payload) == length:
-                    return Frame(version, length, payload)
-        
-        return None
-            
     def __repr__(self):
         return "<pydiesel.api.Frame version={} length={} {} {} />".format(
             self.version, self.length, self.isValid() and 'VALID' or 'INVALID',
@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: protobuf.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -15,1498 +13,68 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='protobuf.proto',
-  package='com.mwr.jdiesel.api',
-  serialized_pb=_b('\n\x0eprotobuf.proto\x12\x13\x63om.mwr.jdiesel.api\"\xb4!\n\x07Message\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x36\n\x04type\x18\x02 \x02(\x0e\x32(.com.mwr.jdiesel.api.Message.MessageType\x12\x42\n\x0esystem_request\x18\x05 \x01(\x0b\x32*.com.mwr.jdiesel.api.Message.SystemRequest\x12\x44\n\x0fsystem_response\x18\x06 \x01(\x0b\x32+.com.mwr.jdiesel.api.Message.SystemResponse\x12J\n\x12reflection_request\x18\x07 \x01(\x0b\x32..com.mwr.jdiesel.api.Message.ReflectionRequest\x12L\n\x13reflection_response\x18\x08 \x01(\x0b\x32/.com.mwr.jdiesel.api.Message.ReflectionResponse\x12Q\n\x16\x66ile_transform_request\x18\t \x01(\x0b\x32\x31.com.mwr.jdiesel.api.Message.FileTransformRequest\x12S\n\x17\x66ile_transform_response\x18\n \x01(\x0b\x32\x32.com.mwr.jdiesel.api.Message.FileTransformResponse\x1a\xa2\n\n\x11ReflectionRequest\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12H\n\x04type\x18\x02 \x02(\x0e\x32:.com.mwr.jdiesel.api.Message.ReflectionRequest.RequestType\x12G\n\x07resolve\x18\x03 \x01(\x0b\x32\x36.com.mwr.jdiesel.api.Message.ReflectionRequest.Resolve\x12K\n\tconstruct\x18\x04 \x01(\x0b\x32\x38.com.mwr.jdiesel.api.Message.ReflectionRequest.Construct\x12\x45\n\x06invoke\x18\x05 \x01(\x0b\x32\x35.com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke\x12P\n\x0cset_property\x18\x06 \x01(\x0b\x32:.com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty\x12P\n\x0cget_property\x18\x07 \x01(\x0b\x32:.com.mwr.jdiesel.api.Message.ReflectionRequest.GetProperty\x12\x45\n\x06\x64\x65lete\x18\x08 \x01(\x0b\x32\x35.com.mwr.jdiesel.api.Message.ReflectionRequest.Delete\x1a\x1c\n\x07Resolve\x12\x11\n\tclassname\x18\x01 \x01(\t\x1a\x82\x01\n\tConstruct\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x37\n\x08\x61rgument\x18\x02 \x03(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x1a\x8f\x01\n\x06Invoke\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x37\n\x08\x61rgument\x18\x03 \x03(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x1a\x93\x01\n\x0bSetProperty\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x10\n\x08property\x18\x02 \x01(\t\x12\x34\n\x05value\x18\x03 \x01(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x1a]\n\x0bGetProperty\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x10\n\x08property\x18\x02 \x01(\t\x1a\x46\n\x06\x44\x65lete\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\"u\n\x0bRequestType\x12\x0b\n\x07RESOLVE\x10\x01\x12\r\n\tCONSTRUCT\x10\x02\x12\n\n\x06INVOKE\x10\x03\x12\x10\n\x0cSET_PROPERTY\x10\x04\x12\x10\n\x0cGET_PROPERTY\x10\x05\x12\n\n\x06\x44\x45LETE\x10\x06\x12\x0e\n\nDELETE_ALL\x10\x07\x1a\xfa\x01\n\x12ReflectionResponse\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12N\n\x06status\x18\x02 \x02(\x0e\x32>.com.mwr.jdiesel.api.Message.ReflectionResponse.ResponseStatus\x12\x35\n\x06result\x18\x03 \x01(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x12\x14\n\x0c\x65rrormessage\x18\x08 \x01(\t\"3\n\x0eResponseStatus\x12\x0b\n\x07SUCCESS\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\t\n\x05\x46\x41TAL\x10\x03\x1a\xd3\x02\n\rSystemRequest\x12J\n\x04type\x18\x01 \x02(\x0e\x32\x36.com.mwr.jdiesel.api.Message.SystemRequest.RequestType:\x04PING\x12\x33\n\x06\x64\x65vice\x18\x05 \x01(\x0b\x32#.com.mwr.jdiesel.api.Message.Device\x12\x12\n\nsession_id\x18\x07 \x01(\t\x12\x10\n\x08password\x18\x08 \x01(\t\"\x9a\x01\n\x0bRequestType\x12\x08\n\x04PING\x10\x01\x12\x0f\n\x0b\x42IND_DEVICE\x10\x02\x12\x11\n\rUNBIND_DEVICE\x10\x03\x12\x10\n\x0cLIST_DEVICES\x10\x04\x12\x11\n\rSTART_SESSION\x10\x05\x12\x10\n\x0cSTOP_SESSION\x10\x06\x12\x13\n\x0fRESTART_SESSION\x10\x07\x12\x11\n\rLIST_SESSIONS\x10\x08\x1a\xcc\x03\n\x0eSystemResponse\x12\x46\n\x04type\x18\x01 \x02(\x0e\x32\x38.com.mwr.jdiesel.api.Message.SystemResponse.ResponseType\x12J\n\x06status\x18\x02 \x02(\x0e\x32:.com.mwr.jdiesel.api.Message.SystemResponse.ResponseStatus\x12\x34\n\x07\x64\x65vices\x18\x06 \x03(\x0b\x32#.com.mwr.jdiesel.api.Message.Device\x12\x12\n\nsession_id\x18\x07 \x01(\t\x12\x15\n\rerror_message\x18\x08 \x01(\t\x12\x36\n\x08sessions\x18\t \x03(\x0b\x32$.com.mwr.jdiesel.api.Message.Session\"c\n\x0cResponseType\x12\x08\n\x04PONG\x10\x01\x12\t\n\x05\x42OUND\x10\x02\x12\x0b\n\x07UNBOUND\x10\x03\x12\x0f\n\x0b\x44\x45VICE_LIST\x10\x04\x12\x0e\n\nSESSION_ID\x10\x05\x12\x10\n\x0cSESSION_LIST\x10\x06\"(\n\x0eResponseStatus\x12\x0b\n\x07SUCCESS\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x1a\xf4\x02\n\x08\x41rgument\x12H\n\x04type\x18\x01 \x02(\x0e\x32\x32.com.mwr.jdiesel.api.Message.Argument.ArgumentType:\x06STRING\x12\x39\n\tprimitive\x18\x02 \x01(\x0b\x32&.com.mwr.jdiesel.api.Message.Primitive\x12\x0e\n\x06string\x18\x03 \x01(\t\x12<\n\x06object\x18\x04 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x31\n\x05\x61rray\x18\x05 \x01(\x0b\x32\".com.mwr.jdiesel.api.Message.Array\x12\x0c\n\x04\x64\x61ta\x18\x06 \x01(\x0c\"T\n\x0c\x41rgumentType\x12\x08\n\x04NULL\x10\x01\x12\r\n\tPRIMITIVE\x10\x02\x12\n\n\x06STRING\x10\x03\x12\n\n\x06OBJECT\x10\x04\x12\t\n\x05\x41RRAY\x10\x05\x12\x08\n\x04\x44\x41TA\x10\x06\x1a\xc2\x01\n\x05\x41rray\x12\x42\n\x04type\x18\x01 \x02(\x0e\x32,.com.mwr.jdiesel.api.Message.Array.ArrayType:\x06STRING\x12\x36\n\x07\x65lement\x18\x02 \x03(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\"=\n\tArrayType\x12\r\n\tPRIMITIVE\x10\x01\x12\n\n\x06STRING\x10\x02\x12\n\n\x06OBJECT\x10\x03\x12\t\n\x05\x41RRAY\x10\x04\x1aK\n\x06\x44\x65vice\x12\n\n\x02id\x18\x01 \x02(\t\x12\x14\n\x0cmanufacturer\x18\x02 \x02(\t\x12\r\n\x05model\x18\x03 \x02(\t\x12\x10\n\x08software\x18\x04 \x02(\t\x1a$\n\x0fObjectReference\x12\x11\n\treference\x18\x01 \x01(\x05\x1a\xa6\x02\n\tPrimitive\x12\x42\n\x04type\x18\x01 \x02(\x0e\x32\x34.com.mwr.jdiesel.api.Message.Primitive.PrimitiveType\x12\x0c\n\x04\x62ool\x18\x02 \x01(\x08\x12\x0b\n\x03int\x18\x03 \x01(\x05\x12\x0c\n\x04long\x18\x04 \x01(\x03\x12\r\n\x05\x66loat\x18\x05 \x01(\x02\x12\x0c\n\x04\x62yte\x18\x06 \x01(\x05\x12\r\n\x05short\x18\x07 \x01(\x05\x12\x0e\n\x06\x64ouble\x18\x08 \x01(\x01\x12\x0c\n\x04\x63har\x18\t \x01(\x05\"b\n\rPrimitiveType\x12\x08\n\x04\x42OOL\x10\x01\x12\x07\n\x03INT\x10\x02\x12\x08\n\x04LONG\x10\x03\x12\t\n\x05\x46LOAT\x10\x04\x12\x08\n\x04\x42YTE\x10\x05\x12\t\n\x05SHORT\x10\x06\x12\n\n\x06\x44OUBLE\x10\x07\x12\x08\n\x04\x43HAR\x10\x08\x1a(\n\x07Session\x12\n\n\x02id\x18\x01 \x02(\t\x12\x11\n\tdevice_id\x18\x02 \x02(\t\x1a\x61\n\x14\x46ileTransformRequest\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12\x0e\n\x06upload\x18\x02 \x02(\x08\x12\x17\n\x0fremote_filename\x18\x03 \x02(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x1aJ\n\x15\x46ileTransformResponse\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12\x0f\n\x07success\x18\x02 \x02(\x08\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"\xa0\x01\n\x0bMessageType\x12\x12\n\x0eSYSTEM_REQUEST\x10\x01\x12\x13\n\x0fSYSTEM_RESPONSE\x10\x02\x12\x16\n\x12REFLECTION_REQUEST\x10\x03\x12\x17\n\x13REFLECTION_RESPONSE\x10\x04\x12\x1a\n\x16\x46ILE_TRANSFORM_REQUEST\x10\x05\x12\x1b\n\x17\x46ILE_TRANSFORM_RESPONSE\x10\x06\x42\x02H\x01')
-)
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-
-
-_MESSAGE_REFLECTIONREQUEST_REQUESTTYPE = _descriptor.EnumDescriptor(
-  name='RequestType',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.RequestType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='RESOLVE', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONSTRUCT', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INVOKE', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SET_PROPERTY', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GET_PROPERTY', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DELETE', index=5, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DELETE_ALL', index=6, number=7,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=1777,
-  serialized_end=1894,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_REFLECTIONREQUEST_REQUESTTYPE)
-
-_MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS = _descriptor.EnumDescriptor(
-  name='ResponseStatus',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionResponse.ResponseStatus',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SUCCESS', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ERROR', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FATAL', index=2, number=3,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=2096,
-  serialized_end=2147,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS)
-
-_MESSAGE_SYSTEMREQUEST_REQUESTTYPE = _descriptor.EnumDescriptor(
-  name='RequestType',
-  full_name='com.mwr.jdiesel.api.Message.SystemRequest.RequestType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='PING', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BIND_DEVICE', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNBIND_DEVICE', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LIST_DEVICES', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='START_SESSION', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STOP_SESSION', index=5, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RESTART_SESSION', index=6, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LIST_SESSIONS', index=7, number=8,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=2335,
-  serialized_end=2489,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_SYSTEMREQUEST_REQUESTTYPE)
-
-_MESSAGE_SYSTEMRESPONSE_RESPONSETYPE = _descriptor.EnumDescriptor(
-  name='ResponseType',
-  full_name='com.mwr.jdiesel.api.Message.SystemResponse.ResponseType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='PONG', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BOUND', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='UNBOUND', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DEVICE_LIST', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SESSION_ID', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SESSION_LIST', index=5, number=6,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=2811,
-  serialized_end=2910,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_SYSTEMRESPONSE_RESPONSETYPE)
-
-_MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS = _descriptor.EnumDescriptor(
-  name='ResponseStatus',
-  full_name='com.mwr.jdiesel.api.Message.SystemResponse.ResponseStatus',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SUCCESS', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ERROR', index=1, number=2,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=2096,
-  serialized_end=2136,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS)
-
-_MESSAGE_ARGUMENT_ARGUMENTTYPE = _descriptor.EnumDescriptor(
-  name='ArgumentType',
-  full_name='com.mwr.jdiesel.api.Message.Argument.ArgumentType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NULL', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PRIMITIVE', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STRING', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OBJECT', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ARRAY', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DATA', index=5, number=6,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=3243,
-  serialized_end=3327,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_ARGUMENT_ARGUMENTTYPE)
-
-_MESSAGE_ARRAY_ARRAYTYPE = _descriptor.EnumDescriptor(
-  name='ArrayType',
-  full_name='com.mwr.jdiesel.api.Message.Array.ArrayType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='PRIMITIVE', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='STRING', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OBJECT', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ARRAY', index=3, number=4,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=3463,
-  serialized_end=3524,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_ARRAY_ARRAYTYPE)
-
-_MESSAGE_PRIMITIVE_PRIMITIVETYPE = _descriptor.EnumDescriptor(
-  name='PrimitiveType',
-  full_name='com.mwr.jdiesel.api.Message.Primitive.PrimitiveType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='BOOL', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INT', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LONG', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FLOAT', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='BYTE', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SHORT', index=5, number=6,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DOUBLE', index=6, number=7,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CHAR', index=7, number=8,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=3838,
-  serialized_end=3936,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_PRIMITIVE_PRIMITIVETYPE)
-
-_MESSAGE_MESSAGETYPE = _descriptor.EnumDescriptor(
-  name='MessageType',
-  full_name='com.mwr.jdiesel.api.Message.MessageType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='SYSTEM_REQUEST', index=0, number=1,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SYSTEM_RESPONSE', index=1, number=2,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='REFLECTION_REQUEST', index=2, number=3,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='REFLECTION_RESPONSE', index=3, number=4,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FILE_TRANSFORM_REQUEST', index=4, number=5,
-      options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FILE_TRANSFORM_RESPONSE', index=5, number=6,
-      options=None,
-      type=None),
-  ],
-  containing_type=None,
-  options=None,
-  serialized_start=4156,
-  serialized_end=4316,
-)
-_sym_db.RegisterEnumDescriptor(_MESSAGE_MESSAGETYPE)
-
-
-_MESSAGE_REFLECTIONREQUEST_RESOLVE = _descriptor.Descriptor(
-  name='Resolve',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Resolve',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='classname', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Resolve.classname', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1151,
-  serialized_end=1179,
-)
-
-_MESSAGE_REFLECTIONREQUEST_CONSTRUCT = _descriptor.Descriptor(
-  name='Construct',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Construct',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='object', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Construct.object', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='argument', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Construct.argument', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1182,
-  serialized_end=1312,
-)
-
-_MESSAGE_REFLECTIONREQUEST_INVOKE = _descriptor.Descriptor(
-  name='Invoke',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='object', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke.object', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='method', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke.method', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='argument', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke.argument', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1315,
-  serialized_end=1458,
-)
-
-_MESSAGE_REFLECTIONREQUEST_SETPROPERTY = _descriptor.Descriptor(
-  name='SetProperty',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='object', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty.object', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='property', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty.property', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty.value', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1461,
-  serialized_end=1608,
-)
-
-_MESSAGE_REFLECTIONREQUEST_GETPROPERTY = _descriptor.Descriptor(
-  name='GetProperty',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.GetProperty',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='object', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.GetProperty.object', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='property', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.GetProperty.property', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1610,
-  serialized_end=1703,
-)
-
-_MESSAGE_REFLECTIONREQUEST_DELETE = _descriptor.Descriptor(
-  name='Delete',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Delete',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='object', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.Delete.object', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1705,
-  serialized_end=1775,
-)
-
-_MESSAGE_REFLECTIONREQUEST = _descriptor.Descriptor(
-  name='ReflectionRequest',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.type', index=1,
-      number=2, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='resolve', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.resolve', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='construct', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.construct', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='invoke', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.invoke', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='set_property', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.set_property', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='get_property', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.get_property', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='delete', full_name='com.mwr.jdiesel.api.Message.ReflectionRequest.delete', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[_MESSAGE_REFLECTIONREQUEST_RESOLVE, _MESSAGE_REFLECTIONREQUEST_CONSTRUCT, _MESSAGE_REFLECTIONREQUEST_INVOKE, _MESSAGE_REFLECTIONREQUEST_SETPROPERTY, _MESSAGE_REFLECTIONREQUEST_GETPROPERTY, _MESSAGE_REFLECTIONREQUEST_DELETE, ],
-  enum_types=[
-    _MESSAGE_REFLECTIONREQUEST_REQUESTTYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=580,
-  serialized_end=1894,
-)
-
-_MESSAGE_REFLECTIONRESPONSE = _descriptor.Descriptor(
-  name='ReflectionResponse',
-  full_name='com.mwr.jdiesel.api.Message.ReflectionResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='com.mwr.jdiesel.api.Message.ReflectionResponse.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='status', full_name='com.mwr.jdiesel.api.Message.ReflectionResponse.status', index=1,
-      number=2, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='result', full_name='com.mwr.jdiesel.api.Message.ReflectionResponse.result', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='errormessage', full_name='com.mwr.jdiesel.api.Message.ReflectionResponse.errormessage', index=3,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1897,
-  serialized_end=2147,
-)
-
-_MESSAGE_SYSTEMREQUEST = _descriptor.Descriptor(
-  name='SystemRequest',
-  full_name='com.mwr.jdiesel.api.Message.SystemRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.SystemRequest.type', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=True, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='device', full_name='com.mwr.jdiesel.api.Message.SystemRequest.device', index=1,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='com.mwr.jdiesel.api.Message.SystemRequest.session_id', index=2,
-      number=7, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='password', full_name='com.mwr.jdiesel.api.Message.SystemRequest.password', index=3,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESSAGE_SYSTEMREQUEST_REQUESTTYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2150,
-  serialized_end=2489,
-)
-
-_MESSAGE_SYSTEMRESPONSE = _descriptor.Descriptor(
-  name='SystemResponse',
-  full_name='com.mwr.jdiesel.api.Message.SystemResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.SystemResponse.type', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='status', full_name='com.mwr.jdiesel.api.Message.SystemResponse.status', index=1,
-      number=2, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='devices', full_name='com.mwr.jdiesel.api.Message.SystemResponse.devices', index=2,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='com.mwr.jdiesel.api.Message.SystemResponse.session_id', index=3,
-      number=7, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='error_message', full_name='com.mwr.jdiesel.api.Message.SystemResponse.error_message', index=4,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sessions', full_name='com.mwr.jdiesel.api.Message.SystemResponse.sessions', index=5,
-      number=9, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESSAGE_SYSTEMRESPONSE_RESPONSETYPE,
-    _MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2492,
-  serialized_end=2952,
-)
-
-_MESSAGE_ARGUMENT = _descriptor.Descriptor(
-  name='Argument',
-  full_name='com.mwr.jdiesel.api.Message.Argument',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.Argument.type', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=True, default_value=3,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='primitive', full_name='com.mwr.jdiesel.api.Message.Argument.primitive', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='string', full_name='com.mwr.jdiesel.api.Message.Argument.string', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='object', full_name='com.mwr.jdiesel.api.Message.Argument.object', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='array', full_name='com.mwr.jdiesel.api.Message.Argument.array', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='data', full_name='com.mwr.jdiesel.api.Message.Argument.data', index=5,
-      number=6, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESSAGE_ARGUMENT_ARGUMENTTYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2955,
-  serialized_end=3327,
-)
-
-_MESSAGE_ARRAY = _descriptor.Descriptor(
-  name='Array',
-  full_name='com.mwr.jdiesel.api.Message.Array',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.Array.type', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=True, default_value=2,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='element', full_name='com.mwr.jdiesel.api.Message.Array.element', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESSAGE_ARRAY_ARRAYTYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3330,
-  serialized_end=3524,
-)
-
-_MESSAGE_DEVICE = _descriptor.Descriptor(
-  name='Device',
-  full_name='com.mwr.jdiesel.api.Message.Device',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='com.mwr.jdiesel.api.Message.Device.id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='manufacturer', full_name='com.mwr.jdiesel.api.Message.Device.manufacturer', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='model', full_name='com.mwr.jdiesel.api.Message.Device.model', index=2,
-      number=3, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='software', full_name='com.mwr.jdiesel.api.Message.Device.software', index=3,
-      number=4, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3526,
-  serialized_end=3601,
-)
-
-_MESSAGE_OBJECTREFERENCE = _descriptor.Descriptor(
-  name='ObjectReference',
-  full_name='com.mwr.jdiesel.api.Message.ObjectReference',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='reference', full_name='com.mwr.jdiesel.api.Message.ObjectReference.reference', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3603,
-  serialized_end=3639,
-)
-
-_MESSAGE_PRIMITIVE = _descriptor.Descriptor(
-  name='Primitive',
-  full_name='com.mwr.jdiesel.api.Message.Primitive',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.Primitive.type', index=0,
-      number=1, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='bool', full_name='com.mwr.jdiesel.api.Message.Primitive.bool', index=1,
-      number=2, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='int', full_name='com.mwr.jdiesel.api.Message.Primitive.int', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='long', full_name='com.mwr.jdiesel.api.Message.Primitive.long', index=3,
-      number=4, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='float', full_name='com.mwr.jdiesel.api.Message.Primitive.float', index=4,
-      number=5, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='byte', full_name='com.mwr.jdiesel.api.Message.Primitive.byte', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='short', full_name='com.mwr.jdiesel.api.Message.Primitive.short', index=6,
-      number=7, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='double', full_name='com.mwr.jdiesel.api.Message.Primitive.double', index=7,
-      number=8, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='char', full_name='com.mwr.jdiesel.api.Message.Primitive.char', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _MESSAGE_PRIMITIVE_PRIMITIVETYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3642,
-  serialized_end=3936,
-)
-
-_MESSAGE_SESSION = _descriptor.Descriptor(
-  name='Session',
-  full_name='com.mwr.jdiesel.api.Message.Session',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='com.mwr.jdiesel.api.Message.Session.id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='device_id', full_name='com.mwr.jdiesel.api.Message.Session.device_id', index=1,
-      number=2, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3938,
-  serialized_end=3978,
-)
-
-_MESSAGE_FILETRANSFORMREQUEST = _descriptor.Descriptor(
-  name='FileTransformRequest',
-  full_name='com.mwr.jdiesel.api.Message.FileTransformRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='com.mwr.jdiesel.api.Message.FileTransformRequest.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='upload', full_name='com.mwr.jdiesel.api.Message.FileTransformRequest.upload', index=1,
-      number=2, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='remote_filename', full_name='com.mwr.jdiesel.api.Message.FileTransformRequest.remote_filename', index=2,
-      number=3, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='data', full_name='com.mwr.jdiesel.api.Message.FileTransformRequest.data', index=3,
-      number=4, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3980,
-  serialized_end=4077,
-)
-
-_MESSAGE_FILETRANSFORMRESPONSE = _descriptor.Descriptor(
-  name='FileTransformResponse',
-  full_name='com.mwr.jdiesel.api.Message.FileTransformResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='session_id', full_name='com.mwr.jdiesel.api.Message.FileTransformResponse.session_id', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='success', full_name='com.mwr.jdiesel.api.Message.FileTransformResponse.success', index=1,
-      number=2, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='data', full_name='com.mwr.jdiesel.api.Message.FileTransformResponse.data', index=2,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4079,
-  serialized_end=4153,
-)
-
-_MESSAGE = _descriptor.Descriptor(
-  name='Message',
-  full_name='com.mwr.jdiesel.api.Message',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='com.mwr.jdiesel.api.Message.id', index=0,
-      number=1, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='com.mwr.jdiesel.api.Message.type', index=1,
-      number=2, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=1,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='system_request', full_name='com.mwr.jdiesel.api.Message.system_request', index=2,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='system_response', full_name='com.mwr.jdiesel.api.Message.system_response', index=3,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='reflection_request', full_name='com.mwr.jdiesel.api.Message.reflection_request', index=4,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='reflection_response', full_name='com.mwr.jdiesel.api.Message.reflection_response', index=5,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='file_transform_request', full_name='com.mwr.jdiesel.api.Message.file_transform_request', index=6,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='file_transform_response', full_name='com.mwr.jdiesel.api.Message.file_transform_response', index=7,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[_MESSAGE_REFLECTIONREQUEST, _MESSAGE_REFLECTIONRESPONSE, _MESSAGE_SYSTEMREQUEST, _MESSAGE_SYSTEMRESPONSE, _MESSAGE_ARGUMENT, _MESSAGE_ARRAY, _MESSAGE_DEVICE, _MESSAGE_OBJECTREFERENCE, _MESSAGE_PRIMITIVE, _MESSAGE_SESSION, _MESSAGE_FILETRANSFORMREQUEST, _MESSAGE_FILETRANSFORMRESPONSE, ],
-  enum_types=[
-    _MESSAGE_MESSAGETYPE,
-  ],
-  options=None,
-  is_extendable=False,
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=40,
-  serialized_end=4316,
-)
-
-_MESSAGE_REFLECTIONREQUEST_RESOLVE.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONREQUEST_CONSTRUCT.fields_by_name['object'].message_type = _MESSAGE_OBJECTREFERENCE
-_MESSAGE_REFLECTIONREQUEST_CONSTRUCT.fields_by_name['argument'].message_type = _MESSAGE_ARGUMENT
-_MESSAGE_REFLECTIONREQUEST_CONSTRUCT.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONREQUEST_INVOKE.fields_by_name['object'].message_type = _MESSAGE_OBJECTREFERENCE
-_MESSAGE_REFLECTIONREQUEST_INVOKE.fields_by_name['argument'].message_type = _MESSAGE_ARGUMENT
-_MESSAGE_REFLECTIONREQUEST_INVOKE.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONREQUEST_SETPROPERTY.fields_by_name['object'].message_type = _MESSAGE_OBJECTREFERENCE
-_MESSAGE_REFLECTIONREQUEST_SETPROPERTY.fields_by_name['value'].message_type = _MESSAGE_ARGUMENT
-_MESSAGE_REFLECTIONREQUEST_SETPROPERTY.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONREQUEST_GETPROPERTY.fields_by_name['object'].message_type = _MESSAGE_OBJECTREFERENCE
-_MESSAGE_REFLECTIONREQUEST_GETPROPERTY.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONREQUEST_DELETE.fields_by_name['object'].message_type = _MESSAGE_OBJECTREFERENCE
-_MESSAGE_REFLECTIONREQUEST_DELETE.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['type'].enum_type = _MESSAGE_REFLECTIONREQUEST_REQUESTTYPE
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['resolve'].message_type = _MESSAGE_REFLECTIONREQUEST_RESOLVE
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['construct'].message_type = _MESSAGE_REFLECTIONREQUEST_CONSTRUCT
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['invoke'].message_type = _MESSAGE_REFLECTIONREQUEST_INVOKE
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['set_property'].message_type = _MESSAGE_REFLECTIONREQUEST_SETPROPERTY
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['get_property'].message_type = _MESSAGE_REFLECTIONREQUEST_GETPROPERTY
-_MESSAGE_REFLECTIONREQUEST.fields_by_name['delete'].message_type = _MESSAGE_REFLECTIONREQUEST_DELETE
-_MESSAGE_REFLECTIONREQUEST.containing_type = _MESSAGE
-_MESSAGE_REFLECTIONREQUEST_REQUESTTYPE.containing_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE_REFLECTIONRESPONSE.fields_by_name['status'].enum_type = _MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS
-_MESSAGE_REFLECTIONRESPONSE.fields_by_name['result'].message_type = _MESSAGE_ARGUMENT
-_MESSAGE_REFLECTIONRESPONSE.containing_type = _MESSAGE
-_MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS.containing_type = _MESSAGE_REFLECTIONRESPONSE
-_MESSAGE_SYSTEMREQUEST.fields_by_name['type'].enum_type = _MESSAGE_SYSTEMREQUEST_REQUESTTYPE
-_MESSAGE_SYSTEMREQUEST.fields_by_name['device'].message_type = _MESSAGE_DEVICE
-_MESSAGE_SYSTEMREQUEST.containing_type = _MESSAGE
-_MESSAGE_SYSTEMREQUEST_REQUESTTYPE.containing_type = _MESSAGE_SYSTEMREQUEST
-_MESSAGE_SYSTEMRESPONSE.fields_by_name['type'].enum_type = _MESSAGE_SYSTEMRESPONSE_RESPONSETYPE
-_MESSAGE_SYSTEMRESPONSE.fields_by_name['status'].enum_type = _MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS
-_MESSAGE_SYSTEMRESPONSE.fields_by_name['devices'].message_type = _MESSAGE_DEVICE
-_MESSAGE_SYSTEMRESPONSE.fields_by_name['sessions'].message_type = _MESSAGE_SESSION
-_MESSAGE_SYSTEMRESPONSE.containing_type = _MESSAGE
-_MESSAGE_SYSTEMRESPONSE_RESPONSETYPE.containing_type = _MESSAGE_SYSTEMRESPONSE
-_MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS.containing_type = _MESSAGE_SYSTEMRESPONSE
-_MESSAGE_ARGUMENT.fields_by_name['type'].enum_type = _MESSAGE_ARGUMENT_ARGUMENTTYPE
-_MESSAGE_ARGUMENT.fields_by_name['primitive'].message_type = _MESSAGE_PRIMITIVE
-_MESSAGE_ARGUMENT.fields_by_name['object'].message_type = _MESSAGE_OBJECTREFERENCE
-_MESSAGE_ARGUMENT.fields_by_name['array'].message_type = _MESSAGE_ARRAY
-_MESSAGE_ARGUMENT.containing_type = _MESSAGE
-_MESSAGE_ARGUMENT_ARGUMENTTYPE.containing_type = _MESSAGE_ARGUMENT
-_MESSAGE_ARRAY.fields_by_name['type'].enum_type = _MESSAGE_ARRAY_ARRAYTYPE
-_MESSAGE_ARRAY.fields_by_name['element'].message_type = _MESSAGE_ARGUMENT
-_MESSAGE_ARRAY.containing_type = _MESSAGE
-_MESSAGE_ARRAY_ARRAYTYPE.containing_type = _MESSAGE_ARRAY
-_MESSAGE_DEVICE.containing_type = _MESSAGE
-_MESSAGE_OBJECTREFERENCE.containing_type = _MESSAGE
-_MESSAGE_PRIMITIVE.fields_by_name['type'].enum_type = _MESSAGE_PRIMITIVE_PRIMITIVETYPE
-_MESSAGE_PRIMITIVE.containing_type = _MESSAGE
-_MESSAGE_PRIMITIVE_PRIMITIVETYPE.containing_type = _MESSAGE_PRIMITIVE
-_MESSAGE_SESSION.containing_type = _MESSAGE
-_MESSAGE_FILETRANSFORMREQUEST.containing_type = _MESSAGE
-_MESSAGE_FILETRANSFORMRESPONSE.containing_type = _MESSAGE
-_MESSAGE.fields_by_name['type'].enum_type = _MESSAGE_MESSAGETYPE
-_MESSAGE.fields_by_name['system_request'].message_type = _MESSAGE_SYSTEMREQUEST
-_MESSAGE.fields_by_name['system_response'].message_type = _MESSAGE_SYSTEMRESPONSE
-_MESSAGE.fields_by_name['reflection_request'].message_type = _MESSAGE_REFLECTIONREQUEST
-_MESSAGE.fields_by_name['reflection_response'].message_type = _MESSAGE_REFLECTIONRESPONSE
-_MESSAGE.fields_by_name['file_transform_request'].message_type = _MESSAGE_FILETRANSFORMREQUEST
-_MESSAGE.fields_by_name['file_transform_response'].message_type = _MESSAGE_FILETRANSFORMRESPONSE
-_MESSAGE_MESSAGETYPE.containing_type = _MESSAGE
-DESCRIPTOR.message_types_by_name['Message'] = _MESSAGE
-
-Message = _reflection.GeneratedProtocolMessageType('Message', (_message.Message,), dict(
-
-  ReflectionRequest = _reflection.GeneratedProtocolMessageType('ReflectionRequest', (_message.Message,), dict(
-
-    Resolve = _reflection.GeneratedProtocolMessageType('Resolve', (_message.Message,), dict(
-      DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST_RESOLVE,
-      __module__ = 'protobuf_pb2'
-      # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest.Resolve)
-      ))
-    ,
-
-    Construct = _reflection.GeneratedProtocolMessageType('Construct', (_message.Message,), dict(
-      DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST_CONSTRUCT,
-      __module__ = 'protobuf_pb2'
-      # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest.Construct)
-      ))
-    ,
-
-    Invoke = _reflection.GeneratedProtocolMessageType('Invoke', (_message.Message,), dict(
-      DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST_INVOKE,
-      __module__ = 'protobuf_pb2'
-      # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke)
-      ))
-    ,
-
-    SetProperty = _reflection.GeneratedProtocolMessageType('SetProperty', (_message.Message,), dict(
-      DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST_SETPROPERTY,
-      __module__ = 'protobuf_pb2'
-      # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty)
-      ))
-    ,
-
-    GetProperty = _reflection.GeneratedProtocolMessageType('GetProperty', (_message.Message,), dict(
-      DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST_GETPROPERTY,
-      __module__ = 'protobuf_pb2'
-      # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest.GetProperty)
-      ))
-    ,
-
-    Delete = _reflection.GeneratedProtocolMessageType('Delete', (_message.Message,), dict(
-      DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST_DELETE,
-      __module__ = 'protobuf_pb2'
-      # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest.Delete)
-      ))
-    ,
-    DESCRIPTOR = _MESSAGE_REFLECTIONREQUEST,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionRequest)
-    ))
-  ,
-
-  ReflectionResponse = _reflection.GeneratedProtocolMessageType('ReflectionResponse', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_REFLECTIONRESPONSE,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ReflectionResponse)
-    ))
-  ,
-
-  SystemRequest = _reflection.GeneratedProtocolMessageType('SystemRequest', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_SYSTEMREQUEST,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.SystemRequest)
-    ))
-  ,
-
-  SystemResponse = _reflection.GeneratedProtocolMessageType('SystemResponse', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_SYSTEMRESPONSE,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.SystemResponse)
-    ))
-  ,
-
-  Argument = _reflection.GeneratedProtocolMessageType('Argument', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_ARGUMENT,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.Argument)
-    ))
-  ,
-
-  Array = _reflection.GeneratedProtocolMessageType('Array', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_ARRAY,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.Array)
-    ))
-  ,
-
-  Device = _reflection.GeneratedProtocolMessageType('Device', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_DEVICE,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.Device)
-    ))
-  ,
-
-  ObjectReference = _reflection.GeneratedProtocolMessageType('ObjectReference', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_OBJECTREFERENCE,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.ObjectReference)
-    ))
-  ,
-
-  Primitive = _reflection.GeneratedProtocolMessageType('Primitive', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_PRIMITIVE,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.Primitive)
-    ))
-  ,
-
-  Session = _reflection.GeneratedProtocolMessageType('Session', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_SESSION,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.Session)
-    ))
-  ,
-
-  FileTransformRequest = _reflection.GeneratedProtocolMessageType('FileTransformRequest', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_FILETRANSFORMREQUEST,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.FileTransformRequest)
-    ))
-  ,
-
-  FileTransformResponse = _reflection.GeneratedProtocolMessageType('FileTransformResponse', (_message.Message,), dict(
-    DESCRIPTOR = _MESSAGE_FILETRANSFORMRESPONSE,
-    __module__ = 'protobuf_pb2'
-    # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message.FileTransformResponse)
-    ))
-  ,
-  DESCRIPTOR = _MESSAGE,
-  __module__ = 'protobuf_pb2'
-  # @@protoc_insertion_point(class_scope:com.mwr.jdiesel.api.Message)
-  ))
-_sym_db.RegisterMessage(Message)
-_sym_db.RegisterMessage(Message.ReflectionRequest)
-_sym_db.RegisterMessage(Message.ReflectionRequest.Resolve)
-_sym_db.RegisterMessage(Message.ReflectionRequest.Construct)
-_sym_db.RegisterMessage(Message.ReflectionRequest.Invoke)
-_sym_db.RegisterMessage(Message.ReflectionRequest.SetProperty)
-_sym_db.RegisterMessage(Message.ReflectionRequest.GetProperty)
-_sym_db.RegisterMessage(Message.ReflectionRequest.Delete)
-_sym_db.RegisterMessage(Message.ReflectionResponse)
-_sym_db.RegisterMessage(Message.SystemRequest)
-_sym_db.RegisterMessage(Message.SystemResponse)
-_sym_db.RegisterMessage(Message.Argument)
-_sym_db.RegisterMessage(Message.Array)
-_sym_db.RegisterMessage(Message.Device)
-_sym_db.RegisterMessage(Message.ObjectReference)
-_sym_db.RegisterMessage(Message.Primitive)
-_sym_db.RegisterMessage(Message.Session)
-_sym_db.RegisterMessage(Message.FileTransformRequest)
-_sym_db.RegisterMessage(Message.FileTransformResponse)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('H\001'))
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0eprotobuf.proto\x12\x13\x63om.mwr.jdiesel.api\"\x9b$\n\x07Message\x12\n\n\x02id\x18\x01 \x02(\x05\x12\x36\n\x04type\x18\x02 \x02(\x0e\x32(.com.mwr.jdiesel.api.Message.MessageType\x12\x42\n\x0esystem_request\x18\x05 \x01(\x0b\x32*.com.mwr.jdiesel.api.Message.SystemRequest\x12\x44\n\x0fsystem_response\x18\x06 \x01(\x0b\x32+.com.mwr.jdiesel.api.Message.SystemResponse\x12J\n\x12reflection_request\x18\x07 \x01(\x0b\x32..com.mwr.jdiesel.api.Message.ReflectionRequest\x12L\n\x13reflection_response\x18\x08 \x01(\x0b\x32/.com.mwr.jdiesel.api.Message.ReflectionResponse\x12Q\n\x16\x66ile_transform_request\x18\t \x01(\x0b\x32\x31.com.mwr.jdiesel.api.Message.FileTransformRequest\x12S\n\x17\x66ile_transform_response\x18\n \x01(\x0b\x32\x32.com.mwr.jdiesel.api.Message.FileTransformResponse\x1a\x84\x0b\n\x11ReflectionRequest\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12H\n\x04type\x18\x02 \x02(\x0e\x32:.com.mwr.jdiesel.api.Message.ReflectionRequest.RequestType\x12G\n\x07resolve\x18\x03 \x01(\x0b\x32\x36.com.mwr.jdiesel.api.Message.ReflectionRequest.Resolve\x12K\n\tconstruct\x18\x04 \x01(\x0b\x32\x38.com.mwr.jdiesel.api.Message.ReflectionRequest.Construct\x12\x45\n\x06invoke\x18\x05 \x01(\x0b\x32\x35.com.mwr.jdiesel.api.Message.ReflectionRequest.Invoke\x12P\n\x0cset_property\x18\x06 \x01(\x0b\x32:.com.mwr.jdiesel.api.Message.ReflectionRequest.SetProperty\x12P\n\x0cget_property\x18\x07 \x01(\x0b\x32:.com.mwr.jdiesel.api.Message.ReflectionRequest.GetProperty\x12\x45\n\x06\x64\x65lete\x18\x08 \x01(\x0b\x32\x35.com.mwr.jdiesel.api.Message.ReflectionRequest.Delete\x12=\n\x05\x62\x61tch\x18\t \x03(\x0b\x32..com.mwr.jdiesel.api.Message.ReflectionRequest\x12\x15\n\raccept_packed\x18\n \x01(\x08\x1a\x1c\n\x07Resolve\x12\x11\n\tclassname\x18\x01 \x01(\t\x1a\x82\x01\n\tConstruct\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x37\n\x08\x61rgument\x18\x02 \x03(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x1a\x8f\x01\n\x06Invoke\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x37\n\x08\x61rgument\x18\x03 \x03(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x1a\x93\x01\n\x0bSetProperty\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x10\n\x08property\x18\x02 \x01(\t\x12\x34\n\x05value\x18\x03 \x01(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x1a]\n\x0bGetProperty\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x10\n\x08property\x18\x02 \x01(\t\x1a\x46\n\x06\x44\x65lete\x12<\n\x06object\x18\x01 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\"\x80\x01\n\x0bRequestType\x12\x0b\n\x07RESOLVE\x10\x01\x12\r\n\tCONSTRUCT\x10\x02\x12\n\n\x06INVOKE\x10\x03\x12\x10\n\x0cSET_PROPERTY\x10\x04\x12\x10\n\x0cGET_PROPERTY\x10\x05\x12\n\n\x06\x44\x45LETE\x10\x06\x12\x0e\n\nDELETE_ALL\x10\x07\x12\t\n\x05\x42\x41TCH\x10\x08\x1a\xba\x02\n\x12ReflectionResponse\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12N\n\x06status\x18\x02 \x02(\x0e\x32>.com.mwr.jdiesel.api.Message.ReflectionResponse.ResponseStatus\x12\x35\n\x06result\x18\x03 \x01(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x12\x14\n\x0c\x65rrormessage\x18\x08 \x01(\t\x12>\n\x05\x62\x61tch\x18\t \x03(\x0b\x32/.com.mwr.jdiesel.api.Message.ReflectionResponse\"3\n\x0eResponseStatus\x12\x0b\n\x07SUCCESS\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\t\n\x05\x46\x41TAL\x10\x03\x1a\xd3\x02\n\rSystemRequest\x12J\n\x04type\x18\x01 \x02(\x0e\x32\x36.com.mwr.jdiesel.api.Message.SystemRequest.RequestType:\x04PING\x12\x33\n\x06\x64\x65vice\x18\x05 \x01(\x0b\x32#.com.mwr.jdiesel.api.Message.Device\x12\x12\n\nsession_id\x18\x07 \x01(\t\x12\x10\n\x08password\x18\x08 \x01(\t\"\x9a\x01\n\x0bRequestType\x12\x08\n\x04PING\x10\x01\x12\x0f\n\x0b\x42IND_DEVICE\x10\x02\x12\x11\n\rUNBIND_DEVICE\x10\x03\x12\x10\n\x0cLIST_DEVICES\x10\x04\x12\x11\n\rSTART_SESSION\x10\x05\x12\x10\n\x0cSTOP_SESSION\x10\x06\x12\x13\n\x0fRESTART_SESSION\x10\x07\x12\x11\n\rLIST_SESSIONS\x10\x08\x1a\xcc\x03\n\x0eSystemResponse\x12\x46\n\x04type\x18\x01 \x02(\x0e\x32\x38.com.mwr.jdiesel.api.Message.SystemResponse.ResponseType\x12J\n\x06status\x18\x02 \x02(\x0e\x32:.com.mwr.jdiesel.api.Message.SystemResponse.ResponseStatus\x12\x34\n\x07\x64\x65vices\x18\x06 \x03(\x0b\x32#.com.mwr.jdiesel.api.Message.Device\x12\x12\n\nsession_id\x18\x07 \x01(\t\x12\x15\n\rerror_message\x18\x08 \x01(\t\x12\x36\n\x08sessions\x18\t \x03(\x0b\x32$.com.mwr.jdiesel.api.Message.Session\"c\n\x0cResponseType\x12\x08\n\x04PONG\x10\x01\x12\t\n\x05\x42OUND\x10\x02\x12\x0b\n\x07UNBOUND\x10\x03\x12\x0f\n\x0b\x44\x45VICE_LIST\x10\x04\x12\x0e\n\nSESSION_ID\x10\x05\x12\x10\n\x0cSESSION_LIST\x10\x06\"(\n\x0eResponseStatus\x12\x0b\n\x07SUCCESS\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x1a\xf4\x02\n\x08\x41rgument\x12H\n\x04type\x18\x01 \x02(\x0e\x32\x32.com.mwr.jdiesel.api.Message.Argument.ArgumentType:\x06STRING\x12\x39\n\tprimitive\x18\x02 \x01(\x0b\x32&.com.mwr.jdiesel.api.Message.Primitive\x12\x0e\n\x06string\x18\x03 \x01(\t\x12<\n\x06object\x18\x04 \x01(\x0b\x32,.com.mwr.jdiesel.api.Message.ObjectReference\x12\x31\n\x05\x61rray\x18\x05 \x01(\x0b\x32\".com.mwr.jdiesel.api.Message.Array\x12\x0c\n\x04\x64\x61ta\x18\x06 \x01(\x0c\"T\n\x0c\x41rgumentType\x12\x08\n\x04NULL\x10\x01\x12\r\n\tPRIMITIVE\x10\x02\x12\n\n\x06STRING\x10\x03\x12\n\n\x06OBJECT\x10\x04\x12\t\n\x05\x41RRAY\x10\x05\x12\x08\n\x04\x44\x41TA\x10\x06\x1a\x9d\x02\n\x05\x41rray\x12\x42\n\x04type\x18\x01 \x02(\x0e\x32,.com.mwr.jdiesel.api.Message.Array.ArrayType:\x06STRING\x12\x36\n\x07\x65lement\x18\x02 \x03(\x0b\x32%.com.mwr.jdiesel.api.Message.Argument\x12I\n\x0bpacked_type\x18\x03 \x01(\x0e\x32\x34.com.mwr.jdiesel.api.Message.Primitive.PrimitiveType\x12\x0e\n\x06packed\x18\x04 \x01(\x0c\"=\n\tArrayType\x12\r\n\tPRIMITIVE\x10\x01\x12\n\n\x06STRING\x10\x02\x12\n\n\x06OBJECT\x10\x03\x12\t\n\x05\x41RRAY\x10\x04\x1aK\n\x06\x44\x65vice\x12\n\n\x02id\x18\x01 \x02(\t\x12\x14\n\x0cmanufacturer\x18\x02 \x02(\t\x12\r\n\x05model\x18\x03 \x02(\t\x12\x10\n\x08software\x18\x04 \x02(\t\x1a_\n\x0fObjectReference\x12\x11\n\treference\x18\x01 \x01(\x05\x12\x13\n\x0b\x62\x61tch_index\x18\x02 \x01(\x05\x12\x12\n\nclass_name\x18\x03 \x01(\t\x12\x10\n\x08is_class\x18\x04 \x01(\x08\x1a\xa6\x02\n\tPrimitive\x12\x42\n\x04type\x18\x01 \x02(\x0e\x32\x34.com.mwr.jdiesel.api.Message.Primitive.PrimitiveType\x12\x0c\n\x04\x62ool\x18\x02 \x01(\x08\x12\x0b\n\x03int\x18\x03 \x01(\x05\x12\x0c\n\x04long\x18\x04 \x01(\x03\x12\r\n\x05\x66loat\x18\x05 \x01(\x02\x12\x0c\n\x04\x62yte\x18\x06 \x01(\x05\x12\r\n\x05short\x18\x07 \x01(\x05\x12\x0e\n\x06\x64ouble\x18\x08 \x01(\x01\x12\x0c\n\x04\x63har\x18\t \x01(\x05\"b\n\rPrimitiveType\x12\x08\n\x04\x42OOL\x10\x01\x12\x07\n\x03INT\x10\x02\x12\x08\n\x04LONG\x10\x03\x12\t\n\x05\x46LOAT\x10\x04\x12\x08\n\x04\x42YTE\x10\x05\x12\t\n\x05SHORT\x10\x06\x12\n\n\x06\x44OUBLE\x10\x07\x12\x08\n\x04\x43HAR\x10\x08\x1a(\n\x07Session\x12\n\n\x02id\x18\x01 \x02(\t\x12\x11\n\tdevice_id\x18\x02 \x02(\t\x1a\x81\x01\n\x14\x46ileTransformRequest\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12\x0e\n\x06upload\x18\x02 \x02(\x08\x12\x17\n\x0fremote_filename\x18\x03 \x02(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x12\x0e\n\x06offset\x18\x05 \x01(\x03\x12\x0e\n\x06length\x18\x06 \x01(\x05\x1aX\n\x15\x46ileTransformResponse\x12\x12\n\nsession_id\x18\x01 \x02(\t\x12\x0f\n\x07success\x18\x02 \x02(\x08\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x12\x0c\n\x04size\x18\x04 \x01(\x03\"\xa0\x01\n\x0bMessageType\x12\x12\n\x0eSYSTEM_REQUEST\x10\x01\x12\x13\n\x0fSYSTEM_RESPONSE\x10\x02\x12\x16\n\x12REFLECTION_REQUEST\x10\x03\x12\x17\n\x13REFLECTION_RESPONSE\x10\x04\x12\x1a\n\x16\x46ILE_TRANSFORM_REQUEST\x10\x05\x12\x1b\n\x17\x46ILE_TRANSFORM_RESPONSE\x10\x06\x42\x02H\x01')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'protobuf_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'H\001'
+  _MESSAGE._serialized_start=40
+  _MESSAGE._serialized_end=4675
+  _MESSAGE_REFLECTIONREQUEST._serialized_start=580
+  _MESSAGE_REFLECTIONREQUEST._serialized_end=1992
+  _MESSAGE_REFLECTIONREQUEST_RESOLVE._serialized_start=1237
+  _MESSAGE_REFLECTIONREQUEST_RESOLVE._serialized_end=1265
+  _MESSAGE_REFLECTIONREQUEST_CONSTRUCT._serialized_start=1268
+  _MESSAGE_REFLECTIONREQUEST_CONSTRUCT._serialized_end=1398
+  _MESSAGE_REFLECTIONREQUEST_INVOKE._serialized_start=1401
+  _MESSAGE_REFLECTIONREQUEST_INVOKE._serialized_end=1544
+  _MESSAGE_REFLECTIONREQUEST_SETPROPERTY._serialized_start=1547
+  _MESSAGE_REFLECTIONREQUEST_SETPROPERTY._serialized_end=1694
+  _MESSAGE_REFLECTIONREQUEST_GETPROPERTY._serialized_start=1696
+  _MESSAGE_REFLECTIONREQUEST_GETPROPERTY._serialized_end=1789
+  _MESSAGE_REFLECTIONREQUEST_DELETE._serialized_start=1791
+  _MESSAGE_REFLECTIONREQUEST_DELETE._serialized_end=1861
+  _MESSAGE_REFLECTIONREQUEST_REQUESTTYPE._serialized_start=1864
+  _MESSAGE_REFLECTIONREQUEST_REQUESTTYPE._serialized_end=1992
+  _MESSAGE_REFLECTIONRESPONSE._serialized_start=1995
+  _MESSAGE_REFLECTIONRESPONSE._serialized_end=2309
+  _MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS._serialized_start=2258
+  _MESSAGE_REFLECTIONRESPONSE_RESPONSESTATUS._serialized_end=2309
+  _MESSAGE_SYSTEMREQUEST._serialized_start=2312
+  _MESSAGE_SYSTEMREQUEST._serialized_end=2651
+  _MESSAGE_SYSTEMREQUEST_REQUESTTYPE._serialized_start=2497
+  _MESSAGE_SYSTEMREQUEST_REQUESTTYPE._serialized_end=2651
+  _MESSAGE_SYSTEMRESPONSE._serialized_start=2654
+  _MESSAGE_SYSTEMRESPONSE._serialized_end=3114
+  _MESSAGE_SYSTEMRESPONSE_RESPONSETYPE._serialized_start=2973
+  _MESSAGE_SYSTEMRESPONSE_RESPONSETYPE._serialized_end=3072
+  _MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS._serialized_start=2258
+  _MESSAGE_SYSTEMRESPONSE_RESPONSESTATUS._serialized_end=2298
+  _MESSAGE_ARGUMENT._serialized_start=3117
+  _MESSAGE_ARGUMENT._serialized_end=3489
+  _MESSAGE_ARGUMENT_ARGUMENTTYPE._serialized_start=3405
+  _MESSAGE_ARGUMENT_ARGUMENTTYPE._serialized_end=3489
+  _MESSAGE_ARRAY._serialized_start=3492
+  _MESSAGE_ARRAY._serialized_end=3777
+  _MESSAGE_ARRAY_ARRAYTYPE._serialized_start=3716
+  _MESSAGE_ARRAY_ARRAYTYPE._serialized_end=3777
+  _MESSAGE_DEVICE._serialized_start=3779
+  _MESSAGE_DEVICE._serialized_end=3854
+  _MESSAGE_OBJECTREFERENCE._serialized_start=3856
+  _MESSAGE_OBJECTREFERENCE._serialized_end=3951
+  _MESSAGE_PRIMITIVE._serialized_start=3954
+  _MESSAGE_PRIMITIVE._serialized_end=4248
+  _MESSAGE_PRIMITIVE_PRIMITIVETYPE._serialized_start=4150
+  _MESSAGE_PRIMITIVE_PRIMITIVETYPE._serialized_end=4248
+  _MESSAGE_SESSION._serialized_start=4250
+  _MESSAGE_SESSION._serialized_end=4290
+  _MESSAGE_FILETRANSFORMREQUEST._serialized_start=4293
+  _MESSAGE_FILETRANSFORMREQUEST._serialized_end=4422
+  _MESSAGE_FILETRANSFORMRESPONSE._serialized_start=4424
+  _MESSAGE_FILETRANSFORMRESPONSE._serialized_end=4512
+  _MESSAGE_MESSAGETYPE._serialized_start=4515
+  _MESSAGE_MESSAGETYPE._serialized_end=4675
 # @@protoc_insertion_point(module_scope)
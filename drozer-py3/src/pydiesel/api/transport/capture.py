@@ -0,0 +1,276 @@
+import collections
+import gzip
+import heapq
+import itertools
+import socket
+import struct
+import threading
+import time
+
+from .. import Frame
+from ..protobuf_pb2 import Message
+
+class Capture(object):
+    """
+    The format of a capture file: a header, followed by a record for every
+    frame sent or received, each giving its direction, the time since the
+    capture started and the length of the payload, followed by the payload.
+
+    A capture file with a name ending in .gz is compressed.
+    """
+
+    HEADER = b"DZCAP\x00\x00\x01"
+    RECORD = struct.Struct(">BdI")
+
+    REQUEST = 0
+    RESPONSE = 1
+
+    @classmethod
+    def open(cls, path, mode):
+        if path.endswith(".gz"):
+            return gzip.open(path, mode)
+        else:
+            return open(path, mode)
+
+
+class CaptureWriter(object):
+    """
+    Writes the frames exchanged by a SocketTransport to a capture file.
+    """
+
+    def __init__(self, path):
+        self.frames = 0
+
+        self.__file = Capture.open(path, "wb")
+        self.__file.write(Capture.HEADER)
+        self.__lock = threading.Lock()
+        self.__started = time.time()
+
+    def close(self):
+        with self.__lock:
+            self.__file.close()
+
+    def request(self, payload):
+        """
+        Record the payload of a frame sent to the Agent.
+        """
+
+        self.__write(Capture.REQUEST, payload)
+
+    def response(self, payload):
+        """
+        Record the payload of a frame received from the Agent.
+        """
+
+        self.__write(Capture.RESPONSE, payload)
+
+    def __write(self, direction, payload):
+        with self.__lock:
+            if not self.__file.closed:
+                self.__file.write(Capture.RECORD.pack(direction, time.time() - self.__started, len(payload)))
+                self.__file.write(bytes(payload))
+
+                self.frames += 1
+
+
+class CaptureReader(object):
+    """
+    Reads the records of a capture file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def records(self):
+        """
+        Iterate through the records in the capture, as (direction, time,
+        Message) tuples.
+        """
+
+        with Capture.open(self.path, "rb") as capture:
+            if capture.read(len(Capture.HEADER)) != Capture.HEADER:
+                raise ValueError("%s is not a drozer capture file" % self.path)
+
+            while True:
+                header = capture.read(Capture.RECORD.size)
+
+                if len(header) < Capture.RECORD.size:
+                    return
+
+                direction, timestamp, length = Capture.RECORD.unpack(header)
+                message = Message()
+                message.ParseFromString(capture.read(length))
+
+                yield direction, timestamp, message
+
+    def exchanges(self):
+        """
+        Get each request in the capture, paired with its response and the time
+        the Agent took to send it, in the order the requests were sent.
+        Requests that were never answered are paired with None.
+        """
+
+        exchanges, sent = [], {}
+
+        for direction, timestamp, message in self.records():
+            if direction == Capture.REQUEST:
+                sent[message.id] = len(exchanges)
+                exchanges.append([message, None, 0.0, timestamp])
+            elif message.id in sent:
+                exchange = exchanges[sent.pop(message.id)]
+                exchange[1] = message
+                exchange[2] = timestamp - exchange[3]
+
+        return [(request, response, latency) for request, response, latency, sent_at in exchanges]
+
+
+class Replay(object):
+    """
+    Serves the responses from a capture file, in place of an Agent.
+
+    Each request is answered with the response that was recorded for an
+    identical request (ignoring the message identifier), in the order they
+    were recorded. A request that was made more often than in the capture is
+    given the last recorded response again. A request that was never recorded
+    is a miss, and is answered with an error.
+
+    Responses are sent immediately or, with timing, after the time that the
+    Agent originally took, divided by speed.
+    """
+
+    SYSTEM_RESPONSES = {
+        Message.SystemRequest.PING: Message.SystemResponse.PONG,
+        Message.SystemRequest.BIND_DEVICE: Message.SystemResponse.BOUND,
+        Message.SystemRequest.UNBIND_DEVICE: Message.SystemResponse.UNBOUND,
+        Message.SystemRequest.LIST_DEVICES: Message.SystemResponse.DEVICE_LIST,
+        Message.SystemRequest.START_SESSION: Message.SystemResponse.SESSION_ID,
+        Message.SystemRequest.STOP_SESSION: Message.SystemResponse.SESSION_ID,
+        Message.SystemRequest.RESTART_SESSION: Message.SystemResponse.SESSION_ID,
+        Message.SystemRequest.LIST_SESSIONS: Message.SystemResponse.SESSION_LIST }
+
+    def __init__(self, path, timing=False, speed=1.0):
+        self.hits = 0
+        self.misses = 0
+        self.repeats = 0
+        self.speed = speed
+        self.timing = timing
+
+        self.__condition = threading.Condition()
+        self.__queue = []
+        self.__responses = collections.defaultdict(collections.deque)
+        self.__sequence = itertools.count()
+        self.__served = {}
+
+        for request, response, latency in CaptureReader(path).exchanges():
+            if response is not None:
+                self.__responses[self.key(request)].append((response, latency))
+
+    def connect(self):
+        """
+        Get a socket, connected to the replay, that can be given to
+        SocketTransport#fromSocket.
+        """
+
+        replay, console = socket.socketpair()
+
+        threading.Thread(target=self.__serve, args=(replay,), name="drozer-replay", daemon=True).start()
+
+        if self.timing:
+            threading.Thread(target=self.__drain, args=(replay,), name="drozer-replay-timing", daemon=True).start()
+
+        return console
+
+    def key(self, request):
+        """
+        Get the key by which a request is matched against the capture.
+        """
+
+        request = Message.FromString(request.SerializePartialToString())
+        request.ClearField("id")
+
+        return request.SerializePartialToString(deterministic=True)
+
+    def respond(self, request):
+        """
+        Get the recorded response to a request, and the delay before sending
+        it. A miss is answered with an error, without delay.
+        """
+
+        key = self.key(request)
+        responses = self.__responses.get(key)
+
+        if responses is not None and len(responses) > 0:
+            self.hits += 1
+            self.__served[key] = response = responses.popleft()
+        elif key in self.__served:
+            self.repeats += 1
+            response = self.__served[key]
+        else:
+            self.misses += 1
+            response = (self.__miss(request), 0.0)
+
+        message = Message()
+        message.CopyFrom(response[0])
+        message.id = request.id
+
+        return message, response[1] / self.speed
+
+    def __drain(self, sock):
+        while True:
+            with self.__condition:
+                while len(self.__queue) == 0 or self.__queue[0][0] > time.time():
+                    self.__condition.wait(self.__queue[0][0] - time.time() if len(self.__queue) > 0 else None)
+
+                due, sequence, data = heapq.heappop(self.__queue)
+
+            try:
+                sock.sendall(data)
+            except OSError:
+                return
+
+    def __miss(self, request):
+        """
+        Build the error response to a request that is not in the capture.
+        """
+
+        error = "no response to this request was captured"
+
+        if request.type == Message.SYSTEM_REQUEST:
+            response = Message(type=Message.SYSTEM_RESPONSE)
+            response.system_response.type = self.SYSTEM_RESPONSES[request.system_request.type]
+            response.system_response.status = Message.SystemResponse.ERROR
+            response.system_response.error_message = error
+        elif request.type == Message.FILE_TRANSFORM_REQUEST:
+            response = Message(type=Message.FILE_TRANSFORM_RESPONSE)
+            response.file_transform_response.session_id = request.file_transform_request.session_id
+            response.file_transform_response.success = False
+        else:
+            response = Message(type=Message.REFLECTION_RESPONSE)
+            response.reflection_response.session_id = request.reflection_request.session_id
+            response.reflection_response.status = Message.ReflectionResponse.ERROR
+            response.reflection_response.errormessage = error
+
+        return response
+
+    def __serve(self, sock):
+        while True:
+            try:
+                frame = Frame.readFromSocket(sock)
+            except OSError:
+                return
+
+            if frame is None:
+                return
+
+            response = self.respond(frame.message())
+            data = Frame.fromMessage(response[0].SerializeToString()).bytes()
+
+            if self.timing:
+                with self.__condition:
+                    heapq.heappush(self.__queue, (time.time() + response[1], next(self.__sequence), data))
+                    self.__condition.notify()
+            else:
+                try:
+                    sock.sendall(data)
+                except OSError:
+                    return
@@ -1,8 +1,11 @@
 import socket
 import ssl
+import threading
+from concurrent.futures import Future, TimeoutError
 from typing import Optional, List, Tuple
 
 from .. import Frame
+from .capture import CaptureWriter, Replay
 from .exceptions import ConnectionError
 from .transport import Transport
 
@@ -15,7 +18,8 @@ class SocketTransport(Transport):
 
     def __init__(self, arguments, trust_callback=None):
         Transport.__init__(self)
-        self.choice = None
+        self.choice = getattr(arguments, 'serial', None)
+        self.__resetDispatcher()
         if arguments.ssl:
             provider = Provider()
             self.__socket = ssl.wrap_socket(self.__socket, cert_reqs=ssl.CERT_REQUIRED, ca_certs=provider.ca_certificate_path())
@@ -45,29 +49,81 @@ class SocketTransport(Transport):
             print("Connect via adb fail, then try tcp connect")
             self.__socket = socket.socket()
             self.setTimeout(90.0)
+            self.__socket.settimeout(90.0)
             self.__socket.connect(endpoint)
+            self.__socket.settimeout(None)
         
         if arguments.ssl:
             trust_callback(provider, self.__socket.getpeercert(True), self.__socket.getpeername())
+
+    @classmethod
+    def fromSocket(cls, sock):
+        """
+        Build a SocketTransport around a socket that is already connected to a
+        Server, without negotiating a connection through adb.
+        """
+
+        transport = cls.__new__(cls)
+        Transport.__init__(transport)
+        transport.choice = None
+        transport.__socket = sock
+        transport.__resetDispatcher()
+
+        return transport
+
+    @classmethod
+    def replay(cls, path, timing=False, speed=1.0):
+        """
+        Build a SocketTransport that is served the responses in a capture file,
+        written by #record, in place of a connection to a Server.
+
+        See Replay for how requests are matched to the capture.
+        """
+
+        return cls.fromSocket(Replay(path, timing, speed).connect())
             
     def close(self):
         """
         Close the connection to the Server.
+
+        Any Messages still awaiting a response are failed with a
+        ConnectionError.
         """
 
+        self.stopRecording()
+
+        try:
+            self.__socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         self.__socket.close()
+
+    def pending(self):
+        """
+        Get the number of Messages that have been sent, but are still awaiting
+        a response.
+        """
+
+        with self.__pending_lock:
+            return len(self.__pending)
         
     def receive(self):
         """
         Receive a Message from the Server.
 
         If not frame is available, None is returned.
+
+        This is used by the reader thread to collect responses, and must not
+        be called directly once a Message has been sent with #send_async.
         """
 
         try:
             frame = Frame.readFromSocket(self.__socket)
     
             if frame is not None:
+                if self.__recorder is not None:
+                    self.__recorder.response(frame.payload)
+
                 return frame.message()
             else:
                 return None
@@ -76,6 +132,25 @@ class SocketTransport(Transport):
         except ssl.SSLError as e:
             raise ConnectionError(e)
 
+    def record(self, path):
+        """
+        Write every Message sent and received, from now on, to a capture file,
+        which can be served back by #replay.
+        """
+
+        self.stopRecording()
+        self.__recorder = CaptureWriter(path)
+
+    def stopRecording(self):
+        """
+        Stop writing Messages to the capture file, and close it.
+        """
+
+        recorder, self.__recorder = self.__recorder, None
+
+        if recorder is not None:
+            recorder.close()
+
     def send(self, message):
         """
         Send a Message to the Server.
@@ -84,40 +159,140 @@ class SocketTransport(Transport):
         returned.
         """
 
-        try:
+        with self.__send_lock:
             message_id = self.nextId()
-    
-            frame = Frame.fromMessage(message.setId(message_id).build())
-    
-            self.__socket.sendall(frame.bytes())
-    
+
+            self.__write(message.setId(message_id))
+
             return message_id
-        except socket.timeout as e:
-            raise ConnectionError(e)
-        except ssl.SSLError as e:
-            raise ConnectionError(e)
 
-    def sendAndReceive(self, message):
+    def send_async(self, message):
         """
-        Send a Message to the Server, and wait for the response to be received.
+        Send a Message to the Server, without waiting for the response.
+
+        A Future is returned, which is resolved with the response Message once
+        the reader thread receives it. Many Messages may be in flight at once,
+        and their responses can arrive in any order.
         """
 
-        message_id = self.send(message)
+        future = Future()
+
+        with self.__send_lock:
+            message_id = self.nextId()
+
+            with self.__pending_lock:
+                self.__pending[message_id] = future
 
-        while True:
-            response = self.receive()
+                if self.__reader is None:
+                    self.__reader = threading.Thread(target=self.__dispatch, name="drozer-transport-reader", daemon=True)
+                    self.__reader.start()
 
-            if response is None:
-                raise ConnectionError(RuntimeError('Received an empty response from the Agent.'))
-            elif response.id == message_id:
-                return response
+            try:
+                self.__write(message.setId(message_id))
+            except Exception:
+                with self.__pending_lock:
+                    self.__pending.pop(message_id, None)
+                raise
+
+        future.message_id = message_id
+
+        return future
+
+    def sendAndReceive(self, message):
+        """
+        Send a Message to the Server, and wait for the response to be received.
+        """
+
+        return self.wait(self.send_async(message))
             
     def setTimeout(self, timeout):
         """
-        Change the read timeout on the socket.
+        Change the time to wait for a response to each Message.
         """
         
-        self.__socket.settimeout(timeout)
+        self.__timeout = timeout
+
+    def wait(self, future):
+        """
+        Wait for the response to a Message sent with #send_async.
+
+        If no response arrives before the timeout set with #setTimeout, a
+        ConnectionError is raised.
+        """
+
+        try:
+            return future.result(self.__timeout)
+        except TimeoutError as e:
+            with self.__pending_lock:
+                self.__pending.pop(getattr(future, 'message_id', None), None)
+
+            raise ConnectionError(socket.timeout("timed out waiting for a response from the Agent"))
+
+    def __dispatch(self):
+        """
+        Body of the reader thread: reads each response from the socket, and
+        resolves the Future registered against its Message identifier.
+
+        Responses without a matching Future are discarded. If the connection
+        fails, every outstanding Future is failed with a ConnectionError.
+        """
+
+        try:
+            while True:
+                response = self.receive()
+
+                if response is None:
+                    raise ConnectionError(RuntimeError('Received an empty response from the Agent.'))
+
+                with self.__pending_lock:
+                    future = self.__pending.pop(response.id, None)
+
+                if future is not None:
+                    future.set_result(response)
+        except Exception as e:
+            if not isinstance(e, ConnectionError):
+                e = ConnectionError(e)
+
+            with self.__pending_lock:
+                pending = list(self.__pending.values())
+
+                self.__pending.clear()
+                self.__reader = None
+
+            for future in pending:
+                future.set_exception(e)
+
+    def __resetDispatcher(self):
+        """
+        Prepare the bookkeeping used to match responses to outstanding
+        Messages.
+        """
+
+        self.__pending = {}
+        self.__pending_lock = threading.Lock()
+        self.__reader = None
+        self.__recorder = None
+        self.__send_lock = threading.Lock()
+        self.__timeout = None
+
+    def __write(self, message):
+        """
+        Write a built Message onto the socket, as a single Frame.
+        """
+
+        payload = message.build()
+
+        if self.__recorder is not None:
+            self.__recorder.request(payload)
+
+        try:
+            self.__socket.sendall(Frame.fromMessage(payload).bytes())
+        except socket.timeout as e:
+            raise ConnectionError(e)
+        except ssl.SSLError as e:
+            raise ConnectionError(e)
+        except OSError as e:
+            raise ConnectionError(e)
 
     def __getEndpoint(self, arguments) -> Optional[Tuple[str, int]]:
         """
@@ -141,30 +316,46 @@ class SocketTransport(Transport):
         
         return host, int(port)
 
-    def adb(self, s: str):
+    @staticmethod
+    def adb(s: str):
         return ('%04x' % len(s)).encode('ascii') + s.encode()
 
-    def connect_via_adb(self, port: int) -> Optional[str]:
-        # adb devices
+    @classmethod
+    def adbDevices(cls) -> List[str]:
+        """
+        List the devices known to the adb server, as "serial\tstate" lines.
+
+        Raises a ConnectionError if the adb server cannot be asked.
+        """
+
         _tmp_socket = socket.socket()
         try:
-            _tmp_socket.connect((self.AdbHost, self.AdbPort))
+            _tmp_socket.connect((cls.AdbHost, cls.AdbPort))
         except Exception:
-            return "adb server seems not alive"
-        _tmp_socket.send(self.adb('host:devices'))
+            raise ConnectionError("adb server seems not alive")
+        _tmp_socket.send(cls.adb('host:devices'))
         if _tmp_socket.recv(4) != b'OKAY':
             _tmp_socket.close()
-            return "adb(host:devices) fail"
+            raise ConnectionError("adb(host:devices) fail")
         devices = _tmp_socket.recv(int(_tmp_socket.recv(4).decode('ascii'), 16)).decode().strip().split('\n')
         _tmp_socket.close()
 
+        return devices
+
+    def connect_via_adb(self, port: int) -> Optional[str]:
+        # adb devices
+        try:
+            devices = self.adbDevices()
+        except ConnectionError as e:
+            return str(e.cause)
+
         # adb -s
         self.__socket = socket.socket()
         try:
             self.__socket.connect((self.AdbHost, self.AdbPort))
         except Exception:
             return "adb server seems not alive"
-        if len(devices) == 1:
+        if len(devices) == 1 and self.choice is None:
             self.__socket.send(self.adb('host:transport-any'))
         else:
             self.__socket.send(self.adb('host:transport:%s' % self.choose_device(devices)))
@@ -1,2 +1,10 @@
 class FtpException(Exception):
-    pass
+    """
+    Raised when a file transfer fails. The offset is the number of bytes that
+    were transferred successfully, from which the transfer can be resumed.
+    """
+
+    def __init__(self, message, offset=None):
+        Exception.__init__(self, message)
+
+        self.offset = offset
@@ -1,18 +1,156 @@
+import io
+
 from . import FtpException
 from ..api.builders.file_transform_request import FileTransformRequestFactory
+from ..api.transport.exceptions import ConnectionError
 
 
 class Ftp:
-    def __init__(self, session):
+    """
+    Transfers files between the local file system and the Agent's.
+
+    Agents that support it are sent files in chunks of block_size bytes, each
+    addressed by its offset in the file, so that memory use does not depend on
+    the size of the file. A chunk whose response is lost (the connection times
+    out or drops) is retried from the last good offset and, if it still fails,
+    the FtpException carries that offset so that the transfer can be resumed
+    later. A chunk that the Agent refuses is not retried. Older Agents are sent
+    the whole file in a single message.
+
+    The Agent never sends more than max_chunk_size bytes in a chunk, so larger
+    downloads are requested in chunks of that size.
+    """
+
+    max_chunk_size = 4 * 1024 * 1024
+    minimum_agent_version = 20407
+
+    def __init__(self, session, block_size=65536, retries=3):
         self.__session = session
+        self.block_size = block_size
+        self.retries = retries
+
+    def chunked(self) -> bool:
+        """
+        True, if the Agent supports chunked transfers.
+        """
+
+        return getattr(self.__session, "agent_version", 0) >= self.minimum_agent_version
 
     def upload(self, filename: str, data: bytes):
-        ret = self.__session.sendAndReceive(FileTransformRequestFactory(True, filename, data))
-        if not ret.file_transform_response.success:
-            raise FtpException("upload fail")
+        self.uploadFile(filename, io.BytesIO(data))
 
     def download(self, filename) -> bytes:
-        ret = self.__session.sendAndReceive(FileTransformRequestFactory(False, filename))
-        if not ret.file_transform_response.success:
-            raise FtpException("download fail")
-        return ret.file_transform_response.data
+        destination = io.BytesIO()
+
+        self.downloadFile(filename, destination)
+
+        return destination.getvalue()
+
+    def uploadFile(self, filename: str, source, offset=0, block_size=None, progress=None) -> int:
+        """
+        Write the contents of the local file object source into filename on the
+        Agent, starting from offset, and return the size of the remote file.
+
+        progress is called with the number of bytes transferred, and the total
+        if it is known, after each chunk.
+        """
+
+        if not self.chunked():
+            data = source.read()
+
+            self.__transfer(FileTransformRequestFactory(True, filename, data), 0, "upload fail")
+            self.__progress(progress, len(data), len(data))
+
+            return len(data)
+
+        block_size = block_size or self.block_size
+        total = self.__size(source)
+
+        if offset:
+            source.seek(offset)
+
+        while True:
+            data = source.read(block_size)
+
+            self.__transfer(FileTransformRequestFactory(True, filename, data).setChunk(offset), offset, "upload fail")
+
+            offset += len(data)
+            self.__progress(progress, offset, total)
+
+            if len(data) < block_size:
+                return offset
+
+    def downloadFile(self, filename: str, destination, offset=0, block_size=None, progress=None) -> int:
+        """
+        Read filename on the Agent, from offset, into the local file object
+        destination, and return the offset reached (the size of the file, if it
+        was read to the end).
+
+        progress is called with the number of bytes transferred, and the total
+        if it is known, after each chunk.
+        """
+
+        if not self.chunked():
+            data = self.__transfer(FileTransformRequestFactory(False, filename), 0, "download fail").data
+
+            destination.write(data)
+            self.__progress(progress, len(data), len(data))
+
+            return len(data)
+
+        block_size = min(block_size or self.block_size, self.max_chunk_size)
+
+        while True:
+            response = self.__transfer(FileTransformRequestFactory(False, filename).setChunk(offset, block_size), offset, "download fail")
+
+            destination.write(response.data)
+
+            offset += len(response.data)
+            self.__progress(progress, offset, response.size or None)
+
+            # the Agent may send less than was asked for, so read until the
+            # reported size is reached, or nothing more comes back
+            if len(response.data) == 0 or response.HasField("size") and offset >= response.size:
+                return offset
+            elif not response.HasField("size") and len(response.data) < block_size:
+                return offset
+
+    def __progress(self, progress, transferred, total):
+        if progress is not None:
+            progress(transferred, total)
+
+    def __size(self, source):
+        """
+        Get the size of a local file object, or None if it cannot be found.
+        """
+
+        try:
+            position = source.tell()
+            size = source.seek(0, io.SEEK_END)
+            source.seek(position)
+
+            return size
+        except (AttributeError, OSError):
+            return None
+
+    def __transfer(self, request, offset, error):
+        """
+        Send a FileTransformRequest, retrying it if the response is lost, and
+        return the FileTransformResponse.
+
+        The session is asked to raise a lost connection, rather than exit, so
+        that the transfer can be retried or resumed.
+        """
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.__session.sendAndReceive(request, exit_on_loss=False)
+            except (ConnectionError, OSError):
+                continue
+
+            if response is not None and response.file_transform_response.success:
+                return response.file_transform_response
+            else:
+                break
+
+        raise FtpException(error, offset)
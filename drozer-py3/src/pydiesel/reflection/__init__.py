@@ -1,7 +1,10 @@
 
 __all__ = [ "types",
+            "BatchResult",
+            "ReflectionBatch",
             "ReflectionException",
             "Reflector" ]
 
+from .batch import BatchResult, ReflectionBatch
 from .exceptions import ReflectionException
 from .reflector import Reflector
@@ -0,0 +1,208 @@
+from ..api.builders import ReflectionRequestFactory
+from ..api.protobuf_pb2 import Message
+from .exceptions import ReflectionException
+from .types.reflected_type import ReflectedType
+
+class BatchResult(object):
+    """
+    A placeholder for the result of an operation recorded in a ReflectionBatch.
+
+    Until the batch is flushed, a BatchResult can be used as the target of, or
+    an argument to, later operations in the same batch. Once the batch has been
+    flushed, #result returns the value.
+    """
+
+    def __init__(self, batch, index):
+        self._batch = batch
+        self._index = index
+        self._response = None
+        self._value = None
+
+    def done(self):
+        """
+        True, if the batch containing this operation has been flushed.
+        """
+
+        return self._response is not None
+
+    def result(self):
+        """
+        Get the result of the operation, as a ReflectedType.
+
+        If the operation failed, a ReflectionException is raised.
+        """
+
+        if self._response is None:
+            raise ReflectionException("the batch has not been flushed")
+        elif self._response.status == Message.ReflectionResponse.SUCCESS:
+            return self._value
+        else:
+            raise ReflectionException(self._response.errormessage)
+
+    def _pb(self):
+        """
+        Get an Argument representation of the result, as defined in the drozer
+        protocol.
+        """
+
+        if self.done():
+            return self.result()._pb()
+        else:
+            argument = Message.Argument(type=Message.Argument.OBJECT)
+
+            argument.object.batch_index = self._index
+
+            return argument
+
+    def _reference(self, reference):
+        """
+        Point an ObjectReference at the result of this operation.
+        """
+
+        if self.done():
+            reference.reference = self.result()._ref
+        else:
+            reference.batch_index = self._index
+
+
+class ReflectionBatch(object):
+    """
+    A ReflectionBatch records reflection operations, and delivers them to the
+    Agent in a single BATCH request when it is flushed:
+
+        with reflector.batch() as batch:
+            types = [batch.invoke(cursor, "getType", i) for i in range(columns)]
+
+        [t.result() for t in types]
+
+    Each operation returns a BatchResult placeholder, rather than the value.
+    """
+
+    minimum_agent_version = 20406
+
+    def __init__(self, reflector):
+        self._reflector = reflector
+
+        self.__requests = []
+        self.__results = []
+
+    def construct(self, robj, *args):
+        """
+        Record a CONSTRUCT operation, to build a new instance of a class.
+        """
+
+        request = ReflectionRequestFactory.construct(0).setArguments(self.__arguments(args))
+
+        return self.__record(request, request.builder.reflection_request.construct.object, robj)
+
+    def flush(self):
+        """
+        Deliver the recorded operations to the Agent, and fill in their
+        BatchResults.
+
+        The batch is emptied, and can be used to record further operations.
+
+        Results are read as soon as they arrive, so that the Reflector does not
+        release an object that one of them refers to.
+        """
+
+        if len(self.__requests) == 0:
+            return
+
+        requests, results = self.__requests, self.__results
+
+        self.__requests = []
+        self.__results = []
+
+        self._reflector._start()
+
+        try:
+            response = self._reflector.sendAndReceive(ReflectionRequestFactory.batch(requests))
+
+            if response is None:
+                raise ReflectionException("expected a response to BATCH")
+            elif len(response.reflection_response.batch) != len(results):
+                raise ReflectionException(response.reflection_response.errormessage or "expected %d responses to BATCH" % len(results))
+
+            for result, result_response in zip(results, response.reflection_response.batch):
+                if result_response.status == Message.ReflectionResponse.SUCCESS:
+                    result._value = ReflectedType.fromArgument(result_response.result, reflector=self._reflector)
+
+                result._response = result_response
+        finally:
+            self._reflector._finish()
+
+    def getProperty(self, robj, property_name):
+        """
+        Record a GET_PROPERTY operation, to read the value of an object's field.
+        """
+
+        request = ReflectionRequestFactory.getProperty(0, property_name)
+
+        return self.__record(request, request.builder.reflection_request.get_property.object, robj)
+
+    def invoke(self, robj, method, *args):
+        """
+        Record an INVOKE operation, to call a method on an object.
+        """
+
+        request = ReflectionRequestFactory.invoke(0, method).setArguments(self.__arguments(args))
+
+        return self.__record(request, request.builder.reflection_request.invoke.object, robj)
+
+    def resolve(self, class_name):
+        """
+        Record a RESOLVE operation, to get a reference to a class given its
+        name.
+        """
+
+        return self.__record(ReflectionRequestFactory.resolve(class_name), None, None)
+
+    def __arguments(self, args):
+        """
+        Convert native arguments into ReflectedTypes, leaving BatchResults for
+        the Agent to resolve.
+        """
+
+        return [isinstance(arg, BatchResult) and self.__check(arg) or ReflectedType.fromNative(arg, reflector=self._reflector) for arg in args]
+
+    def __check(self, result):
+        """
+        Ensure that a BatchResult can be referred to by this batch: it must
+        either be filled in already, or be pending in this batch.
+        """
+
+        if not result.done() and result._batch is not self:
+            raise ReflectionException("cannot refer to a pending result from another batch")
+
+        return result
+
+    def __record(self, request, reference, robj):
+        """
+        Add a request to the batch, pointing it at its target object, and
+        return a BatchResult for it.
+        """
+
+        if isinstance(robj, BatchResult):
+            reference.ClearField("reference")
+
+            self.__check(robj)._reference(reference)
+        elif robj is not None:
+            reference.reference = robj._ref
+
+        result = BatchResult(self, len(self.__requests))
+
+        self.__requests.append(request)
+        self.__results.append(result)
+
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self):
+        return len(self.__requests)
@@ -0,0 +1,43 @@
+class MemberCache(object):
+    """
+    Records whether the members of a Java class are fields or methods, so that
+    every ReflectedObject of that class can go straight to GET_PROPERTY or
+    INVOKE, rather than trying to read each method as a field first.
+
+    Classes are keyed by the runtime class name the Agent sends with an object
+    reference. The members of a Class object are its static fields, so these
+    are kept apart from those of its instances.
+    """
+
+    FIELD = "field"
+    METHOD = "method"
+
+    def __init__(self):
+        self.__kinds = {}
+
+    def clear(self):
+        """
+        Forget about all members.
+        """
+
+        self.__kinds.clear()
+
+    def get(self, klass, name):
+        """
+        Get the kind of a member, FIELD or METHOD, or None if it is not known.
+        """
+
+        return self.__kinds.get(klass, {}).get(name)
+
+    def put(self, klass, name, kind):
+        """
+        Record the kind of a member.
+        """
+
+        self.__kinds.setdefault(klass, {})[name] = kind
+
+    def __contains__(self, klass):
+        return klass in self.__kinds
+
+    def __len__(self):
+        return len(self.__kinds)
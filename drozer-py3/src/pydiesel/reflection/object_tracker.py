@@ -0,0 +1,146 @@
+import collections
+import threading
+import weakref
+
+class ObjectTracker(object):
+    """
+    Counts the ReflectedObjects that refer to each entry in the Agent's
+    ObjectStore, so that an entry can be released once nothing in the console
+    refers to it any more.
+
+    A finalizer on each ReflectedObject queues its reference when it is
+    collected. The queue is only processed when the tracker is next used, so
+    finalizers (which may run at any point) never touch the counts. Once the
+    last ReflectedObject with a reference has gone, the reference is ready to
+    #take, and can be deleted from the ObjectStore.
+
+    The tracker also records the most entries that have been live at once, and
+    raises a warning (see #overflowing) when there are more than warning.
+    """
+
+    def __init__(self, threshold=64, warning=10000):
+        self.high_water = 0
+        self.released = 0
+        self.threshold = threshold
+        self.warning = warning
+
+        self.__dead = set()
+        self.__entries = {}
+        self.__finalized = collections.deque()
+        self.__lock = threading.Lock()
+        self.__warned = False
+
+    def discard(self, ref):
+        """
+        Forget about a reference, which has been deleted from the ObjectStore
+        by other means.
+        """
+
+        with self.__lock:
+            self.__drain()
+
+            self.__entries.pop(ref, None)
+            self.__dead.discard(ref)
+
+    def live(self):
+        """
+        Get the number of ObjectStore entries that ReflectedObjects refer to.
+        """
+
+        with self.__lock:
+            self.__drain()
+
+            return len(self.__entries)
+
+    def overflowing(self):
+        """
+        True, the first time this is called after the number of live entries
+        has risen above warning. It is rearmed once the number falls below half
+        of warning.
+        """
+
+        with self.__lock:
+            self.__drain()
+
+            if len(self.__entries) > self.warning and not self.__warned:
+                self.__warned = True
+
+                return True
+            elif len(self.__entries) < self.warning // 2:
+                self.__warned = False
+
+            return False
+
+    def pending(self):
+        """
+        Get the number of references that are ready to be released.
+        """
+
+        with self.__lock:
+            self.__drain()
+
+            return len(self.__dead)
+
+    def reset(self):
+        """
+        Forget about every reference, after the ObjectStore has been cleared.
+        """
+
+        with self.__lock:
+            self.__dead.clear()
+            self.__entries.clear()
+            self.__finalized.clear()
+
+    def take(self):
+        """
+        Get the references that are ready to be released, and count them as
+        released.
+        """
+
+        with self.__lock:
+            self.__drain()
+
+            refs, self.__dead = sorted(self.__dead), set()
+            self.released += len(refs)
+
+            return refs
+
+    def track(self, obj):
+        """
+        Start counting a ReflectedObject against the ObjectStore entry that it
+        refers to.
+        """
+
+        with self.__lock:
+            self.__drain()
+
+            ref = obj._ref
+
+            if ref not in self.__entries:
+                # a token identifies this entry, so finalizers from before the
+                # reference was reset or discarded do not count against it
+                self.__entries[ref] = [0, object()]
+                self.__dead.discard(ref)
+
+            entry = self.__entries[ref]
+            entry[0] += 1
+
+            self.high_water = max(self.high_water, len(self.__entries))
+
+        weakref.finalize(obj, self.__finalized.append, (ref, entry[1])).atexit = False
+
+    def __drain(self):
+        """
+        Count the finalized ReflectedObjects off their entries.
+        """
+
+        while len(self.__finalized) > 0:
+            ref, token = self.__finalized.popleft()
+            entry = self.__entries.get(ref)
+
+            if entry is not None and entry[1] is token:
+                entry[0] -= 1
+
+                if entry[0] == 0:
+                    del self.__entries[ref]
+                    self.__dead.add(ref)
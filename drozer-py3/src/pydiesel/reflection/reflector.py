@@ -1,6 +1,12 @@
+import threading
+
 from ..api.builders import ReflectionRequestFactory
 from ..api.protobuf_pb2 import Message
+from .batch import ReflectionBatch
 from .exceptions import ReflectionException
+from .member_cache import MemberCache
+from .object_tracker import ObjectTracker
+from .resolve_cache import ResolveCache
 from .types.reflected_type import ReflectedType
 
 class Reflector:
@@ -10,25 +16,62 @@ class Reflector:
 
     The Reflector handles building of Reflection Messages, delivery to the Agent
     and interpretation of the result.
+
+    Objects in the Agent's ObjectStore that are no longer referred to by any
+    ReflectedObject are released in the background, with DELETE requests that
+    ride along with the Reflector's other traffic.
+
+    The Agent gives an object the same reference each time it is returned, so
+    a response that has not been read yet may carry a reference that is about
+    to be released. Releases are held back while any request is outstanding,
+    and sent before the next request goes out.
     """
 
     def __init__(self, session):
+        self.__lock = threading.Lock()
+        self.__outstanding = 0
+        self.__releasing = []
         self.__session = session
 
+        self.member_cache = MemberCache()
+        self.object_tracker = ObjectTracker()
+        self.resolve_cache = ResolveCache()
+
+    def agentVersion(self):
+        """
+        Get the version of the Agent, if the session knows it, or else 0.
+        """
+
+        return getattr(self.__session, "agent_version", 0)
+
+    def batch(self):
+        """
+        Start a new ReflectionBatch, which records operations and delivers them
+        to the Agent in a single round trip. This is normally used as a context
+        manager, which flushes the batch on exit.
+        """
+
+        return ReflectionBatch(self)
+
+    def collect(self):
+        """
+        Release every ObjectStore entry that is no longer referred to, and wait
+        for the Agent to delete them. Returns the number of entries released.
+        """
+
+        count = self.__release()
+
+        self.__reap()
+
+        return count
+
     def construct(self, robj, *args):
         """
         Constructs a new instance of a class, with optional arguments, and
         returns the object instance.
         """
 
-        response = self.sendAndReceive(ReflectionRequestFactory.construct(robj._ref).setArguments(args))
-        
-        if response is None:
-            raise ReflectionException("expected a response to CONSTRUCT")
-        elif response.reflection_response.status == Message.ReflectionResponse.SUCCESS:
-            return ReflectedType.fromArgument(response.reflection_response.result, reflector=self)
-        else:
-            raise ReflectionException(response.reflection_response.errormessage)
+        return self.__exchange(ReflectionRequestFactory.construct(robj._ref).setArguments(args), "CONSTRUCT")
 
     def delete(self, robj):
         """
@@ -36,6 +79,9 @@ class Reflector:
         status.
         """
 
+        self.object_tracker.discard(robj._ref)
+        self.resolve_cache.discard(robj._ref)
+
         response = self.sendAndReceive(ReflectionRequestFactory.delete(robj._ref))
 
         return response is not None and response.reflection_response.status == Message.ReflectionResponse.SUCCESS
@@ -43,8 +89,15 @@ class Reflector:
     def deleteAll(self):
         """
         Removes all objects stored in the remote ObjectStore.
+
+        This invalidates all cached class references.
         """
 
+        self.__reap()
+
+        self.object_tracker.reset()
+        self.resolve_cache.clear()
+
         response = self.sendAndReceive(ReflectionRequestFactory.deleteAll())
 
         if response is None:
@@ -54,55 +107,98 @@ class Reflector:
         else:
             raise ReflectionException(response.reflection_response.errormessage)
 
+    def gather(self, futures):
+        """
+        Waits for the responses to requests delivered with #send_async, and
+        returns the result of each, in the order they were given.
+
+        If any request failed, a ReflectionException is raised.
+        """
+
+        results = []
+
+        try:
+            for response in self.__session.gather(futures):
+                if response is None:
+                    raise ReflectionException("expected a response to an asynchronous request")
+                elif response.reflection_response.status == Message.ReflectionResponse.SUCCESS:
+                    results.append(ReflectedType.fromArgument(response.reflection_response.result, reflector=self))
+                else:
+                    raise ReflectionException(response.reflection_response.errormessage)
+        finally:
+            self._finish(len(futures))
+
+        return results
+
     def getProperty(self, robj, property_name):
         """
         Reads a property from an object, and returns the value.
         """
 
-        response = self.sendAndReceive(ReflectionRequestFactory.getProperty(robj._ref, property_name))
-
-        if response is None:
-            raise ReflectionException("expected a response to GET_PROPERTY")
-        elif response.reflection_response.status == Message.ReflectionResponse.SUCCESS:
-            return ReflectedType.fromArgument(response.reflection_response.result, reflector=self)
-        else:
-            raise ReflectionException(response.reflection_response.errormessage)
+        return self.__exchange(ReflectionRequestFactory.getProperty(robj._ref, property_name), "GET_PROPERTY")
 
     def invoke(self, robj, method, *args):
         """
         Invokes a method on an object, and returns the return value.
         """
 
-        response = self.sendAndReceive(ReflectionRequestFactory.invoke(robj._ref, method).setArguments(args))
-
-        if response is None:
-            raise ReflectionException("expected a response to INVOKE")
-        elif response.reflection_response.status == Message.ReflectionResponse.SUCCESS:
-            return ReflectedType.fromArgument(response.reflection_response.result, reflector=self)
-        else:
-            raise ReflectionException(response.reflection_response.errormessage)
+        return self.__exchange(ReflectionRequestFactory.invoke(robj._ref, method).setArguments(args), "INVOKE")
 
     def resolve(self, class_name):
         """
         Resolves a Java class, given its fully qualified name, and returns a
         ReflectedObject that can be used to instantiate it with #construct.
+
+        Class references are cached, until the ObjectStore is cleared.
         """
 
-        response: Message = self.sendAndReceive(ReflectionRequestFactory.resolve(class_name))
+        klass = self.resolve_cache.get(class_name)
 
-        if response is None:
-            raise ReflectionException("expected a response to RESOLVE")
-        elif response.reflection_response.status == Message.ReflectionResponse.SUCCESS:
-            return ReflectedType.fromArgument(response.reflection_response.result, reflector=self)
-        else:
-            raise ReflectionException(response.reflection_response.errormessage)
+        if klass is not None:
+            return klass
+
+        klass = self.__exchange(ReflectionRequestFactory.resolve(class_name), "RESOLVE")
+
+        self.resolve_cache.put(class_name, klass)
+
+        return klass
+
+    def send_async(self, message_or_factory):
+        """
+        Delivers a request to the Agent without waiting for its response, so
+        that many requests can be in flight at once.
+
+        Returns a Future, which should be passed to #gather to collect the
+        result:
+
+            futures = [reflector.send_async(ReflectionRequestFactory.invoke(cursor._ref, "getString").setArguments([ReflectedType.fromNative(i, reflector=reflector)])) for i in range(columns)]
+            values = reflector.gather(futures)
+
+        Releases are held back until the Future has been gathered.
+        """
+
+        self._start()
+
+        try:
+            return self.__session.send_async(message_or_factory)
+        except:
+            self._finish()
+            raise
 
     def sendAndReceive(self, message_or_factory):
         """
         Provides a wrapper around the Session's sendAndReceive method.
+
+        Releases are held back until the response arrives, so a caller that
+        reads objects out of it must do so before its next request.
         """
 
-        return self.__session.sendAndReceive(message_or_factory)
+        self._start()
+
+        try:
+            return self.__session.sendAndReceive(message_or_factory)
+        finally:
+            self._finish()
 
     def setProperty(self, robj, property_name, value):
         """
@@ -117,3 +213,101 @@ class Reflector:
             return response
         else:
             raise ReflectionException(response.reflection_response.errormessage)
+
+    def _finish(self, count=1):
+        """
+        Mark requests as answered, once their responses have been read.
+        """
+
+        with self.__lock:
+            self.__outstanding -= count
+
+    def _start(self):
+        """
+        Mark a request as outstanding, before it is sent. Earlier responses have
+        been read by now, so this is where entries are released.
+        """
+
+        self.__collectGarbage()
+
+        with self.__lock:
+            self.__outstanding += 1
+
+    def __collectGarbage(self):
+        """
+        Invoked before each exchange with the Agent, to collect the responses to
+        earlier DELETE requests (which the Agent has answered by now) and send
+        more if enough entries are ready to be released.
+        """
+
+        self.__reap()
+
+        if self.object_tracker.pending() >= self.object_tracker.threshold:
+            self.__release()
+
+        if self.object_tracker.overflowing() and hasattr(self.__session, "stderr"):
+            self.__session.stderr.write("The Agent is holding %d objects for this session. Long-lived references to remote objects may exhaust its memory.\n" % self.object_tracker.live())
+
+    def __exchange(self, message_or_factory, operation):
+        """
+        Send a request and wait for its response, and get its result as a
+        ReflectedType. Releases are held back until the result has been read.
+        """
+
+        self._start()
+
+        try:
+            response = self.sendAndReceive(message_or_factory)
+
+            if response is None:
+                raise ReflectionException("expected a response to " + operation)
+            elif response.reflection_response.status == Message.ReflectionResponse.SUCCESS:
+                return ReflectedType.fromArgument(response.reflection_response.result, reflector=self)
+            else:
+                raise ReflectionException(response.reflection_response.errormessage)
+        finally:
+            self._finish()
+
+    def __reap(self):
+        """
+        Wait for the responses to outstanding DELETE requests.
+
+        An entry may already have gone from the ObjectStore, so failures are
+        ignored.
+        """
+
+        with self.__lock:
+            futures, self.__releasing = self.__releasing, []
+
+        if len(futures) > 0:
+            self.__session.gather(futures)
+
+    def __release(self):
+        """
+        Deliver DELETE requests for the entries that are ready to be released,
+        without waiting for the responses.
+
+        Nothing is released while another request is outstanding, since its
+        response could carry one of the references. The lock is held until the
+        requests are sent, so that no new request can overtake them.
+
+        Agents that support BATCH get a single request.
+        """
+
+        with self.__lock:
+            if self.__outstanding > 0:
+                return 0
+
+            refs = self.object_tracker.take()
+
+            if len(refs) == 0:
+                return 0
+
+            if self.agentVersion() >= ReflectionBatch.minimum_agent_version:
+                requests = [ReflectionRequestFactory.batch([ReflectionRequestFactory.delete(ref) for ref in refs])]
+            else:
+                requests = [ReflectionRequestFactory.delete(ref) for ref in refs]
+
+            self.__releasing.extend([self.__session.send_async(request) for request in requests])
+
+        return len(refs)
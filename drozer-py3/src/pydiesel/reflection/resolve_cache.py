@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+
+class ResolveCache(object):
+    """
+    A bounded, least-recently-used cache of the class references returned by
+    RESOLVE requests, which counts its hits and misses.
+
+    Class references live in the Agent's ObjectStore, so the cache must be
+    cleared whenever the ObjectStore is.
+
+    The cache may be shared by threads that reflect concurrently.
+    """
+
+    def __init__(self, size=256):
+        self.hits = 0
+        self.misses = 0
+        self.size = size
+
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def clear(self):
+        """
+        Remove all class references from the cache.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def discard(self, ref):
+        """
+        Remove any class reference to the object ref, after it has been deleted
+        from the ObjectStore.
+        """
+
+        with self.__lock:
+            for class_name in [c for c, klass in self.__entries.items() if klass._ref == ref]:
+                del self.__entries[class_name]
+
+    def get(self, class_name):
+        """
+        Get the cached class reference for class_name, or None if it has not
+        been resolved.
+        """
+
+        with self.__lock:
+            if class_name in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(class_name)
+
+                return self.__entries[class_name]
+            else:
+                self.misses += 1
+
+                return None
+
+    def put(self, class_name, klass):
+        """
+        Store a class reference, evicting the least-recently-used entry if the
+        cache is full.
+        """
+
+        with self.__lock:
+            self.__entries[class_name] = klass
+            self.__entries.move_to_end(class_name)
+
+            while len(self.__entries) > self.size:
+                self.__entries.popitem(last=False)
+
+    def __contains__(self, class_name):
+        return class_name in self.__entries
+
+    def __len__(self):
+        return len(self.__entries)
@@ -17,8 +17,15 @@ class ReflectedArray(ReflectedType):
         """
         Builds a new ReflectedArray, given an Argument as defined in the drozer
         protocol that contains an Array.
+
+        A primitive Array becomes a ReflectedPrimitiveArray.
         """
 
+        from .reflected_primitive_array import ReflectedPrimitiveArray
+
+        if argument.array.type == Message.Array.PRIMITIVE and (argument.array.HasField("packed") or len(argument.array.element) > 0):
+            return ReflectedPrimitiveArray.fromArgument(argument, reflector)
+
         array = []
 
         for element in argument.array.element:
@@ -72,22 +79,27 @@ class ReflectedArray(ReflectedType):
         protocol.
         """
 
+        from .reflected_primitive_array import ReflectedPrimitiveArray
+
         argument = Message.Argument(type=Message.Argument.ARRAY)
+        element_type = len(self._native) > 0 and ReflectedType.fromNative(self._native[0], reflector=self._reflector)._pb().type or Message.Argument.NULL
 
-        if self._native[0]._pb().type == Message.Argument.ARRAY:
+        if element_type == Message.Argument.ARRAY:
             argument.array.type = Message.Array.ARRAY
-        elif self._native[0]._pb().type == Message.Argument.NULL:
+        elif element_type == Message.Argument.NULL:
             argument.array.type = Message.Array.OBJECT
-        elif self._native[0]._pb().type == Message.Argument.OBJECT:
+        elif element_type == Message.Argument.OBJECT:
             argument.array.type = Message.Array.OBJECT
-        elif self._native[0]._pb().type == Message.Argument.STRING:
+        elif element_type == Message.Argument.STRING:
             argument.array.type = Message.Array.STRING
-        elif self._native[0]._pb().type == Message.Argument.PRIMITIVE:
+        elif element_type == Message.Argument.PRIMITIVE:
+            # send the values packed, if the Agent supports it
+            if self._reflector is not None and self._reflector.agentVersion() >= ReflectedPrimitiveArray.minimum_agent_version:
+                return ReflectedPrimitiveArray(self._native[0].type(), [p.native() for p in self._native], reflector=self._reflector)._pb()
+
             argument.array.type = Message.Array.PRIMITIVE
 
-        for e in self._native:
-            element = argument.array.element.add()
-            element.MergeFrom(ReflectedType.fromNative(e, reflector=self._reflector)._pb())
+        argument.array.element.extend([ReflectedType.fromNative(e, reflector=self._reflector)._pb() for e in self._native])
 
         return argument
 
@@ -2,6 +2,7 @@ from functools import partial
 
 from ...api.protobuf_pb2 import Message
 from ..exceptions import ReflectionException
+from ..member_cache import MemberCache
 from .reflected_type import ReflectedType
 
 class ReflectedObject(ReflectedType):
@@ -17,18 +18,42 @@ class ReflectedObject(ReflectedType):
         self._field_names = set()
         self._not_field_names = set(['_ref', 'getField'])
 
+    @classmethod
+    def fromArgument(cls, argument, reflector):
+        """
+        Creates a new ReflectedObject, given an Argument message as defined in
+        the drozer protocol, and counts it against the ObjectStore entry it
+        refers to.
+        """
+
+        obj = cls(argument.object.reference, reflector=reflector)
+
+        if argument.object.HasField("class_name"):
+            obj._class = (argument.object.class_name, argument.object.is_class)
+
+        if getattr(reflector, "object_tracker", None) is not None:
+            reflector.object_tracker.track(obj)
+
+        return obj
+
     def __getattr__(self, attr):
         if attr.startswith('_'):
             return object.__getattribute__(self, attr)
 
-        if attr in self._field_names:
+        kind = self._member_kind(attr)
+
+        if kind == MemberCache.FIELD:
             return self._reflector.getProperty(self, attr)
 
-        if attr not in self._not_field_names:
+        if kind != MemberCache.METHOD:
             try:
-                return self._reflector.getProperty(self, attr)
+                value = self._reflector.getProperty(self, attr)
+
+                self._remember_member(attr, MemberCache.FIELD)
+
+                return value
             except ReflectionException:
-                self._not_field_names.add(attr)
+                self._remember_member(attr, MemberCache.METHOD)
 
         return partial(self._invoker, attr)
 
@@ -37,14 +62,23 @@ class ReflectedObject(ReflectedType):
             object.__setattr__(self, attr, value)
             return
 
-        if attr in self._field_names:
+        kind = self._member_kind(attr)
+
+        if kind == MemberCache.FIELD:
             return self._reflector.setProperty(self, attr, ReflectedType.fromNative(value, reflector=self._reflector))
 
-        if attr not in self._not_field_names:
+        if kind != MemberCache.METHOD:
             try:
-                return self._reflector.setProperty(self, attr, ReflectedType.fromNative(value, reflector=self._reflector))
+                result = self._reflector.setProperty(self, attr, ReflectedType.fromNative(value, reflector=self._reflector))
+
+                self._remember_member(attr, MemberCache.FIELD)
+
+                return result
             except ReflectionException:
-                self._not_field_names.add(attr)
+                # a set can fail for a real field (if it is final, or the value
+                # has the wrong type), so the failure says nothing about what
+                # kind of member attr is, and is not remembered
+                pass
 
     def _has_property(self, attr):
         """
@@ -53,6 +87,35 @@ class ReflectedObject(ReflectedType):
         
         return not isinstance(self.__getattr__(attr), partial)
     
+    def _member_kind(self, attr):
+        """
+        Get the kind of a member, FIELD or METHOD, from the reflector's
+        MemberCache if the runtime class is known, or else from what this
+        object has seen.
+        """
+
+        if attr in self._not_field_names:
+            return MemberCache.METHOD
+        elif attr in self._field_names:
+            return MemberCache.FIELD
+        elif self._class is not None:
+            return self._reflector.member_cache.get(self._class, attr)
+        else:
+            return None
+
+    def _remember_member(self, attr, kind):
+        """
+        Record the kind of a member, for every object of the same runtime
+        class if it is known, or else for this object alone.
+        """
+
+        if self._class is not None:
+            self._reflector.member_cache.put(self._class, attr, kind)
+        elif kind == MemberCache.FIELD:
+            self._field_names.add(attr)
+        else:
+            self._not_field_names.add(attr)
+
     def _invoker(self, method_name, *args, **kwargs):
         """
         Invokes methods on the object, in the Java VM, proxying through the
@@ -0,0 +1,264 @@
+import array
+import sys
+
+from ...api.protobuf_pb2 import Message
+from .reflected_array import ReflectedArray
+from .reflected_primitive import ReflectedPrimitive
+from .reflected_type import ReflectedType
+
+class ReflectedPrimitiveArray(ReflectedArray):
+    """
+    A ReflectedArray of primitives, which keeps its values in an array.array
+    rather than as a ReflectedPrimitive for each element.
+
+    ReflectedPrimitives are only built as elements are accessed, and the values
+    are sent to and from an Agent that supports it packed into a single string
+    of bytes.
+    """
+
+    # the Agent accepts packed arrays as arguments
+    minimum_agent_version = 20409
+
+    FIELDS = { "boolean": "bool", "byte": "byte", "char": "char", "double": "double",
+               "float": "float", "int": "int", "long": "long", "short": "short" }
+    PRIMITIVE_TYPES = { "boolean": Message.Primitive.BOOL, "byte": Message.Primitive.BYTE,
+                        "char": Message.Primitive.CHAR, "double": Message.Primitive.DOUBLE,
+                        "float": Message.Primitive.FLOAT, "int": Message.Primitive.INT,
+                        "long": Message.Primitive.LONG, "short": Message.Primitive.SHORT }
+    TYPECODES = { "boolean": "B", "byte": "b", "char": "H", "double": "d",
+                  "float": "f", "int": "i", "long": "q", "short": "h" }
+
+    INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+    def __init__(self, primitive_type, values, *args, **kwargs):
+        ReflectedType.__init__(self, *args, **kwargs)
+
+        self._type = primitive_type
+        self._values = array.array(ReflectedPrimitiveArray.TYPECODES[primitive_type], values)
+
+    @classmethod
+    def fromArgument(cls, argument, reflector):
+        """
+        Builds a new ReflectedPrimitiveArray, given an Argument as defined in
+        the drozer protocol that contains a non-empty, packed or unpacked,
+        primitive Array.
+        """
+
+        if argument.array.HasField("packed"):
+            primitive_type = cls.__javaType(argument.array.packed_type)
+
+            return cls.unpack(primitive_type, argument.array.packed, reflector=reflector)
+        else:
+            primitive_type = cls.__javaType(argument.array.element[0].primitive.type)
+            field = ReflectedPrimitiveArray.FIELDS[primitive_type]
+
+            return cls(primitive_type, [getattr(e.primitive, field) for e in argument.array.element], reflector=reflector)
+
+    @classmethod
+    def fromNative(cls, values, reflector):
+        """
+        Builds a new ReflectedPrimitiveArray from an array.array, inferring the
+        Java type from its typecode.
+        """
+
+        for primitive_type, typecode in ReflectedPrimitiveArray.TYPECODES.items():
+            if typecode == values.typecode:
+                return cls(primitive_type, values, reflector=reflector)
+
+        raise TypeError("no Java type for an array of typecode '%s'" % values.typecode)
+
+    @classmethod
+    def primitiveType(cls, values):
+        """
+        Get the Java type of a list of native values, if they can be sent as a
+        primitive array: all bools, all floats, or all ints that fit into an
+        int. Otherwise, None is returned.
+        """
+
+        if len(values) == 0:
+            return None
+
+        native_type = type(values[0])
+
+        if native_type not in (bool, float, int) or any(type(v) is not native_type for v in values):
+            return None
+        elif native_type is bool:
+            return "boolean"
+        elif native_type is float:
+            return "float"
+        elif ReflectedPrimitiveArray.INT_MIN <= min(values) and max(values) <= ReflectedPrimitiveArray.INT_MAX:
+            return "int"
+        else:
+            return None
+
+    @classmethod
+    def unpack(cls, primitive_type, packed, reflector=None):
+        """
+        Builds a new ReflectedPrimitiveArray from big-endian packed values.
+        """
+
+        values = array.array(ReflectedPrimitiveArray.TYPECODES[primitive_type])
+        values.frombytes(packed)
+
+        if sys.byteorder == "little":
+            values.byteswap()
+
+        return cls(primitive_type, values, reflector=reflector)
+
+    def append(self, obj):
+        self._values.append(self.__value(obj))
+
+        return self
+
+    def count(self, obj):
+        return self._values.count(self.__value(obj))
+
+    def extend(self, objects):
+        if isinstance(objects, ReflectedPrimitiveArray) and objects._type == self._type:
+            self._values.extend(objects._values)
+        else:
+            self._values.extend(self.__value(o) for o in objects)
+
+        return self
+
+    def index(self, i):
+        return self._values.index(self.__value(i))
+
+    def insert(self, i, obj):
+        self._values.insert(i, self.__value(obj))
+
+    def native(self):
+        """
+        Get the elements of the array, as ReflectedPrimitives.
+        """
+
+        return [self.__element(v) for v in self._values]
+
+    def pack(self):
+        """
+        Get the values of the array, packed as big-endian bytes.
+        """
+
+        if sys.byteorder == "little":
+            values = array.array(self._values.typecode, self._values)
+            values.byteswap()
+
+            return values.tobytes()
+        else:
+            return self._values.tobytes()
+
+    def pop(self, i=-1):
+        return self.__element(self._values.pop(i))
+
+    def remove(self, obj):
+        self._values.remove(self.__value(obj))
+
+    def sort(self):
+        self._values = array.array(self._values.typecode, sorted(self._values))
+
+        return self
+
+    def type(self):
+        """
+        Get the Java type of the elements.
+        """
+
+        return self._type
+
+    def values(self):
+        """
+        Get the values of the array, as an array.array, without building a
+        ReflectedPrimitive for each.
+        """
+
+        return self._values
+
+    def _pb(self):
+        """
+        Get an Argument representation of the Array, as defined in the drozer
+        protocol. The values are packed if the Agent supports it.
+        """
+
+        argument = Message.Argument(type=Message.Argument.ARRAY)
+        argument.array.type = Message.Array.PRIMITIVE
+
+        primitive_type = ReflectedPrimitiveArray.PRIMITIVE_TYPES[self._type]
+
+        if self._reflector is not None and self._reflector.agentVersion() >= ReflectedPrimitiveArray.minimum_agent_version:
+            argument.array.packed_type = primitive_type
+            argument.array.packed = self.pack()
+        else:
+            field = ReflectedPrimitiveArray.FIELDS[self._type]
+
+            for value in self.__natives():
+                element = argument.array.element.add(type=Message.Argument.PRIMITIVE)
+                element.primitive.type = primitive_type
+                setattr(element.primitive, field, value)
+
+        return argument
+
+    @property
+    def _native(self):
+        return self.native()
+
+    @classmethod
+    def __javaType(cls, primitive_type):
+        for java_type, pb_type in ReflectedPrimitiveArray.PRIMITIVE_TYPES.items():
+            if pb_type == primitive_type:
+                return java_type
+
+    def __element(self, value):
+        return ReflectedPrimitive(self._type, bool(value) if self._type == "boolean" else value, reflector=self._reflector)
+
+    def __natives(self):
+        if self._type == "boolean":
+            return (bool(v) for v in self._values)
+        else:
+            return self._values
+
+    def __value(self, obj):
+        if isinstance(obj, ReflectedPrimitive):
+            return obj.native()
+        else:
+            return obj
+
+    def __add__(self, other):
+        return ReflectedPrimitiveArray(self._type, self._values, reflector=self._reflector).extend(other)
+
+    def __delitem__(self, i):
+        del self._values[i]
+
+    def __eq__(self, other):
+        if isinstance(other, ReflectedPrimitiveArray):
+            return self._type == other._type and self._values == other._values
+        elif isinstance(other, ReflectedArray):
+            return self.native() == other._native
+        else:
+            return self.native() == other
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReflectedPrimitiveArray(self._type, self._values[index], reflector=self._reflector)
+        else:
+            return self.__element(self._values[index])
+
+    def __iter__(self):
+        return (self.__element(v) for v in self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __mul__(self, other):
+        return self.native() * (isinstance(other, ReflectedType) and other._native or other)
+
+    def __setitem__(self, index, obj):
+        self._values[index] = self.__value(obj)
+
+    def __str__(self):
+        return "[{}]".format(", ".join([str(v) for v in self.__natives()]))
+
+    def __format__(self, format_spec):
+        return self.__str__()
@@ -1,3 +1,4 @@
+import array
 import sys
 
 from ...api.protobuf_pb2 import Message
@@ -44,7 +45,7 @@ class ReflectedType(object):
         elif argument.type == Message.Argument.NULL:
             return ReflectedNull(reflector=reflector)
         elif argument.type == Message.Argument.OBJECT:
-            return ReflectedObject(argument.object.reference, reflector=reflector)
+            return ReflectedObject.fromArgument(argument, reflector=reflector)
         elif argument.type == Message.Argument.PRIMITIVE:
             return ReflectedPrimitive.fromArgument(argument, reflector)
         elif argument.type == Message.Argument.STRING:
@@ -64,6 +65,7 @@ class ReflectedType(object):
         from .reflected_null import ReflectedNull
         from .reflected_object import ReflectedObject
         from .reflected_primitive import ReflectedPrimitive
+        from .reflected_primitive_array import ReflectedPrimitiveArray
         from .reflected_string import ReflectedString
 
         if obj_type is None and isinstance(obj, ReflectedType) or obj_type == "object":
@@ -90,7 +92,16 @@ class ReflectedType(object):
             return ReflectedPrimitive("double", obj, reflector=reflector)
         elif obj is None:
             return ReflectedNull(reflector=reflector)
+        elif isinstance(obj, array.array):
+            return ReflectedPrimitiveArray.fromNative(obj, reflector=reflector)
         elif hasattr(obj, '__iter__'):
-            return ReflectedArray(obj, reflector=reflector)
+            # a list of primitives is kept as an array.array, rather than as a
+            # ReflectedPrimitive for each element
+            primitive_type = isinstance(obj, (list, tuple)) and ReflectedPrimitiveArray.primitiveType(obj) or None
+
+            if primitive_type is not None:
+                return ReflectedPrimitiveArray(primitive_type, obj, reflector=reflector)
+            else:
+                return ReflectedArray(obj, reflector=reflector)
         else:
             return None
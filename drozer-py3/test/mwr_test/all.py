@@ -1,8 +1,9 @@
 import unittest
 
-from mwr_test.cinnibar.api import builders, frame_test
-from mwr_test.cinnibar.reflection import reflected_array_test, reflected_null_test, reflected_object_test, reflected_primitive_test, reflected_string_test, reflected_type_test, reflector_test
-from mwr_test.droidhg import android_test, console, modules, repoman, ssl
+from mwr_test.cinnibar.api import builders, frame_test, transport
+from mwr_test.cinnibar.file import ftp_test
+from mwr_test.cinnibar.reflection import member_cache_test, object_tracker_test, reflected_array_test, reflected_null_test, reflected_object_test, reflected_primitive_array_test, reflected_primitive_test, reflected_string_test, reflected_type_test, reflection_batch_test, reflector_test, resolve_cache_test
+from mwr_test.droidhg import android_test, apk_store_test, axml_test, console, device_test, manifest_cache_test, modules, repoman, server, session_test, ssl, standin_test
 
 all_tests = unittest.TestSuite((
   builders.reflection_request_test.ReflectionRequestFactoryTestSuite(),
@@ -13,47 +14,68 @@ all_tests = unittest.TestSuite((
   #api.formatters.system_response_test
 
   frame_test.FrameTestSuite(),
+  transport.capture_test.CaptureTestSuite(),
+  transport.socket_transport_test.SocketTransportTestSuite(),
+  ftp_test.FtpTestSuite(),
   #api.reflection_message_test
   #api.system_message_test
 
+  console.bootstrap_test.BootstrapTestSuite(),
   console.coloured_stream_test.ColouredStreamTestSuite(),
+  console.parallel_test.ParallelRunnerTestSuite(),
+  console.wire_trace_test.WireTraceTestSuite(),
   #console.console_test
   #console.sequencer_test
   #console.server_test
 
   modules.import_conflict_resolver_test.ImportConflictResolverTestSuite(),
+  modules.memo_test.MemoStoreTestSuite(),
   modules.module_base_test.ModuleTestSuite(),
+  modules.registry_test.ModuleRegistryTestSuite(),
+  modules.trie_test.ModuleTrieTestSuite(),
   #modules.common.assets
   #modules.common.busy_box
-  #modules.common.file_system
+  modules.common.file_system_test.FileSystemTestSuite(),
   #modules.common.filtering
   #modules.common.formatter
-  #modules.common.loader
-  #modules.common.package_manager
+  modules.common.loader_test.ClassLoaderTestSuite(),
   #modules.common.path_completion
-  #modules.common.provider
+  modules.common.package_manager_test.PackageManagerTestSuite(),
+  modules.common.provider_test.ProviderTestSuite(),
+  modules.common.scan_engine_test.ScanEngineTestSuite(),
   #modules.common.shell
   #modules.common.strings
   #modules.common.vulnerability
   #modules.common.zip_file
 
+  member_cache_test.MemberCacheTestSuite(),
+  object_tracker_test.ObjectTrackerTestSuite(),
   reflected_array_test.ReflectedArrayTestSuite(),
   reflected_null_test.ReflectedNullTestSuite(),
   reflected_object_test.ReflectedObjectTestSuite(),
   reflected_string_test.ReflectedStringTestSuite(),
   reflected_primitive_test.ReflectedPrimitiveTestSuite(),
+  reflected_primitive_array_test.ReflectedPrimitiveArrayTestSuite(),
   reflected_type_test.ReflectedTypeTestSuite(),
+  reflection_batch_test.ReflectionBatchTestSuite(),
   reflector_test.ReflectorTestSuite(),
+  resolve_cache_test.ResolveCacheTestSuite(),
   
   repoman.installer_test.ModuleInstallerTestSuite(),
   repoman.remote_test.RemoteTestSuite(),
   repoman.repository_builder_test.RepositoryBuilderTestSuite(),
   repoman.repository_test.RepositoryTestSuite(),
   
+  server.frame_receiver_test.FrameReceiverTestSuite(),
+
   ssl.ca.CATestSuite(),
 
-  android_test.IntentTestSuite() ))
-  #device_test
-  #session_test
+  android_test.IntentTestSuite(),
+  apk_store_test.ApkStoreTestSuite(),
+  axml_test.AxmlTestSuite(),
+  device_test.DeviceCollectionTestSuite(),
+  manifest_cache_test.ManifestCacheTestSuite(),
+  session_test.SessionCollectionTestSuite(),
+  standin_test.StandInTestSuite() ))
 
 unittest.TextTestRunner().run(all_tests)
@@ -0,0 +1,89 @@
+"""
+Measures the throughput of the drozer Server relay: consoles send reflection
+requests through drozer.server.protocols.drozerp.Drozer connections, which are
+forwarded to an Agent's connection, and the Agent's responses are forwarded
+back, for varying numbers of concurrent sessions.
+
+Data is delivered to each connection in TCP-sized reads, which split and join
+frames arbitrarily.
+
+    PYTHONPATH=src:test python -m mwr_test.benchmarks.drozerp_benchmark
+"""
+
+import time
+
+from twisted.internet.testing import StringTransport
+
+from pydiesel.api import Frame
+from pydiesel.api.builders import ReflectionRequestFactory, ReflectionResponseFactory
+
+from drozer.device import Device
+from drozer.server.protocols.drozerp import Drozer
+from drozer.session import Sessions
+
+READ_SIZE = 4096
+
+def connection():
+    protocol = Drozer()
+    protocol.makeConnection(StringTransport())
+
+    return protocol
+
+def deliver(protocol, data):
+    for offset in range(0, len(data), READ_SIZE):
+        protocol.dataReceived(data[offset:offset + READ_SIZE])
+
+def frames(messages):
+    return b"".join(Frame.fromMessage(m).bytes() for m in messages)
+
+def measure(sessions, requests):
+    """
+    Relay requests and responses for each session, and return the throughput
+    in frames per second.
+    """
+
+    Sessions.clear()
+
+    agent = connection()
+    device = Device("benchmark", "drozer", "benchmark", "none")
+    device.connection = agent
+
+    consoles = []
+
+    for i in range(sessions):
+        console = connection()
+        consoles.append(console)
+
+        Sessions.add_session("session-%d" % i, device, console)
+
+    messages = [[ReflectionRequestFactory.resolve("java.lang.String").setSessionId("session-%d" % i).setId(j).builder for j in range(requests)] for i in range(sessions)]
+
+    console_data = [frames(m.SerializeToString() for m in session) for session in messages]
+    agent_data = frames(ReflectionResponseFactory().inReplyTo(messages[i][j]).build() for j in range(requests) for i in range(sessions))
+
+    start = time.perf_counter()
+
+    for console, data in zip(consoles, console_data):
+        deliver(console, data)
+
+    deliver(agent, agent_data)
+
+    elapsed = time.perf_counter() - start
+
+    assert len(agent.transport.value()) == sum(len(d) for d in console_data)
+    assert sum(len(c.transport.value()) for c in consoles) == len(agent_data)
+
+    Sessions.clear()
+
+    return 2 * sessions * requests / elapsed
+
+def main():
+    print("%10s %10s %16s" % ("sessions", "requests", "frames/s"))
+
+    for sessions in [1, 10, 100, 1000]:
+        requests = max(10, 20000 // sessions)
+
+        print("%10d %10d %16.0f" % (sessions, requests, measure(sessions, requests)))
+
+if __name__ == "__main__":
+    main()
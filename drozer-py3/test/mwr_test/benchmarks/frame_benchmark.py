@@ -0,0 +1,77 @@
+"""
+Measures the throughput of Frame.readFromSocket on multi-megabyte responses,
+against the reader it replaced, which grew the payload by concatenation.
+
+    PYTHONPATH=src:test python -m mwr_test.benchmarks.frame_benchmark
+"""
+
+import socket
+import threading
+import time
+from struct import unpack
+
+from pydiesel.api import Frame
+from pydiesel.api.protobuf_pb2 import Message
+
+def concatenatingReadFromSocket(sock):
+    """
+    The original Frame.readFromSocket, kept as a reference point.
+    """
+
+    header = sock.recv(8)
+
+    if len(header) == 8:
+        version, length = unpack(">II", header)
+        payload = b""
+
+        while len(payload) != length:
+            payload += sock.recv(length - len(payload))
+
+            if len(payload) == length:
+                return Frame(version, length, payload)
+
+    return None
+
+def response(size):
+    message = Message(id=1, type=Message.REFLECTION_RESPONSE)
+    message.reflection_response.session_id = "555"
+    message.reflection_response.status = Message.ReflectionResponse.SUCCESS
+    message.reflection_response.result.type = Message.Argument.DATA
+    message.reflection_response.result.data = b"\x00" * size
+
+    return Frame.fromMessage(message.SerializeToString()).bytes()
+
+def measure(reader, data, repeat):
+    """
+    Read a frame repeat times from a socket pair, and return the throughput in
+    MB/s.
+    """
+
+    console, agent = socket.socketpair()
+    writer = threading.Thread(target=lambda: [agent.sendall(data) for i in range(repeat)], daemon=True)
+
+    start = time.perf_counter()
+    writer.start()
+
+    for i in range(repeat):
+        reader(console).message()
+
+    elapsed = time.perf_counter() - start
+
+    writer.join()
+    console.close()
+    agent.close()
+
+    return len(data) * repeat / elapsed / 1e6
+
+def main():
+    print("%10s %16s %16s" % ("size", "before (MB/s)", "after (MB/s)"))
+
+    for size in [1 << 16, 1 << 20, 1 << 22, 1 << 24]:
+        data = response(size)
+        repeat = max(2, (1 << 26) // size)
+
+        print("%10d %16.1f %16.1f" % (size, measure(concatenatingReadFromSocket, data, repeat), measure(Frame.readFromSocket, data, repeat)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Measures the cost of converting values between Python and the drozer protocol
+in the reflection type system: ReflectedType#fromNative and #_pb to encode,
+ReflectedType#fromArgument to decode, and the ReflectionRequestFactory
+builders, for representative payloads.
+
+Each case reports its median throughput over several repeats, and the peak
+memory allocated by a single operation. Results can be saved as a baseline, and
+later runs compared against it: a case regresses if its throughput falls, or
+its peak memory grows, by more than the tolerance. Throughput is compared
+relative to a fixed pure-Python workload, timed in the same run, so that a
+baseline recorded on one machine can be checked on another.
+
+The baseline records the Python version (major.minor) and the protobuf
+implementation it was measured with. Both change the cost of every case, so a
+baseline is only compared with runs in the same environment. Patch releases do
+not, so they are not recorded.
+
+    PYTHONPATH=src:test python -m mwr_test.benchmarks.reflection_benchmark
+    PYTHONPATH=src:test python -m mwr_test.benchmarks.reflection_benchmark --save
+    PYTHONPATH=src:test python -m mwr_test.benchmarks.reflection_benchmark --compare
+
+`make benchmark` runs the comparison.
+
+With --compare, the exit status is 1 if any case has regressed, and 2 if the
+baseline was recorded in a different environment.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from google.protobuf.internal import api_implementation
+
+from pydiesel.api.builders import ReflectionRequestFactory
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.reflection import Reflector
+from pydiesel.reflection.types.reflected_object import ReflectedObject
+from pydiesel.reflection.types.reflected_primitive_array import ReflectedPrimitiveArray
+from pydiesel.reflection.types.reflected_type import ReflectedType
+
+BASELINE = os.path.join(os.path.dirname(__file__), "reflection_baseline.json")
+
+class Session(object):
+    """
+    Stands in for a console Session: the benchmarks never send a message, but
+    the Reflector needs to know the version of the Agent.
+    """
+
+    def __init__(self, agent_version):
+        self.agent_version = agent_version
+
+def calibrate():
+    """
+    A fixed pure-Python workload, against which throughput is normalised.
+    """
+
+    total = 0
+
+    for i in range(20000):
+        total += len(str(i))
+
+    return total
+
+def cases():
+    """
+    Get the benchmark cases, as (name, operation) pairs.
+    """
+
+    current = Reflector(Session(ReflectedPrimitiveArray.minimum_agent_version))
+    legacy = Reflector(Session(0))
+
+    strings = ["com.example.app%04d" % i for i in range(1000)]
+    objects = [[ReflectedObject(i * 10 + j, reflector=current) for j in range(10)] for i in range(100)]
+    blob = os.urandom(1 << 20)
+    ints = list(range(10000))
+    arguments = [ReflectedType.fromNative(v, reflector=current, obj_type=t) for v, t in [(1, None), (2 ** 40, "long"), (1.5, None), (True, "boolean"), ("a string", None), (b"bytes", None), (None, None)] * 8]
+
+    def decode(value, reflector):
+        argument = ReflectedType.fromNative(value, reflector=reflector)._pb()
+
+        return lambda: ReflectedType.fromArgument(argument, reflector)
+
+    def encode(value, reflector):
+        return lambda: ReflectedType.fromNative(value, reflector=reflector)._pb()
+
+    def invoke():
+        return ReflectionRequestFactory.invoke(objects[0][0]._ref, "method").setArguments(arguments).setSessionId("555").setId(1).build()
+
+    request = invoke()
+
+    def parse():
+        message = Message.FromString(request)
+
+        return [ReflectedType.fromArgument(a, current) for a in message.reflection_request.invoke.argument]
+
+    return [
+        ("encode String[1000]", encode(strings, current)),
+        ("decode String[1000]", decode(strings, current)),
+        ("encode Object[100][10]", encode(objects, current)),
+        ("decode Object[100][10]", decode(objects, current)),
+        ("encode byte[1M]", encode(blob, current)),
+        ("decode byte[1M]", decode(blob, current)),
+        ("encode int[10000] packed", encode(ints, current)),
+        ("decode int[10000] packed", decode(ints, current)),
+        ("encode int[10000] elements", encode(ints, legacy)),
+        ("decode int[10000] elements", decode(ints, legacy)),
+        ("build invoke, 56 arguments", invoke),
+        ("parse invoke, 56 arguments", parse) ]
+
+def environment():
+    """
+    Describe the environment that the benchmarks run in, as far as it affects
+    the results.
+    """
+
+    return { "protobuf": api_implementation.Type(), "python": "%d.%d" % sys.version_info[:2] }
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results against a baseline, and get a list of the regressions, as
+    (name, measure, baseline, result) tuples.
+    """
+
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        if result["relative"] < baseline[name]["relative"] * (1 - tolerance):
+            regressions.append((name, "relative throughput", baseline[name]["relative"], result["relative"]))
+        if result["peak"] > baseline[name]["peak"] * (1 + tolerance):
+            regressions.append((name, "peak bytes", baseline[name]["peak"], result["peak"]))
+
+    return regressions
+
+def measure(operation, min_time, repeats):
+    """
+    Get the number of times per second that an operation can be performed,
+    as the median of repeats samples that each run it for at least min_time
+    seconds, and the peak memory it allocates.
+    """
+
+    operation()
+
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    samples = []
+
+    for i in range(repeats):
+        count, start = 0, time.perf_counter()
+
+        while True:
+            operation()
+
+            count += 1
+            elapsed = time.perf_counter() - start
+
+            if elapsed >= min_time:
+                samples.append(count / elapsed)
+
+                break
+
+    return statistics.median(samples), peak
+
+def run(min_time, repeats):
+    """
+    Run every case, and get the results keyed by case name.
+    """
+
+    reference = measure(calibrate, min_time, repeats)[0]
+    results = {}
+
+    for name, operation in cases():
+        throughput, peak = measure(operation, min_time, repeats)
+
+        results[name] = { "throughput": throughput, "relative": throughput / reference, "peak": peak }
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark the pydiesel reflection type system")
+    parser.add_argument("--baseline", default=BASELINE, metavar="FILE", help="the baseline to save to, or compare with")
+    parser.add_argument("--compare", action="store_true", default=False, help="compare the results with the baseline, and fail if any case has regressed")
+    parser.add_argument("--min-time", default=0.2, metavar="SECONDS", type=float, help="the time to repeat each case for, in each sample")
+    parser.add_argument("--repeat", default=5, metavar="N", type=int, help="the number of samples to take the median of")
+    parser.add_argument("--save", action="store_true", default=False, help="save the results as the baseline")
+    parser.add_argument("--tolerance", default=0.25, metavar="FRACTION", type=float, help="the change that is reported as a regression")
+    arguments = parser.parse_args()
+
+    if arguments.compare:
+        with open(arguments.baseline) as f:
+            baseline = json.load(f)
+
+        if baseline.get("environment") != environment():
+            print("cannot compare with %s: it was recorded with %s, and this is %s" % (arguments.baseline, baseline.get("environment"), environment()))
+            sys.exit(2)
+
+    results = run(arguments.min_time, arguments.repeat)
+
+    print("%-30s %12s %12s %12s" % ("case", "ops/s", "relative", "peak (KB)"))
+
+    for name, result in results.items():
+        print("%-30s %12.1f %12.5f %12.1f" % (name, result["throughput"], result["relative"], result["peak"] / 1024.0))
+
+    if arguments.save:
+        with open(arguments.baseline, "w") as f:
+            json.dump({ "environment": environment(), "results": results }, f, indent=2, sort_keys=True)
+
+    if arguments.compare:
+        regressions = compare(results, baseline["results"], arguments.tolerance)
+
+        print()
+
+        for name, measurement, before, after in regressions:
+            print("REGRESSION %s: %s was %.5g, now %.5g" % (name, measurement, before, after))
+
+        if len(regressions) > 0:
+            sys.exit(1)
+        else:
+            print("no regressions against %s" % arguments.baseline)
+
+if __name__ == "__main__":
+    main()
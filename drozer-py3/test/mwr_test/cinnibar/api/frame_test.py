@@ -16,6 +16,13 @@ class FrameTestCase(unittest.TestCase):
             self.recvd.append(length)
             
             return self.fragments.pop(0)
+
+        def recv_into(self, buffer, length):
+            fragment = self.recv(length)
+
+            buffer[:len(fragment)] = fragment
+
+            return len(fragment)
     
     def testItShouldBuildFrameFromMessage(self):
         message = Message(id=1, type=Message.REFLECTION_REQUEST).SerializeToString()
@@ -84,6 +91,17 @@ class FrameTestCase(unittest.TestCase):
         assert frame.Frame.readFromSocket(socket) != None
         assert socket.recvd == [8, 11, 8]
 
+    def testItShouldReadFragmentedHeaderFromASocket(self):
+        socket = FrameTestCase.MockSocket([b"\x00\x00\x00", b"\x02\x00\x00\x00\x0b", b"the payload"])
+
+        assert frame.Frame.readFromSocket(socket).payload == b"the payload"
+        assert socket.recvd == [8, 5, 11]
+
+    def testItShouldNotReadAFrameFromAClosedSocket(self):
+        socket = FrameTestCase.MockSocket([b"\x00\x00\x00\x02\x00\x00\x00\x0b", b"the", b""])
+
+        assert frame.Frame.readFromSocket(socket) == None
+
 
 def FrameTestSuite():
     suite = unittest.TestSuite()
@@ -100,6 +118,8 @@ def FrameTestSuite():
     suite.addTest(FrameTestCase("testItShouldNotReadPartialFrameFromAStream"))
     suite.addTest(FrameTestCase("testItShouldReadFrameFromASocket"))
     suite.addTest(FrameTestCase("testItShouldReadFragmentedFrameFromASocket"))
+    suite.addTest(FrameTestCase("testItShouldReadFragmentedHeaderFromASocket"))
+    suite.addTest(FrameTestCase("testItShouldNotReadAFrameFromAClosedSocket"))
 
     return suite
   
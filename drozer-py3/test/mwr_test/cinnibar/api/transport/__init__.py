@@ -0,0 +1,2 @@
+from . import capture_test
+from . import socket_transport_test
\ No newline at end of file
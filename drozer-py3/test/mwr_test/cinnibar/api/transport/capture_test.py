@@ -0,0 +1,182 @@
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from pydiesel.api import Frame
+from pydiesel.api.builders import ReflectionRequestFactory
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.api.transport import SocketTransport
+from pydiesel.api.transport.capture import Capture, CaptureReader, CaptureWriter, Replay
+
+class CaptureTestCase(unittest.TestCase):
+
+    def record(self, classnames, delay=0.0):
+        """
+        Record a SocketTransport resolving each of classnames against an agent
+        that answers with the class name, after delay seconds.
+        """
+
+        agent, console = socket.socketpair()
+
+        def serve():
+            for i in range(len(classnames)):
+                request = Frame.readFromSocket(agent).message()
+                time.sleep(delay)
+                agent.sendall(self.reply(request))
+
+        threading.Thread(target=serve, daemon=True).start()
+
+        transport = SocketTransport.fromSocket(console)
+        transport.setTimeout(5.0)
+        transport.record(self.path)
+
+        for classname in classnames:
+            transport.sendAndReceive(self.resolve(classname))
+
+        transport.close()
+        agent.close()
+
+    def reply(self, request):
+        response = Message(id=request.id, type=Message.REFLECTION_RESPONSE)
+        response.reflection_response.session_id = "555"
+        response.reflection_response.status = Message.ReflectionResponse.SUCCESS
+        response.reflection_response.result.type = Message.Argument.STRING
+        response.reflection_response.result.string = request.reflection_request.resolve.classname.upper()
+
+        return Frame.fromMessage(response.SerializeToString()).bytes()
+
+    def replay(self, timing=False, speed=1.0):
+        self.replayed = Replay(self.path, timing, speed)
+
+        transport = SocketTransport.fromSocket(self.replayed.connect())
+        transport.setTimeout(5.0)
+
+        return transport
+
+    def resolve(self, classname):
+        return ReflectionRequestFactory.resolve(classname).setSessionId("555")
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "session.dzcap")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testItShouldReadTheRecordsWritten(self):
+        self.path += ".gz"
+
+        writer = CaptureWriter(self.path)
+        writer.request(Message(id=1, type=Message.REFLECTION_REQUEST).SerializePartialToString())
+        writer.response(Message(id=1, type=Message.REFLECTION_RESPONSE).SerializePartialToString())
+        writer.close()
+
+        records = list(CaptureReader(self.path).records())
+
+        assert [(r[0], r[2].id, r[2].type) for r in records] == [(Capture.REQUEST, 1, Message.REFLECTION_REQUEST), (Capture.RESPONSE, 1, Message.REFLECTION_RESPONSE)]
+        assert records[0][1] <= records[1][1]
+
+    def testItShouldRejectAFileThatIsNotACapture(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a capture")
+
+        try:
+            list(CaptureReader(self.path).records())
+
+            assert False, "expected a ValueError"
+        except ValueError:
+            pass
+
+    def testItShouldRecordEachExchange(self):
+        self.record(["java.io.File", "java.lang.String"])
+
+        exchanges = CaptureReader(self.path).exchanges()
+
+        assert [e[0].reflection_request.resolve.classname for e in exchanges] == ["java.io.File", "java.lang.String"]
+        assert [e[1].reflection_response.result.string for e in exchanges] == ["JAVA.IO.FILE", "JAVA.LANG.STRING"]
+        assert [e[0].id for e in exchanges] == [e[1].id for e in exchanges]
+
+    def testItShouldReplayTheRecordedResponses(self):
+        self.record(["java.io.File", "java.lang.String"])
+
+        transport = self.replay()
+        transport.nextId()
+
+        responses = [transport.sendAndReceive(self.resolve(c)) for c in ["java.lang.String", "java.io.File"]]
+
+        assert [r.reflection_response.result.string for r in responses] == ["JAVA.LANG.STRING", "JAVA.IO.FILE"]
+        assert self.replayed.hits == 2
+
+        transport.close()
+
+    def testItShouldRepeatTheLastResponseToARepeatedRequest(self):
+        self.record(["java.io.File"])
+
+        transport = self.replay()
+
+        for i in range(3):
+            assert transport.sendAndReceive(self.resolve("java.io.File")).reflection_response.result.string == "JAVA.IO.FILE"
+
+        assert self.replayed.hits == 1
+        assert self.replayed.repeats == 2
+
+        transport.close()
+
+    def testItShouldAnswerAMissWithAnError(self):
+        self.record(["java.io.File"])
+
+        transport = self.replay()
+        response = transport.sendAndReceive(self.resolve("java.util.List"))
+
+        assert response.reflection_response.status == Message.ReflectionResponse.ERROR
+        assert self.replayed.misses == 1
+
+        transport.close()
+
+    def testItShouldReplayWithTheOriginalTiming(self):
+        self.record(["java.io.File"], delay=0.2)
+
+        transport = self.replay()
+        start = time.time()
+        transport.sendAndReceive(self.resolve("java.io.File"))
+
+        assert time.time() - start < 0.15
+
+        transport.close()
+
+        transport = self.replay(timing=True)
+        start = time.time()
+        transport.sendAndReceive(self.resolve("java.io.File"))
+
+        assert time.time() - start >= 0.2
+
+        transport.close()
+
+        transport = self.replay(timing=True, speed=4.0)
+        start = time.time()
+        transport.sendAndReceive(self.resolve("java.io.File"))
+
+        assert time.time() - start < 0.15
+
+        transport.close()
+
+
+def CaptureTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(CaptureTestCase("testItShouldReadTheRecordsWritten"))
+    suite.addTest(CaptureTestCase("testItShouldRejectAFileThatIsNotACapture"))
+    suite.addTest(CaptureTestCase("testItShouldRecordEachExchange"))
+    suite.addTest(CaptureTestCase("testItShouldReplayTheRecordedResponses"))
+    suite.addTest(CaptureTestCase("testItShouldRepeatTheLastResponseToARepeatedRequest"))
+    suite.addTest(CaptureTestCase("testItShouldAnswerAMissWithAnError"))
+    suite.addTest(CaptureTestCase("testItShouldReplayWithTheOriginalTiming"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(CaptureTestSuite())
@@ -0,0 +1,109 @@
+import socket
+import threading
+import unittest
+
+from pydiesel.api import Frame
+from pydiesel.api.builders import ReflectionRequestFactory
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.api.transport import SocketTransport
+from pydiesel.api.transport.exceptions import ConnectionError
+
+class SocketTransportTestCase(unittest.TestCase):
+
+    def reply(self, request):
+        response = Message(id=request.id, type=Message.REFLECTION_RESPONSE)
+        response.reflection_response.session_id = "555"
+        response.reflection_response.status = Message.ReflectionResponse.SUCCESS
+        response.reflection_response.result.type = Message.Argument.STRING
+        response.reflection_response.result.string = request.reflection_request.resolve.classname
+
+        return Frame.fromMessage(response.SerializeToString()).bytes()
+
+    def serve(self, count, reverse=False):
+        """
+        Reads count requests from the agent end of the socket pair, and then
+        replies to them, optionally in reverse order.
+        """
+
+        def agent():
+            requests = [Frame.readFromSocket(self.agent).message() for i in range(count)]
+
+            if reverse:
+                requests.reverse()
+
+            for request in requests:
+                self.agent.sendall(self.reply(request))
+
+        thread = threading.Thread(target=agent, daemon=True)
+        thread.start()
+
+        return thread
+
+    def setUp(self):
+        self.agent, console = socket.socketpair()
+
+        self.transport = SocketTransport.fromSocket(console)
+        self.transport.setTimeout(5.0)
+
+    def tearDown(self):
+        self.transport.close()
+        self.agent.close()
+
+    def testItShouldSendAndReceive(self):
+        self.serve(1)
+
+        response = self.transport.sendAndReceive(ReflectionRequestFactory.resolve("java.lang.String").setSessionId("555"))
+
+        assert response.reflection_response.result.string == "java.lang.String"
+        assert self.transport.pending() == 0
+
+    def testItShouldKeepManyMessagesInFlight(self):
+        self.serve(10)
+
+        futures = [self.transport.send_async(ReflectionRequestFactory.resolve("Class%d" % i).setSessionId("555")) for i in range(10)]
+
+        assert [self.transport.wait(f).reflection_response.result.string for f in futures] == ["Class%d" % i for i in range(10)]
+
+    def testItShouldMatchResponsesReceivedOutOfOrder(self):
+        self.serve(5, reverse=True)
+
+        futures = [self.transport.send_async(ReflectionRequestFactory.resolve("Class%d" % i).setSessionId("555")) for i in range(5)]
+
+        assert [self.transport.wait(f).reflection_response.result.string for f in futures] == ["Class%d" % i for i in range(5)]
+
+    def testItShouldRaiseConnectionErrorWhenTheConnectionIsLost(self):
+        future = self.transport.send_async(ReflectionRequestFactory.resolve("java.lang.String").setSessionId("555"))
+
+        self.agent.close()
+
+        try:
+            self.transport.wait(future)
+
+            assert False, "expected a ConnectionError"
+        except ConnectionError:
+            pass
+
+    def testItShouldRaiseConnectionErrorOnTimeout(self):
+        self.transport.setTimeout(0.1)
+
+        try:
+            self.transport.sendAndReceive(ReflectionRequestFactory.resolve("java.lang.String").setSessionId("555"))
+
+            assert False, "expected a ConnectionError"
+        except ConnectionError:
+            assert self.transport.pending() == 0
+
+
+def SocketTransportTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(SocketTransportTestCase("testItShouldSendAndReceive"))
+    suite.addTest(SocketTransportTestCase("testItShouldKeepManyMessagesInFlight"))
+    suite.addTest(SocketTransportTestCase("testItShouldMatchResponsesReceivedOutOfOrder"))
+    suite.addTest(SocketTransportTestCase("testItShouldRaiseConnectionErrorWhenTheConnectionIsLost"))
+    suite.addTest(SocketTransportTestCase("testItShouldRaiseConnectionErrorOnTimeout"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(SocketTransportTestSuite())
@@ -0,0 +1 @@
+from . import ftp_test
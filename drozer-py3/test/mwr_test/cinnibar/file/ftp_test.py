@@ -0,0 +1,179 @@
+import io
+import unittest
+
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.api.transport.exceptions import ConnectionError
+from pydiesel.file import Ftp, FtpException
+
+class MockFileSession(object):
+    """
+    Answers FileTransformRequests from an in-memory file system, in place of a
+    console Session.
+    """
+
+    def __init__(self, agent_version=20407, files={}, max_chunk=None):
+        self.agent_version = agent_version
+        self.drops = 0
+        self.exit_on_loss = []
+        self.failures = 0
+        self.files = dict(files)
+        self.max_chunk = max_chunk
+        self.requests = []
+
+    def sendAndReceive(self, factory, exit_on_loss=True):
+        request = factory.setSessionId("555").builder.file_transform_request
+        response = Message(id=factory.builder.id, type=Message.FILE_TRANSFORM_RESPONSE)
+        response.file_transform_response.session_id = "555"
+        response.file_transform_response.success = True
+
+        self.exit_on_loss.append(exit_on_loss)
+        self.requests.append(request)
+
+        if self.drops > 0:
+            self.drops -= 1
+
+            raise ConnectionError(OSError("connection reset"))
+
+        if self.failures > 0:
+            self.failures -= 1
+            response.file_transform_response.success = False
+        elif request.upload:
+            if request.HasField("offset"):
+                data = self.files.get(request.remote_filename, b"")[:request.offset] + request.data
+            else:
+                data = request.data
+
+            self.files[request.remote_filename] = data
+            response.file_transform_response.size = len(data)
+        elif request.remote_filename not in self.files:
+            response.file_transform_response.success = False
+        elif request.HasField("offset"):
+            data = self.files[request.remote_filename]
+
+            length = request.length if self.max_chunk is None else min(request.length, self.max_chunk)
+
+            response.file_transform_response.data = data[request.offset:request.offset + length]
+            response.file_transform_response.size = len(data)
+        else:
+            response.file_transform_response.data = self.files[request.remote_filename]
+
+        return response
+
+
+class FtpTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.data = bytes(range(256)) * 10
+        self.session = MockFileSession(files={ "/data/file": self.data })
+        self.ftp = Ftp(self.session, block_size=1000)
+
+    def testItShouldDownloadInChunks(self):
+        destination = io.BytesIO()
+
+        assert self.ftp.downloadFile("/data/file", destination) == len(self.data)
+        assert destination.getvalue() == self.data
+        assert [r.offset for r in self.session.requests] == [0, 1000, 2000]
+
+    def testItShouldUploadInChunks(self):
+        assert self.ftp.uploadFile("/data/copy", io.BytesIO(self.data)) == len(self.data)
+        assert self.session.files["/data/copy"] == self.data
+        assert [len(r.data) for r in self.session.requests] == [1000, 1000, 560]
+
+    def testItShouldUploadAnEmptyFile(self):
+        assert self.ftp.uploadFile("/data/empty", io.BytesIO(b"")) == 0
+        assert self.session.files["/data/empty"] == b""
+
+    def testItShouldReportProgress(self):
+        progress = []
+
+        self.ftp.downloadFile("/data/file", io.BytesIO(), progress=lambda done, total: progress.append((done, total)))
+
+        assert progress == [(1000, 2560), (2000, 2560), (2560, 2560)]
+
+    def testItShouldNotRetryARefusedChunk(self):
+        self.session.failures = 1
+
+        try:
+            self.ftp.downloadFile("/data/file", io.BytesIO())
+
+            assert False, "should have raised FtpException"
+        except FtpException as e:
+            assert e.offset == 0
+
+        assert len(self.session.requests) == 1
+
+    def testItShouldRetryAChunkWhenTheConnectionDrops(self):
+        self.session.drops = 1
+        destination = io.BytesIO()
+
+        assert self.ftp.downloadFile("/data/file", destination) == len(self.data)
+        assert destination.getvalue() == self.data
+        assert [r.offset for r in self.session.requests] == [0, 0, 1000, 2000]
+        assert self.session.exit_on_loss == [False] * 4
+
+    def testItShouldRaiseTheOffsetReachedWhenTheConnectionIsLost(self):
+        self.session.drops = self.ftp.retries + 1
+
+        try:
+            self.ftp.downloadFile("/data/file", io.BytesIO(), offset=1000)
+
+            assert False, "should have raised FtpException"
+        except FtpException as e:
+            assert e.offset == 1000
+
+    def testItShouldReadPastChunksShorterThanRequested(self):
+        self.session.max_chunk = 300
+        destination = io.BytesIO()
+
+        assert self.ftp.downloadFile("/data/file", destination) == len(self.data)
+        assert destination.getvalue() == self.data
+
+    def testItShouldNotAskForMoreThanTheAgentSends(self):
+        self.ftp.downloadFile("/data/file", io.BytesIO(), block_size=Ftp.max_chunk_size * 2)
+
+        assert self.session.requests[0].length == Ftp.max_chunk_size
+
+    def testItShouldResumeFromTheLastGoodOffset(self):
+        self.session.files["/data/copy"] = self.data[:1500] + b"junk"
+
+        assert self.ftp.uploadFile("/data/copy", io.BytesIO(self.data), offset=1500) == len(self.data)
+        assert self.session.files["/data/copy"] == self.data
+
+    def testItShouldRaiseTheOffsetReached(self):
+        self.session.failures = 1
+
+        try:
+            self.ftp.downloadFile("/data/file", io.BytesIO(), offset=2000)
+
+            assert False, "should have raised FtpException"
+        except FtpException as e:
+            assert e.offset == 2000
+
+    def testItShouldSendWholeFilesToOlderAgents(self):
+        self.session.agent_version = 20406
+
+        assert self.ftp.download("/data/file") == self.data
+        assert len(self.session.requests) == 1
+        assert not self.session.requests[0].HasField("offset")
+
+
+def FtpTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(FtpTestCase("testItShouldDownloadInChunks"))
+    suite.addTest(FtpTestCase("testItShouldUploadInChunks"))
+    suite.addTest(FtpTestCase("testItShouldUploadAnEmptyFile"))
+    suite.addTest(FtpTestCase("testItShouldReportProgress"))
+    suite.addTest(FtpTestCase("testItShouldNotRetryARefusedChunk"))
+    suite.addTest(FtpTestCase("testItShouldRetryAChunkWhenTheConnectionDrops"))
+    suite.addTest(FtpTestCase("testItShouldRaiseTheOffsetReachedWhenTheConnectionIsLost"))
+    suite.addTest(FtpTestCase("testItShouldReadPastChunksShorterThanRequested"))
+    suite.addTest(FtpTestCase("testItShouldNotAskForMoreThanTheAgentSends"))
+    suite.addTest(FtpTestCase("testItShouldResumeFromTheLastGoodOffset"))
+    suite.addTest(FtpTestCase("testItShouldRaiseTheOffsetReached"))
+    suite.addTest(FtpTestCase("testItShouldSendWholeFilesToOlderAgents"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(FtpTestSuite())
@@ -1,7 +1,12 @@
+from . import member_cache_test
+from . import object_tracker_test
 from . import reflected_array_test
 from . import reflected_null_test
 from . import reflected_object_test
+from . import reflected_primitive_array_test
 from . import reflected_primitive_test
 from . import reflected_string_test
 from . import reflected_type_test
+from . import reflection_batch_test
 from . import reflector_test
+from . import resolve_cache_test
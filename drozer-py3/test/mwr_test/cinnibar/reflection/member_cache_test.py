@@ -0,0 +1,111 @@
+import unittest
+
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.reflection import Reflector
+from pydiesel.reflection.member_cache import MemberCache
+
+from mwr_test.mocks.agent import MockAgent
+
+class ApplicationInfo(object):
+
+    def __init__(self, name):
+        self.packageName = name
+
+    def loadLabel(self):
+        return self.packageName.upper()
+
+
+class PackageInfo(object):
+
+    def __init__(self, name):
+        self.applicationInfo = ApplicationInfo(name)
+
+    def getName(self):
+        return self.applicationInfo.packageName
+
+    @property
+    def versionCode(self):
+        # stands in for a final field, which cannot be set
+        return 3
+
+
+class PackageInfoFactory(object):
+
+    CREATOR = "creator"
+
+    def __call__(self, name):
+        return PackageInfo(name)
+
+    def build(self, name):
+        return PackageInfo(name)
+
+
+class MemberCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = MockAgent({ "android.content.pm.PackageInfo": PackageInfoFactory() })
+        self.reflector = Reflector(self.agent.session())
+        self.klass = self.reflector.resolve("android.content.pm.PackageInfo")
+
+    def tearDown(self):
+        self.agent.close()
+
+    def requestsFor(self, f):
+        requests = len(self.agent.requests)
+
+        f()
+
+        return self.agent.requests[requests:]
+
+    def testItShouldInvokeAKnownMethodDirectly(self):
+        self.klass.build("com.example.one").getName()
+
+        other = self.klass.build("com.example.two")
+
+        assert self.requestsFor(lambda: other.getName()) == [Message.ReflectionRequest.INVOKE]
+
+    def testItShouldGetAKnownFieldDirectly(self):
+        str(self.klass.build("com.example.one").applicationInfo.packageName)
+
+        other = self.klass.build("com.example.two")
+
+        assert self.requestsFor(lambda: str(other.applicationInfo.packageName)) == [Message.ReflectionRequest.GET_PROPERTY, Message.ReflectionRequest.GET_PROPERTY]
+
+    def testItShouldNotRememberAFailedSet(self):
+        self.klass.build("com.example.one").versionCode = 4
+
+        other = self.klass.build("com.example.two")
+
+        assert self.reflector.member_cache.get(("PackageInfo", False), "versionCode") is None
+        assert int(other.versionCode) == 3
+        assert self.reflector.member_cache.get(("PackageInfo", False), "versionCode") == MemberCache.FIELD
+
+    def testItShouldKeepStaticMembersApart(self):
+        assert str(self.klass.CREATOR) == "creator"
+
+        assert self.reflector.member_cache.get(("android.content.pm.PackageInfo", True), "CREATOR") == MemberCache.FIELD
+        assert self.reflector.member_cache.get(("PackageInfo", False), "CREATOR") is None
+
+    def testItShouldKeepClassesApart(self):
+        cache = MemberCache()
+
+        cache.put(("PackageInfo", False), "getName", MemberCache.METHOD)
+
+        assert cache.get(("PackageInfo", False), "getName") == MemberCache.METHOD
+        assert cache.get(("PackageInfo", False), "applicationInfo") is None
+        assert cache.get(("ApplicationInfo", False), "getName") is None
+
+
+def MemberCacheTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(MemberCacheTestCase("testItShouldInvokeAKnownMethodDirectly"))
+    suite.addTest(MemberCacheTestCase("testItShouldGetAKnownFieldDirectly"))
+    suite.addTest(MemberCacheTestCase("testItShouldNotRememberAFailedSet"))
+    suite.addTest(MemberCacheTestCase("testItShouldKeepStaticMembersApart"))
+    suite.addTest(MemberCacheTestCase("testItShouldKeepClassesApart"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(MemberCacheTestSuite())
@@ -0,0 +1,185 @@
+import gc
+import unittest
+
+from pydiesel.api.builders import ReflectionRequestFactory
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.reflection import Reflector
+from pydiesel.reflection.object_tracker import ObjectTracker
+from pydiesel.reflection.types.reflected_object import ReflectedObject
+from pydiesel.reflection.types.reflected_type import ReflectedType
+
+from mwr_test.mocks.agent import MockAgent
+
+class Widget(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.children = {}
+
+    def child(self, name):
+        return Widget(name)
+
+    def keep(self, name):
+        return self.children.setdefault(name, Widget(name))
+
+
+class ObjectTrackerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = ObjectTracker(threshold=2, warning=2)
+
+    def track(self, *refs):
+        objects = [ReflectedObject(ref) for ref in refs]
+
+        for obj in objects:
+            self.tracker.track(obj)
+
+        return objects
+
+    def testItShouldCountLiveReferences(self):
+        objects = self.track(1, 2, 2)
+
+        assert self.tracker.live() == 2
+        assert self.tracker.high_water == 2
+
+    def testItShouldReleaseAReferenceWhenTheLastObjectGoes(self):
+        objects = self.track(1, 2, 2)
+
+        objects.pop()
+        gc.collect()
+
+        assert self.tracker.pending() == 0
+
+        objects.pop()
+        gc.collect()
+
+        assert self.tracker.live() == 1
+        assert self.tracker.take() == [2]
+        assert self.tracker.released == 1
+        assert self.tracker.pending() == 0
+
+    def testItShouldIgnoreObjectsFromBeforeAReset(self):
+        stale = ReflectedObject(1)
+        self.tracker.track(stale)
+        self.tracker.reset()
+
+        fresh = ReflectedObject(1)
+        self.tracker.track(fresh)
+
+        del stale
+        gc.collect()
+
+        assert self.tracker.live() == 1
+        assert self.tracker.take() == []
+
+    def testItShouldWarnOnceWhenOverflowing(self):
+        objects = self.track(1, 2, 3)
+
+        assert self.tracker.overflowing()
+        assert not self.tracker.overflowing()
+
+
+class ReflectorGarbageCollectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = MockAgent({ "Widget": Widget })
+        self.session = self.agent.session()
+        self.reflector = Reflector(self.session)
+        self.reflector.object_tracker.threshold = 4
+        self.root = self.reflector.construct(self.reflector.resolve("Widget"), ReflectedType.fromNative("root", reflector=self.reflector))
+
+    def tearDown(self):
+        self.agent.close()
+
+    def testItShouldTrackObjectsFromTheAgent(self):
+        children = [self.root.child("child%d" % i) for i in range(3)]
+
+        assert self.reflector.object_tracker.live() == 5
+        assert len(children) == 3
+
+    def testItShouldDeleteUnreferencedObjects(self):
+        for i in range(8):
+            self.root.child("child%d" % i)
+
+        self.reflector.collect()
+
+        assert Message.ReflectionRequest.DELETE in self.agent.requests
+        assert len(self.agent.objects) == 2
+        assert self.reflector.object_tracker.live() == 2
+
+    def testItShouldDeleteInABatch(self):
+        self.session.agent_version = 20406
+
+        for i in range(8):
+            self.root.child("child%d" % i)
+
+        self.reflector.collect()
+
+        assert Message.ReflectionRequest.DELETE not in self.agent.requests
+        assert Message.ReflectionRequest.BATCH in self.agent.requests
+        assert len(self.agent.objects) == 2
+
+    def testItShouldKeepObjectsThatAreStillReferenced(self):
+        child = self.root.child("child")
+
+        self.reflector.collect()
+
+        assert child.name == "child"
+
+    def testItShouldNotReleaseAReferenceThatIsReturnedAgain(self):
+        self.reflector.object_tracker.threshold = 1
+        self.session.agent_version = 20406
+
+        self.root.keep("kept")
+        gc.collect()
+
+        with self.reflector.batch() as batch:
+            kept = batch.invoke(self.root, "keep", "kept")
+
+        self.root.child("other")
+
+        assert kept.result().name == "kept"
+
+    def testItShouldHoldBackReleasesWhileRequestsAreOutstanding(self):
+        self.reflector.object_tracker.threshold = 64
+
+        for i in range(8):
+            self.root.child("child%d" % i)
+
+        future = self.reflector.send_async(ReflectionRequestFactory.invoke(self.root._ref, "keep").setArguments([ReflectedType.fromNative("kept", reflector=self.reflector)]))
+
+        assert self.reflector.collect() == 0
+        assert Message.ReflectionRequest.DELETE not in self.agent.requests
+
+        kept = self.reflector.gather([future])[0]
+
+        assert self.reflector.collect() == 8
+        assert kept.name == "kept"
+
+    def testItShouldForgetObjectsWhenTheStoreIsCleared(self):
+        self.root.child("child")
+        self.reflector.deleteAll()
+
+        assert self.reflector.object_tracker.live() == 0
+        assert self.reflector.collect() == 0
+
+
+def ObjectTrackerTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ObjectTrackerTestCase("testItShouldCountLiveReferences"))
+    suite.addTest(ObjectTrackerTestCase("testItShouldReleaseAReferenceWhenTheLastObjectGoes"))
+    suite.addTest(ObjectTrackerTestCase("testItShouldIgnoreObjectsFromBeforeAReset"))
+    suite.addTest(ObjectTrackerTestCase("testItShouldWarnOnceWhenOverflowing"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldTrackObjectsFromTheAgent"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldDeleteUnreferencedObjects"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldDeleteInABatch"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldKeepObjectsThatAreStillReferenced"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldNotReleaseAReferenceThatIsReturnedAgain"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldHoldBackReleasesWhileRequestsAreOutstanding"))
+    suite.addTest(ReflectorGarbageCollectionTestCase("testItShouldForgetObjectsWhenTheStoreIsCleared"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ObjectTrackerTestSuite())
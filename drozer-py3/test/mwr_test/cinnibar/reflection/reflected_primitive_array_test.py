@@ -0,0 +1,152 @@
+import array
+import unittest
+
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.reflection.types.reflected_array import ReflectedArray
+from pydiesel.reflection.types.reflected_primitive import ReflectedPrimitive
+from pydiesel.reflection.types.reflected_primitive_array import ReflectedPrimitiveArray
+from pydiesel.reflection.types.reflected_type import ReflectedType
+
+class MockReflector(object):
+
+    def __init__(self, agent_version):
+        self.agent_version = agent_version
+
+    def agentVersion(self):
+        return self.agent_version
+
+
+class ReflectedPrimitiveArrayTestCase(unittest.TestCase):
+
+    def packed(self, primitive_type, packed):
+        argument = Message.Argument(type=Message.Argument.ARRAY)
+        argument.array.type = Message.Array.PRIMITIVE
+        argument.array.packed_type = primitive_type
+        argument.array.packed = packed
+
+        return argument
+
+    def unpacked(self, values):
+        argument = Message.Argument(type=Message.Argument.ARRAY)
+        argument.array.type = Message.Array.PRIMITIVE
+
+        for value in values:
+            element = argument.array.element.add(type=Message.Argument.PRIMITIVE)
+            element.primitive.type = Message.Primitive.INT
+            element.primitive.int = value
+
+        return argument
+
+    def testItShouldBuildFromAPackedArgument(self):
+        values = ReflectedType.fromArgument(self.packed(Message.Primitive.INT, b"\x00\x00\x00\x01\xff\xff\xff\xfe"), reflector=None)
+
+        assert isinstance(values, ReflectedPrimitiveArray)
+        assert values.type() == "int"
+        assert list(values.values()) == [1, -2]
+
+    def testItShouldBuildFromAnUnpackedArgument(self):
+        values = ReflectedType.fromArgument(self.unpacked([1, 2, 3]), reflector=None)
+
+        assert isinstance(values, ReflectedPrimitiveArray)
+        assert list(values.values()) == [1, 2, 3]
+
+    def testItShouldBuildAnEmptyArrayAsBefore(self):
+        values = ReflectedType.fromArgument(self.unpacked([]), reflector=None)
+
+        assert not isinstance(values, ReflectedPrimitiveArray)
+        assert len(values) == 0
+
+    def testItShouldUnpackEveryPrimitiveType(self):
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.BOOL, b"\x01\x00"), reflector=None)) == [True, False]
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.BYTE, b"\xff\x01"), reflector=None).values()) == [-1, 1]
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.CHAR, b"\x00A"), reflector=None).values()) == [65]
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.DOUBLE, b"\x3f\xf0\x00\x00\x00\x00\x00\x00"), reflector=None).values()) == [1.0]
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.FLOAT, b"\x3f\x80\x00\x00"), reflector=None).values()) == [1.0]
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.LONG, b"\x00\x00\x00\x01\x00\x00\x00\x00"), reflector=None).values()) == [1 << 32]
+        assert list(ReflectedType.fromArgument(self.packed(Message.Primitive.SHORT, b"\x01\x00"), reflector=None).values()) == [256]
+
+    def testItShouldBuildElementsOnDemand(self):
+        values = ReflectedPrimitiveArray("int", range(1000000))
+
+        assert len(values) == 1000000
+        assert isinstance(values[5], ReflectedPrimitive)
+        assert values[5].type() == "int"
+        assert values[5] == 5
+        assert list(values[1:3].values()) == [1, 2]
+
+    def testItShouldCompareWithOtherArrays(self):
+        values = ReflectedPrimitiveArray("int", [1, 2, 3])
+
+        assert values == ReflectedPrimitiveArray("int", [1, 2, 3])
+        assert values != ReflectedPrimitiveArray("int", [1, 2])
+        assert values == [1, 2, 3]
+
+    def testItShouldBeModifiable(self):
+        values = ReflectedPrimitiveArray("int", [3, 1])
+
+        values.append(2)
+        values.extend([5, 4])
+        values[0] = ReflectedPrimitive("int", 6)
+
+        assert list(values.sort().values()) == [1, 2, 4, 5, 6]
+        assert values.pop() == 6
+        assert str(values) == "[1, 2, 4, 5]"
+
+    def testItShouldPackForAnAgentThatSupportsIt(self):
+        argument = ReflectedPrimitiveArray("int", [1, -2], reflector=MockReflector(20409))._pb()
+
+        assert argument.array.type == Message.Array.PRIMITIVE
+        assert argument.array.packed_type == Message.Primitive.INT
+        assert argument.array.packed == b"\x00\x00\x00\x01\xff\xff\xff\xfe"
+        assert len(argument.array.element) == 0
+
+    def testItShouldNotPackForAnOlderAgent(self):
+        argument = ReflectedPrimitiveArray("boolean", [True, False], reflector=MockReflector(20408))._pb()
+
+        assert not argument.array.HasField("packed")
+        assert [e.primitive.bool for e in argument.array.element] == [True, False]
+
+    def testItShouldPackAListOfPrimitives(self):
+        argument = ReflectedArray([1, 2], reflector=MockReflector(20409))._pb()
+
+        assert argument.array.packed_type == Message.Primitive.INT
+        assert argument.array.packed == b"\x00\x00\x00\x01\x00\x00\x00\x02"
+
+    def testItShouldBuildFromANativeArray(self):
+        values = ReflectedType.fromNative(array.array("h", [1, 2]), reflector=None)
+
+        assert isinstance(values, ReflectedPrimitiveArray)
+        assert values.type() == "short"
+
+    def testItShouldBuildFromAListOfPrimitives(self):
+        assert ReflectedType.fromNative([1, -2], reflector=None).type() == "int"
+        assert ReflectedType.fromNative((1.5, 2.0), reflector=None).type() == "float"
+        assert ReflectedType.fromNative([True, False], reflector=None).type() == "boolean"
+        assert ReflectedType.fromNative(list(range(10000)), reflector=MockReflector(20409))._pb().array.packed[-4:] == b"\x00\x00\x27\x0f"
+
+    def testItShouldKeepOtherListsAsArrays(self):
+        for values in [[], [1, 2 ** 40], ["a", "b"]]:
+            assert not isinstance(ReflectedType.fromNative(values, reflector=None), ReflectedPrimitiveArray)
+
+
+def ReflectedPrimitiveArrayTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBuildFromAPackedArgument"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBuildFromAnUnpackedArgument"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBuildAnEmptyArrayAsBefore"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldUnpackEveryPrimitiveType"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBuildElementsOnDemand"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldCompareWithOtherArrays"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBeModifiable"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldPackForAnAgentThatSupportsIt"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldNotPackForAnOlderAgent"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldPackAListOfPrimitives"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBuildFromANativeArray"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldBuildFromAListOfPrimitives"))
+    suite.addTest(ReflectedPrimitiveArrayTestCase("testItShouldKeepOtherListsAsArrays"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ReflectedPrimitiveArrayTestSuite())
@@ -0,0 +1,132 @@
+import unittest
+
+from pydiesel.reflection import BatchResult, ReflectionException, Reflector
+from pydiesel.reflection.types.reflected_object import ReflectedObject
+
+from mwr_test.mocks.agent import MockAgent
+
+class Cursor(object):
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def getCount(self):
+        return len(self.rows)
+
+    def getString(self, row, column):
+        return self.rows[row][column]
+
+
+class CursorFactory(object):
+
+    def __call__(self, rows):
+        return Cursor(rows)
+
+    def build(self, rows):
+        return Cursor(rows)
+
+    def empty(self):
+        return Cursor([])
+
+
+class ReflectionBatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = MockAgent({ "Cursor": CursorFactory() })
+        self.reflector = Reflector(self.agent.session())
+        self.cursor = self.reflector.resolve("Cursor").build([["a", "b"], ["c", "d"]])
+
+    def tearDown(self):
+        self.agent.close()
+
+    def testItShouldSendOperationsInOneFrame(self):
+        frames = self.agent.frames
+
+        with self.reflector.batch() as batch:
+            values = [batch.invoke(self.cursor, "getString", r, c) for r in range(2) for c in range(2)]
+
+            assert len(batch) == 4
+
+        assert self.agent.frames == frames + 1
+        assert [str(v.result()) for v in values] == ["a", "b", "c", "d"]
+
+    def testItShouldReturnPlaceholders(self):
+        with self.reflector.batch() as batch:
+            count = batch.invoke(self.cursor, "getCount")
+
+            assert isinstance(count, BatchResult)
+            assert not count.done()
+
+        assert count.done()
+        assert count.result() == 2
+
+    def testItShouldRaiseIfTheBatchHasNotBeenFlushed(self):
+        batch = self.reflector.batch()
+        count = batch.invoke(self.cursor, "getCount")
+
+        try:
+            count.result()
+
+            assert False, "expected a ReflectionException"
+        except ReflectionException:
+            pass
+
+    def testItShouldUseEarlierResultsWithinTheBatch(self):
+        with self.reflector.batch() as batch:
+            factory = batch.resolve("Cursor")
+            cursor = batch.construct(factory, [["x"]])
+            value = batch.invoke(cursor, "getString", 0, 0)
+
+        assert isinstance(cursor.result(), ReflectedObject)
+        assert str(value.result()) == "x"
+
+    def testItShouldUseResultsFromAnEarlierBatch(self):
+        with self.reflector.batch() as batch:
+            factory = batch.resolve("Cursor")
+
+        with self.reflector.batch() as batch:
+            cursor = batch.invoke(factory, "empty")
+            count = batch.invoke(cursor, "getCount")
+
+        assert count.result() == 0
+
+    def testItShouldReportErrorsForEachOperation(self):
+        with self.reflector.batch() as batch:
+            missing = batch.resolve("NoSuchClass")
+            dependant = batch.invoke(missing, "empty")
+            count = batch.invoke(self.cursor, "getCount")
+
+        assert count.result() == 2
+
+        for result in [missing, dependant]:
+            try:
+                result.result()
+
+                assert False, "expected a ReflectionException"
+            except ReflectionException:
+                pass
+
+    def testItShouldNotSendAnEmptyBatch(self):
+        frames = self.agent.frames
+
+        with self.reflector.batch():
+            pass
+
+        assert self.agent.frames == frames
+
+
+def ReflectionBatchTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ReflectionBatchTestCase("testItShouldSendOperationsInOneFrame"))
+    suite.addTest(ReflectionBatchTestCase("testItShouldReturnPlaceholders"))
+    suite.addTest(ReflectionBatchTestCase("testItShouldRaiseIfTheBatchHasNotBeenFlushed"))
+    suite.addTest(ReflectionBatchTestCase("testItShouldUseEarlierResultsWithinTheBatch"))
+    suite.addTest(ReflectionBatchTestCase("testItShouldUseResultsFromAnEarlierBatch"))
+    suite.addTest(ReflectionBatchTestCase("testItShouldReportErrorsForEachOperation"))
+    suite.addTest(ReflectionBatchTestCase("testItShouldNotSendAnEmptyBatch"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ReflectionBatchTestSuite())
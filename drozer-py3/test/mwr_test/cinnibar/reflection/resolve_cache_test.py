@@ -0,0 +1,86 @@
+import unittest
+
+from pydiesel.reflection import Reflector
+from pydiesel.reflection.resolve_cache import ResolveCache
+
+from mwr_test.mocks.agent import MockAgent
+
+class Klass(object):
+    pass
+
+
+class ResolveCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = MockAgent({ "java.lang.Object": Klass(), "java.lang.String": Klass(), "java.lang.Thread": Klass() })
+        self.reflector = Reflector(self.agent.session())
+
+    def tearDown(self):
+        self.agent.close()
+
+    def testItShouldResolveAClassOnce(self):
+        klass = self.reflector.resolve("java.lang.String")
+        frames = self.agent.frames
+
+        assert self.reflector.resolve("java.lang.String") is klass
+        assert self.agent.frames == frames
+        assert self.reflector.resolve_cache.hits == 1
+        assert self.reflector.resolve_cache.misses == 1
+
+    def testItShouldNotCacheAFailedResolve(self):
+        self.agent.classes = {}
+
+        for i in range(2):
+            try:
+                self.reflector.resolve("java.lang.String")
+
+                assert False, "should have caused a ReflectionException"
+            except Exception:
+                pass
+
+        assert self.agent.frames == 2
+        assert len(self.reflector.resolve_cache) == 0
+
+    def testItShouldBeClearedByDeleteAll(self):
+        klass = self.reflector.resolve("java.lang.String")
+
+        self.reflector.deleteAll()
+
+        assert len(self.reflector.resolve_cache) == 0
+        assert self.reflector.resolve("java.lang.String")._ref != klass._ref
+
+    def testItShouldDiscardADeletedClass(self):
+        klass = self.reflector.resolve("java.lang.String")
+        self.reflector.resolve("java.lang.Object")
+
+        self.reflector.delete(klass)
+
+        assert "java.lang.String" not in self.reflector.resolve_cache
+        assert "java.lang.Object" in self.reflector.resolve_cache
+
+    def testItShouldEvictTheLeastRecentlyUsedClass(self):
+        self.reflector.resolve_cache.size = 2
+
+        self.reflector.resolve("java.lang.Object")
+        self.reflector.resolve("java.lang.String")
+        self.reflector.resolve("java.lang.Object")
+        self.reflector.resolve("java.lang.Thread")
+
+        assert "java.lang.Object" in self.reflector.resolve_cache
+        assert "java.lang.String" not in self.reflector.resolve_cache
+        assert "java.lang.Thread" in self.reflector.resolve_cache
+
+
+def ResolveCacheTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ResolveCacheTestCase("testItShouldResolveAClassOnce"))
+    suite.addTest(ResolveCacheTestCase("testItShouldNotCacheAFailedResolve"))
+    suite.addTest(ResolveCacheTestCase("testItShouldBeClearedByDeleteAll"))
+    suite.addTest(ResolveCacheTestCase("testItShouldDiscardADeletedClass"))
+    suite.addTest(ResolveCacheTestCase("testItShouldEvictTheLeastRecentlyUsedClass"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ResolveCacheTestSuite())
@@ -0,0 +1,134 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zipfile
+
+from drozer.apk_store import ApkStore
+from drozer.dex import ApkStrings, DexFormatException, DexStrings
+
+def dex(strings):
+    """
+    Build a minimal DEX file, with only a header and a string table.
+    """
+
+    offsets = []
+    data = []
+    position = 0x70 + 4 * len(strings)
+
+    for string in strings:
+        encoded = bytes([len(string) & 0x7f]) + string.encode("utf-8") + b"\x00"
+
+        offsets.append(struct.pack("<I", position))
+        data.append(encoded)
+        position += len(encoded)
+
+    header = bytearray(0x70)
+    header[0:8] = b"dex\n035\x00"
+    struct.pack_into("<II", header, 0x38, len(strings), 0x70)
+
+    return bytes(header) + b"".join(offsets) + b"".join(data)
+
+def apk(path, entries):
+    with zipfile.ZipFile(path, "w") as f:
+        for (name, data, compress_type) in entries:
+            f.writestr(zipfile.ZipInfo(name), data, compress_type=compress_type)
+
+class DexStringsTestCase(unittest.TestCase):
+
+    def testItShouldReadTheStringTable(self):
+        assert list(DexStrings(dex(["a", "content://com.example/x", "héllo"]))) == ["a", "content://com.example/x", "héllo"]
+
+    def testItShouldReadADexFileAtAnOffset(self):
+        assert list(DexStrings(b"padding" + dex(["a", "b"]), 7)) == ["a", "b"]
+
+    def testItShouldRejectAnythingElse(self):
+        with self.assertRaises(DexFormatException):
+            DexStrings(b"PK\x03\x04" + bytes(0x70))
+
+    def testItShouldRejectATruncatedStringTable(self):
+        with self.assertRaises(DexFormatException):
+            DexStrings(dex(["a", "b"])[0:0x74])
+
+    def testItShouldDecodeModifiedUtf8(self):
+        assert DexStrings.decode(b"a\xc0\x80b") == "a\x00b"
+        assert DexStrings.decode(b"\xed\xa0\xbd\xed\xb8\x80") == "\U0001f600"
+
+
+class ApkStringsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testItShouldReadEveryDexFileInLoadOrder(self):
+        path = os.path.join(self.path, "test.apk")
+
+        apk(path, [("classes10.dex", dex(["ten"]), zipfile.ZIP_STORED),
+            ("classes2.dex", dex(["two"]), zipfile.ZIP_DEFLATED),
+            ("classes.dex", dex(["one"]), zipfile.ZIP_STORED),
+            ("assets/classes.dex", dex(["asset"]), zipfile.ZIP_STORED)])
+
+        assert ApkStrings(path).dexNames() == ["classes.dex", "classes2.dex", "classes10.dex"]
+        assert ApkStrings(path).strings() == ["one", "two", "ten"]
+
+
+class ApkStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = ApkStore(os.path.join(self.path, "store"))
+
+        self.apk = os.path.join(self.path, "test.apk")
+        apk(self.apk, [("classes.dex", dex(["content://com.example/a", "other"]), zipfile.ZIP_STORED)])
+
+        self.digest = ApkStore.digest(self.apk)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testItShouldAddAnApk(self):
+        assert not self.store.has(self.digest)
+
+        self.store.add(self.digest, self.apk)
+
+        assert self.store.has(self.digest)
+        assert self.store.has(self.digest.upper())
+        assert not os.path.exists(self.apk)
+
+    def testItShouldRejectAnApkThatDoesNotMatchItsChecksum(self):
+        with self.assertRaises(ValueError):
+            self.store.add("0" * 32, self.apk)
+
+        assert not self.store.has("0" * 32)
+
+    def testItShouldExtractAndCacheTheStrings(self):
+        self.store.add(self.digest, self.apk)
+
+        assert self.store.strings(self.digest) == ["content://com.example/a", "other"]
+
+        os.remove(self.store.apkPath(self.digest))
+
+        assert ApkStore(self.store.path).strings(self.digest) == ["content://com.example/a", "other"]
+
+
+def ApkStoreTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(DexStringsTestCase("testItShouldReadTheStringTable"))
+    suite.addTest(DexStringsTestCase("testItShouldReadADexFileAtAnOffset"))
+    suite.addTest(DexStringsTestCase("testItShouldRejectAnythingElse"))
+    suite.addTest(DexStringsTestCase("testItShouldRejectATruncatedStringTable"))
+    suite.addTest(DexStringsTestCase("testItShouldDecodeModifiedUtf8"))
+    suite.addTest(ApkStringsTestCase("testItShouldReadEveryDexFileInLoadOrder"))
+    suite.addTest(ApkStoreTestCase("testItShouldAddAnApk"))
+    suite.addTest(ApkStoreTestCase("testItShouldRejectAnApkThatDoesNotMatchItsChecksum"))
+    suite.addTest(ApkStoreTestCase("testItShouldExtractAndCacheTheStrings"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ApkStoreTestSuite())
@@ -0,0 +1,244 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zipfile
+
+from drozer.axml import ANDROID_NAMESPACE, ApkManifest, AxmlDecoder, AxmlFormatException, ResourceTable, StringPool, TypedValue
+from drozer.manifest_parser import Manifest
+
+def chunk(chunk_type, header, body):
+    """
+    Build a ResChunk, given the part of its header after the common fields.
+    """
+
+    return struct.pack("<HHI", chunk_type, 8 + len(header), 8 + len(header) + len(body)) + header + body
+
+def string_pool(strings, utf8=False):
+    offsets = []
+    data = b""
+
+    for string in strings:
+        offsets.append(len(data))
+
+        if utf8:
+            encoded = string.encode("utf-8")
+            data += bytes([len(string), len(encoded)]) + encoded + b"\x00"
+        else:
+            data += struct.pack("<H", len(string)) + string.encode("utf-16-le") + b"\x00\x00"
+
+    data += b"\x00" * (-len(data) % 4)
+    header = struct.pack("<IIIII", len(strings), 0, utf8 and 0x100 or 0, 28 + 4 * len(strings), 0)
+
+    return chunk(0x0001, header, b"".join(struct.pack("<I", o) for o in offsets) + data)
+
+def axml(strings, resource_ids, elements):
+    """
+    Build a binary XML file. elements is a list of ("start", name, attributes)
+    and ("end", name) tuples, where each attribute is (namespace, name, raw,
+    type, data), with strings given by their index.
+    """
+
+    body = string_pool(strings) + chunk(0x0180, b"", b"".join(struct.pack("<I", i) for i in resource_ids))
+
+    for element in elements:
+        node = struct.pack("<II", 1, 0xffffffff)
+
+        if element[0] == "start":
+            attributes = b"".join(struct.pack("<IIIHBBI", a[0], a[1], a[2], 8, 0, a[3], a[4]) for a in element[2])
+            ext = struct.pack("<IIHHHHHH", 0xffffffff, element[1], 20, 20, len(element[2]), 0, 0, 0)
+
+            body += chunk(0x0102, node, ext + attributes)
+        else:
+            body += chunk(0x0103, node, struct.pack("<II", 0xffffffff, element[1]))
+
+    return chunk(0x0003, b"", body)
+
+def arsc(package_id, types, keys, entries, values):
+    """
+    Build a resource table with one package, and one type chunk in the default
+    configuration. entries is a list of (type_id, key, value_type, data).
+    """
+
+    pool = string_pool(values, utf8=True)
+    type_pool = string_pool(types)
+    key_pool = string_pool(keys)
+
+    type_chunks = b""
+
+    for type_id in range(1, len(types) + 1):
+        type_entries = [e for e in entries if e[0] == type_id]
+        offsets = b""
+        data = b""
+
+        for (_, key, value_type, value) in type_entries:
+            offsets += struct.pack("<I", len(data))
+            data += struct.pack("<HHI", 8, 0, key) + struct.pack("<HBBI", 8, 0, value_type, value)
+
+        config = struct.pack("<I", 64) + b"\x00" * 60
+        header = struct.pack("<BBHII", type_id, 0, 0, len(type_entries), 8 + 12 + len(config) + len(offsets)) + config
+
+        type_chunks += chunk(0x0201, header, offsets + data)
+
+    name = "com.example".encode("utf-16-le").ljust(256, b"\x00")
+    package_header_size = 8 + 4 + 256 + 20
+    header = struct.pack("<I", package_id) + name + struct.pack("<IIIII", package_header_size, 0, package_header_size + len(type_pool), 0, 0)
+
+    return chunk(0x0002, struct.pack("<I", 1), pool + chunk(0x0200, header, type_pool + key_pool + type_chunks))
+
+NO_STRING = 0xffffffff
+
+STRINGS = ["name", "exported", "", "authorities", ANDROID_NAMESPACE, "android", "manifest", "package", "com.example", "application", "provider", "com.example.Provider", "label", "versionCode"]
+
+MANIFEST = axml(STRINGS, [0x01010003, 0x01010010, 0x01010018],
+    [("start", 6, [(NO_STRING, 7, 8, 0x03, 8), (4, 13, NO_STRING, 0x10, 7)]),
+     ("start", 9, [(4, 12, NO_STRING, 0x01, 0x7f020000)]),
+     ("start", 10, [(4, 0, 11, 0x03, 11), (4, 1, NO_STRING, 0x12, 0xffffffff), (4, 2, NO_STRING, 0x01, 0x7f020001)]),
+     ("end", 10),
+     ("end", 9),
+     ("end", 6)])
+
+RESOURCES = arsc(0x7f, ["attr", "string"], ["app_name", "authority"], [(2, 0, 0x03, 0), (2, 1, 0x03, 1)], ["Example", "com.example.data"])
+
+class AxmlDecoderTestCase(unittest.TestCase):
+
+    def testItShouldDecodeElementsAndAttributes(self):
+        root = AxmlDecoder(MANIFEST).decode()
+
+        assert root.tag == "manifest"
+        assert root.get("package") == "com.example"
+        assert root.get("{%s}versionCode" % ANDROID_NAMESPACE) == "7"
+        assert root.find("application/provider").get("{%s}name" % ANDROID_NAMESPACE) == "com.example.Provider"
+        assert root.find("application/provider").get("{%s}exported" % ANDROID_NAMESPACE) == "true"
+
+    def testItShouldRecoverStrippedAttributeNames(self):
+        provider = AxmlDecoder(MANIFEST).decode().find("application/provider")
+
+        assert provider.get("{%s}authorities" % ANDROID_NAMESPACE) == "@0x7f020001"
+
+    def testItShouldNameKnownAttributesByTheirResourceId(self):
+        strings = ["a", "b", "c", ANDROID_NAMESPACE, "application"]
+        root = AxmlDecoder(axml(strings, [0x01010280, 0x010104ec, 0x01010003, 0x01010202],
+            [("start", 4, [(3, 0, NO_STRING, 0x12, 0), (3, 1, NO_STRING, 0x12, 0xffffffff), (3, 2, 2, 0x03, 2), (3, 3, 2, 0x03, 2)]),
+             ("end", 4)])).decode()
+
+        assert root.get("{%s}allowBackup" % ANDROID_NAMESPACE) == "false"
+        assert root.get("{%s}usesCleartextTraffic" % ANDROID_NAMESPACE) == "true"
+        assert root.get("{%s}name" % ANDROID_NAMESPACE) == "c"
+        assert root.get("{%s}targetActivity" % ANDROID_NAMESPACE) == "c"
+        assert root.get("{%s}a" % ANDROID_NAMESPACE) is None
+
+    def testItShouldResolveReferencesAgainstTheResourceTable(self):
+        root = AxmlDecoder(MANIFEST, ResourceTable(RESOURCES)).decode()
+
+        assert root.find("application").get("{%s}label" % ANDROID_NAMESPACE) == "@string/app_name"
+        assert root.find("application/provider").get("{%s}authorities" % ANDROID_NAMESPACE) == "@string/authority"
+
+    def testItShouldBuildAManifest(self):
+        manifest = Manifest(AxmlDecoder(MANIFEST).decode())
+
+        assert manifest.package == "com.example"
+        assert manifest.versionCode == "7"
+        assert manifest.application.providers[0].name == "com.example.Provider"
+        assert manifest.application.providers[0].is_exported()
+
+    def testItShouldRejectAnythingElse(self):
+        with self.assertRaises(AxmlFormatException):
+            AxmlDecoder(b"<manifest />").decode()
+
+
+class ResourceTableTestCase(unittest.TestCase):
+
+    def testItShouldReadNamesAndValues(self):
+        resources = ResourceTable(RESOURCES)
+
+        assert resources.name(0x7f020000) == "string/app_name"
+        assert resources.value(0x7f020000) == "Example"
+        assert resources.value(0x7f020001) == "com.example.data"
+        assert resources.name(0x7f020002) is None
+
+
+class StringPoolTestCase(unittest.TestCase):
+
+    def testItShouldReadUtf16Strings(self):
+        pool = StringPool(string_pool(["a", "héllo"]), 0)
+
+        assert len(pool) == 2
+        assert pool[1] == "héllo"
+        assert pool[2] is None
+
+    def testItShouldReadUtf8Strings(self):
+        assert StringPool(string_pool(["a", "héllo"], utf8=True), 0)[1] == "héllo"
+
+
+class TypedValueTestCase(unittest.TestCase):
+
+    def testItShouldFormatValues(self):
+        assert TypedValue.format(TypedValue.TYPE_INT_BOOLEAN, 0) == "false"
+        assert TypedValue.format(TypedValue.TYPE_INT_DEC, 0xffffffff) == "-1"
+        assert TypedValue.format(TypedValue.TYPE_INT_HEX, 16) == "0x00000010"
+        assert TypedValue.format(TypedValue.TYPE_FLOAT, 0x3fc00000) == "1.5"
+        assert TypedValue.format(TypedValue.TYPE_DIMENSION, 0x00001001) == "16dip"
+        assert TypedValue.format(TypedValue.TYPE_REFERENCE, 0x01010003) == "@android:attr/name"
+        assert TypedValue.format(TypedValue.TYPE_FIRST_COLOR, 0xff00ff00) == "#ff00ff00"
+
+
+class ApkManifestTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testItShouldReadTheManifestFromAnApk(self):
+        path = os.path.join(self.path, "test.apk")
+
+        with zipfile.ZipFile(path, "w") as apk:
+            apk.writestr("AndroidManifest.xml", MANIFEST)
+            apk.writestr("resources.arsc", RESOURCES)
+
+        assert ApkManifest(path).element().find("application").get("{%s}label" % ANDROID_NAMESPACE) == "@string/app_name"
+        assert 'android:exported="true"' in ApkManifest(path).xml()
+
+    def testItShouldRejectAnApkWithoutAManifest(self):
+        path = os.path.join(self.path, "test.apk")
+
+        with zipfile.ZipFile(path, "w") as apk:
+            apk.writestr("classes.dex", b"dex")
+
+        with self.assertRaises(AxmlFormatException):
+            ApkManifest(path).element()
+
+    def testItShouldRejectAFileThatIsNotAnApk(self):
+        path = os.path.join(self.path, "test.apk")
+
+        with open(path, "wb") as f:
+            f.write(MANIFEST)
+
+        with self.assertRaises(AxmlFormatException):
+            ApkManifest(path).element()
+
+
+def AxmlTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(AxmlDecoderTestCase("testItShouldDecodeElementsAndAttributes"))
+    suite.addTest(AxmlDecoderTestCase("testItShouldRecoverStrippedAttributeNames"))
+    suite.addTest(AxmlDecoderTestCase("testItShouldNameKnownAttributesByTheirResourceId"))
+    suite.addTest(AxmlDecoderTestCase("testItShouldResolveReferencesAgainstTheResourceTable"))
+    suite.addTest(AxmlDecoderTestCase("testItShouldBuildAManifest"))
+    suite.addTest(AxmlDecoderTestCase("testItShouldRejectAnythingElse"))
+    suite.addTest(ResourceTableTestCase("testItShouldReadNamesAndValues"))
+    suite.addTest(StringPoolTestCase("testItShouldReadUtf16Strings"))
+    suite.addTest(StringPoolTestCase("testItShouldReadUtf8Strings"))
+    suite.addTest(TypedValueTestCase("testItShouldFormatValues"))
+    suite.addTest(ApkManifestTestCase("testItShouldReadTheManifestFromAnApk"))
+    suite.addTest(ApkManifestTestCase("testItShouldRejectAnApkWithoutAManifest"))
+    suite.addTest(ApkManifestTestCase("testItShouldRejectAFileThatIsNotAnApk"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(AxmlTestSuite())
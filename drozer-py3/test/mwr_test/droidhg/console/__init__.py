@@ -1 +1 @@
-from . import coloured_stream_test
+from . import bootstrap_test, coloured_stream_test, parallel_test, wire_trace_test
@@ -0,0 +1,189 @@
+import unittest
+
+from pydiesel.reflection import ReflectionException
+
+from drozer.console.bootstrap import Bootstrap, StartupTimings
+
+class MockObject(object):
+
+    def __init__(self, **members):
+        self.__dict__.update(members)
+
+
+class MockPrimitive(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def native(self):
+        return self.value
+
+
+class MockResult(object):
+
+    def __init__(self, value=None, error=None):
+        self.error = error
+        self.value = value
+
+    def result(self):
+        if self.error is not None:
+            raise ReflectionException(self.error)
+
+        return self.value
+
+
+class MockBatch(object):
+
+    def __init__(self, reflector):
+        self.reflector = reflector
+
+    def construct(self, robj, *args):
+        return self.__apply(robj, lambda klass: klass(*self.__arguments(args)))
+
+    def getProperty(self, robj, property_name):
+        return self.__apply(robj, lambda obj: getattr(obj, property_name))
+
+    def invoke(self, robj, method, *args):
+        return self.__apply(robj, lambda obj: getattr(obj, method)(*self.__arguments(args)))
+
+    def resolve(self, class_name):
+        return MockResult(self.reflector.classes[class_name])
+
+    def __apply(self, robj, operation):
+        obj = robj.value if isinstance(robj, MockResult) else robj
+
+        if isinstance(robj, MockResult) and robj.error is not None or obj is None:
+            return MockResult(error="is not an object")
+
+        return MockResult(operation(obj))
+
+    def __arguments(self, args):
+        for arg in args:
+            if isinstance(arg, MockResult) and isinstance(arg.value, str) and self.reflector.agent_version < 20408:
+                raise ReflectionException("is not an object")
+
+        return [arg.value if isinstance(arg, MockResult) else arg for arg in args]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.reflector.batches += 1
+
+
+class MockReflector(object):
+
+    def __init__(self, agent_version, context=True, granted={}):
+        self.agent_version = agent_version
+        self.batches = 0
+
+        package = MockObject(requestedPermissions=list(granted.keys()), requestedPermissionsFlags=[MockPrimitive(g and 3 or 1) for g in granted.values()])
+        package_manager = MockObject(getPackageInfo=lambda name, flags: name == "com.mwr.dz" and flags == 0x1000 and package or None)
+
+        self.classes = {
+            "com.mwr.dz.Agent": MockObject(getContext=lambda: context and MockObject(
+                getApplicationInfo=lambda: MockObject(dataDir="/data/data/com.mwr.dz"),
+                getPackageManager=lambda: package_manager,
+                getPackageName=lambda: "com.mwr.dz") or None),
+            "com.mwr.dz.BuildConfig": MockObject(VERSION_CODE=agent_version),
+            "java.io.File": lambda path: MockObject(getCanonicalPath=lambda: "/"),
+        }
+
+    def batch(self):
+        return MockBatch(self)
+
+    def resolve(self, class_name):
+        return self.classes[class_name]
+
+
+class BootstrapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.granted = { "android.permission.INTERNET": True, "android.permission.CAMERA": False }
+
+    def testItShouldBootstrapInOneBatch(self):
+        reflector = MockReflector(20408, granted=self.granted)
+        bootstrap = Bootstrap(reflector).run()
+
+        assert reflector.batches == 1
+        assert bootstrap.agent_version == 20408
+        assert bootstrap.has_context == True
+        assert bootstrap.data_dir == "/data/data/com.mwr.dz"
+        assert bootstrap.permissions == ["android.permission.INTERNET", "com.mwr.dz.permissions.GET_CONTEXT"]
+
+    def testItShouldAskForPermissionsSeparatelyOnAnOlderAgent(self):
+        reflector = MockReflector(20406, granted=self.granted)
+        bootstrap = Bootstrap(reflector).run()
+
+        assert reflector.batches == 2
+        assert bootstrap.permissions == ["android.permission.INTERNET", "com.mwr.dz.permissions.GET_CONTEXT"]
+
+    def testItShouldBootstrapWithoutAContext(self):
+        reflector = MockReflector(20408, context=False)
+        bootstrap = Bootstrap(reflector).run()
+
+        assert reflector.batches == 1
+        assert bootstrap.has_context == False
+        assert bootstrap.data_dir == "/"
+        assert bootstrap.permissions == []
+
+    def testItShouldNotBatchOnAnAgentWithoutBatch(self):
+        reflector = MockReflector(20405)
+        bootstrap = Bootstrap(reflector).run()
+
+        assert reflector.batches == 0
+        assert bootstrap.agent_version == 20405
+        assert bootstrap.has_context is None
+        assert bootstrap.data_dir is None
+        assert bootstrap.permissions is None
+
+    def testItShouldRecordStartupPhases(self):
+        timings = StartupTimings()
+
+        Bootstrap(MockReflector(20408), timings).run()
+
+        assert [p[0] for p in timings.phases] == ["agent version", "bootstrap"]
+        assert "total" in timings.report()
+
+
+class StartupTimingsTestCase(unittest.TestCase):
+
+    def testItShouldCountMessagesInEachPhase(self):
+        timings = StartupTimings()
+
+        with timings.phase("connect"):
+            timings.messages += 1
+
+        with timings.phase("bootstrap"):
+            timings.messages += 3
+
+        assert [(p[0], p[2]) for p in timings.phases] == [("connect", 1), ("bootstrap", 3)]
+        assert timings.total() >= 0
+
+    def testItShouldRecordAFailedPhase(self):
+        timings = StartupTimings()
+
+        try:
+            with timings.phase("connect"):
+                raise RuntimeError("unreachable")
+        except RuntimeError:
+            pass
+
+        assert timings.phases[0][0] == "connect"
+
+
+def BootstrapTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(BootstrapTestCase("testItShouldBootstrapInOneBatch"))
+    suite.addTest(BootstrapTestCase("testItShouldAskForPermissionsSeparatelyOnAnOlderAgent"))
+    suite.addTest(BootstrapTestCase("testItShouldBootstrapWithoutAContext"))
+    suite.addTest(BootstrapTestCase("testItShouldNotBatchOnAnAgentWithoutBatch"))
+    suite.addTest(BootstrapTestCase("testItShouldRecordStartupPhases"))
+    suite.addTest(StartupTimingsTestCase("testItShouldCountMessagesInEachPhase"))
+    suite.addTest(StartupTimingsTestCase("testItShouldRecordAFailedPhase"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(BootstrapTestSuite())
@@ -0,0 +1,63 @@
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+
+from drozer.console.parallel import DeviceResult, ParallelRunner, runOnDevice
+
+class ParallelRunnerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.output = tempfile.mkdtemp()
+        self.arguments = argparse.Namespace(accept_certificate=False, agent_password=None, debug=False, file=[], no_color=False, onecmd="list", server="127.0.0.1:1", ssl=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.output)
+
+    def testItShouldNameResultFilesAfterTheSerial(self):
+        runner = ParallelRunner(self.arguments, ["emulator-5554", "192.168.0.2:5555"], self.output)
+
+        assert runner.resultPath("emulator-5554") == os.path.join(self.output, "emulator-5554.txt")
+        assert runner.resultPath("192.168.0.2:5555") == os.path.join(self.output, "192.168.0.2_5555.txt")
+
+    def testItShouldSummariseResults(self):
+        runner = ParallelRunner(self.arguments, ["one", "two"], self.output)
+
+        summary = runner.summary([DeviceResult("one", "one.txt", "ok", 1.5), DeviceResult("two", "two.txt", "failed", 0.2, "connection refused")])
+
+        assert "one.txt" in summary
+        assert "connection refused" in summary
+        assert summary.endswith("2 devices, 1 ok, 1 failed\n")
+
+    def testItShouldReportADeviceThatCannotBeReached(self):
+        result = runOnDevice((self.arguments, "one", os.path.join(self.output, "one.txt")))
+
+        assert result.serial == "one"
+        assert result.status == "failed"
+        assert result.error is not None
+        assert os.path.exists(result.path)
+
+    def testItShouldRunOnEveryDeviceAndWriteASummary(self):
+        runner = ParallelRunner(self.arguments, ["one", "two", "three"], self.output, concurrency=2)
+        seen = []
+
+        results = runner.run(progress=seen.append)
+
+        assert [r.serial for r in results] == ["one", "two", "three"]
+        assert len(seen) == 3
+        assert os.path.exists(os.path.join(self.output, "summary.txt"))
+
+
+def ParallelRunnerTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ParallelRunnerTestCase("testItShouldNameResultFilesAfterTheSerial"))
+    suite.addTest(ParallelRunnerTestCase("testItShouldSummariseResults"))
+    suite.addTest(ParallelRunnerTestCase("testItShouldReportADeviceThatCannotBeReached"))
+    suite.addTest(ParallelRunnerTestCase("testItShouldRunOnEveryDeviceAndWriteASummary"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ParallelRunnerTestSuite())
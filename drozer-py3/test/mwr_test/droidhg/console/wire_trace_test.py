@@ -0,0 +1,121 @@
+import json
+import os
+import tempfile
+import unittest
+
+from pydiesel.api.builders import ReflectionRequestFactory
+from pydiesel.api.protobuf_pb2 import Message
+
+from drozer.console.wire_trace import WireTrace
+
+class WireTraceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.trace = WireTrace("app.package.list")
+
+    def object(self, ref, class_name=None):
+        response = Message(type=Message.REFLECTION_RESPONSE)
+        response.reflection_response.session_id = "session"
+        response.reflection_response.status = Message.ReflectionResponse.SUCCESS
+        response.reflection_response.result.type = Message.Argument.OBJECT
+        response.reflection_response.result.object.reference = ref
+
+        if class_name is not None:
+            response.reflection_response.result.object.class_name = class_name
+
+        return response
+
+    def send(self, request, response):
+        entry = self.trace.begin(request.builder)
+        self.trace.complete(entry, response)
+
+        return entry
+
+    def testItShouldRecordAMessage(self):
+        entry = self.send(ReflectionRequestFactory.resolve("java.lang.String"), self.object(1, "java.lang.String"))
+
+        assert entry["type"] == "RESOLVE"
+        assert entry["target"] == "java.lang.String"
+        assert entry["module"] == "app.package.list"
+        assert entry["request_bytes"] > 0
+        assert entry["response_bytes"] > 0
+        assert entry["status"] == "SUCCESS"
+        assert entry["latency"] >= 0
+
+    def testItShouldRecordTheCallingFrame(self):
+        entry = self.send(ReflectionRequestFactory.resolve("java.lang.String"), self.object(1))
+
+        assert entry["frame"].startswith(__file__.rstrip("c"))
+        assert entry["frame"].endswith("in send")
+
+    def testItShouldNameTheClassOfAnInvokedObject(self):
+        self.send(ReflectionRequestFactory.resolve("android.content.Context"), self.object(1, "android.app.ContextImpl"))
+
+        entry = self.send(ReflectionRequestFactory.invoke(1, "getPackageManager"), self.object(2, "android.app.ApplicationPackageManager"))
+
+        assert entry["target"] == "android.app.ContextImpl.getPackageManager"
+        assert self.send(ReflectionRequestFactory.invoke(2, "getPackageInfo"), self.object(3))["target"] == "android.app.ApplicationPackageManager.getPackageInfo"
+        assert self.send(ReflectionRequestFactory.invoke(3, "toString"), self.object(4))["target"] == "?.toString"
+
+    def testItShouldNameAResolvedClassForAnOlderAgent(self):
+        self.send(ReflectionRequestFactory.resolve("java.io.File"), self.object(1))
+
+        assert self.send(ReflectionRequestFactory.construct(1), self.object(2))["target"] == "java.io.File"
+
+    def testItShouldRecordALostMessage(self):
+        entry = self.trace.begin(ReflectionRequestFactory.deleteAll().builder)
+        self.trace.complete(entry, None, "LOST")
+
+        assert entry["type"] == "DELETE_ALL"
+        assert entry["response_bytes"] is None
+        assert entry["status"] == "LOST"
+
+    def testItShouldSummariseTheTopTargets(self):
+        self.send(ReflectionRequestFactory.resolve("java.io.File"), self.object(1))
+
+        for i in range(3):
+            self.send(ReflectionRequestFactory.invoke(1, "listFiles"), self.object(2))
+
+        self.trace.finish()
+        summary = self.trace.summary()
+
+        assert summary.startswith("4 messages in")
+        assert "Top targets by round trips:\n   count   time (s)      bytes  target\n       3" in summary
+        assert "INVOKE java.io.File.listFiles" in summary
+        assert "Top targets by time:" in summary
+        assert "Top callers by round trips:" in summary
+
+    def testItShouldExportTheTrace(self):
+        self.send(ReflectionRequestFactory.resolve("java.io.File"), self.object(1))
+
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+
+        try:
+            self.trace.export(path)
+
+            with open(path) as trace_file:
+                trace = json.load(trace_file)
+        finally:
+            os.remove(path)
+
+        assert trace["module"] == "app.package.list"
+        assert len(trace["messages"]) == 1
+        assert trace["messages"][0]["target"] == "java.io.File"
+
+
+def WireTraceTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(WireTraceTestCase("testItShouldRecordAMessage"))
+    suite.addTest(WireTraceTestCase("testItShouldRecordTheCallingFrame"))
+    suite.addTest(WireTraceTestCase("testItShouldNameTheClassOfAnInvokedObject"))
+    suite.addTest(WireTraceTestCase("testItShouldNameAResolvedClassForAnOlderAgent"))
+    suite.addTest(WireTraceTestCase("testItShouldRecordALostMessage"))
+    suite.addTest(WireTraceTestCase("testItShouldSummariseTheTopTargets"))
+    suite.addTest(WireTraceTestCase("testItShouldExportTheTrace"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(WireTraceTestSuite())
@@ -0,0 +1,42 @@
+import unittest
+
+from drozer.device import Device, DeviceCollection
+
+class DeviceCollectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.devices = DeviceCollection()
+
+    def testItShouldKeepTheFirstDeviceWithAnIdentifier(self):
+        first = Device("device", "drozer", "test", "none")
+
+        self.devices.add(first)
+        self.devices.add(Device("device", "drozer", "test", "none"))
+
+        assert len(self.devices) == 1
+        assert self.devices.get("device") is first
+
+    def testItShouldTestMembershipByIdentifier(self):
+        self.devices.add(Device("device", "drozer", "test", "none"))
+
+        assert Device("device", "other", "other", "other") in self.devices
+        assert Device("other", "drozer", "test", "none") not in self.devices
+
+    def testItShouldIterateOverDevices(self):
+        self.devices.add(Device("one", "drozer", "test", "none"))
+        self.devices.add(Device("two", "drozer", "test", "none"))
+
+        assert sorted(d.device_id for d in self.devices) == ["one", "two"]
+
+
+def DeviceCollectionTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(DeviceCollectionTestCase("testItShouldKeepTheFirstDeviceWithAnIdentifier"))
+    suite.addTest(DeviceCollectionTestCase("testItShouldTestMembershipByIdentifier"))
+    suite.addTest(DeviceCollectionTestCase("testItShouldIterateOverDevices"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(DeviceCollectionTestSuite())
@@ -0,0 +1,167 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from drozer.manifest_cache import ManifestCache
+from drozer.manifest_parser import Manifest
+
+MANIFEST = """<manifest xmlns:android="http://schemas.android.com/apk/res/android" package="com.example" android:versionCode="3">
+  <application>
+    <activity android:name=".Main" android:exported="true" />
+  </application>
+</manifest>"""
+
+class Payload(object):
+    """
+    Records being unpickled, as a malicious cache entry could run code.
+    """
+
+    unpickled = False
+
+    def __reduce__(self):
+        return (Payload.load, ())
+
+    @staticmethod
+    def load():
+        Payload.unpickled = True
+
+        return Payload()
+
+
+class ManifestCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = ManifestCache(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testItShouldKeyByDevicePackageAndVersion(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        assert key == ManifestCache.key("fingerprint", "com.example", 3, 1000)
+        assert key != ManifestCache.key("other", "com.example", 3, 1000)
+        assert key != ManifestCache.key("fingerprint", "com.example", 4, 1000)
+        assert key != ManifestCache.key("fingerprint", "com.example", 3, 2000)
+        assert key != ManifestCache.key("fingerprint", "com.example", 3, 1000, local=True)
+
+    def testItShouldMissAnUncachedManifest(self):
+        assert self.cache.get(ManifestCache.key("fingerprint", "com.example", 3, 1000)) is None
+        assert self.cache.misses == 1
+
+    def testItShouldCacheTheXml(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        self.cache.put(key, MANIFEST)
+
+        assert ManifestCache(self.path).get(key) == MANIFEST
+
+    def testItShouldCacheAParsedManifest(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        self.cache.put(key, MANIFEST)
+        self.cache.putManifest(key, (False, ("has_activity", True)), Manifest(MANIFEST, False, has_activity=True))
+
+        manifest = ManifestCache(self.path).getManifest(key, (False, ("has_activity", True)))
+
+        assert manifest.package == "com.example"
+        assert manifest.application.activities[0].name == ".Main"
+        assert self.cache.get(key) == MANIFEST
+        assert self.cache.getManifest(key, (True,)).package == "com.example"
+        assert self.cache.getManifest(ManifestCache.key("fingerprint", "com.example", 4, 1000), (True,)) is None
+
+    def testItShouldStoreAParsedManifestAsXml(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        self.cache.putManifest(key, (True,), Manifest(MANIFEST))
+
+        with open(os.path.join(self.path, key + ".manifest"), "rb") as f:
+            data = f.read()
+
+        assert data.startswith(ManifestCache.HEADER)
+        assert b'package=\\"com.example\\"' in data
+        assert ManifestCache(self.path).getManifest(key, (True,)).application.activities[0].name == ".Main"
+
+    def testItShouldEvictTheLeastRecentlyUsedEntries(self):
+        self.cache.max_size = 3 * len(MANIFEST)
+        keys = [ManifestCache.key("fingerprint", "com.example", 3, i) for i in range(4)]
+
+        for i, key in enumerate(keys):
+            self.cache.put(key, MANIFEST)
+
+            os.utime(os.path.join(self.path, key + ".manifest"), (i, i))
+
+        self.cache.put(ManifestCache.key("fingerprint", "com.example", 3, 4), MANIFEST)
+
+        assert self.cache.size() <= self.cache.max_size
+        assert self.cache.get(keys[0]) is None
+        assert self.cache.get(keys[3]) == MANIFEST
+
+    def testItShouldDiscardACorruptEntry(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        with open(os.path.join(self.path, key + ".manifest"), "wb") as f:
+            f.write(b"not a manifest")
+
+        assert self.cache.get(key) is None
+        assert not os.path.exists(os.path.join(self.path, key + ".manifest"))
+
+    def testItShouldDiscardAnEntryWithoutTheHeader(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        with open(os.path.join(self.path, key + ".manifest"), "wb") as f:
+            pickle.dump({ "xml": MANIFEST, "manifests": {} }, f)
+
+        assert self.cache.get(key) is None
+        assert not os.path.exists(os.path.join(self.path, key + ".manifest"))
+
+    def testItShouldNotUnpickleAnEntry(self):
+        key = ManifestCache.key("fingerprint", "com.example", 3, 1000)
+
+        with open(os.path.join(self.path, key + ".manifest"), "wb") as f:
+            f.write(b"DZMANIFEST\x00\x01")
+            pickle.dump({ "xml": MANIFEST, "manifests": { (True,): Payload() } }, f)
+
+        assert self.cache.getManifest(key, (True,)) is None
+        assert not Payload.unpickled
+        assert not os.path.exists(os.path.join(self.path, key + ".manifest"))
+
+    def testItShouldTrackTheSizeAsEntriesAreWritten(self):
+        keys = [ManifestCache.key("fingerprint", "com.example", 3, i) for i in range(3)]
+
+        for key in keys:
+            self.cache.put(key, MANIFEST)
+        self.cache.put(keys[0], MANIFEST * 2)
+
+        assert self.cache.size() == sum(os.path.getsize(os.path.join(self.path, key + ".manifest")) for key in keys)
+        assert self.cache.size() == ManifestCache(self.path).size()
+
+    def testItShouldClear(self):
+        self.cache.put(ManifestCache.key("fingerprint", "com.example", 3, 1000), MANIFEST)
+        self.cache.clear()
+
+        assert self.cache.size() == 0
+
+
+def ManifestCacheTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ManifestCacheTestCase("testItShouldKeyByDevicePackageAndVersion"))
+    suite.addTest(ManifestCacheTestCase("testItShouldMissAnUncachedManifest"))
+    suite.addTest(ManifestCacheTestCase("testItShouldCacheTheXml"))
+    suite.addTest(ManifestCacheTestCase("testItShouldCacheAParsedManifest"))
+    suite.addTest(ManifestCacheTestCase("testItShouldStoreAParsedManifestAsXml"))
+    suite.addTest(ManifestCacheTestCase("testItShouldEvictTheLeastRecentlyUsedEntries"))
+    suite.addTest(ManifestCacheTestCase("testItShouldDiscardACorruptEntry"))
+    suite.addTest(ManifestCacheTestCase("testItShouldDiscardAnEntryWithoutTheHeader"))
+    suite.addTest(ManifestCacheTestCase("testItShouldNotUnpickleAnEntry"))
+    suite.addTest(ManifestCacheTestCase("testItShouldTrackTheSizeAsEntriesAreWritten"))
+    suite.addTest(ManifestCacheTestCase("testItShouldClear"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ManifestCacheTestSuite())
@@ -1,2 +1,6 @@
+from . import common
 from . import import_conflict_resolver_test
+from . import memo_test
 from . import module_base_test
+from . import registry_test
+from . import trie_test
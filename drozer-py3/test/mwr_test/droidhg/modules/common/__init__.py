@@ -0,0 +1 @@
+from . import file_system_test, loader_test, package_manager_test, provider_test, scan_engine_test
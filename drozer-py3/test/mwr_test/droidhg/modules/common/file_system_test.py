@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pydiesel.file import Ftp
+
+from drozer.modules import common
+from mwr_test.cinnibar.file.ftp_test import MockFileSession
+from mwr_test.mocks.session import MockSession
+
+class FileSystemTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.destination = os.path.join(self.directory, "file")
+        self.session = MockFileSession(files={ "/data/file": b"remote data" })
+        self.file_system = common.FileSystem(MockSession(None, ftp=Ftp(self.session, block_size=4)))
+
+        with open(self.destination, "wb") as f:
+            f.write(b"local")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self):
+        with open(self.destination, "rb") as f:
+            return f.read()
+
+    def testItShouldReplaceTheDestination(self):
+        assert self.file_system.downloadFile("/data/file", self.destination) == len(b"remote data")
+        assert self.read() == b"remote data"
+        assert os.listdir(self.directory) == ["file"]
+
+    def testItShouldLeaveTheDestinationIfTheFileIsMissing(self):
+        assert self.file_system.downloadFile("/data/missing", self.destination) is None
+        assert self.read() == b"local"
+        assert os.listdir(self.directory) == ["file"]
+
+    def testItShouldLeaveTheDestinationIfAChunkFails(self):
+        self.session.failures = 10
+
+        assert self.file_system.downloadFile("/data/file", self.destination) is None
+        assert self.read() == b"local"
+        assert os.listdir(self.directory) == ["file"]
+
+    def testItShouldResumeFromTheEndOfTheDestination(self):
+        with open(self.destination, "wb") as f:
+            f.write(b"remote")
+
+        assert self.file_system.downloadFile("/data/file", self.destination, resume=True) == len(b"remote data")
+        assert self.read() == b"remote data"
+
+
+def FileSystemTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(FileSystemTestCase("testItShouldReplaceTheDestination"))
+    suite.addTest(FileSystemTestCase("testItShouldLeaveTheDestinationIfTheFileIsMissing"))
+    suite.addTest(FileSystemTestCase("testItShouldLeaveTheDestinationIfAChunkFails"))
+    suite.addTest(FileSystemTestCase("testItShouldResumeFromTheEndOfTheDestination"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(FileSystemTestSuite())
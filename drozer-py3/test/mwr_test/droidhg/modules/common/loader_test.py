@@ -0,0 +1,94 @@
+import threading
+import time
+import unittest
+
+from drozer.modules import common, Module
+from drozer.modules.common import loader
+from mwr_test.mocks.session import MockSession
+
+class ClassLoaderTestCase(unittest.TestCase):
+
+    class MockUtils(object):
+        """
+        Stands in for pydiesel.reflection.utils, counting the libraries that
+        are built and uploaded, and the classes loaded from them.
+        """
+
+        def __init__(self):
+            self.builds = 0
+            self.loads = 0
+
+        def ClassLoader(self, source, cache_path, construct, system_class_loader, relative_to=None):
+            utils = self
+
+            class MockClassLoader(object):
+
+                def getClassLoader(self):
+                    utils.builds += 1
+                    time.sleep(0.05)
+
+                    return self
+
+                def loadClass(self, klass):
+                    utils.loads += 1
+                    time.sleep(0.01)
+
+                    return klass
+
+            return MockClassLoader()
+
+    class MockModule(common.ClassLoader):
+
+        def has_context(self):
+            return False
+
+        def klass(self, class_name):
+            return self
+
+        def getSystemClassLoader(self):
+            return None
+
+        def new(self, class_name, *args):
+            return self
+
+        def getCanonicalPath(self):
+            return self
+
+        def native(self):
+            return "/data/data/com.mwr.dz"
+
+    def setUp(self):
+        self.caches = Module._Module__klasses, Module._Module__loaders
+        self.utils = loader.utils
+
+        Module._Module__klasses, Module._Module__loaders = {}, {}
+        loader.utils = ClassLoaderTestCase.MockUtils()
+
+    def tearDown(self):
+        Module._Module__klasses, Module._Module__loaders = self.caches
+        loader.utils = self.utils
+
+    def testItShouldBuildALibraryOnceAcrossThreads(self):
+        module = ClassLoaderTestCase.MockModule(MockSession(None))
+        classes = []
+        threads = [threading.Thread(target=lambda: classes.append(module.loadClass("common/ZipUtil.apk", "ZipUtil"))) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert classes == ["ZipUtil"] * 8
+        assert loader.utils.builds == 1
+        assert loader.utils.loads == 1
+
+
+def ClassLoaderTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ClassLoaderTestCase("testItShouldBuildALibraryOnceAcrossThreads"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ClassLoaderTestSuite())
@@ -0,0 +1,222 @@
+import io
+import json
+import unittest
+
+from pydiesel.reflection import ReflectionException, Reflector
+
+from drozer.modules import common, Module
+from drozer.modules.app import package
+from drozer.modules.scanner.misc import native
+from drozer.modules.common.package_manager import PackageItemInfo, PackageRecord
+from drozer.standin import Scenario, StandInAgent
+from mwr_test.droidhg.standin_test import StandInSession
+from mwr_test.mocks.session import MockSession
+
+class PackageManagerTestCase(unittest.TestCase):
+
+    class MockContext(object):
+
+        def getPackageManager(self):
+            return "package manager"
+
+    class MockPackageInventory(object):
+
+        def __init__(self, packages):
+            self.calls = []
+            self.packages = packages
+
+        def list(self, package_manager, flags, fields):
+            self.calls.append(("list", flags, fields))
+
+            return json.dumps([self.project(p, fields) for p in self.packages])
+
+        def project(self, package, fields):
+            return dict((name, package.get(name)) for name in fields.split(","))
+
+        def single(self, package_manager, package, flags, fields):
+            self.calls.append(("single", flags, fields))
+
+            for p in self.packages:
+                if p["packageName"] == package:
+                    return json.dumps(self.project(p, fields))
+
+            raise ReflectionException(package)
+
+    class MockPackageManager(common.PackageManager):
+
+        def __init__(self, inventory):
+            common.PackageManager.__init__(self, MockSession(None))
+
+            self.inventory = inventory
+
+        def getContext(self):
+            return PackageManagerTestCase.MockContext()
+
+        def loadClass(self, source, klass, relative_to=None):
+            return self.inventory
+
+    def setUp(self):
+        self.inventory = PackageManagerTestCase.MockPackageInventory([
+            { "packageName": "com.example.a", "uid": 10001, "gids": [3003], "sharedUserId": None,
+              "activities": [{ "name": "com.example.a.Main", "packageName": "com.example.a" }] },
+            { "packageName": "com.example.b", "uid": 10002, "gids": None, "sharedUserId": "shared",
+              "activities": None } ])
+        self.package_manager = PackageManagerTestCase.MockPackageManager(self.inventory)
+
+    def testItShouldFetchEveryPackageInOneCall(self):
+        records = self.package_manager.packageManager().getPackageRecords(["packageName", "uid"], common.PackageManager.GET_GIDS)
+
+        assert [(r.packageName, r.uid) for r in records] == [("com.example.a", 10001), ("com.example.b", 10002)]
+        assert self.inventory.calls == [("list", common.PackageManager.GET_GIDS, "packageName,uid")]
+
+    def testItShouldOnlyHoldTheRequestedFields(self):
+        record = self.package_manager.packageManager().getPackageRecords(["packageName"])[0]
+
+        try:
+            record.uid
+
+            assert False, "expected an AttributeError"
+        except AttributeError:
+            pass
+
+    def testItShouldDecodeNullsArraysAndComponents(self):
+        a, b = self.package_manager.packageManager().getPackageRecords(["activities", "gids", "sharedUserId"])
+
+        assert a.activities == [PackageItemInfo("com.example.a.Main", "com.example.a")]
+        assert a.gids == [3003]
+        assert a.sharedUserId is None
+        assert b.activities is None
+        assert b.gids is None
+        assert b.sharedUserId == "shared"
+
+    def testItShouldFetchASinglePackage(self):
+        record = self.package_manager.packageManager().getPackageRecord("com.example.b", ["uid"])
+
+        assert record.uid == 10002
+        assert self.inventory.calls == [("single", 0, "uid")]
+
+    def testItShouldRaiseForAnUnknownPackage(self):
+        try:
+            self.package_manager.packageManager().getPackageRecord("com.example.missing", ["uid"])
+
+            assert False, "expected a NoSuchPackageException"
+        except common.PackageManager.NoSuchPackageException:
+            pass
+
+
+class PackageManagerFallbackTestCase(unittest.TestCase):
+
+    class StandInPackageManager(common.PackageManager):
+
+        def loadClass(self, source, klass, relative_to=None):
+            raise RuntimeError("could not build %s" % source)
+
+    def setUp(self):
+        self.caches = Module._Module__klasses, Module._Module__loaders
+
+        Module._Module__klasses, Module._Module__loaders = {}, {}
+
+        self.agent = StandInAgent(Scenario.synthetic(3))
+        self.session = StandInSession(self.agent.listen("127.0.0.1", 0), Scenario.agent_version)
+        self.package_manager = PackageManagerFallbackTestCase.StandInPackageManager(MockSession(Reflector(self.session)))
+        self.package_manager.clearObjectStore()
+
+    def tearDown(self):
+        self.session.close()
+        self.agent.close()
+
+        Module._Module__klasses, Module._Module__loaders = self.caches
+
+    def testItShouldReadTheFieldsThroughReflection(self):
+        records = self.package_manager.packageManager().getPackageRecords(["packageName", "label", "uid", "requestedPermissions", "activities"], common.PackageManager.GET_PERMISSIONS)
+
+        assert len(records) == 4
+        assert records[1].packageName == "com.example.app0000"
+        assert records[1].label == "app0000"
+        assert isinstance(records[1].uid, int)
+        assert records[1].requestedPermissions == ["android.permission.INTERNET", "android.permission.CAMERA"]
+        assert records[1].activities is None
+
+    def testItShouldRaiseForAnUnknownPackage(self):
+        try:
+            self.package_manager.packageManager().getPackageRecord("com.example.missing", ["uid"])
+
+            assert False, "expected a NoSuchPackageException"
+        except common.PackageManager.NoSuchPackageException:
+            pass
+
+    def testItShouldReportNoGenerationBeforeAPackageChanges(self):
+        assert self.package_manager.packageGeneration() == 0
+
+    def testItShouldReportTheGenerationOfTheChangedPackages(self):
+        self.agent.scenario.sequence = 3
+
+        assert self.package_manager.packageGeneration() == 3
+
+
+class PackageModulesTestCase(unittest.TestCase):
+    """
+    Runs the modules that read PackageRecords against packages without an
+    ApplicationInfo, for which the inventory reports the application's fields
+    as null.
+    """
+
+    def run_module(self, module, *args):
+        inventory = PackageManagerTestCase.MockPackageInventory([
+            { "packageName": "com.example.a", "label": "Example", "nativeLibraries": ["lib/armeabi/libexample.so"] },
+            { "packageName": "com.example.b", "label": None, "nativeLibraries": None } ])
+        stdout = io.StringIO()
+
+        class MockModule(module):
+
+            def clearObjectStore(self):
+                pass
+
+            def getContext(self):
+                return PackageManagerTestCase.MockContext()
+
+            def loadClass(self, source, klass, relative_to=None):
+                return inventory
+
+        MockModule(MockSession(None, stdout=stdout)).run(list(args))
+
+        return stdout.getvalue()
+
+    def testItShouldFilterPackagesWithoutALabel(self):
+        assert self.run_module(package.List, "-f", "example") == "com.example.a (Example)\ncom.example.b (None)\n"
+        assert self.run_module(package.List, "-f", "missing") == ""
+
+    def testItShouldShowAPackageWithoutALabel(self):
+        output = self.run_module(package.Info, "-f", "example")
+
+        assert "Package: com.example.a\n  Application Label: Example\n" in output
+        assert "Package: com.example.b\n  Application Label: null\n" in output
+        assert self.run_module(package.Info, "-f", "missing") == ""
+
+    def testItShouldFindNoLibrariesInAPackageWithoutAnApplication(self):
+        output = self.run_module(native.Native, "-v")
+
+        assert "   - lib/armeabi/libexample.so\n" in output
+        assert "Package: com.example.b\n  No Native Libraries.\n" in output
+
+
+def PackageManagerTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(PackageManagerTestCase("testItShouldFetchEveryPackageInOneCall"))
+    suite.addTest(PackageManagerTestCase("testItShouldOnlyHoldTheRequestedFields"))
+    suite.addTest(PackageManagerTestCase("testItShouldDecodeNullsArraysAndComponents"))
+    suite.addTest(PackageManagerTestCase("testItShouldFetchASinglePackage"))
+    suite.addTest(PackageManagerTestCase("testItShouldRaiseForAnUnknownPackage"))
+    suite.addTest(PackageManagerFallbackTestCase("testItShouldReadTheFieldsThroughReflection"))
+    suite.addTest(PackageManagerFallbackTestCase("testItShouldRaiseForAnUnknownPackage"))
+    suite.addTest(PackageManagerFallbackTestCase("testItShouldReportNoGenerationBeforeAPackageChanges"))
+    suite.addTest(PackageManagerFallbackTestCase("testItShouldReportTheGenerationOfTheChangedPackages"))
+    suite.addTest(PackageModulesTestCase("testItShouldFilterPackagesWithoutALabel"))
+    suite.addTest(PackageModulesTestCase("testItShouldShowAPackageWithoutALabel"))
+    suite.addTest(PackageModulesTestCase("testItShouldFindNoLibrariesInAPackageWithoutAnApplication"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(PackageManagerTestSuite())
@@ -0,0 +1,113 @@
+import struct
+import unittest
+
+from drozer.modules import common
+from mwr_test.mocks.session import MockSession
+
+def encode(rows):
+    """
+    Serialize rows in the format written by CursorWindowReader.
+    """
+
+    data = struct.pack(">i", len(rows))
+
+    for row in rows:
+        for value in row:
+            if value is None:
+                data += struct.pack(">b", 0)
+            elif isinstance(value, int):
+                data += struct.pack(">bq", 1, value)
+            elif isinstance(value, float):
+                data += struct.pack(">bd", 2, value)
+            elif isinstance(value, str):
+                data += struct.pack(">bi", 3, len(value.encode("utf-8"))) + value.encode("utf-8")
+            else:
+                data += struct.pack(">bi", 4, len(value)) + value
+
+    return data
+
+class ProviderTestCase(unittest.TestCase):
+
+    class MockBinary(object):
+
+        def __init__(self, data):
+            self.__data = data
+
+        def data(self):
+            return self.__data
+
+    class MockCursor(object):
+
+        def __init__(self, columns, rows):
+            self.columns = columns
+            self.rows = rows
+
+        def getColumnNames(self):
+            return self.columns
+
+    class MockCursorWindowReader(object):
+
+        def __init__(self):
+            self.reads = []
+
+        def read(self, cursor, position, count):
+            self.reads.append((position, count))
+
+            return ProviderTestCase.MockBinary(encode(cursor.rows[position:position + count]))
+
+    class MockProvider(common.Provider):
+
+        def __init__(self, reader):
+            common.Provider.__init__(self, MockSession(None))
+
+            self.reader = reader
+
+        def loadClass(self, source, klass, relative_to=None):
+            return self.reader
+
+    def setUp(self):
+        self.reader = ProviderTestCase.MockCursorWindowReader()
+        self.provider = ProviderTestCase.MockProvider(self.reader)
+        self.cursor = ProviderTestCase.MockCursor(["_id", "name"], [[i, "row %d" % i] for i in range(10)])
+
+    def testItShouldDecodeTypedValues(self):
+        rows = common.Provider.decodeCursorWindow(encode([[None, 42, -1.5, "café", b"\x00\xff", ""]]), 6)
+
+        assert rows == [[None, 42, -1.5, "café", b"\x00\xff", ""]]
+
+    def testItShouldDecodeAnEmptyWindow(self):
+        assert common.Provider.decodeCursorWindow(encode([]), 3) == []
+
+    def testItShouldYieldColumnsThenRowsInPages(self):
+        rows = list(self.provider.getRows(self.cursor, page_size=4))
+
+        assert rows[0] == ["_id", "name"]
+        assert rows[1:] == self.cursor.rows
+        assert self.reader.reads == [(0, 4), (4, 4), (8, 4)]
+
+    def testItShouldApplyAnOffsetAndLimit(self):
+        rows = list(self.provider.getRows(self.cursor, page_size=4, offset=3, limit=5))
+
+        assert rows[1:] == self.cursor.rows[3:8]
+        assert self.reader.reads == [(3, 4), (7, 1)]
+
+    def testItShouldStopAtTheEndOfTheCursor(self):
+        rows = list(self.provider.getRows(self.cursor, page_size=5))
+
+        assert len(rows) == 11
+        assert self.reader.reads == [(0, 5), (5, 5), (10, 5)]
+
+
+def ProviderTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ProviderTestCase("testItShouldDecodeTypedValues"))
+    suite.addTest(ProviderTestCase("testItShouldDecodeAnEmptyWindow"))
+    suite.addTest(ProviderTestCase("testItShouldYieldColumnsThenRowsInPages"))
+    suite.addTest(ProviderTestCase("testItShouldApplyAnOffsetAndLimit"))
+    suite.addTest(ProviderTestCase("testItShouldStopAtTheEndOfTheCursor"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ProviderTestSuite())
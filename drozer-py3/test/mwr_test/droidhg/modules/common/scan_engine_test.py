@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+
+from drozer.modules.common.scan_engine import ScanEngine
+
+class ScanEngineTestCase(unittest.TestCase):
+
+    class MockProbe(object):
+
+        def __init__(self, duration=0.0):
+            self.active = {}
+            self.duration = duration
+            self.lock = threading.Lock()
+            self.peak = 0
+            self.peak_per_authority = 0
+            self.starts = {}
+
+        def __call__(self, uri):
+            authority = ScanEngine.authority(uri)
+
+            with self.lock:
+                self.active[authority] = self.active.get(authority, 0) + 1
+                self.peak = max(self.peak, sum(self.active.values()))
+                self.peak_per_authority = max(self.peak_per_authority, self.active[authority])
+                self.starts.setdefault(authority, []).append(time.monotonic())
+
+            time.sleep(self.duration)
+
+            with self.lock:
+                self.active[authority] -= 1
+
+            if uri.endswith("/error"):
+                raise RuntimeError("probe failed")
+
+            return uri.upper()
+
+    def testItShouldGetTheAuthorityOfAUri(self):
+        assert ScanEngine.authority("content://settings/secure") == "settings"
+        assert ScanEngine.authority("content://com.example.provider") == "com.example.provider"
+
+    def testItShouldProbeEveryUriOnce(self):
+        results = list(ScanEngine(ScanEngineTestCase.MockProbe()).scan(["content://a/1", "content://b/1", "content://a/1"]))
+
+        assert sorted(r.uri for r in results) == ["content://a/1", "content://b/1"]
+        assert all(r.value == r.uri.upper() for r in results)
+
+    def testItShouldReportAProbeThatRaises(self):
+        results = list(ScanEngine(ScanEngineTestCase.MockProbe()).scan(["content://a/error"]))
+
+        assert results[0].value is None
+        assert isinstance(results[0].error, RuntimeError)
+
+    def testItShouldLimitTheNumberOfWorkers(self):
+        probe = ScanEngineTestCase.MockProbe(0.02)
+
+        list(ScanEngine(probe, workers=3, per_authority=10).scan(["content://%d/x" % i for i in range(12)]))
+
+        assert probe.peak == 3
+
+    def testItShouldLimitProbesPerAuthority(self):
+        probe = ScanEngineTestCase.MockProbe(0.02)
+
+        list(ScanEngine(probe, workers=8, per_authority=2).scan(["content://a/%d" % i for i in range(8)] + ["content://b/%d" % i for i in range(8)]))
+
+        assert probe.peak_per_authority == 2
+        assert probe.peak == 4
+
+    def testItShouldSpaceOutProbesOfAnAuthority(self):
+        probe = ScanEngineTestCase.MockProbe()
+
+        list(ScanEngine(probe, workers=4, per_authority=4, interval=0.05).scan(["content://a/%d" % i for i in range(3)]))
+
+        starts = probe.starts["a"]
+
+        assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:]))
+
+    def testItShouldYieldResultsBeforeTheUrisAreExhausted(self):
+        released = threading.Event()
+
+        def uris():
+            yield "content://a/1"
+
+            released.wait(5)
+
+            yield "content://a/2"
+
+        scan = ScanEngine(ScanEngineTestCase.MockProbe()).scan(uris())
+
+        # the first result arrives while the second URI is still being searched
+        # for, so release the search from another thread
+        threading.Timer(0.2, released.set).start()
+        first = next(scan)
+
+        assert first.uri == "content://a/1"
+        assert [r.uri for r in scan] == ["content://a/2"]
+
+
+def ScanEngineTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ScanEngineTestCase("testItShouldGetTheAuthorityOfAUri"))
+    suite.addTest(ScanEngineTestCase("testItShouldProbeEveryUriOnce"))
+    suite.addTest(ScanEngineTestCase("testItShouldReportAProbeThatRaises"))
+    suite.addTest(ScanEngineTestCase("testItShouldLimitTheNumberOfWorkers"))
+    suite.addTest(ScanEngineTestCase("testItShouldLimitProbesPerAuthority"))
+    suite.addTest(ScanEngineTestCase("testItShouldSpaceOutProbesOfAnAuthority"))
+    suite.addTest(ScanEngineTestCase("testItShouldYieldResultsBeforeTheUrisAreExhausted"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ScanEngineTestSuite())
@@ -0,0 +1,116 @@
+import time
+import unittest
+
+from drozer.modules.memo import MemoStore, memoized
+
+class MemoStoreTestCase(unittest.TestCase):
+
+    class MockModule(object):
+
+        def __init__(self, memo):
+            self.calls = 0
+            self.generation = 1
+            self.memo = memo
+
+        def packageGeneration(self):
+            return self.generation
+
+        @memoized()
+        def discover(self, package):
+            self.calls += 1
+
+            return "uris in %s" % package
+
+        @memoized()
+        def iterate(self, package):
+            self.calls += 1
+
+            for i in range(3):
+                yield "%s/%d" % (package, i)
+
+    def setUp(self):
+        self.store = MemoStore()
+        self.module = MemoStoreTestCase.MockModule(self.store)
+
+    def testItShouldStoreAndGetAValue(self):
+        key = MemoStore.key("f", ("a",), {}, 1)
+
+        assert self.store.get(key) == (False, None)
+
+        self.store.put(key, "value")
+
+        assert self.store.get(key) == (True, "value")
+        assert self.store.hits == 1
+        assert self.store.misses == 1
+
+    def testItShouldExpireAValue(self):
+        key = MemoStore.key("f", ("a",), {}, 1)
+
+        self.store.put(key, "value", ttl=0.01)
+        time.sleep(0.02)
+
+        assert self.store.get(key) == (False, None)
+        assert len(self.store) == 0
+
+    def testItShouldInvalidateAFunction(self):
+        self.store.put(MemoStore.key("f", ("a",), {}, 1), "a")
+        self.store.put(MemoStore.key("f", ("b",), {}, 1), "b")
+        self.store.put(MemoStore.key("g", (), {}, 1), "c")
+
+        assert self.store.names() == ["f", "g"]
+        assert self.store.invalidate("f") == 2
+        assert self.store.names() == ["g"]
+        assert self.store.invalidate() == 1
+
+    def testItShouldMemoizeAMethod(self):
+        assert self.module.discover("com.example") == "uris in com.example"
+        assert self.module.discover("com.example") == "uris in com.example"
+        assert self.module.calls == 1
+
+        self.module.discover("com.other")
+
+        assert self.module.calls == 2
+
+    def testItShouldRecomputeWhenThePackagesChange(self):
+        self.module.discover("com.example")
+        self.module.generation = 2
+        self.module.discover("com.example")
+
+        assert self.module.calls == 2
+
+    def testItShouldReplayAGenerator(self):
+        assert list(self.module.iterate("content://a")) == ["content://a/0", "content://a/1", "content://a/2"]
+        assert list(self.module.iterate("content://a")) == ["content://a/0", "content://a/1", "content://a/2"]
+        assert self.module.calls == 1
+
+    def testItShouldNotStoreAnUnfinishedGenerator(self):
+        next(self.module.iterate("content://a"))
+
+        assert list(self.module.iterate("content://a")) == ["content://a/0", "content://a/1", "content://a/2"]
+        assert self.module.calls == 2
+
+    def testItShouldNotMemoizeWithoutAStore(self):
+        module = MemoStoreTestCase.MockModule(None)
+
+        module.discover("com.example")
+        module.discover("com.example")
+
+        assert module.calls == 2
+
+
+def MemoStoreTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(MemoStoreTestCase("testItShouldStoreAndGetAValue"))
+    suite.addTest(MemoStoreTestCase("testItShouldExpireAValue"))
+    suite.addTest(MemoStoreTestCase("testItShouldInvalidateAFunction"))
+    suite.addTest(MemoStoreTestCase("testItShouldMemoizeAMethod"))
+    suite.addTest(MemoStoreTestCase("testItShouldRecomputeWhenThePackagesChange"))
+    suite.addTest(MemoStoreTestCase("testItShouldReplayAGenerator"))
+    suite.addTest(MemoStoreTestCase("testItShouldNotStoreAnUnfinishedGenerator"))
+    suite.addTest(MemoStoreTestCase("testItShouldNotMemoizeWithoutAStore"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(MemoStoreTestSuite())
@@ -3,7 +3,8 @@ import functools
 import sys
 import unittest
 
-from pydiesel.reflection.types import ReflectedObject, ReflectedType
+from pydiesel.reflection.types.reflected_object import ReflectedObject
+from pydiesel.reflection.types.reflected_type import ReflectedType
 
 from drozer.modules import Module
 from mwr_test.mocks.session import MockSession
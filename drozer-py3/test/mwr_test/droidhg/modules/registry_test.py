@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from drozer.modules import base, collection, loader
+from drozer.modules.registry import ModuleInfo, ModuleRegistry
+
+class ExampleModule(base.Module):
+
+    name = "An example module"
+    author = ["A", "B"]
+    path = ["example", "path"]
+    permissions = ["com.mwr.dz.permissions.GET_CONTEXT"]
+
+
+class ModuleRegistryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.index = os.path.join(self.path, "index")
+        self.source = os.path.join(self.path, "module.py")
+
+        with open(self.source, "w") as f:
+            f.write("# a module\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testItShouldRecordModuleMetadata(self):
+        info = ModuleInfo.fromKlass(ExampleModule)
+
+        assert info.fqmn() == ExampleModule.fqmn()
+        assert info.namespace() == ExampleModule.namespace()
+        assert info.module == ExampleModule.__module__
+        assert info.author == ["A", "B"]
+
+    def testItShouldMissAnUnindexedFile(self):
+        assert ModuleRegistry(self.index).get(self.source) is None
+
+    def testItShouldKeepAnIndexOnDisk(self):
+        registry = ModuleRegistry(self.index)
+        registry.put(self.source, ModuleRegistry.signature(self.source), [ModuleInfo.fromKlass(ExampleModule)])
+        registry.save()
+
+        infos = ModuleRegistry(self.index).get(self.source)
+
+        assert len(infos) == 1
+        assert infos[0].fqmn() == "example.path.examplemodule"
+        assert infos[0].permissions == ["com.mwr.dz.permissions.GET_CONTEXT"]
+
+    def testItShouldMissAChangedFile(self):
+        registry = ModuleRegistry(self.index)
+        registry.put(self.source, ModuleRegistry.signature(self.source), [ModuleInfo.fromKlass(ExampleModule)])
+
+        with open(self.source, "a") as f:
+            f.write("# changed\n")
+
+        assert registry.get(self.source) is None
+
+    def testItShouldPruneRemovedFiles(self):
+        registry = ModuleRegistry(self.index)
+        registry.put(self.source, ModuleRegistry.signature(self.source), [])
+
+        assert registry.prune([self.source]) == 0
+        assert registry.prune([]) == 1
+        assert registry.get(self.source) is None
+
+    def testItShouldIgnoreACorruptIndex(self):
+        with open(self.index, "w") as f:
+            f.write("{ not json")
+
+        assert ModuleRegistry(self.index).get(self.source) is None
+
+
+class ModuleLoaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.index = os.path.join(self.path, "index")
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testItShouldLoadTheSameModulesFromTheIndex(self):
+        cold = collection.ModuleCollection(loader.ModuleLoader(ModuleRegistry(self.index)))
+        modules = cold.all()
+
+        assert os.path.exists(self.index)
+
+        warm = collection.ModuleCollection(loader.ModuleLoader(ModuleRegistry(self.index)))
+
+        assert warm.all() == modules
+        assert len(modules) > 0
+
+    def testItShouldGetModuleMetadataWithoutItsImplementation(self):
+        modules = collection.ModuleCollection(loader.ModuleLoader(ModuleRegistry(self.index)))
+        key = modules.all()[0]
+
+        assert modules.info(key).name == modules.get(key).name
+        assert modules.info(key).fqmn() == modules.get(key).fqmn() == key
+
+
+def ModuleRegistryTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ModuleRegistryTestCase("testItShouldRecordModuleMetadata"))
+    suite.addTest(ModuleRegistryTestCase("testItShouldMissAnUnindexedFile"))
+    suite.addTest(ModuleRegistryTestCase("testItShouldKeepAnIndexOnDisk"))
+    suite.addTest(ModuleRegistryTestCase("testItShouldMissAChangedFile"))
+    suite.addTest(ModuleRegistryTestCase("testItShouldPruneRemovedFiles"))
+    suite.addTest(ModuleRegistryTestCase("testItShouldIgnoreACorruptIndex"))
+    suite.addTest(ModuleLoaderTestCase("testItShouldLoadTheSameModulesFromTheIndex"))
+    suite.addTest(ModuleLoaderTestCase("testItShouldGetModuleMetadataWithoutItsImplementation"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ModuleRegistryTestSuite())
@@ -0,0 +1,77 @@
+import unittest
+
+from drozer.modules.trie import ModuleTrie
+
+MODULES = {
+    "app.activity.info": ["GET_CONTEXT"],
+    "app.activity.start": ["GET_CONTEXT"],
+    "app.provider.query": ["GET_CONTEXT"],
+    "information.datetime": [],
+    "scanner.provider.injection": ["GET_CONTEXT", "READ_SETTINGS"],
+    "tools.setup.su": ["ROOT"],
+}
+
+class ModuleTrieTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = ModuleTrie()
+        self.trie.update(MODULES)
+
+    def testItShouldFindEveryModuleInOrder(self):
+        assert self.trie.find() == sorted(MODULES.keys())
+
+    def testItShouldFindModulesByPrefix(self):
+        assert self.trie.find("app.act") == ["app.activity.info", "app.activity.start"]
+        assert self.trie.find("app.x") == []
+
+    def testItShouldFindModulesByContents(self):
+        assert self.trie.find(contains="PROVIDER") == ["app.provider.query", "scanner.provider.injection"]
+        assert self.trie.find(contains="su") == ["tools.setup.su"]
+        assert self.trie.find("app.", contains="provider") == ["app.provider.query"]
+
+    def testItShouldFilterModulesByPermission(self):
+        assert self.trie.find(permissions=[]) == ["information.datetime"]
+        assert self.trie.find(permissions=["GET_CONTEXT"]) == ["app.activity.info", "app.activity.start", "app.provider.query", "information.datetime"]
+        assert self.trie.find("scanner", permissions=["GET_CONTEXT", "READ_SETTINGS", "UNKNOWN"]) == ["scanner.provider.injection"]
+
+    def testItShouldFindNamespaces(self):
+        assert self.trie.namespaces("app.") == set(["app.activity", "app.provider"])
+        assert self.trie.namespaces(permissions=[]) == set(["information"])
+
+    def testItShouldRemoveModules(self):
+        self.trie.remove("app.activity.start")
+
+        assert "app.activity.start" not in self.trie
+        assert self.trie.find("app.activity") == ["app.activity.info"]
+        assert self.trie.find(contains="start") == []
+
+    def testItShouldUpdateIncrementally(self):
+        self.trie.find(permissions=["GET_CONTEXT"])
+
+        modules = dict(MODULES)
+        del modules["app.activity.start"]
+        modules["tools.setup.su"] = ["GET_CONTEXT"]
+        modules["tools.setup.busybox"] = []
+
+        self.trie.update(modules)
+
+        assert len(self.trie) == 6
+        assert self.trie.find("tools", permissions=["GET_CONTEXT"]) == ["tools.setup.busybox", "tools.setup.su"]
+        assert "app.activity.start" not in self.trie.find()
+
+
+def ModuleTrieTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ModuleTrieTestCase("testItShouldFindEveryModuleInOrder"))
+    suite.addTest(ModuleTrieTestCase("testItShouldFindModulesByPrefix"))
+    suite.addTest(ModuleTrieTestCase("testItShouldFindModulesByContents"))
+    suite.addTest(ModuleTrieTestCase("testItShouldFilterModulesByPermission"))
+    suite.addTest(ModuleTrieTestCase("testItShouldFindNamespaces"))
+    suite.addTest(ModuleTrieTestCase("testItShouldRemoveModules"))
+    suite.addTest(ModuleTrieTestCase("testItShouldUpdateIncrementally"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(ModuleTrieTestSuite())
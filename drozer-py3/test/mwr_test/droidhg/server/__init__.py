@@ -0,0 +1 @@
+from . import frame_receiver_test
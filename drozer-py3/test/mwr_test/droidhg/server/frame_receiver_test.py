@@ -0,0 +1,88 @@
+import unittest
+
+from twisted.internet.testing import StringTransport
+
+from pydiesel.api import Frame
+from pydiesel.api.protobuf_pb2 import Message
+
+from drozer.server.receivers.frame import FrameReceiver
+from mwr.common.twisted import StreamBuffer
+
+class FrameReceiverTestCase(unittest.TestCase):
+
+    class MockFrameReceiver(FrameReceiver):
+
+        def __init__(self):
+            FrameReceiver.__init__(self)
+
+            self.frames = []
+
+        def frameReceived(self, frame):
+            self.frames.append(frame.message().id)
+
+    def frame(self, message_id):
+        return Frame.fromMessage(Message(id=message_id, type=Message.REFLECTION_REQUEST).SerializeToString()).bytes()
+
+    def setUp(self):
+        self.receiver = FrameReceiverTestCase.MockFrameReceiver()
+        self.receiver.makeConnection(StringTransport())
+
+    def testItShouldReceiveAFrame(self):
+        self.receiver.dataReceived(self.frame(1))
+
+        assert self.receiver.frames == [1]
+        assert len(self.receiver.stream) == 0
+
+    def testItShouldReceiveEveryFrameInOneRead(self):
+        self.receiver.dataReceived(self.frame(1) + self.frame(2) + self.frame(3))
+
+        assert self.receiver.frames == [1, 2, 3]
+
+    def testItShouldWaitForTheRestOfAFrame(self):
+        data = self.frame(1) + self.frame(2)
+
+        self.receiver.dataReceived(data[:3])
+        self.receiver.dataReceived(data[3:len(data) - 2])
+
+        assert self.receiver.frames == [1]
+
+        self.receiver.dataReceived(data[len(data) - 2:])
+
+        assert self.receiver.frames == [1, 2]
+        assert len(self.receiver.stream) == 0
+
+    def testItShouldKeepUnreadDataWhenCompacting(self):
+        stream = StreamBuffer()
+
+        stream.append(b"the payload")
+        stream.read(4)
+        stream.compact()
+        stream.append(b"!")
+
+        assert stream.tell() == 0
+        assert stream.read() == b"payload!"
+
+    def testItShouldSeekBackToAnEarlierPosition(self):
+        stream = StreamBuffer()
+
+        stream.append(b"the payload")
+        position = stream.tell()
+        stream.read(4)
+        stream.seek(position)
+
+        assert stream.read(3) == b"the"
+
+
+def FrameReceiverTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(FrameReceiverTestCase("testItShouldReceiveAFrame"))
+    suite.addTest(FrameReceiverTestCase("testItShouldReceiveEveryFrameInOneRead"))
+    suite.addTest(FrameReceiverTestCase("testItShouldWaitForTheRestOfAFrame"))
+    suite.addTest(FrameReceiverTestCase("testItShouldKeepUnreadDataWhenCompacting"))
+    suite.addTest(FrameReceiverTestCase("testItShouldSeekBackToAnEarlierPosition"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(FrameReceiverTestSuite())
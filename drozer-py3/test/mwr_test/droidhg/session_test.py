@@ -0,0 +1,94 @@
+import unittest
+
+from pydiesel.api.builders import ReflectionRequestFactory, ReflectionResponseFactory
+from pydiesel.api.protobuf_pb2 import Message
+
+from drozer.api.handlers import ReflectionRequestForwarder, ReflectionResponseForwarder
+from drozer.device import Device
+from drozer.session import Session, SessionCollection, Sessions
+
+class MockConnection(object):
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, message):
+        self.written.append(message)
+
+class SessionCollectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Device("device", "drozer", "test", "none")
+        self.sessions = SessionCollection()
+
+    def testItShouldGetASessionByIdentifier(self):
+        self.sessions.add_session("one", self.device, None)
+        self.sessions.add_session("two", self.device, None)
+
+        assert self.sessions.get("two").session_id == "two"
+        assert self.sessions.get("three") is None
+        assert len(self.sessions) == 2
+
+    def testItShouldReplaceASessionWithTheSameIdentifier(self):
+        self.sessions.add_session("one", self.device, None)
+        self.sessions.add_session("one", self.device, "console")
+
+        assert len(self.sessions) == 1
+        assert self.sessions.get("one").console == "console"
+
+    def testItShouldRemoveASession(self):
+        self.sessions.add_session("one", self.device, None)
+        session = self.sessions.get("one")
+
+        self.sessions.remove(session)
+
+        assert session not in self.sessions
+        assert self.sessions.get("one") is None
+
+    def testItShouldNotRemoveAReplacedSession(self):
+        stale = Session("one", self.device, None)
+
+        self.sessions.add_session("one", self.device, None)
+
+        try:
+            self.sessions.remove(stale)
+
+            assert False, "should have raised KeyError"
+        except KeyError:
+            pass
+
+        assert self.sessions.get("one") is not None
+
+    def testItShouldCountForwardedMessages(self):
+        console = MockConnection()
+        self.device.connection = MockConnection()
+
+        Sessions.add_session("counted", self.device, console)
+
+        try:
+            request = ReflectionRequestFactory.resolve("java.lang.String").setSessionId("counted").setId(1).builder
+
+            ReflectionRequestForwarder(None, None).handle(request)
+            ReflectionRequestForwarder(None, None).handle(request)
+            ReflectionResponseForwarder(None, None).handle(ReflectionResponseFactory().inReplyTo(request).builder)
+
+            assert Sessions.get("counted").requests == 2
+            assert Sessions.get("counted").responses == 1
+            assert len(console.written) == 1
+        finally:
+            Sessions.discard(Sessions.get("counted"))
+
+
+def SessionCollectionTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(SessionCollectionTestCase("testItShouldGetASessionByIdentifier"))
+    suite.addTest(SessionCollectionTestCase("testItShouldReplaceASessionWithTheSameIdentifier"))
+    suite.addTest(SessionCollectionTestCase("testItShouldRemoveASession"))
+    suite.addTest(SessionCollectionTestCase("testItShouldNotRemoveAReplacedSession"))
+    suite.addTest(SessionCollectionTestCase("testItShouldCountForwardedMessages"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(SessionCollectionTestSuite())
@@ -0,0 +1,312 @@
+import io
+import os
+import shutil
+import socket
+import tempfile
+import time
+import unittest
+import zipfile
+
+from pydiesel.api.builders import ReflectionRequestFactory, SystemRequestFactory
+from pydiesel.api.protobuf_pb2 import Message
+from pydiesel.api.transport import SocketTransport
+from pydiesel.file import Ftp
+from pydiesel.reflection import ReflectionException, Reflector
+from pydiesel.reflection.types.reflected_primitive_array import ReflectedPrimitiveArray
+from pydiesel.reflection.types.reflected_type import ReflectedType
+
+from drozer.apk_store import ApkStore
+from drozer.manifest_cache import ManifestCache
+from drozer.modules import Module
+from drozer.modules.app import package, provider
+from drozer.modules.scanner.provider import find_uris
+from drozer.standin import ReflectionHandler, Scenario, StandInAgent
+from mwr_test.mocks.session import MockSession
+
+class StandInSession(object):
+    """
+    Delivers messages to a StandInAgent over TCP, in place of a console
+    Session.
+    """
+
+    def __init__(self, port, agent_version):
+        self.agent_version = agent_version
+        self.transport = SocketTransport.fromSocket(socket.create_connection(("127.0.0.1", port)))
+        self.transport.setTimeout(5.0)
+
+        response = self.transport.sendAndReceive(SystemRequestFactory.startSession("standin"))
+
+        self.session_id = response.system_response.session_id
+
+    def close(self):
+        self.transport.close()
+
+    def gather(self, futures, exit_on_loss=True):
+        return [self.transport.wait(f) for f in futures]
+
+    def send_async(self, message, exit_on_loss=True):
+        return self.transport.send_async(message.setSessionId(self.session_id))
+
+    def sendAndReceive(self, message, exit_on_loss=True):
+        return self.transport.sendAndReceive(message.setSessionId(self.session_id))
+
+
+class ReflectionHandlerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ReflectionHandler()
+
+    def testItShouldSendPythonValuesAsJavaTypes(self):
+        assert self.handler.argument(True).primitive.type == Message.Primitive.BOOL
+        assert self.handler.argument(1).primitive.type == Message.Primitive.INT
+        assert self.handler.argument(2 ** 40).primitive.type == Message.Primitive.LONG
+        assert self.handler.argument(1.5).primitive.type == Message.Primitive.DOUBLE
+        assert self.handler.argument("a").type == Message.Argument.STRING
+        assert self.handler.argument(b"a").type == Message.Argument.DATA
+        assert self.handler.argument(None).type == Message.Argument.NULL
+
+    def testItShouldSendListsAsTypedArrays(self):
+        assert self.handler.argument(["a", "b"]).array.type == Message.Array.STRING
+        assert self.handler.argument([1, 2]).array.type == Message.Array.PRIMITIVE
+        assert self.handler.argument([object()]).array.type == Message.Array.OBJECT
+        assert self.handler.argument([]).array.type == Message.Array.OBJECT
+
+    def testItShouldPackPrimitiveArraysWhenAsked(self):
+        argument = self.handler.argument([1, -2], packed=True)
+
+        assert argument.array.packed_type == Message.Primitive.INT
+        assert argument.array.packed == b"\x00\x00\x00\x01\xff\xff\xff\xfe"
+        assert self.handler.native(argument) == [1, -2]
+
+    def testItShouldNameObjectsByTheirJavaClass(self):
+        argument = self.handler.argument(Scenario().packages[0].application_info)
+
+        assert argument.object.class_name == "android.content.pm.ApplicationInfo"
+        assert self.handler.objects[argument.object.reference].packageName == "com.mwr.dz"
+
+
+class StandInAgentTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = StandInAgent(Scenario.synthetic(3, files={ "/data/data/com.mwr.dz/hello.txt": "hello world" }))
+        self.port = self.agent.listen("127.0.0.1", 0)
+        self.session = StandInSession(self.port, self.agent.scenario.agent_version)
+        self.reflector = Reflector(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.agent.close()
+
+    def testItShouldListItsDevice(self):
+        response = self.session.transport.sendAndReceive(SystemRequestFactory.listDevices())
+
+        assert [d.id for d in response.system_response.devices] == ["standin"]
+
+    def testItShouldReportTheAgentVersion(self):
+        assert int(self.reflector.resolve("com.mwr.dz.BuildConfig").VERSION_CODE) == Scenario.agent_version
+
+    def testItShouldServeThePackageManager(self):
+        package_manager = self.reflector.resolve("com.mwr.dz.Agent").getContext().getPackageManager()
+        packages = package_manager.getInstalledPackages(0x1000)
+
+        assert int(packages.size()) == 4
+        assert str(packages.get(1).packageName) == "com.example.app0000"
+        assert [str(p) for p in packages.get(1).requestedPermissions] == ["android.permission.INTERNET", "android.permission.CAMERA"]
+        assert isinstance(packages.get(1).requestedPermissionsFlags, ReflectedPrimitiveArray)
+        assert packages.get(1).activities == None
+
+    def testItShouldRaiseForAnUnknownPackage(self):
+        package_manager = self.reflector.resolve("com.mwr.dz.Agent").getContext().getPackageManager()
+
+        try:
+            package_manager.getPackageInfo("com.example.missing", 0)
+
+            assert False, "expected a ReflectionException"
+        except ReflectionException as e:
+            assert str(e) == "com.example.missing"
+
+    def testItShouldQueryAnExportedContentProvider(self):
+        context = self.reflector.resolve("com.mwr.dz.Agent").getContext()
+        uri = self.reflector.resolve("android.net.Uri").parse("content://com.example.app0000.provider/rows")
+        cursor = context.getContentResolver().query(uri, None, None, None, None)
+
+        assert int(cursor.getCount()) == 5
+        assert [str(c) for c in cursor.getColumnNames()] == ["_id", "name"]
+        assert cursor.moveToFirst() == True
+        assert str(cursor.getString(1)) == "row0"
+
+    def testItShouldRefuseAProviderThatIsNotExported(self):
+        context = self.reflector.resolve("com.mwr.dz.Agent").getContext()
+        uri = self.reflector.resolve("android.net.Uri").parse("content://com.example.app0001.provider/rows")
+
+        try:
+            context.getContentResolver().query(uri, None, None, None, None)
+
+            assert False, "expected a ReflectionException"
+        except ReflectionException as e:
+            assert "Permission Denial" in str(e)
+
+    def testItShouldServeFiles(self):
+        ftp = Ftp(self.session, block_size=4)
+
+        assert ftp.download("/data/data/com.mwr.dz/hello.txt") == b"hello world"
+
+        ftp.upload("/data/data/com.mwr.dz/upload.txt", b"uploaded")
+
+        assert self.agent.scenario.fs.read("/data/data/com.mwr.dz/upload.txt") == b"uploaded"
+        assert self.reflector.construct(self.reflector.resolve("java.io.File"), ReflectedType.fromNative("upload.txt", reflector=self.reflector)).exists() == True
+
+    def testItShouldShareTheLatencyOfPipelinedMessages(self):
+        self.session.close()
+        self.agent.close()
+
+        self.agent = StandInAgent(Scenario(), latency=0.1)
+        self.session = StandInSession(self.agent.listen("127.0.0.1", 0), Scenario.agent_version)
+        self.reflector = Reflector(self.session)
+
+        start = time.time()
+        self.reflector.resolve("com.mwr.dz.BuildConfig")
+
+        assert time.time() - start >= 0.1
+
+        start = time.time()
+        responses = self.session.gather([self.session.send_async(ReflectionRequestFactory.resolve("java.io.File")) for i in range(5)])
+
+        assert len(responses) == 5
+        assert time.time() - start < 0.3
+
+    def testItShouldLimitTheBandwidth(self):
+        self.session.close()
+        self.agent.close()
+
+        self.agent = StandInAgent(Scenario(files={ "/big": b"x" * 20000 }), bandwidth=100000)
+        self.session = StandInSession(self.agent.listen("127.0.0.1", 0), Scenario.agent_version)
+
+        start = time.time()
+        Ftp(self.session).download("/big")
+
+        assert time.time() - start >= 0.2
+
+
+class StandInModulesTestCase(unittest.TestCase):
+
+    def apk(self, *strings):
+        apk = io.BytesIO()
+
+        with zipfile.ZipFile(apk, "w") as archive:
+            archive.writestr("classes.dex", b"\x00".join(s.encode() for s in strings))
+
+        return apk.getvalue()
+
+    def run_module(self, module, *args):
+        """
+        Run a module against the stand-in, and get what it wrote to stdout.
+        """
+
+        stdout = io.StringIO()
+        apks = ApkStore(os.path.join(self.directory, "apks"))
+        manifests = ManifestCache(self.directory)
+
+        class StandInModule(module):
+
+            @classmethod
+            def apkStore(cls):
+                return apks
+
+            @classmethod
+            def manifestCache(cls):
+                return manifests
+
+        instance = StandInModule(MockSession(Reflector(self.session), stdout=stdout, stderr=stdout, ftp=Ftp(self.session)))
+        instance.clearObjectStore()
+
+        # the helper APKs are built with javac and dx, so load them as the
+        # Agent would once they had been uploaded
+        context = instance.getContext()
+        system = instance.klass("java.lang.ClassLoader").getSystemClassLoader()
+
+        for source in ["common/FileUtil.apk", "common/PermissionHelper.apk", "common/ZipUtil.apk", "common/shrink.apk"]:
+            Module.cache_classloader(source, instance.new("dalvik.system.DexClassLoader", str(context.getCacheDir().toString()) + "/" + source, str(context.getCacheDir().toString()), None, system))
+
+        instance.run(list(args))
+
+        return stdout.getvalue()
+
+    def setUp(self):
+        # the modules cache stand-in classes and class loaders on Module, so
+        # they are kept apart from the caches that other tests see
+        self.caches = Module._Module__klasses, Module._Module__loaders
+
+        Module._Module__klasses, Module._Module__loaders = {}, {}
+
+        self.directory = tempfile.mkdtemp()
+        self.agent = StandInAgent(Scenario.synthetic(4, files={
+            "/data/app/com.example.app0000-1/base.apk": self.apk("content://com.example.app0000.provider/secrets", "content://com.example.app0001.provider/hidden") }))
+        self.session = StandInSession(self.agent.listen("127.0.0.1", 0), Scenario.agent_version)
+
+    def tearDown(self):
+        self.session.close()
+        self.agent.close()
+
+        shutil.rmtree(self.directory)
+
+        Module._Module__klasses, Module._Module__loaders = self.caches
+
+    def testItShouldServeTheAgentsCacheAndDataDirectories(self):
+        context = Reflector(self.session).resolve("com.mwr.dz.Agent").getContext()
+
+        assert str(context.getCacheDir().getAbsolutePath()) == "/data/data/com.mwr.dz/cache"
+        assert str(context.getDir("dex", 0).getAbsolutePath()) == "/data/data/com.mwr.dz/app_dex"
+
+    def testItShouldFindTheUrisOfAProvider(self):
+        output = self.run_module(find_uris.FindUris, "-a", "com.example.app0000")
+
+        assert "Able to Query    content://com.example.app0000.provider/secrets" in output
+        assert "Unable to Query  content://com.example.app0001.provider/hidden" in output
+        assert not self.agent.scenario.fs.isDirectory("/data/data/com.mwr.dz/cache")
+
+    def testItShouldListTheExportedProviders(self):
+        output = self.run_module(provider.Info)
+
+        assert "Authority: com.example.app0000.provider" in output
+        assert "Authority: com.example.app0001.provider" not in output
+
+    def testItShouldCarryOnPastAnApkThatCannotBeDecodedLocally(self):
+        output = self.run_module(provider.Info, "--local")
+
+        assert "com.example.app0000 cannot parse manifest. the APK has no AndroidManifest.xml" in output
+        assert "com.example.app0001 cannot parse manifest. cannot pull APK" in output
+
+    def testItShouldReportTheAttackSurface(self):
+        output = self.run_module(package.AttackSurface, "com.example.app0000")
+
+        assert "1 content providers exported" in output
+        assert "is debuggable" in output
+
+
+def StandInTestSuite():
+    suite = unittest.TestSuite()
+
+    suite.addTest(ReflectionHandlerTestCase("testItShouldSendPythonValuesAsJavaTypes"))
+    suite.addTest(ReflectionHandlerTestCase("testItShouldSendListsAsTypedArrays"))
+    suite.addTest(ReflectionHandlerTestCase("testItShouldPackPrimitiveArraysWhenAsked"))
+    suite.addTest(ReflectionHandlerTestCase("testItShouldNameObjectsByTheirJavaClass"))
+    suite.addTest(StandInAgentTestCase("testItShouldListItsDevice"))
+    suite.addTest(StandInAgentTestCase("testItShouldReportTheAgentVersion"))
+    suite.addTest(StandInAgentTestCase("testItShouldServeThePackageManager"))
+    suite.addTest(StandInAgentTestCase("testItShouldRaiseForAnUnknownPackage"))
+    suite.addTest(StandInAgentTestCase("testItShouldQueryAnExportedContentProvider"))
+    suite.addTest(StandInAgentTestCase("testItShouldRefuseAProviderThatIsNotExported"))
+    suite.addTest(StandInAgentTestCase("testItShouldServeFiles"))
+    suite.addTest(StandInAgentTestCase("testItShouldShareTheLatencyOfPipelinedMessages"))
+    suite.addTest(StandInAgentTestCase("testItShouldLimitTheBandwidth"))
+    suite.addTest(StandInModulesTestCase("testItShouldServeTheAgentsCacheAndDataDirectories"))
+    suite.addTest(StandInModulesTestCase("testItShouldFindTheUrisOfAProvider"))
+    suite.addTest(StandInModulesTestCase("testItShouldListTheExportedProviders"))
+    suite.addTest(StandInModulesTestCase("testItShouldCarryOnPastAnApkThatCannotBeDecodedLocally"))
+    suite.addTest(StandInModulesTestCase("testItShouldReportTheAttackSurface"))
+
+    return suite
+
+if __name__ == "__main__":
+    unittest.TextTestRunner().run(StandInTestSuite())
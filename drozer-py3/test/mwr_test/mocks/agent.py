@@ -0,0 +1,68 @@
+import socket
+import threading
+
+from pydiesel.api.transport import SocketTransport
+
+from drozer.standin import ReflectionHandler, Scenario, StandInAgent
+
+class MockAgent(StandInAgent):
+    """
+    A stand-in Agent, which answers reflection requests on one end of a socket
+    pair using plain Python objects in place of Java ones.
+
+    Classes are made available to RESOLVE by name, through the classes dict.
+    Every session shares the same ObjectStore, objects.
+    """
+
+    def __init__(self, classes={}):
+        StandInAgent.__init__(self, Scenario())
+
+        self.handler = ReflectionHandler(classes)
+
+        self.__agent, self.__console = socket.socketpair()
+
+        threading.Thread(target=self.serve, args=(self.__agent,), daemon=True).start()
+
+    @property
+    def classes(self):
+        return self.handler.classes
+
+    @classes.setter
+    def classes(self, classes):
+        self.handler.classes = classes
+
+    @property
+    def objects(self):
+        return self.handler.objects
+
+    def close(self):
+        self.__agent.close()
+
+    def session(self):
+        """
+        Get a session-like object that delivers messages to this agent.
+        """
+
+        return MockAgentSession(SocketTransport.fromSocket(self.__console))
+
+    def sessionHandler(self, session_id):
+        return self.handler
+
+
+class MockAgentSession(object):
+    """
+    Delivers messages to a MockAgent, in place of a console Session.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.transport.setTimeout(5.0)
+
+    def gather(self, futures):
+        return [self.transport.wait(f) for f in futures]
+
+    def send_async(self, message):
+        return self.transport.send_async(message.setSessionId("555"))
+
+    def sendAndReceive(self, message):
+        return self.transport.sendAndReceive(message.setSessionId("555"))
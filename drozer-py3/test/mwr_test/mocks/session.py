@@ -2,7 +2,10 @@ import sys
 
 class MockSession(object):
     
-    def __init__(self, reflector, stdout=sys.stdout, stderr=sys.stderr, variables={}):
+    def __init__(self, reflector, stdout=sys.stdout, stderr=sys.stderr, variables={}, ftp=None, agent_version=20407, memo=None):
+        self.agent_version = agent_version
+        self.ftp = ftp
+        self.memo = memo
         self.modules = None
         self.reflector = reflector
         self.stdout = stdout